@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Colour - Benchmarks
+===================
+
+*Airspeed Velocity* benchmarks suite tracking the time and the peak memory of
+*Colour* hot paths on synthetic data, run it with the *benchmarks* *Invoke*
+task.
+"""
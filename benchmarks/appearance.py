@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Appearance Benchmarks
+=====================
+
+Defines the :mod:`colour.appearance` package benchmarks:
+
+-   :class:`benchmarks.appearance.XYZToCAM16`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.appearance import XYZ_to_CAM16
+
+from benchmarks.common import DTYPES, SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['XYZToCAM16']
+
+
+class XYZToCAM16(object):
+    """
+    Benchmarks :func:`colour.XYZ_to_CAM16` definition.
+    """
+
+    params = (SIZES, DTYPES)
+    param_names = ('size', 'dtype')
+    timeout = 240
+
+    def setup(self, size, dtype):
+        self.XYZ = random_array(size, dtype, high=100)
+        self.XYZ_w = np.array([95.05, 100.00, 108.88])
+
+    def time_XYZ_to_CAM16(self, size, dtype):
+        XYZ_to_CAM16(self.XYZ, self.XYZ_w, 318.31, 20.0)
+
+    def peakmem_XYZ_to_CAM16(self, size, dtype):
+        XYZ_to_CAM16(self.XYZ, self.XYZ_w, 318.31, 20.0)
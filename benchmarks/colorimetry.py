@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Colorimetry Benchmarks
+======================
+
+Defines the :mod:`colour.colorimetry` package benchmarks:
+
+-   :class:`benchmarks.colorimetry.SdToXYZ`
+-   :class:`benchmarks.colorimetry.MsdsToXYZ`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.colorimetry import (SpectralDistribution, SpectralShape,
+                                msds_to_XYZ, sd_to_XYZ)
+
+from benchmarks.common import DTYPES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['SdToXYZ', 'MsdsToXYZ']
+
+
+class SdToXYZ(object):
+    """
+    Benchmarks :func:`colour.sd_to_XYZ` definition for various methods and
+    spectral distribution intervals.
+    """
+
+    params = (['ASTM E308', 'Integration'], [1, 5, 10, 20])
+    param_names = ('method', 'interval')
+
+    def setup(self, method, interval):
+        shape = SpectralShape(360, 780, interval)
+        values = np.random.RandomState(4).uniform(0, 1, len(shape.range()))
+        self.sd = SpectralDistribution(values, shape.range())
+
+    def time_sd_to_XYZ(self, method, interval):
+        sd_to_XYZ(self.sd, method=method)
+
+    def peakmem_sd_to_XYZ(self, method, interval):
+        sd_to_XYZ(self.sd, method=method)
+
+
+class MsdsToXYZ(object):
+    """
+    Benchmarks :func:`colour.msds_to_XYZ` definition with the *Integration*
+    method on multi-spectral arrays.
+
+    Notes
+    -----
+    -   The *4K* size is not benchmarked as the 31 bins array would require
+        about 2GB of memory.
+    """
+
+    params = (['1', '1e3', '1e6'], DTYPES)
+    param_names = ('size', 'dtype')
+    timeout = 240
+
+    def setup(self, size, dtype):
+        self.shape = SpectralShape(400, 700, 10)
+        self.msds = random_array(size, dtype, channels=len(self.shape.range()))
+
+    def time_msds_to_XYZ(self, size, dtype):
+        msds_to_XYZ(self.msds, method='Integration', shape=self.shape)
+
+    def peakmem_msds_to_XYZ(self, size, dtype):
+        msds_to_XYZ(self.msds, method='Integration', shape=self.shape)
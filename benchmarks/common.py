@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Common Benchmarks Utilities
+===========================
+
+Defines the common benchmarks utilities objects:
+
+-   :attr:`benchmarks.common.SIZES`
+-   :attr:`benchmarks.common.DTYPES`
+-   :func:`benchmarks.common.random_array`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['SHAPES', 'SIZES', 'DTYPES', 'random_array']
+
+SHAPES = {
+    '1': (1, ),
+    '10': (10, ),
+    '1e3': (1000, ),
+    '1e6': (1000000, ),
+    '4K': (2160, 3840),
+}
+"""
+Samples array shapes, without the channels axis, keyed by size name.
+
+SHAPES : dict
+"""
+
+SIZES = ['1', '1e3', '1e6', '4K']
+"""
+Default input sizes names: a single sample, :math:`10^3` and :math:`10^6`
+samples and a *4K UHDTV* image.
+
+SIZES : list
+"""
+
+DTYPES = ['float32', 'float64']
+"""
+Default input dtypes.
+
+DTYPES : list
+"""
+
+
+def random_array(size, dtype='float64', channels=3, low=0, high=1, seed=4):
+    """
+    Returns a reproducible array of uniformly distributed random samples.
+
+    Parameters
+    ----------
+    size : unicode
+        Size name, see :attr:`benchmarks.common.SHAPES` attribute.
+    dtype : unicode, optional
+        Array dtype.
+    channels : int, optional
+        Channels count, if *None*, the array has no channels axis.
+    low : numeric or array_like, optional
+        Lower boundary of the samples.
+    high : numeric or array_like, optional
+        Upper boundary of the samples.
+    seed : int, optional
+        Random generator seed.
+
+    Returns
+    -------
+    ndarray
+        Random samples.
+    """
+
+    shape = SHAPES[size] + (() if channels is None else (channels, ))
+
+    return np.random.RandomState(seed).uniform(low, high, shape).astype(dtype)
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Difference Benchmarks
+=====================
+
+Defines the :mod:`colour.difference` package benchmarks:
+
+-   :class:`benchmarks.difference.DeltaECIE2000`
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.difference import delta_E_CIE2000
+
+from benchmarks.common import DTYPES, SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['DeltaECIE2000']
+
+
+class DeltaECIE2000(object):
+    """
+    Benchmarks :func:`colour.difference.delta_E_CIE2000` definition.
+    """
+
+    params = (SIZES, DTYPES)
+    param_names = ('size', 'dtype')
+    timeout = 240
+
+    def setup(self, size, dtype):
+        self.Lab_1 = random_array(
+            size, dtype, low=(0, -100, -100), high=(100, 100, 100), seed=4)
+        self.Lab_2 = random_array(
+            size, dtype, low=(0, -100, -100), high=(100, 100, 100), seed=8)
+
+    def time_delta_E_CIE2000(self, size, dtype):
+        delta_E_CIE2000(self.Lab_1, self.Lab_2)
+
+    def peakmem_delta_E_CIE2000(self, size, dtype):
+        delta_E_CIE2000(self.Lab_1, self.Lab_2)
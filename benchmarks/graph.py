@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Graph Benchmarks
+================
+
+Defines the :mod:`colour.graph` package benchmarks:
+
+-   :class:`benchmarks.graph.Convert`
+-   :class:`benchmarks.graph.ConvertMany`
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.graph import convert, convert_many
+from colour.utilities import suppress_warnings
+
+from benchmarks.common import DTYPES, SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['Convert', 'ConvertMany']
+
+
+class Convert(object):
+    """
+    Benchmarks :func:`colour.convert` definition along short and long
+    conversion paths.
+    """
+
+    params = (SIZES, DTYPES, [('sRGB', 'CIE XYZ'), ('sRGB', 'CAM16UCS'),
+                              ('CIE XYZ', 'Hexadecimal')])
+    param_names = ('size', 'dtype', 'path')
+    timeout = 240
+
+    def setup(self, size, dtype, path):
+        self.a = random_array(size, dtype)
+
+    def time_convert(self, size, dtype, path):
+        with suppress_warnings(colour_usage_warnings=True):
+            convert(self.a, *path)
+
+    def peakmem_convert(self, size, dtype, path):
+        with suppress_warnings(colour_usage_warnings=True):
+            convert(self.a, *path)
+
+
+class ConvertMany(object):
+    """
+    Benchmarks :func:`colour.convert_many` definition against as many
+    :func:`colour.convert` definition calls for targets sharing conversion
+    paths prefixes.
+    """
+
+    params = (SIZES, DTYPES)
+    param_names = ('size', 'dtype')
+    timeout = 240
+
+    targets = ('CIE Lab', 'CIE LCHab', 'CAM16', 'CAM16UCS', 'JzAzBz',
+               'Hunter Lab')
+
+    def setup(self, size, dtype):
+        self.a = random_array(size, dtype)
+
+    def time_convert_many(self, size, dtype):
+        with suppress_warnings(colour_usage_warnings=True):
+            convert_many(self.a, 'CIE XYZ', self.targets)
+
+    def time_convert(self, size, dtype):
+        with suppress_warnings(colour_usage_warnings=True):
+            for target in self.targets:
+                convert(self.a, 'CIE XYZ', target)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Benchmarks
+==============
+
+Defines the :mod:`colour.io` package benchmarks:
+
+-   :class:`benchmarks.luts.LUT3DApply`
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.algebra import TABLE_INTERPOLATION_METHODS
+from colour.io import LUT3D
+
+from benchmarks.common import DTYPES, SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['LUT3DApply']
+
+
+class LUT3DApply(object):
+    """
+    Benchmarks :meth:`colour.LUT3D.apply` method with a synthetic
+    :math:`33^3` table.
+    """
+
+    params = (SIZES, DTYPES, ['Trilinear', 'Tetrahedral'])
+    param_names = ('size', 'dtype', 'interpolator')
+    timeout = 240
+
+    def setup(self, size, dtype, interpolator):
+        self.LUT = LUT3D(size=33)
+        self.LUT.table = self.LUT.table ** (1 / 2.2)
+        self.RGB = random_array(size, dtype)
+        self.interpolator = TABLE_INTERPOLATION_METHODS[interpolator]
+
+    def time_LUT3D_apply(self, size, dtype, interpolator):
+        self.LUT.apply(self.RGB, interpolator=self.interpolator)
+
+    def peakmem_LUT3D_apply(self, size, dtype, interpolator):
+        self.LUT.apply(self.RGB, interpolator=self.interpolator)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Models Benchmarks
+=================
+
+Defines the :mod:`colour.models` package benchmarks:
+
+-   :class:`benchmarks.models.RGBToRGB`
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.models import RGB_COLOURSPACES, RGB_to_RGB
+
+from benchmarks.common import DTYPES, SIZES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['RGBToRGB']
+
+
+class RGBToRGB(object):
+    """
+    Benchmarks :func:`colour.RGB_to_RGB` definition, with and without the
+    colour component transfer functions.
+    """
+
+    params = (SIZES, DTYPES, [False, True])
+    param_names = ('size', 'dtype', 'cctf')
+    timeout = 240
+
+    def setup(self, size, dtype, cctf):
+        self.RGB = random_array(size, dtype)
+        self.input_colourspace = RGB_COLOURSPACES['sRGB']
+        self.output_colourspace = RGB_COLOURSPACES['ITU-R BT.2020']
+
+    def time_RGB_to_RGB(self, size, dtype, cctf):
+        RGB_to_RGB(
+            self.RGB,
+            self.input_colourspace,
+            self.output_colourspace,
+            apply_cctf_decoding=cctf,
+            apply_cctf_encoding=cctf)
+
+    def peakmem_RGB_to_RGB(self, size, dtype, cctf):
+        RGB_to_RGB(
+            self.RGB,
+            self.input_colourspace,
+            self.output_colourspace,
+            apply_cctf_decoding=cctf,
+            apply_cctf_encoding=cctf)
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Notation Benchmarks
+===================
+
+Defines the :mod:`colour.notation` package benchmarks:
+
+-   :class:`benchmarks.notation.XyYToMunsellSpecification`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.notation import MUNSELL_COLOURS_REAL
+from colour.notation.munsell import xyY_to_munsell_specification
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['XyYToMunsellSpecification']
+
+
+class XyYToMunsellSpecification(object):
+    """
+    Benchmarks :func:`colour.notation.munsell.xyY_to_munsell_specification`
+    definition on *Munsell Renotation System* real colours.
+
+    Notes
+    -----
+    -   The conversion iterates over each sample, about 0.2s per sample,
+        thus only the *1* and *10* sizes are benchmarked.
+    """
+
+    params = (['1', '10'], ['float32', 'float64'])
+    param_names = ('size', 'dtype')
+    timeout = 240
+
+    def setup(self, size, dtype):
+        xyY = np.array([
+            xyY for (_hue, value, _chroma), xyY in MUNSELL_COLOURS_REAL
+            if value >= 2
+        ])
+        xyY[..., 2] /= 100
+
+        indexes = np.random.RandomState(4).choice(
+            xyY.shape[0], int(size), replace=False)
+        self.xyY = xyY[indexes].astype(dtype)
+
+    def time_xyY_to_munsell_specification(self, size, dtype):
+        xyY_to_munsell_specification(self.xyY)
+
+    def peakmem_xyY_to_munsell_specification(self, size, dtype):
+        xyY_to_munsell_specification(self.xyY)
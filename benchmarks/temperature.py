@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Temperature Benchmarks
+======================
+
+Defines the :mod:`colour.temperature` package benchmarks:
+
+-   :class:`benchmarks.temperature.UvToCCT`
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.temperature import uv_to_CCT
+
+from benchmarks.common import DTYPES, random_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['UvToCCT']
+
+
+class UvToCCT(object):
+    """
+    Benchmarks :func:`colour.uv_to_CCT` definition.
+
+    Notes
+    -----
+    -   Both methods iterate over each sample: *Robertson (1968)* method
+        takes about 70us per sample and is benchmarked up to the *1e3* size
+        while *Ohno (2013)* method takes about 50ms per sample and is only
+        benchmarked with the *1* and *10* sizes.
+    """
+
+    params = (['1', '10', '1e3'], DTYPES, ['Ohno 2013', 'Robertson 1968'])
+    param_names = ('size', 'dtype', 'method')
+    timeout = 240
+
+    def setup(self, size, dtype, method):
+        if method == 'Ohno 2013' and size == '1e3':
+            raise NotImplementedError
+
+        self.uv = random_array(
+            size, dtype, channels=2, low=(0.18, 0.29), high=(0.26, 0.33))
+
+    def time_uv_to_CCT(self, size, dtype, method):
+        uv_to_CCT(self.uv, method)
+
+    def peakmem_uv_to_CCT(self, size, dtype, method):
+        uv_to_CCT(self.uv, method)
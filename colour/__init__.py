@@ -66,20 +66,21 @@ from .algebra import (CubicSplineInterpolator, Extrapolator,
                       table_interpolation, lagrange_coefficients)
 from .colorimetry import (
     BANDPASS_CORRECTION_METHODS, CCS_ILLUMINANTS, CCS_LIGHT_SOURCES,
-    LIGHTNESS_METHODS, LUMINANCE_METHODS, MSDS_CMFS, MSDS_TO_XYZ_METHODS,
-    MultiSpectralDistributions, SDS_ILLUMINANTS, SDS_LEFS, SDS_LIGHT_SOURCES,
-    SD_GAUSSIAN_METHODS, SD_MULTI_LEDS_METHODS, SD_SINGLE_LED_METHODS,
-    SD_TO_XYZ_METHODS, SPECTRAL_SHAPE_ASTME308, SPECTRAL_SHAPE_DEFAULT,
-    SpectralDistribution, SpectralShape, TVS_ILLUMINANTS_HUNTERLAB,
-    WHITENESS_METHODS, YELLOWNESS_METHODS, bandpass_correction,
-    colorimetric_purity, complementary_wavelength, dominant_wavelength,
-    excitation_purity, lightness, luminance, luminous_efficacy,
-    luminous_efficiency, luminous_flux, msds_constant, msds_ones, msds_zeros,
-    msds_to_XYZ, sd_CIE_illuminant_D_series, sd_CIE_standard_illuminant_A,
-    sd_blackbody, sd_constant, sd_gaussian,
-    sd_mesopic_luminous_efficiency_function, sd_multi_leds, sd_ones,
-    sd_single_led, sd_to_XYZ, sd_zeros, wavelength_to_XYZ, whiteness,
-    yellowness)
+    LIGHTNESS_METHODS, LUMINANCE_METHODS, MSDS_CMFS, MSDS_GAUSSIAN_METHODS,
+    MSDS_SINGLE_LED_METHODS, MSDS_TO_XYZ_METHODS, MultiSpectralDistributions,
+    SDS_ILLUMINANTS, SDS_LEFS, SDS_LIGHT_SOURCES, SD_GAUSSIAN_METHODS,
+    SD_MULTI_LEDS_METHODS, SD_SINGLE_LED_METHODS, SD_TO_XYZ_METHODS,
+    SPECTRAL_SHAPE_ASTME308, SPECTRAL_SHAPE_DEFAULT, SpectralDistribution,
+    SpectralShape, TVS_ILLUMINANTS_HUNTERLAB, WHITENESS_METHODS,
+    YELLOWNESS_METHODS, bandpass_correction, colorimetric_purity,
+    complementary_wavelength, dominant_wavelength, excitation_purity,
+    lightness, luminance, luminous_efficacy, luminous_efficiency,
+    luminous_flux, msds_CIE_illuminant_D_series, msds_blackbody, msds_constant,
+    msds_gaussian, msds_ones, msds_single_led, msds_zeros, msds_to_XYZ,
+    sd_CIE_illuminant_D_series, sd_CIE_standard_illuminant_A, sd_blackbody,
+    sd_constant, sd_gaussian, sd_mesopic_luminous_efficiency_function,
+    sd_multi_leds, sd_ones, sd_single_led, sd_to_XYZ, sd_zeros,
+    wavelength_to_XYZ, whiteness, yellowness)
 from .blindness import (
     CVD_MATRICES_MACHADO2010, matrix_anomalous_trichromacy_Machado2009,
     matrix_cvd_Machado2009, msds_cmfs_anomalous_trichromacy_Machado2009)
@@ -161,7 +162,7 @@ from .volume import (
     RGB_colourspace_volume_MonteCarlo,
     RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
     is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
-from .graph import describe_conversion_path, convert
+from .graph import describe_conversion_path, convert, convert_many
 
 from colour.utilities import is_matplotlib_installed
 
@@ -206,16 +207,18 @@ __all__ += [
 __all__ += [
     'BANDPASS_CORRECTION_METHODS', 'CCS_ILLUMINANTS', 'CCS_LIGHT_SOURCES',
     'LIGHTNESS_METHODS', 'LUMINANCE_METHODS', 'MSDS_CMFS',
-    'MSDS_TO_XYZ_METHODS', 'MultiSpectralDistributions', 'SDS_ILLUMINANTS',
-    'SDS_LEFS', 'SDS_LIGHT_SOURCES', 'SD_GAUSSIAN_METHODS',
-    'SD_MULTI_LEDS_METHODS', 'SD_SINGLE_LED_METHODS', 'SD_TO_XYZ_METHODS',
-    'SPECTRAL_SHAPE_ASTME308', 'SPECTRAL_SHAPE_DEFAULT',
-    'SpectralDistribution', 'SpectralShape', 'TVS_ILLUMINANTS_HUNTERLAB',
-    'WHITENESS_METHODS', 'YELLOWNESS_METHODS', 'bandpass_correction',
-    'colorimetric_purity', 'complementary_wavelength', 'dominant_wavelength',
-    'excitation_purity', 'lightness', 'luminance', 'luminous_efficacy',
-    'luminous_efficiency', 'luminous_flux', 'msds_constant', 'msds_ones',
-    'msds_zeros', 'msds_to_XYZ', 'sd_CIE_illuminant_D_series',
+    'MSDS_GAUSSIAN_METHODS', 'MSDS_SINGLE_LED_METHODS', 'MSDS_TO_XYZ_METHODS',
+    'MultiSpectralDistributions', 'SDS_ILLUMINANTS', 'SDS_LEFS',
+    'SDS_LIGHT_SOURCES', 'SD_GAUSSIAN_METHODS', 'SD_MULTI_LEDS_METHODS',
+    'SD_SINGLE_LED_METHODS', 'SD_TO_XYZ_METHODS', 'SPECTRAL_SHAPE_ASTME308',
+    'SPECTRAL_SHAPE_DEFAULT', 'SpectralDistribution', 'SpectralShape',
+    'TVS_ILLUMINANTS_HUNTERLAB', 'WHITENESS_METHODS', 'YELLOWNESS_METHODS',
+    'bandpass_correction', 'colorimetric_purity', 'complementary_wavelength',
+    'dominant_wavelength', 'excitation_purity', 'lightness', 'luminance',
+    'luminous_efficacy', 'luminous_efficiency', 'luminous_flux',
+    'msds_CIE_illuminant_D_series', 'msds_blackbody', 'msds_constant',
+    'msds_gaussian', 'msds_ones', 'msds_single_led', 'msds_zeros',
+    'msds_to_XYZ', 'sd_CIE_illuminant_D_series',
     'sd_CIE_standard_illuminant_A', 'sd_blackbody', 'sd_constant',
     'sd_gaussian', 'sd_mesopic_luminous_efficiency_function', 'sd_multi_leds',
     'sd_ones', 'sd_single_led', 'sd_to_XYZ', 'sd_zeros', 'wavelength_to_XYZ',
@@ -323,7 +326,7 @@ __all__ += [
     'is_within_mesh_volume', 'is_within_pointer_gamut',
     'is_within_visible_spectrum'
 ]
-__all__ += ['describe_conversion_path', 'convert']
+__all__ += ['describe_conversion_path', 'convert', 'convert_many']
 
 __application_name__ = 'Colour'
 
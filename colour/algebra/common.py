@@ -17,6 +17,7 @@ import functools
 import numpy as np
 
 from colour.utilities import as_float_array, as_float
+from colour.utilities.common import _context_variable
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -30,12 +31,12 @@ __all__ = [
     'smoothstep_function'
 ]
 
-_SPOW_ENABLED = True
+_SPOW_ENABLED = _context_variable('spow_enabled', True)
 """
-Global variable storing the current *Colour* safe / symmetrical power function
-enabled state.
+Context variable storing the current *Colour* safe / symmetrical power
+function enabled state, each thread and *asyncio* task sees its own value.
 
-_SPOW_ENABLED : bool
+_SPOW_ENABLED : ContextVar
 """
 
 
@@ -58,7 +59,7 @@ def is_spow_enabled():
     True
     """
 
-    return _SPOW_ENABLED
+    return _SPOW_ENABLED.get()
 
 
 def set_spow_enable(enable):
@@ -80,9 +81,7 @@ def set_spow_enable(enable):
     False
     """
 
-    global _SPOW_ENABLED
-
-    _SPOW_ENABLED = enable
+    _SPOW_ENABLED.set(enable)
 
 
 class spow_enable(object):
@@ -99,14 +98,14 @@ class spow_enable(object):
 
     def __init__(self, enable):
         self._enable = enable
-        self._previous_state = is_spow_enabled()
+        self._tokens = []
 
     def __enter__(self):
         """
         Called upon entering the context manager and decorator.
         """
 
-        set_spow_enable(self._enable)
+        self._tokens.append(_SPOW_ENABLED.set(self._enable))
 
         return self
 
@@ -115,7 +114,7 @@ class spow_enable(object):
         Called upon exiting the context manager and decorator.
         """
 
-        set_spow_enable(self._previous_state)
+        _SPOW_ENABLED.reset(self._tokens.pop())
 
     def __call__(self, function):
         """
@@ -124,8 +123,13 @@ class spow_enable(object):
 
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
-            with self:
+            # The token is kept local as the decorator instance is shared by
+            # the threads calling the wrapped definition.
+            token = _SPOW_ENABLED.set(self._enable)
+            try:
                 return function(*args, **kwargs)
+            finally:
+                _SPOW_ENABLED.reset(token)
 
         return wrapper
 
@@ -162,7 +166,7 @@ def spow(a, p):
     0.0
     """
 
-    if not _SPOW_ENABLED:
+    if not _SPOW_ENABLED.get():
         return np.power(a, p)
 
     a = np.atleast_1d(a)
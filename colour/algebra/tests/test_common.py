@@ -5,6 +5,7 @@ Defines unit tests for :mod:`colour.algebra.common` module.
 
 from __future__ import division, unicode_literals
 
+import multiprocessing.pool
 import numpy as np
 import unittest
 
@@ -99,6 +100,39 @@ class TestSpowEnable(unittest.TestCase):
 
         fn_b()
 
+    def test_spow_enable_threads(self):
+        """
+        Tests :func:`colour.algebra.common.spow_enable` definition with
+        concurrent threads.
+        """
+
+        @spow_enable(False)
+        def fn_a(a):
+            """
+            :func:`spow_enable` unit tests :func:`fn_a` definition.
+            """
+
+            return spow(a, 0.5)
+
+        def fn_b(i):
+            """
+            :func:`spow_enable` unit tests :func:`fn_b` definition.
+            """
+
+            for _ in range(50):
+                if i % 2:
+                    self.assertTrue(np.isnan(fn_a(-4)))
+                else:
+                    self.assertEqual(spow(-4, 0.5), -2)
+
+            return is_spow_enabled()
+
+        pool = multiprocessing.pool.ThreadPool(4)
+        try:
+            self.assertListEqual(pool.map(fn_b, range(16)), [True] * 16)
+        finally:
+            pool.terminate()
+
 
 class TestSpow(unittest.TestCase):
     """
@@ -8,6 +8,7 @@ Defines *CAM16* colour appearance model objects:
 -   :class:`colour.appearance.InductionFactors_CAM16`
 -   :attr:`colour.VIEWING_CONDITIONS_CAM16`
 -   :class:`colour.CAM_Specification_CAM16`
+-   :class:`colour.appearance.ViewingConditions_CAM16`
 -   :func:`colour.XYZ_to_CAM16`
 -   :func:`colour.CAM16_to_XYZ`
 
@@ -24,22 +25,13 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.algebra import spow
 from colour.appearance.ciecam02 import (
-    VIEWING_CONDITIONS_CIECAM02, P, achromatic_response_forward,
-    achromatic_response_inverse, brightness_correlate, chroma_correlate,
-    colourfulness_correlate, degree_of_adaptation, eccentricity_factor,
-    hue_angle, hue_quadrature, lightness_correlate,
-    opponent_colour_dimensions_forward, opponent_colour_dimensions_inverse,
+    VIEWING_CONDITIONS_CIECAM02, ViewingConditions_CIECAM02,
+    achromatic_response_forward, degree_of_adaptation,
     post_adaptation_non_linear_response_compression_forward,
     post_adaptation_non_linear_response_compression_inverse,
-    matrix_post_adaptation_non_linear_response_compression,
-    saturation_correlate, temporary_magnitude_quantity_inverse,
     viewing_condition_dependent_parameters)
-from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              as_namedtuple, vector_dot, from_range_100,
-                              from_range_degrees, ones, to_domain_100,
-                              to_domain_degrees, tsplit)
+from colour.utilities import (CaseInsensitiveMapping, vector_dot, ones, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -50,8 +42,8 @@ __status__ = 'Production'
 
 __all__ = [
     'MATRIX_16', 'MATRIX_INVERSE_16', 'InductionFactors_CAM16',
-    'VIEWING_CONDITIONS_CAM16', 'CAM_Specification_CAM16', 'XYZ_to_CAM16',
-    'CAM16_to_XYZ'
+    'VIEWING_CONDITIONS_CAM16', 'CAM_Specification_CAM16',
+    'ViewingConditions_CAM16', 'XYZ_to_CAM16', 'CAM16_to_XYZ'
 ]
 
 MATRIX_16 = np.array([
@@ -154,6 +146,185 @@ class CAM_Specification_CAM16(
             cls, J, C, h, s, Q, M, H, HC)
 
 
+class ViewingConditions_CAM16(ViewingConditions_CIECAM02):
+    """
+    Defines the *CAM16* colour appearance model viewing conditions and caches
+    their dependent terms so that conversions sharing the same reference
+    white and surround, e.g. the frames of an image sequence, do not
+    recompute them.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Luminous factor of background :math:`Y_b` such as
+        :math:`Y_b = 100 x L_b / L_w` where :math:`L_w` is the luminance of the
+        light source and :math:`L_b` is the luminance of the background.
+    surround : InductionFactors_CAM16, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Notes
+    -----
+
+    +------------------------------+-----------------------+---------------+
+    | **Domain**                   | **Scale - Reference** | **Scale - 1** |
+    +==============================+=======================+===============+
+    | ``XYZ_w``                    | [0, 100]              | [0, 1]        |
+    +------------------------------+-----------------------+---------------+
+
+    -   The reference white is converted using the *Colour* domain-range scale
+        active at instantiation time.
+    -   Chunked evaluation requires uniform viewing conditions, i.e. a single
+        reference white and scalar :math:`L_A` and :math:`Y_b` values.
+
+    References
+    ----------
+    :cite:`Li2017`
+
+    Examples
+    --------
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> viewing_conditions = ViewingConditions_CAM16(XYZ_w, L_A, Y_b)
+    >>> specification = viewing_conditions.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CAM_Specification_CAM16(J=41.7312079..., C=0.1033557..., \
+h=217.0679597..., s=2.3450150..., Q=195.3717089..., M=0.1074367..., \
+H=275.5949861..., HC=None)
+    >>> viewing_conditions.inverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    _SPECIFICATION = CAM_Specification_CAM16
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=VIEWING_CONDITIONS_CAM16['Average'],
+                 discount_illuminant=False):
+        super(ViewingConditions_CAM16,
+              self).__init__(XYZ_w, L_A, Y_b, surround, discount_illuminant)
+
+    def _compute_parameters(self):
+        """
+        Computes the viewing conditions dependent parameters.
+
+        Returns
+        -------
+        CaseInsensitiveMapping
+            Viewing conditions dependent parameters.
+        """
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        # Step 0
+        # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
+        RGB_w = vector_dot(MATRIX_16, self._XYZ_w)
+
+        # Computing degree of adaptation :math:`D`.
+        D = (np.clip(degree_of_adaptation(self._surround.F, self._L_A), 0, 1)
+             if not self._discount_illuminant else ones(self._L_A.shape))
+
+        n, F_L, N_bb, N_cb, z = tsplit(
+            viewing_condition_dependent_parameters(self._Y_b, Y_w, self._L_A))
+
+        D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
+                 D[..., np.newaxis])
+        RGB_wc = D_RGB * RGB_w
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            RGB_wc, F_L)
+
+        # Computing achromatic responses for the whitepoint.
+        A_w = achromatic_response_forward(RGB_aw, N_bb)
+
+        return CaseInsensitiveMapping({
+            'Y_w': Y_w,
+            'n': n,
+            'F_L': F_L,
+            'N_bb': N_bb,
+            'N_cb': N_cb,
+            'z': z,
+            'D': D,
+            'D_RGB': D_RGB,
+            'RGB_w': RGB_w,
+            'A_w': A_w,
+        })
+
+    def _adaptation_forward(self, XYZ):
+        """
+        Converts given *CIE XYZ* tristimulus values in reference scale to
+        post-adaptation non linear response compressed *RGB* values.
+
+        Parameters
+        ----------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+
+        Returns
+        -------
+        ndarray
+            Post-adaptation non linear response compressed *RGB* values.
+        """
+
+        p = self._parameters
+
+        # Step 1
+        # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
+        RGB = vector_dot(MATRIX_16, XYZ)
+
+        # Step 2
+        RGB_c = p['D_RGB'] * RGB
+
+        # Step 3
+        # Applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_c, p['F_L'])
+
+        return RGB_a
+
+    def _adaptation_inverse(self, RGB_a):
+        """
+        Converts given post-adaptation non linear response compressed *RGB*
+        values to *CIE XYZ* tristimulus values in reference scale.
+
+        Parameters
+        ----------
+        RGB_a : ndarray
+            Post-adaptation non linear response compressed *RGB* values.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+        """
+
+        p = self._parameters
+
+        # Step 5
+        # Applying inverse post-adaptation non linear response compression.
+        RGB_c = post_adaptation_non_linear_response_compression_inverse(
+            RGB_a, p['F_L'])
+
+        # Step 6
+        RGB = RGB_c / p['D_RGB']
+
+        # Step 7
+        XYZ = vector_dot(MATRIX_INVERSE_16, RGB)
+
+        return XYZ
+
+
 def XYZ_to_CAM16(XYZ,
                  XYZ_w,
                  L_A,
@@ -238,86 +409,8 @@ h=217.0679597..., s=2.3450150..., Q=195.3717089..., M=0.1074367..., \
 H=275.5949861..., HC=None)
     """
 
-    XYZ = to_domain_100(XYZ)
-    XYZ_w = to_domain_100(XYZ_w)
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = as_float_array(L_A)
-    Y_b = as_float_array(Y_b)
-
-    # Step 0
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB_w = vector_dot(MATRIX_16, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else ones(L_A.shape))
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
-             D[..., np.newaxis])
-    RGB_wc = D_RGB * RGB_w
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_wc, F_L)
-
-    # Computing achromatic responses for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Step 1
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB = vector_dot(MATRIX_16, XYZ)
-
-    # Step 2
-    RGB_c = D_RGB * RGB
-
-    # Step 3
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_c, F_L)
-
-    # Step 4
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Step 5
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Step 6
-    # Computing achromatic responses for the stimulus.
-    A = achromatic_response_forward(RGB_a, N_bb)
-
-    # Step 7
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Step 8
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Step 9
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CAM_Specification_CAM16(
-        from_range_100(J), from_range_100(C), from_range_degrees(h),
-        from_range_100(s), from_range_100(Q), from_range_100(M),
-        from_range_degrees(H, 400), None)
+    return ViewingConditions_CAM16(XYZ_w, L_A, Y_b, surround,
+                                   discount_illuminant).forward(XYZ)
 
 
 def CAM16_to_XYZ(specification,
@@ -414,75 +507,5 @@ def CAM16_to_XYZ(specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(specification,
-                                                CAM_Specification_CAM16)
-    J = to_domain_100(J)
-    C = to_domain_100(C) if C is not None else C
-    h = to_domain_degrees(h)
-    M = to_domain_100(M) if M is not None else M
-    L_A = as_float_array(L_A)
-    XYZ_w = to_domain_100(XYZ_w)
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-
-    # Step 0
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB_w = vector_dot(MATRIX_16, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else ones(L_A.shape))
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    D_RGB = (D[..., np.newaxis] * Y_w[..., np.newaxis] / RGB_w + 1 -
-             D[..., np.newaxis])
-    RGB_wc = D_RGB * RGB_w
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_wc, F_L)
-
-    # Computing achromatic responses for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Step 1
-    if C is None and M is not None:
-        C = M / spow(F_L, 0.25)
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CAM_Specification_CAM16" argument!')
-
-    # Step 2
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_inverse(C, J, n)
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_inverse(A_w, J, surround.c, z)
-
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
-
-    # Step 3
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_inverse(P_n, h))
-
-    # Step 4
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = matrix_post_adaptation_non_linear_response_compression(P_2, a, b)
-
-    # Step 5
-    # Applying inverse post-adaptation non linear response compression.
-    RGB_c = post_adaptation_non_linear_response_compression_inverse(RGB_a, F_L)
-
-    # Step 6
-    RGB = RGB_c / D_RGB
-
-    # Step 7
-    XYZ = vector_dot(MATRIX_INVERSE_16, RGB)
-
-    return from_range_100(XYZ)
+    return ViewingConditions_CAM16(XYZ_w, L_A, Y_b, surround,
+                                   discount_illuminant).inverse(specification)
@@ -8,6 +8,7 @@ Defines *CIECAM02* colour appearance model objects:
 -   :class:`colour.appearance.InductionFactors_CIECAM02`
 -   :attr:`colour.VIEWING_CONDITIONS_CIECAM02`
 -   :class:`colour.CAM_Specification_CIECAM02`
+-   :class:`colour.appearance.ViewingConditions_CIECAM02`
 -   :func:`colour.XYZ_to_CIECAM02`
 -   :func:`colour.CIECAM02_to_XYZ`
 
@@ -30,16 +31,18 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 from collections import namedtuple
+from functools import partial
 
 from colour.algebra import spow
 from colour.adaptation import CAT_CAT02
 from colour.appearance.hunt import (MATRIX_HPE_TO_XYZ, MATRIX_XYZ_TO_HPE,
                                     luminance_level_adaptation_factor)
-from colour.constants import EPSILON
-from colour.utilities import (
-    CaseInsensitiveMapping, as_float_array, as_int_array, as_namedtuple,
-    as_float, from_range_degrees, matrix_dot, vector_dot, from_range_100, ones,
-    to_domain_100, to_domain_degrees, tsplit, tstack, zeros)
+from colour.constants import DEFAULT_FLOAT_DTYPE, EPSILON
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              as_int_array, as_namedtuple, as_float,
+                              chunk_slices, from_range_degrees, matrix_dot,
+                              vector_dot, from_range_100, ones, to_domain_100,
+                              to_domain_degrees, tsplit, tstack, zeros)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -51,11 +54,11 @@ __status__ = 'Production'
 __all__ = [
     'CAT02_INVERSE_CAT', 'InductionFactors_CIECAM02',
     'VIEWING_CONDITIONS_CIECAM02', 'HUE_DATA_FOR_HUE_QUADRATURE',
-    'CAM_Specification_CIECAM02', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
-    'chromatic_induction_factors', 'base_exponential_non_linearity',
-    'viewing_condition_dependent_parameters', 'degree_of_adaptation',
-    'full_chromatic_adaptation_forward', 'full_chromatic_adaptation_inverse',
-    'RGB_to_rgb', 'rgb_to_RGB',
+    'CAM_Specification_CIECAM02', 'ViewingConditions_CIECAM02',
+    'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ', 'chromatic_induction_factors',
+    'base_exponential_non_linearity', 'viewing_condition_dependent_parameters',
+    'degree_of_adaptation', 'full_chromatic_adaptation_forward',
+    'full_chromatic_adaptation_inverse', 'RGB_to_rgb', 'rgb_to_RGB',
     'post_adaptation_non_linear_response_compression_forward',
     'post_adaptation_non_linear_response_compression_inverse',
     'opponent_colour_dimensions_forward', 'opponent_colour_dimensions_inverse',
@@ -170,6 +173,595 @@ CAM_Specification_CIECAM02` class.
             cls, J, C, h, s, Q, M, H, HC)
 
 
+class ViewingConditions_CIECAM02(object):
+    """
+    Defines the *CIECAM02* colour appearance model viewing conditions and
+    caches their dependent terms so that conversions sharing the same
+    reference white and surround, e.g. the frames of an image sequence, do
+    not recompute them.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white.
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Luminous factor of background :math:`Y_b` such as
+        :math:`Y_b = 100 x L_b / L_w` where :math:`L_w` is the luminance of the
+        light source and :math:`L_b` is the luminance of the background.
+    surround : InductionFactors_CIECAM02, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.XYZ_w`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.L_A`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.Y_b`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.surround`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.\
+discount_illuminant`
+    -   :attr:`~colour.appearance.ViewingConditions_CIECAM02.parameters`
+
+    Methods
+    -------
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.__init__`
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.forward`
+    -   :meth:`~colour.appearance.ViewingConditions_CIECAM02.inverse`
+
+    Notes
+    -----
+
+    +------------------------------+-----------------------+---------------+
+    | **Domain**                   | **Scale - Reference** | **Scale - 1** |
+    +==============================+=======================+===============+
+    | ``XYZ_w``                    | [0, 100]              | [0, 1]        |
+    +------------------------------+-----------------------+---------------+
+
+    -   The reference white is converted using the *Colour* domain-range scale
+        active at instantiation time.
+    -   Chunked evaluation requires uniform viewing conditions, i.e. a single
+        reference white and scalar :math:`L_A` and :math:`Y_b` values.
+
+    References
+    ----------
+    :cite:`Fairchild2004c`, :cite:`Luo2013`, :cite:`Moroneya`,
+    :cite:`Wikipedia2007a`
+
+    Examples
+    --------
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> L_A = 318.31
+    >>> Y_b = 20.0
+    >>> viewing_conditions = ViewingConditions_CIECAM02(XYZ_w, L_A, Y_b)
+    >>> specification = viewing_conditions.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CAM_Specification_CIECAM02(J=41.7310911..., C=0.1047077..., \
+h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
+H=278.0607358..., HC=None)
+    >>> viewing_conditions.inverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    _SPECIFICATION = CAM_Specification_CIECAM02
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=VIEWING_CONDITIONS_CIECAM02['Average'],
+                 discount_illuminant=False):
+        self._XYZ_w = to_domain_100(XYZ_w)
+        self._L_A = as_float_array(L_A)
+        self._Y_b = as_float_array(Y_b)
+        self._surround = surround
+        self._discount_illuminant = discount_illuminant
+
+        self._is_uniform = (self._XYZ_w.ndim == 1 and self._L_A.size == 1 and
+                            self._Y_b.size == 1)
+
+        self._parameters = self._compute_parameters()
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter property for the *CIE XYZ* tristimulus values of reference
+        white.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
+
+        return self._XYZ_w
+
+    @property
+    def L_A(self):
+        """
+        Getter property for the adapting field *luminance* :math:`L_A`.
+
+        Returns
+        -------
+        ndarray
+            Adapting field *luminance* :math:`L_A`.
+        """
+
+        return self._L_A
+
+    @property
+    def Y_b(self):
+        """
+        Getter property for the luminous factor of background :math:`Y_b`.
+
+        Returns
+        -------
+        ndarray
+            Luminous factor of background :math:`Y_b`.
+        """
+
+        return self._Y_b
+
+    @property
+    def surround(self):
+        """
+        Getter property for the surround viewing conditions induction factors.
+
+        Returns
+        -------
+        namedtuple
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter property for whether the illuminant is discounted.
+
+        Returns
+        -------
+        bool
+            Whether the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    @property
+    def parameters(self):
+        """
+        Getter property for the cached viewing conditions dependent
+        parameters.
+
+        Returns
+        -------
+        CaseInsensitiveMapping
+            Viewing conditions dependent parameters, e.g. :math:`n`,
+            :math:`F_L`, :math:`N_{bb}`, :math:`N_{cb}`, :math:`z`, :math:`D`,
+            :math:`RGB_w` and :math:`A_w`.
+        """
+
+        return self._parameters
+
+    def _compute_parameters(self):
+        """
+        Computes the viewing conditions dependent parameters.
+
+        Returns
+        -------
+        CaseInsensitiveMapping
+            Viewing conditions dependent parameters.
+        """
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        n, F_L, N_bb, N_cb, z = tsplit(
+            viewing_condition_dependent_parameters(self._Y_b, Y_w, self._L_A))
+
+        # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
+        # sharpened *RGB* values.
+        RGB_w = vector_dot(CAT_CAT02, self._XYZ_w)
+
+        # Computing degree of adaptation :math:`D`.
+        D = (degree_of_adaptation(self._surround.F, self._L_A)
+             if not self._discount_illuminant else ones(self._L_A.shape))
+
+        # Computing full chromatic adaptation.
+        RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_pw = RGB_to_rgb(RGB_wc)
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            RGB_pw, F_L)
+
+        # Computing achromatic response for the whitepoint.
+        A_w = achromatic_response_forward(RGB_aw, N_bb)
+
+        return CaseInsensitiveMapping({
+            'Y_w': Y_w,
+            'n': n,
+            'F_L': F_L,
+            'N_bb': N_bb,
+            'N_cb': N_cb,
+            'z': z,
+            'D': D,
+            'RGB_w': RGB_w,
+            'A_w': A_w,
+        })
+
+    def _adaptation_forward(self, XYZ):
+        """
+        Converts given *CIE XYZ* tristimulus values in reference scale to
+        post-adaptation non linear response compressed *RGB* values.
+
+        Parameters
+        ----------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+
+        Returns
+        -------
+        ndarray
+            Post-adaptation non linear response compressed *RGB* values.
+        """
+
+        p = self._parameters
+
+        # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
+        # sharpened *RGB* values.
+        RGB = vector_dot(CAT_CAT02, XYZ)
+
+        # Computing full chromatic adaptation.
+        RGB_c = full_chromatic_adaptation_forward(RGB, p['RGB_w'], p['Y_w'],
+                                                  p['D'])
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_p = RGB_to_rgb(RGB_c)
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_p, p['F_L'])
+
+        return RGB_a
+
+    def _adaptation_inverse(self, RGB_a):
+        """
+        Converts given post-adaptation non linear response compressed *RGB*
+        values to *CIE XYZ* tristimulus values in reference scale.
+
+        Parameters
+        ----------
+        RGB_a : ndarray
+            Post-adaptation non linear response compressed *RGB* values.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+        """
+
+        p = self._parameters
+
+        # Applying inverse post-adaptation non linear response compression.
+        RGB_p = post_adaptation_non_linear_response_compression_inverse(
+            RGB_a, p['F_L'])
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_c = rgb_to_RGB(RGB_p)
+
+        # Applying inverse full chromatic adaptation.
+        RGB = full_chromatic_adaptation_inverse(RGB_c, p['RGB_w'], p['Y_w'],
+                                                p['D'])
+
+        # Converting *CMCCAT2000* transform sharpened *RGB* values to *CIE XYZ*
+        # tristimulus values.
+        XYZ = vector_dot(CAT02_INVERSE_CAT, RGB)
+
+        return XYZ
+
+    def _forward(self, XYZ):
+        """
+        Computes the colour appearance model correlates from given *CIE XYZ*
+        tristimulus values in reference scale.
+
+        Parameters
+        ----------
+        XYZ : ndarray
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+
+        Returns
+        -------
+        tuple
+            Correlates :math:`J`, :math:`C`, :math:`h`, :math:`s`, :math:`Q`,
+            :math:`M` and :math:`H`.
+        """
+
+        p = self._parameters
+        surround = self._surround
+
+        RGB_a = self._adaptation_forward(XYZ)
+
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
+
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h)
+        # TODO: Compute hue composition.
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic responses for the stimulus.
+        A = achromatic_response_forward(RGB_a, p['N_bb'])
+
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, p['A_w'], surround.c, p['z'])
+
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = brightness_correlate(surround.c, J, p['A_w'], p['F_L'])
+
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, p['n'], surround.N_c, p['N_cb'], e_t, a, b,
+                             RGB_a)
+
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, p['F_L'])
+
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
+
+        return J, C, h, s, Q, M, H
+
+    def _inverse(self, J, C, h):
+        """
+        Converts given colour appearance model correlates in reference scale
+        to *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        J : ndarray
+            Correlate of *Lightness* :math:`J`.
+        C : ndarray
+            Correlate of *chroma* :math:`C`.
+        h : ndarray
+            *Hue* angle :math:`h` in degrees.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+        """
+
+        p = self._parameters
+        surround = self._surround
+
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_inverse(C, J, p['n'])
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = achromatic_response_inverse(p['A_w'], J, surround.c, p['z'])
+
+        # Computing *P_1* to *P_3*.
+        P_n = P(surround.N_c, p['N_cb'], e_t, t, A, p['N_bb'])
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_inverse(P_n, h))
+
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = matrix_post_adaptation_non_linear_response_compression(
+            P_2, a, b)
+
+        return self._adaptation_inverse(RGB_a)
+
+    def _assert_chunkable(self, chunk_size, out):
+        """
+        Asserts that the viewing conditions support chunked or buffered
+        evaluation.
+        """
+
+        is_chunked = chunk_size is not None or out is not None
+        if is_chunked and not self._is_uniform:
+            raise ValueError(
+                'Chunked or buffered evaluation requires uniform viewing '
+                'conditions, i.e. a single reference white and scalar "L_A" '
+                'and "Y_b" values!')
+
+    def forward(self, XYZ, chunk_size=None, dtype=None, out=None):
+        """
+        Computes the colour appearance model correlates from given *CIE XYZ*
+        tristimulus values under the viewing conditions.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus.
+        chunk_size : int, optional
+            Number of samples evaluated at once, bounding the size of the
+            intermediate arrays. If *None*, all the samples are evaluated at
+            once.
+        dtype : object, optional
+            Type of the correlates arrays, default to the type defined by the
+            :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+            Intermediate computations still happen chunk by chunk at that
+            default precision.
+        out : namedtuple, optional
+            Colour appearance model specification whose correlates arrays
+            are written in-place, correlates set to *None* are not stored.
+
+        Returns
+        -------
+        namedtuple
+            Colour appearance model specification.
+
+        Raises
+        ------
+        ValueError
+            If chunked or buffered evaluation is requested with non uniform
+            viewing conditions.
+
+        Notes
+        -----
+        -   The domain and range of that method are the same as those of the
+            matching :func:`colour.XYZ_to_CIECAM02` or
+            :func:`colour.XYZ_to_CAM16` definitions.
+        """
+
+        self._assert_chunkable(chunk_size, out)
+
+        if chunk_size is None and out is None:
+            J, C, h, s, Q, M, H = self._forward(to_domain_100(XYZ))
+
+            correlates = [
+                from_range_100(J),
+                from_range_100(C),
+                from_range_degrees(h),
+                from_range_100(s),
+                from_range_100(Q),
+                from_range_100(M),
+                from_range_degrees(H, 400),
+            ]
+
+            if dtype is not None:
+                correlates = [
+                    np.asarray(correlate, dtype) for correlate in correlates
+                ]
+
+            return self._SPECIFICATION(*correlates)
+
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
+        XYZ = np.asarray(XYZ)
+        shape = XYZ.shape[:-1]
+        XYZ = np.reshape(XYZ, (-1, 3))
+
+        if out is None:
+            out = self._SPECIFICATION(
+                *[np.empty(shape, dtype) for _ in range(7)])
+
+        out = as_namedtuple(out, self._SPECIFICATION)
+        range_scalers = (from_range_100, from_range_100, from_range_degrees,
+                         from_range_100, from_range_100, from_range_100,
+                         partial(from_range_degrees, scale_factor=400))
+
+        for chunk in chunk_slices(XYZ.shape[0], chunk_size):
+            correlates = self._forward(to_domain_100(XYZ[chunk]))
+
+            for correlate, buffer, scaler in zip(correlates, out[:7],
+                                                 range_scalers):
+                if buffer is not None:
+                    buffer.flat[chunk] = scaler(correlate)
+
+        return out
+
+    def inverse(self, specification, chunk_size=None, dtype=None, out=None):
+        """
+        Converts given colour appearance model specification to *CIE XYZ*
+        tristimulus values under the viewing conditions.
+
+        Parameters
+        ----------
+        specification : namedtuple
+            Colour appearance model specification. Correlate of *Lightness*
+            :math:`J`, correlate of *chroma* :math:`C` or correlate of
+            *colourfulness* :math:`M` and *hue* angle :math:`h` in degrees
+            must be specified, e.g. :math:`JCh` or :math:`JMh`.
+        chunk_size : int, optional
+            Number of samples evaluated at once, bounding the size of the
+            intermediate arrays. If *None*, all the samples are evaluated at
+            once.
+        dtype : object, optional
+            Type of the *CIE XYZ* tristimulus values array, default to the
+            type defined by the :attr:`colour.constant.DEFAULT_FLOAT_DTYPE`
+            attribute.
+        out : ndarray, optional
+            Array the *CIE XYZ* tristimulus values are written in-place to.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            specification or if chunked or buffered evaluation is requested
+            with non uniform viewing conditions.
+
+        Notes
+        -----
+        -   The domain and range of that method are the same as those of the
+            matching :func:`colour.CIECAM02_to_XYZ` or
+            :func:`colour.CAM16_to_XYZ` definitions.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(specification,
+                                                    self._SPECIFICATION)
+
+        if C is None and M is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "{0}" argument!'.format(
+                                 self._SPECIFICATION.__name__))
+
+        self._assert_chunkable(chunk_size, out)
+
+        F_L = self._parameters['F_L']
+
+        def correlates(chunk=Ellipsis):
+            """
+            Returns the :math:`J`, :math:`C` and :math:`h` correlates in
+            reference scale for given chunk.
+            """
+
+            J_c = to_domain_100(J[chunk])
+            h_c = to_domain_degrees(h[chunk])
+            C_c = (to_domain_100(C[chunk]) if C is not None else
+                   to_domain_100(M[chunk]) / spow(F_L, 0.25))
+
+            return J_c, C_c, h_c
+
+        if chunk_size is None and out is None:
+            J, C, h, M = [
+                np.asarray(a) if a is not None else a for a in (J, C, h, M)
+            ]
+            XYZ = from_range_100(self._inverse(*correlates()))
+
+            return XYZ if dtype is None else XYZ.astype(dtype)
+
+        if dtype is None:
+            dtype = DEFAULT_FLOAT_DTYPE
+
+        shape = np.shape(J)
+        J, C, h, M = [
+            np.reshape(np.asarray(a), -1) if a is not None else a
+            for a in (J, C, h, M)
+        ]
+
+        if out is None:
+            out = np.empty(shape + (3, ), dtype)
+
+        for chunk in chunk_slices(J.size, chunk_size):
+            out.flat[chunk.start * 3:chunk.stop * 3] = np.ravel(
+                from_range_100(self._inverse(*correlates(chunk))))
+
+        return out
+
+
 def XYZ_to_CIECAM02(XYZ,
                     XYZ_w,
                     L_A,
@@ -272,73 +864,8 @@ h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
 H=278.0607358..., HC=None)
     """
 
-    XYZ = to_domain_100(XYZ)
-    XYZ_w = to_domain_100(XYZ_w)
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = as_float_array(L_A)
-    Y_b = as_float_array(Y_b)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB = vector_dot(CAT_CAT02, XYZ)
-    RGB_w = vector_dot(CAT_CAT02, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (degree_of_adaptation(surround.F, L_A)
-         if not discount_illuminant else ones(L_A.shape))
-
-    # Computing full chromatic adaptation.
-    RGB_c = full_chromatic_adaptation_forward(RGB, RGB_w, Y_w, D)
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_p = RGB_to_rgb(RGB_c)
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_p, F_L)
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic responses for the stimulus and the whitepoint.
-    A = achromatic_response_forward(RGB_a, N_bb)
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CAM_Specification_CIECAM02(
-        from_range_100(J), from_range_100(C), from_range_degrees(h),
-        from_range_100(s), from_range_100(Q), from_range_100(M),
-        from_range_degrees(H, 400), None)
+    return ViewingConditions_CIECAM02(XYZ_w, L_A, Y_b, surround,
+                                      discount_illuminant).forward(XYZ)
 
 
 def CIECAM02_to_XYZ(specification,
@@ -459,79 +986,8 @@ def CIECAM02_to_XYZ(specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(specification,
-                                                CAM_Specification_CIECAM02)
-    J = to_domain_100(J)
-    C = to_domain_100(C) if C is not None else C
-    h = to_domain_degrees(h)
-    M = to_domain_100(M) if M is not None else M
-    L_A = as_float_array(L_A)
-    XYZ_w = to_domain_100(XYZ_w)
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    if C is None and M is not None:
-        C = M / spow(F_L, 0.25)
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CAM_Specification_CIECAM02" argument!')
-
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB_w = vector_dot(CAT_CAT02, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (degree_of_adaptation(surround.F, L_A)
-         if not discount_illuminant else ones(L_A.shape))
-
-    # Computing full chromatic adaptation.
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Computing achromatic response for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_inverse(C, J, n)
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_inverse(A_w, J, surround.c, z)
-
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
-
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_inverse(P_n, h))
-
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = matrix_post_adaptation_non_linear_response_compression(P_2, a, b)
-
-    # Applying inverse post-adaptation non linear response compression.
-    RGB_p = post_adaptation_non_linear_response_compression_inverse(RGB_a, F_L)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_c = rgb_to_RGB(RGB_p)
-
-    # Applying inverse full chromatic adaptation.
-    RGB = full_chromatic_adaptation_inverse(RGB_c, RGB_w, Y_w, D)
-
-    # Converting *CMCCAT2000* transform sharpened *RGB* values to *CIE XYZ*
-    # tristimulus values.
-    XYZ = vector_dot(CAT02_INVERSE_CAT, RGB)
-
-    return from_range_100(XYZ)
+    return ViewingConditions_CIECAM02(
+        XYZ_w, L_A, Y_b, surround, discount_illuminant).inverse(specification)
 
 
 def chromatic_induction_factors(n):
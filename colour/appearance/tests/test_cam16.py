@@ -7,11 +7,12 @@ Defines unit tests for :mod:`colour.appearance.cam16` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
-from colour.appearance import (VIEWING_CONDITIONS_CAM16,
-                               InductionFactors_CAM16, CAM_Specification_CAM16,
-                               XYZ_to_CAM16, CAM16_to_XYZ)
+from colour.appearance import (
+    VIEWING_CONDITIONS_CAM16, InductionFactors_CAM16, CAM_Specification_CAM16,
+    ViewingConditions_CAM16, XYZ_to_CAM16, CAM16_to_XYZ)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import (as_namedtuple, domain_range_scale,
                               ignore_numpy_errors, tsplit, tstack)
@@ -25,7 +26,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCAM16ColourAppearanceModelForward',
-    'TestCAM16ColourAppearanceModelInverse'
+    'TestCAM16ColourAppearanceModelInverse', 'TestViewingConditions_CAM16'
 ]
 
 
@@ -299,3 +300,92 @@ class TestCAM16ColourAppearanceModelInverse(ColourAppearanceModelTest):
             surround = InductionFactors_CAM16(case[0], case[0], case[0])
             CAM16_to_XYZ(
                 CAM_Specification_CAM16(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestViewingConditions_CAM16(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.cam16.ViewingConditions_CAM16` class
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._XYZ_w = np.array([95.05, 100.00, 108.88])
+        self._L_A = 318.31
+        self._Y_b = 20.0
+        self._viewing_conditions = ViewingConditions_CAM16(
+            self._XYZ_w, self._L_A, self._Y_b)
+
+        self._XYZ = np.reshape(
+            np.random.RandomState(4).uniform(1, 100, (7 * 5 * 3, )), (7, 5, 3))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.cam16.ViewingConditions_CAM16.forward`
+        method.
+        """
+
+        specification = XYZ_to_CAM16(self._XYZ, self._XYZ_w, self._L_A,
+                                     self._Y_b)
+
+        np.testing.assert_almost_equal(
+            self._viewing_conditions.forward(self._XYZ)[:-1],
+            specification[:-1],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self._viewing_conditions.forward(self._XYZ, chunk_size=4)[:-1],
+            specification[:-1],
+            decimal=7)
+
+        specification_f = self._viewing_conditions.forward(
+            self._XYZ, chunk_size=8, dtype=np.float32)
+        self.assertEqual(specification_f.J.dtype, np.float32)
+        np.testing.assert_allclose(
+            specification_f[:-1], specification[:-1], rtol=1e-5)
+
+        J = np.zeros(self._XYZ.shape[:-1])
+        out = CAM_Specification_CAM16(J=J)
+        self._viewing_conditions.forward(self._XYZ, chunk_size=3, out=out)
+        np.testing.assert_almost_equal(J, specification.J, decimal=7)
+
+    def test_inverse(self):
+        """
+        Tests :meth:`colour.appearance.cam16.ViewingConditions_CAM16.inverse`
+        method.
+        """
+
+        specification = XYZ_to_CAM16(self._XYZ, self._XYZ_w, self._L_A,
+                                     self._Y_b)
+        specification = CAM_Specification_CAM16(
+            J=specification.J, C=specification.C, h=specification.h)
+
+        np.testing.assert_almost_equal(
+            self._viewing_conditions.inverse(specification),
+            self._XYZ,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self._viewing_conditions.inverse(specification, chunk_size=4),
+            self._XYZ,
+            decimal=7)
+
+        out = np.zeros(self._XYZ.shape, np.float32)
+        self._viewing_conditions.inverse(specification, chunk_size=6, out=out)
+        np.testing.assert_allclose(out, self._XYZ, rtol=1e-5)
+
+    def test_raise_exception_chunked_evaluation(self):
+        """
+        Tests :class:`colour.appearance.cam16.ViewingConditions_CAM16` class
+        chunked evaluation raised exception.
+        """
+
+        viewing_conditions = ViewingConditions_CAM16(
+            np.tile(self._XYZ_w, (2, 1)), np.array([self._L_A, self._L_A]),
+            np.array([self._Y_b, self._Y_b]))
+
+        self.assertRaises(
+            ValueError, viewing_conditions.forward, self._XYZ, chunk_size=4)
@@ -7,11 +7,13 @@ Defines unit tests for :mod:`colour.appearance.ciecam02` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import (
     VIEWING_CONDITIONS_CIECAM02, InductionFactors_CIECAM02,
-    CAM_Specification_CIECAM02, XYZ_to_CIECAM02, CIECAM02_to_XYZ)
+    CAM_Specification_CIECAM02, ViewingConditions_CIECAM02, XYZ_to_CIECAM02,
+    CIECAM02_to_XYZ)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import (as_namedtuple, domain_range_scale,
                               ignore_numpy_errors, tsplit, tstack)
@@ -25,7 +27,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCIECAM02ColourAppearanceModelForward',
-    'TestCIECAM02ColourAppearanceModelInverse'
+    'TestCIECAM02ColourAppearanceModelInverse',
+    'TestViewingConditions_CIECAM02'
 ]
 
 
@@ -295,3 +298,92 @@ class TestCIECAM02ColourAppearanceModelInverse(ColourAppearanceModelTest):
             surround = InductionFactors_CIECAM02(case[0], case[0], case[0])
             CIECAM02_to_XYZ(
                 CAM_Specification_CIECAM02(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestViewingConditions_CIECAM02(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.ciecam02.ViewingConditions_CIECAM02`
+    class unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._XYZ_w = np.array([95.05, 100.00, 108.88])
+        self._L_A = 318.31
+        self._Y_b = 20.0
+        self._viewing_conditions = ViewingConditions_CIECAM02(
+            self._XYZ_w, self._L_A, self._Y_b)
+
+        self._XYZ = np.reshape(
+            np.random.RandomState(4).uniform(1, 100, (7 * 5 * 3, )), (7, 5, 3))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.\
+ViewingConditions_CIECAM02.forward` method.
+        """
+
+        specification = XYZ_to_CIECAM02(self._XYZ, self._XYZ_w, self._L_A,
+                                        self._Y_b)
+
+        np.testing.assert_almost_equal(
+            self._viewing_conditions.forward(self._XYZ)[:-1],
+            specification[:-1],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self._viewing_conditions.forward(self._XYZ, chunk_size=4)[:-1],
+            specification[:-1],
+            decimal=7)
+
+        specification_f = self._viewing_conditions.forward(
+            self._XYZ, chunk_size=8, dtype=np.float32)
+        self.assertEqual(specification_f.J.dtype, np.float32)
+        np.testing.assert_allclose(
+            specification_f[:-1], specification[:-1], rtol=1e-5)
+
+        J = np.zeros(self._XYZ.shape[:-1])
+        out = CAM_Specification_CIECAM02(J=J)
+        self._viewing_conditions.forward(self._XYZ, chunk_size=3, out=out)
+        np.testing.assert_almost_equal(J, specification.J, decimal=7)
+
+    def test_inverse(self):
+        """
+        Tests :meth:`colour.appearance.ciecam02.\
+ViewingConditions_CIECAM02.inverse` method.
+        """
+
+        specification = XYZ_to_CIECAM02(self._XYZ, self._XYZ_w, self._L_A,
+                                        self._Y_b)
+        specification = CAM_Specification_CIECAM02(
+            J=specification.J, C=specification.C, h=specification.h)
+
+        np.testing.assert_almost_equal(
+            self._viewing_conditions.inverse(specification),
+            self._XYZ,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            self._viewing_conditions.inverse(specification, chunk_size=4),
+            self._XYZ,
+            decimal=7)
+
+        out = np.zeros(self._XYZ.shape, np.float32)
+        self._viewing_conditions.inverse(specification, chunk_size=6, out=out)
+        np.testing.assert_allclose(out, self._XYZ, rtol=1e-5)
+
+    def test_raise_exception_chunked_evaluation(self):
+        """
+        Tests :class:`colour.appearance.ciecam02.ViewingConditions_CIECAM02`
+        class chunked evaluation raised exception.
+        """
+
+        viewing_conditions = ViewingConditions_CIECAM02(
+            np.tile(self._XYZ_w, (2, 1)), np.array([self._L_A, self._L_A]),
+            np.array([self._Y_b, self._Y_b]))
+
+        self.assertRaises(
+            ValueError, viewing_conditions.forward, self._XYZ, chunk_size=4)
@@ -16,7 +16,7 @@ from .aces_it import (
     generate_illuminants_rawtoaces_v1, white_balance_multipliers,
     best_illuminant, normalise_illuminant, training_data_sds_to_RGB,
     training_data_sds_to_XYZ, optimisation_factory_rawtoaces_v1,
-    optimisation_factory_JzAzBz, matrix_idt)
+    optimisation_factory_JzAzBz, matrix_idt, matrices_idt)
 from .correction import (
     matrix_augmented_Cheung2004, polynomial_expansion_Finlayson2015,
     polynomial_expansion_Vandermonde, POLYNOMIAL_EXPANSION_METHODS,
@@ -25,7 +25,7 @@ from .correction import (
     matrix_colour_correction_Vandermonde, MATRIX_COLOUR_CORRECTION_METHODS,
     matrix_colour_correction, colour_correction_Cheung2004,
     colour_correction_Finlayson2015, colour_correction_Vandermonde,
-    COLOUR_CORRECTION_METHODS, colour_correction)
+    COLOUR_CORRECTION_METHODS, colour_correction, ColourCorrectionModel)
 
 __all__ = ['RGB_CameraSensitivities']
 __all__ += ['RGB_DisplayPrimaries']
@@ -35,7 +35,7 @@ __all__ += [
     'generate_illuminants_rawtoaces_v1', 'white_balance_multipliers',
     'best_illuminant', 'normalise_illuminant', 'training_data_sds_to_RGB',
     'training_data_sds_to_XYZ', 'optimisation_factory_rawtoaces_v1',
-    'optimisation_factory_JzAzBz', 'matrix_idt'
+    'optimisation_factory_JzAzBz', 'matrix_idt', 'matrices_idt'
 ]
 __all__ += [
     'matrix_augmented_Cheung2004', 'polynomial_expansion_Finlayson2015',
@@ -45,7 +45,7 @@ __all__ += [
     'matrix_colour_correction_Vandermonde', 'MATRIX_COLOUR_CORRECTION_METHODS',
     'matrix_colour_correction', 'colour_correction_Cheung2004',
     'colour_correction_Finlayson2015', 'colour_correction_Vandermonde',
-    'COLOUR_CORRECTION_METHODS', 'colour_correction'
+    'COLOUR_CORRECTION_METHODS', 'colour_correction', 'ColourCorrectionModel'
 ]
 
 
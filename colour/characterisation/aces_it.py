@@ -16,6 +16,7 @@ Defines the *Academy Color Encoding System* (ACES) *Input Transform* utilities:
 -   :func:`colour.characterisation.optimisation_factory_rawtoaces_v1`
 -   :func:`colour.characterisation.optimisation_factory_JzAzBz`
 -   :func:`colour.matrix_idt`
+-   :func:`colour.characterisation.matrices_idt`
 
 References
 ----------
@@ -54,7 +55,7 @@ import os
 from scipy.optimize import minimize
 
 from colour.adaptation import matrix_chromatic_adaptation_VonKries
-from colour.algebra import euclidean_distance
+from colour.algebra import euclidean_distance, spow
 from colour.colorimetry import (
     MSDS_CMFS, SDS_ILLUMINANTS, SpectralShape, sds_and_msds_to_msds,
     sd_CIE_illuminant_D_series, sd_blackbody, sd_to_XYZ)
@@ -62,12 +63,16 @@ from colour.constants import DEFAULT_INT_DTYPE
 from colour.characterisation import MSDS_ACES_RICD
 from colour.io import read_sds_from_csv_file
 from colour.models import XYZ_to_JzAzBz, XYZ_to_Lab, XYZ_to_xy, xy_to_XYZ
+from colour.models.jzazbz import (
+    CONSTANTS_JZAZBZ, MATRIX_JZAZBZ_LMS_P_TO_IZAZBZ, MATRIX_JZAZBZ_XYZ_TO_LMS)
 from colour.models.rgb import (RGB_COLOURSPACE_ACES2065_1, RGB_to_XYZ,
                                XYZ_to_RGB, normalised_primary_matrix)
+from colour.models.rgb.transfer_functions import eotf_inverse_ST2084
 from colour.temperature import CCT_to_xy_CIE_D
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              vector_dot, from_range_1, runtime_warning,
-                              tsplit, suppress_warnings)
+                              domain_range_scale, vector_dot, from_range_1,
+                              runtime_warning, multiprocessing_pool, tsplit,
+                              tstack, suppress_warnings)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -83,7 +88,7 @@ __all__ = [
     'generate_illuminants_rawtoaces_v1', 'white_balance_multipliers',
     'best_illuminant', 'normalise_illuminant', 'training_data_sds_to_RGB',
     'training_data_sds_to_XYZ', 'optimisation_factory_rawtoaces_v1',
-    'optimisation_factory_JzAzBz', 'matrix_idt'
+    'optimisation_factory_JzAzBz', 'matrix_idt', 'matrices_idt'
 ]
 
 FLARE_PERCENTAGE = 0.00500
@@ -264,6 +269,28 @@ def read_training_data_rawtoaces_v1():
     return training_data
 
 
+_TRAINING_DATA_RAWTOACES_V1_ALIGNED = {}
+
+
+def _training_data_rawtoaces_v1(shape):
+    """
+    Returns the *RAW to ACES* v1 190 patches aligned to given spectral shape,
+    the aligned patches are cached per spectral shape.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+
+    training_data = _TRAINING_DATA_RAWTOACES_V1_ALIGNED.get(key)
+    if training_data is None:
+        training_data = read_training_data_rawtoaces_v1()
+        if training_data.shape != shape:
+            training_data = training_data.copy().align(shape)
+
+        _TRAINING_DATA_RAWTOACES_V1_ALIGNED[key] = training_data
+
+    return training_data
+
+
 _ILLUMINANTS_RAWTOACES_V1 = None
 
 
@@ -405,6 +432,11 @@ def best_illuminant(RGB_w, sensitivities, illuminants):
     SpectralDistribution
         Best illuminant.
 
+    Notes
+    -----
+    -   The white balance multipliers of the illuminants are computed at once
+        with a single matrix product.
+
     Examples
     --------
     >>> path = os.path.join(
@@ -423,16 +455,24 @@ def best_illuminant(RGB_w, sensitivities, illuminants):
 
     RGB_w = as_float_array(RGB_w)
 
-    sse = np.inf
-    illuminant_b = None
-    for illuminant in illuminants.values():
-        RGB_wi = white_balance_multipliers(sensitivities, illuminant)
-        sse_c = np.sum((RGB_wi / RGB_w - 1) ** 2)
-        if sse_c < sse:
-            sse = sse_c
-            illuminant_b = illuminant
+    illuminants = list(illuminants.values())
+
+    shape = sensitivities.shape
+    values = []
+    for illuminant in illuminants:
+        if illuminant.shape != shape:
+            runtime_warning('Aligning "{0}" illuminant shape to "{1}".'.format(
+                illuminant.name, shape))
+            illuminant = illuminant.copy().align(shape)
 
-    return illuminant_b
+        values.append(illuminant.values)
+
+    RGB_wi = 1 / np.dot(values, sensitivities.values)
+    RGB_wi *= 1 / np.min(RGB_wi, axis=-1)[..., np.newaxis]
+
+    sse = np.sum((RGB_wi / RGB_w - 1) ** 2, axis=-1)
+
+    return illuminants[np.argmin(sse)]
 
 
 def normalise_illuminant(illuminant, sensitivities):
@@ -610,6 +650,104 @@ def training_data_sds_to_XYZ(training_data, cmfs, illuminant):
     return XYZ
 
 
+def _jacobian_matrix_idt(G, RGB):
+    """
+    Returns the jacobian of an objective function with respect to the
+    flattened *Input Device Transform* (IDT) matrix :math:`M` given the
+    gradients :math:`G` of the objective function with respect to the
+    training data *CIE XYZ* tristimulus values
+    :math:`XYZ_t = M_{ACES} \\cdot M \\cdot RGB`.
+    """
+
+    return np.ravel(
+        np.dot(
+            np.transpose(RGB_COLOURSPACE_ACES2065_1.matrix_RGB_to_XYZ),
+            np.dot(np.transpose(G), RGB)))
+
+
+def _jacobian_rawtoaces_v1(M, RGB, Lab):
+    """
+    Returns the analytical jacobian of the objective function according to
+    *RAW to ACES* v1.
+    """
+
+    M = np.reshape(M, [3, 3])
+
+    XYZ_t = vector_dot(RGB_COLOURSPACE_ACES2065_1.matrix_RGB_to_XYZ,
+                       vector_dot(M, RGB))
+    Lab_t = XYZ_to_Lab(XYZ_t, RGB_COLOURSPACE_ACES2065_1.whitepoint)
+
+    distance = np.linalg.norm(Lab_t - Lab)
+    if distance == 0:
+        return np.zeros(9)
+
+    G_L, G_a, G_b = tsplit((Lab_t - Lab) / distance)
+
+    XYZ_n = xy_to_XYZ(RGB_COLOURSPACE_ACES2065_1.whitepoint)
+    XYZ_XYZ_n = XYZ_t / XYZ_n
+    d_f_X, d_f_Y, d_f_Z = tsplit(
+        np.where(XYZ_XYZ_n > (24 / 116) ** 3,
+                 spow(XYZ_XYZ_n, -2 / 3) / 3, 841 / 108) / XYZ_n)
+
+    G = tstack([
+        500 * G_a * d_f_X,
+        (116 * G_L - 500 * G_a + 200 * G_b) * d_f_Y,
+        -200 * G_b * d_f_Z,
+    ])
+
+    return _jacobian_matrix_idt(G, RGB)
+
+
+def _jacobian_JzAzBz(M, RGB, Jab):
+    """
+    Returns the analytical jacobian of the :math:`J_zA_zB_z` colourspace
+    based objective function.
+    """
+
+    M = np.reshape(M, [3, 3])
+
+    XYZ_t = vector_dot(RGB_COLOURSPACE_ACES2065_1.matrix_RGB_to_XYZ,
+                       vector_dot(M, RGB))
+
+    constants = CONSTANTS_JZAZBZ
+    M_XYZ_to_XYZ_p = np.array([
+        [constants.b, 0, 1 - constants.b],
+        [1 - constants.g, constants.g, 0],
+        [0, 0, 1],
+    ])
+
+    LMS = vector_dot(np.dot(MATRIX_JZAZBZ_XYZ_TO_LMS, M_XYZ_to_XYZ_p), XYZ_t)
+
+    with domain_range_scale('ignore'):
+        LMS_p = eotf_inverse_ST2084(LMS, 10000, constants)
+
+    I_z = vector_dot(MATRIX_JZAZBZ_LMS_P_TO_IZAZBZ, LMS_p)[..., 0]
+
+    Jab_t = XYZ_to_JzAzBz(XYZ_t)
+    distance = np.linalg.norm(Jab_t - Jab, axis=-1)[..., np.newaxis]
+    G = np.where(distance == 0, 0,
+                 (Jab_t - Jab) / np.where(distance == 0, 1, distance))
+
+    G[..., 0] *= (1 + constants.d) / (1 + constants.d * I_z) ** 2
+    G = np.dot(G, MATRIX_JZAZBZ_LMS_P_TO_IZAZBZ)
+
+    L_p = 10000
+    Y_p = spow(LMS / L_p, constants.m_1)
+    N_b = (constants.c_1 + constants.c_2 * Y_p) / (constants.c_3 * Y_p + 1)
+    with np.errstate(divide='ignore'):
+        d_Y_p = (constants.m_1 / L_p) * np.abs(
+            LMS / L_p) ** (constants.m_1 - 1)
+    d_N = np.where(
+        LMS == 0, 0,
+        constants.m_2 * np.abs(N_b) **
+        (constants.m_2 - 1) * (constants.c_2 - constants.c_1 * constants.c_3) /
+        (constants.c_3 * Y_p + 1) ** 2 * d_Y_p)
+
+    G = np.dot(G * d_N, np.dot(MATRIX_JZAZBZ_XYZ_TO_LMS, M_XYZ_to_XYZ_p))
+
+    return _jacobian_matrix_idt(G, RGB)
+
+
 def optimisation_factory_rawtoaces_v1():
     """
     Factory that returns the objective function and *CIE XYZ* colourspace to
@@ -626,6 +764,11 @@ def optimisation_factory_rawtoaces_v1():
         Objective function and *CIE XYZ* colourspace to *CIE L\\*a\\*b\\**
         colourspace function.
 
+    Notes
+    -----
+    -   The analytical jacobian of the objective function is available as
+        the ``jacobian`` attribute of the factory.
+
     Examples
     --------
     >>> # Doctests skip for Python 2.x compatibility.
@@ -659,6 +802,9 @@ def optimisation_factory_rawtoaces_v1():
     return objective_function, XYZ_to_optimization_colour_model
 
 
+optimisation_factory_rawtoaces_v1.jacobian = _jacobian_rawtoaces_v1
+
+
 def optimisation_factory_JzAzBz():
     """
     Factory that returns the objective function and *CIE XYZ* colourspace to
@@ -675,6 +821,11 @@ def optimisation_factory_JzAzBz():
         Objective function and *CIE XYZ* colourspace to :math:`J_zA_zB_z`
         colourspace function.
 
+    Notes
+    -----
+    -   The analytical jacobian of the objective function is available as
+        the ``jacobian`` attribute of the factory.
+
     Examples
     --------
     >>> # Doctests skip for Python 2.x compatibility.
@@ -708,6 +859,9 @@ def optimisation_factory_JzAzBz():
     return objective_function, XYZ_to_optimization_colour_model
 
 
+optimisation_factory_JzAzBz.jacobian = _jacobian_JzAzBz
+
+
 def matrix_idt(sensitivities,
                illuminant,
                training_data=None,
@@ -734,7 +888,8 @@ def matrix_idt(sensitivities,
         Standard observer colour matching functions.
     optimisation_factory : callable, optional
         Callable producing the objective function and the *CIE XYZ* to
-        optimisation colour model function.
+        optimisation colour model function, its optional ``jacobian``
+        attribute being the analytical jacobian of the objective function.
     optimisation_kwargs : dict_like, optional
         Parameters for :func:`scipy.optimize.minimize` definition.
 
@@ -743,6 +898,13 @@ def matrix_idt(sensitivities,
     ndarray
         *Input Device Transform* (IDT) matrix.
 
+    Notes
+    -----
+    -   The analytical jacobian of the objective function is used by the
+        optimisation when provided by the optimisation factory ``jacobian``
+        attribute, the *RAW to ACES* v1 190 patches are aligned once per
+        spectral shape.
+
     References
     ----------
     :cite:`Dyer2017`, :cite:`TheAcademyofMotionPictureArtsandSciences2015c`
@@ -780,8 +942,108 @@ def matrix_idt(sensitivities,
            [ 0.023, -0.225,  1.196]])
     """
 
-    if training_data is None:
-        training_data = read_training_data_rawtoaces_v1()
+    sensitivities, training_data = _align_matrix_idt_data(
+        sensitivities, training_data, cmfs)
+
+    return _matrix_idt(sensitivities, illuminant, training_data, cmfs,
+                       optimisation_factory, optimisation_kwargs)
+
+
+def matrices_idt(sensitivities,
+                 illuminants,
+                 training_data=None,
+                 cmfs=MSDS_CMFS['CIE 1931 2 Degree Standard Observer'].copy()
+                 .align(SPECTRAL_SHAPE_RAWTOACES),
+                 optimisation_factory=optimisation_factory_rawtoaces_v1,
+                 optimisation_kwargs=None,
+                 workers=None):
+    """
+    Computes the *Input Device Transform* (IDT) matrices for given camera
+    *RGB* spectral sensitivities and series of illuminants, training data,
+    standard observer colour matching functions and optimization settings
+    according to *RAW to ACES* v1 and *P-2013-001* procedures.
+
+    Parameters
+    ----------
+    sensitivities : RGB_CameraSensitivities
+         Camera *RGB* spectral sensitivities.
+    illuminants : dict_like
+        Illuminant spectral distributions to compute the *Input Device
+        Transform* (IDT) matrices for.
+    training_data : MultiSpectralDistributions, optional
+        Training data multi-spectral distributions, defaults to using the
+        *RAW to ACES* v1 190 patches.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    optimisation_factory : callable, optional
+        Callable producing the objective function and the *CIE XYZ* to
+        optimisation colour model function, its optional ``jacobian``
+        attribute being the analytical jacobian of the objective function.
+    optimisation_kwargs : dict_like, optional
+        Parameters for :func:`scipy.optimize.minimize` definition.
+    workers : int, optional
+        Number of processes computing the matrices, if *None*, the matrices
+        are computed sequentially.
+
+    Returns
+    -------
+    ndarray
+        *Input Device Transform* (IDT) matrices with shape (n, 3, 3) in the
+        illuminants iteration order.
+
+    Notes
+    -----
+    -   The sensitivities and training data are aligned once for the whole
+        series of illuminants.
+
+    References
+    ----------
+    :cite:`Dyer2017`, :cite:`TheAcademyofMotionPictureArtsandSciences2015c`
+
+    Examples
+    --------
+    >>> path = os.path.join(
+    ...     RESOURCES_DIRECTORY_RAWTOACES,
+    ...     'CANON_EOS_5DMark_II_RGB_Sensitivities.csv')
+    >>> sensitivities = sds_and_msds_to_msds(
+    ...     read_sds_from_csv_file(path).values())
+    >>> illuminants = CaseInsensitiveMapping({
+    ...     'D55': SDS_ILLUMINANTS['D55'],
+    ...     'iso7589': generate_illuminants_rawtoaces_v1()['iso7589']
+    ... })
+    >>> # Doctests skip for Python 2.x compatibility.
+    >>> np.around(matrices_idt(sensitivities, illuminants), 3)
+    ... # doctest: +SKIP
+    array([[[ 0.85 , -0.016,  0.151],
+            [ 0.051,  1.126, -0.185],
+            [ 0.02 , -0.194,  1.162]],
+    <BLANKLINE>
+           [[ 0.859, -0.044,  0.16 ],
+            [ 0.01 ,  1.088, -0.114],
+            [-0.023, -0.18 ,  1.159]]])
+    """
+
+    sensitivities, training_data = _align_matrix_idt_data(
+        sensitivities, training_data, cmfs)
+
+    arguments = [(sensitivities, illuminant, training_data, cmfs,
+                  optimisation_factory, optimisation_kwargs)
+                 for illuminant in illuminants.values()]
+
+    if workers is None:
+        matrices = [_wrapper_matrix_idt(argument) for argument in arguments]
+    else:
+        with multiprocessing_pool(workers) as pool:
+            matrices = pool.map(_wrapper_matrix_idt, arguments)
+
+    return np.reshape(matrices, [-1, 3, 3])
+
+
+def _align_matrix_idt_data(sensitivities, training_data, cmfs):
+    """
+    Aligns given camera *RGB* spectral sensitivities and training data to
+    given standard observer colour matching functions shape.
+    """
 
     shape = cmfs.shape
     if sensitivities.shape != shape:
@@ -789,16 +1051,47 @@ def matrix_idt(sensitivities,
             sensitivities.name, shape))
         sensitivities = sensitivities.copy().align(shape)
 
+    if training_data is None:
+        training_data = _training_data_rawtoaces_v1(shape)
+    elif training_data.shape != shape:
+        runtime_warning('Aligning "{0}" training data shape to "{1}".'.format(
+            training_data.name, shape))
+        training_data = training_data.copy().align(shape)
+
+    return sensitivities, training_data
+
+
+def _wrapper_matrix_idt(arguments):
+    """
+    Convenient wrapper to be able to call
+    :func:`colour.characterisation.aces_it._matrix_idt` definition with
+    multiple arguments.
+    """
+
+    (sensitivities, illuminant, training_data, cmfs, optimisation_factory,
+     optimisation_kwargs) = arguments
+
+    return _matrix_idt(sensitivities, illuminant, training_data, cmfs,
+                       optimisation_factory, optimisation_kwargs)
+
+
+def _matrix_idt(sensitivities, illuminant, training_data, cmfs,
+                optimisation_factory, optimisation_kwargs):
+    """
+    Computes an *Input Device Transform* (IDT) matrix for given camera *RGB*
+    spectral sensitivities and training data aligned to given standard
+    observer colour matching functions shape.
+
+    The optimisation factory is called here so that its functions, which
+    cannot be pickled, are created in the worker processes.
+    """
+
+    shape = cmfs.shape
     if illuminant.shape != shape:
         runtime_warning('Aligning "{0}" illuminant shape to "{1}".'.format(
             illuminant.name, shape))
         illuminant = illuminant.copy().align(shape)
 
-    if training_data.shape != shape:
-        runtime_warning('Aligning "{0}" training data shape to "{1}".'.format(
-            training_data.name, shape))
-        training_data = training_data.copy().align(shape)
-
     illuminant = normalise_illuminant(illuminant, sensitivities)
 
     RGB = training_data_sds_to_RGB(training_data, sensitivities, illuminant)
@@ -808,7 +1101,7 @@ def matrix_idt(sensitivities,
         optimisation_factory())
     optimisation_settings = {
         'method': 'BFGS',
-        'jac': '2-point',
+        'jac': getattr(optimisation_factory, 'jacobian', '2-point'),
     }
     if optimisation_kwargs is not None:
         optimisation_settings.update(optimisation_kwargs)
@@ -39,6 +39,8 @@ Defines various objects for colour correction, like colour matching two images:
 -   :func:`colour.colour_correction`: Colour correction of given *RGB*
     colourspace array using the colour correction matrix from given
     :math:`M_T` colour array to :math:`M_R` colour array.
+-   :class:`colour.characterisation.ColourCorrectionModel`: Colour correction
+    model fitted once and applied to any number of *RGB* colourspace arrays.
 
 References
 ----------
@@ -62,8 +64,10 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.algebra import least_square_mapping_MoorePenrose, spow
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.utilities import (CaseInsensitiveMapping, as_float_array, as_int,
-                              closest, filter_kwargs, ones, tsplit, tstack)
+                              chunk_slices, closest, filter_kwargs, ones,
+                              tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -80,7 +84,7 @@ __all__ = [
     'matrix_colour_correction_Vandermonde', 'MATRIX_COLOUR_CORRECTION_METHODS',
     'matrix_colour_correction', 'colour_correction_Cheung2004',
     'colour_correction_Finlayson2015', 'colour_correction_Vandermonde',
-    'COLOUR_CORRECTION_METHODS', 'colour_correction'
+    'COLOUR_CORRECTION_METHODS', 'colour_correction', 'ColourCorrectionModel'
 ]
 
 
@@ -1122,3 +1126,266 @@ def colour_correction(RGB, M_T, M_R, method='Cheung 2004', **kwargs):
     function = COLOUR_CORRECTION_METHODS[method]
 
     return function(RGB, M_T, M_R, **filter_kwargs(function, **kwargs))
+
+
+class ColourCorrectionModel(object):
+    """
+    Defines a colour correction model whose colour correction matrix is fitted
+    once from given :math:`M_T` colour array to :math:`M_R` colour array and
+    then applied to any number of *RGB* colourspace arrays.
+
+    Parameters
+    ----------
+    method : unicode, optional
+        **{'Cheung 2004', 'Finlayson 2015', 'Vandermonde'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    degree : int
+        {:func:`colour.characterisation.polynomial_expansion_Finlayson2015`,
+        :func:`colour.characterisation.polynomial_expansion_Vandermonde`},
+        Expanded polynomial degree, must be one of *[1, 2, 3, 4]* for
+        :func:`colour.characterisation.polynomial_expansion_Finlayson2015`
+        definition.
+    terms : int
+        {:func:`colour.characterisation.matrix_augmented_Cheung2004`},
+        Number of terms of the expanded polynomial, must be one of
+        *[3, 5, 7, 8, 10, 11, 14, 16, 17, 19, 20, 22]*.
+    root_polynomial_expansion : bool
+        {:func:`colour.characterisation.polynomial_expansion_Finlayson2015`},
+        Whether to use the root-polynomials set for the expansion.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.characterisation.ColourCorrectionModel.method`
+    -   :attr:`~colour.characterisation.ColourCorrectionModel.matrix`
+
+    Methods
+    -------
+    -   :meth:`~colour.characterisation.ColourCorrectionModel.__init__`
+    -   :meth:`~colour.characterisation.ColourCorrectionModel.expand`
+    -   :meth:`~colour.characterisation.ColourCorrectionModel.fit`
+    -   :meth:`~colour.characterisation.ColourCorrectionModel.apply`
+
+    References
+    ----------
+    :cite:`Cheung2004`, :cite:`Finlayson2015`, :cite:`Westland2004`,
+    :cite:`Wikipedia2003e`
+
+    Examples
+    --------
+    >>> RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+    >>> prng = np.random.RandomState(2)
+    >>> M_T = prng.random_sample((24, 3))
+    >>> M_R = M_T + (prng.random_sample((24, 3)) - 0.5) * 0.5
+    >>> model = ColourCorrectionModel().fit(M_T, M_R)
+    >>> model.apply(RGB)  # doctest: +ELLIPSIS
+    array([ 0.1793456...,  0.1003392...,  0.0617218...])
+    """
+
+    def __init__(self, method='Cheung 2004', **kwargs):
+        assert method in POLYNOMIAL_EXPANSION_METHODS, (
+            '"{0}" method is not supported, it must be one of {1}!'.format(
+                method, list(POLYNOMIAL_EXPANSION_METHODS.keys())))
+
+        self._method = method
+        self._kwargs = kwargs
+        self._matrix = None
+
+    @property
+    def method(self):
+        """
+        Getter property for the colour correction method.
+
+        Returns
+        -------
+        unicode
+            Colour correction method.
+        """
+
+        return self._method
+
+    @property
+    def matrix(self):
+        """
+        Getter property for the fitted colour correction matrix.
+
+        Returns
+        -------
+        ndarray
+            Colour correction matrix, *None* if the model has not been fitted.
+        """
+
+        return self._matrix
+
+    def expand(self, a):
+        """
+        Performs the polynomial expansion of given :math:`a` array using the
+        model method.
+
+        Parameters
+        ----------
+        a : array_like, (n, 3)
+            :math:`a` array to expand.
+
+        Returns
+        -------
+        ndarray, (n, t)
+            Expanded :math:`a` array.
+        """
+
+        function = POLYNOMIAL_EXPANSION_METHODS[self._method]
+
+        return np.reshape(
+            function(
+                np.reshape(a, (-1, 3)),
+                **filter_kwargs(function, **self._kwargs)),
+            (np.size(a) // 3, -1))
+
+    def fit(self, M_T, M_R, weights=None, regularisation=0):
+        """
+        Fits the colour correction matrix from given :math:`M_T` colour array
+        to :math:`M_R` colour array.
+
+        Parameters
+        ----------
+        M_T : array_like, (n, 3)
+            Test array :math:`M_T` to fit onto array :math:`M_R`.
+        M_R : array_like, (n, 3)
+            Reference array the array :math:`M_T` will be colour fitted
+            against.
+        weights : array_like, (n, ), optional
+            Weights of the :math:`M_T` and :math:`M_R` colour pairs.
+        regularisation : numeric, optional
+            *Tikhonov* regularisation factor :math:`\\lambda` penalising the
+            colour correction matrix norm.
+
+        Returns
+        -------
+        ColourCorrectionModel
+            Fitted colour correction model.
+
+        Notes
+        -----
+        -   The weighted and regularised least squares problem is solved by
+            augmenting the expanded :math:`M_T` array with
+            :math:`\\sqrt{\\lambda}I` rows, with the default arguments, the
+            fitted matrix is the one returned by
+            :func:`colour.matrix_colour_correction` definition.
+
+        Examples
+        --------
+        >>> prng = np.random.RandomState(2)
+        >>> M_T = prng.random_sample((24, 3))
+        >>> M_R = M_T + (prng.random_sample((24, 3)) - 0.5) * 0.5
+        >>> ColourCorrectionModel().fit(M_T, M_R).matrix
+        ... # doctest: +ELLIPSIS
+        array([[ 1.0526376...,  0.1378078..., -0.2276339...],
+               [ 0.0739584...,  1.0293994..., -0.1060115...],
+               [ 0.0572550..., -0.2052633...,  1.1015194...]])
+        """
+
+        M_T_e = self.expand(as_float_array(M_T))
+        M_R = np.reshape(as_float_array(M_R), (-1, 3))
+
+        if weights is not None:
+            weights = np.sqrt(np.reshape(as_float_array(weights), (-1, 1)))
+            M_T_e = M_T_e * weights
+            M_R = M_R * weights
+
+        if regularisation:
+            terms = M_T_e.shape[-1]
+            M_T_e = np.vstack(
+                [M_T_e, np.sqrt(regularisation) * np.identity(terms)])
+            M_R = np.vstack([M_R, np.zeros((terms, 3))])
+
+        self._matrix = least_square_mapping_MoorePenrose(M_T_e, M_R)
+
+        return self
+
+    def apply(self, RGB, chunk_size=2 ** 18, dtype=None, out=None):
+        """
+        Performs colour correction of given *RGB* colourspace array using the
+        fitted colour correction matrix.
+
+        Parameters
+        ----------
+        RGB : array_like, (n, 3)
+            *RGB* colourspace array to colour correct.
+        chunk_size : int, optional
+            Number of colours expanded and corrected at once, bounding the size
+            of the expanded array.
+        dtype : object, optional
+            Type of the colour corrected *RGB* colourspace array, ignored if
+            ``out`` is given.
+        out : ndarray, optional
+            Array the colour corrected *RGB* colourspace array is written to,
+            allowing to reuse it across a sequence of images.
+
+        Returns
+        -------
+        ndarray
+            Colour corrected *RGB* colourspace array.
+
+        Raises
+        ------
+        RuntimeError
+            If the model has not been fitted.
+        ValueError
+            If ``out`` is not a *C-contiguous* array with the shape of the
+            *RGB* colourspace array.
+
+        Notes
+        -----
+        -   The expansion and matrix product are computed with
+            :class:`numpy.float64` precision for each chunk, the product being
+            written to a buffer allocated once per call. The expanded array is
+            returned by the polynomial expansion definitions and is thus
+            allocated per chunk, its size being bounded by ``chunk_size``.
+
+        Examples
+        --------
+        >>> RGB = np.array([[0.17224810, 0.09170660, 0.06416938]] * 4)
+        >>> prng = np.random.RandomState(2)
+        >>> M_T = prng.random_sample((24, 3))
+        >>> M_R = M_T + (prng.random_sample((24, 3)) - 0.5) * 0.5
+        >>> model = ColourCorrectionModel('Finlayson 2015', degree=2)
+        >>> model.fit(M_T, M_R).apply(RGB, chunk_size=3, dtype=np.float32)
+        ... # doctest: +ELLIPSIS
+        array([[ 0.1745697...,  0.0892451...,  0.0511159...],
+               [ 0.1745697...,  0.0892451...,  0.0511159...],
+               [ 0.1745697...,  0.0892451...,  0.0511159...],
+               [ 0.1745697...,  0.0892451...,  0.0511159...]], dtype=float32)
+        """
+
+        if self._matrix is None:
+            raise RuntimeError(
+                'The colour correction model has not been fitted!')
+
+        RGB = np.asarray(RGB)
+        shape = RGB.shape
+        RGB = np.reshape(RGB, (-1, 3))
+
+        if out is None:
+            out = np.empty(shape, DEFAULT_FLOAT_DTYPE
+                           if dtype is None else dtype)
+
+        if out.shape != shape or not out.flags.c_contiguous:
+            raise ValueError('"out" array must be a "C-contiguous" array with '
+                             '"{0}" shape!'.format(shape))
+
+        # Setting the shape of a view raises instead of silently copying.
+        out_f = out.view()
+        out_f.shape = (-1, 3)
+
+        chunks = chunk_slices(RGB.shape[0], chunk_size)
+
+        matrix = np.transpose(self._matrix)
+        buffer = np.empty((chunks[0].stop - chunks[0].start, 3))
+        for chunk in chunks:
+            RGB_c = buffer[:chunk.stop - chunk.start]
+            np.dot(self.expand(as_float_array(RGB[chunk])), matrix, out=RGB_c)
+            out_f[chunk] = RGB_c
+
+        return out
@@ -8,6 +8,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 import os
 import unittest
+from scipy.optimize import approx_fprime
 
 from colour.characterisation import (
     MSDS_ACES_RICD, MSDS_CAMERA_SENSITIVITIES, SDS_COLOURCHECKERS,
@@ -15,12 +16,12 @@ from colour.characterisation import (
     generate_illuminants_rawtoaces_v1, white_balance_multipliers,
     best_illuminant, normalise_illuminant, training_data_sds_to_RGB,
     training_data_sds_to_XYZ, optimisation_factory_rawtoaces_v1,
-    optimisation_factory_JzAzBz, matrix_idt)
+    optimisation_factory_JzAzBz, matrix_idt, matrices_idt)
 from colour.characterisation.aces_it import RESOURCES_DIRECTORY_RAWTOACES
 from colour.colorimetry import (MSDS_CMFS, SDS_ILLUMINANTS, SpectralShape,
                                 sds_and_msds_to_msds, sd_constant, sd_ones)
 from colour.io import read_sds_from_csv_file
-from colour.utilities import domain_range_scale
+from colour.utilities import CaseInsensitiveMapping, domain_range_scale
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -36,7 +37,7 @@ __all__ = [
     'TestWhiteBalanceMultipliers', 'TestBestIlluminant',
     'TestNormaliseIlluminant', 'TestTrainingDataSdsToRGB',
     'TestTrainingDataSdsToXYZ', 'TestOptimizationFactoryRawtoacesV1',
-    'TestOptimizationFactoryJzAzBz', 'TestMatrixIdt'
+    'TestOptimizationFactoryJzAzBz', 'TestMatrixIdt', 'TestMatricesIdt'
 ]
 
 MSDS_CANON_EOS_5DMARK_II = sds_and_msds_to_msds(
@@ -743,6 +744,27 @@ optimisation_factory_rawtoaces_v1` definition.
 
         self.assertEqual(len(optimisation_factory_rawtoaces_v1()), 2)
 
+        objective_function, XYZ_to_optimization_colour_model = (
+            optimisation_factory_rawtoaces_v1())
+        jacobian = optimisation_factory_rawtoaces_v1.jacobian
+
+        illuminant = normalise_illuminant(SDS_ILLUMINANTS['D55'],
+                                          MSDS_CANON_EOS_5DMARK_II)
+        training_data = read_training_data_rawtoaces_v1()
+        RGB = training_data_sds_to_RGB(training_data, MSDS_CANON_EOS_5DMARK_II,
+                                       illuminant)
+        XYZ = training_data_sds_to_XYZ(
+            training_data, MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+            .copy().align(MSDS_CANON_EOS_5DMARK_II.shape), illuminant)
+        reference = XYZ_to_optimization_colour_model(XYZ)
+
+        M = np.ravel(np.identity(3)) + np.linspace(-0.05, 0.05, 9)
+        np.testing.assert_allclose(
+            jacobian(M, RGB, reference),
+            approx_fprime(M, objective_function, 1e-7, RGB, reference),
+            rtol=0.0001,
+            atol=0.0001)
+
 
 class TestOptimizationFactoryJzAzBz(unittest.TestCase):
     """
@@ -758,6 +780,27 @@ optimisation_factory_JzAzBz` definition.
 
         self.assertEqual(len(optimisation_factory_JzAzBz()), 2)
 
+        objective_function, XYZ_to_optimization_colour_model = (
+            optimisation_factory_JzAzBz())
+        jacobian = optimisation_factory_JzAzBz.jacobian
+
+        illuminant = normalise_illuminant(SDS_ILLUMINANTS['D55'],
+                                          MSDS_CANON_EOS_5DMARK_II)
+        training_data = read_training_data_rawtoaces_v1()
+        RGB = training_data_sds_to_RGB(training_data, MSDS_CANON_EOS_5DMARK_II,
+                                       illuminant)
+        XYZ = training_data_sds_to_XYZ(
+            training_data, MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+            .copy().align(MSDS_CANON_EOS_5DMARK_II.shape), illuminant)
+        reference = XYZ_to_optimization_colour_model(XYZ)
+
+        M = np.ravel(np.identity(3)) + np.linspace(-0.05, 0.05, 9)
+        np.testing.assert_allclose(
+            jacobian(M, RGB, reference),
+            approx_fprime(M, objective_function, 1e-7, RGB, reference),
+            rtol=0.0001,
+            atol=0.0001)
+
 
 class TestMatrixIdt(unittest.TestCase):
     """
@@ -848,5 +891,44 @@ class TestMatrixIdt(unittest.TestCase):
             atol=0.0001)
 
 
+class TestMatricesIdt(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.aces_it.matrices_idt`
+    definition unit tests methods.
+    """
+
+    def test_matrices_idt(self):
+        """
+        Tests :func:`colour.characterisation.aces_it.matrices_idt`
+        definition.
+        """
+
+        illuminants = generate_illuminants_rawtoaces_v1()
+        illuminants = CaseInsensitiveMapping(
+            (name, illuminants[name]) for name in ('D55', 'D65', 'iso7589'))
+
+        M = matrices_idt(MSDS_CANON_EOS_5DMARK_II, illuminants)
+        self.assertEqual(M.shape, (3, 3, 3))
+        for i, illuminant in enumerate(illuminants.values()):
+            np.testing.assert_allclose(
+                M[i],
+                matrix_idt(MSDS_CANON_EOS_5DMARK_II, illuminant),
+                rtol=0.0000001,
+                atol=0.0000001)
+
+        np.testing.assert_allclose(
+            matrices_idt(
+                MSDS_CANON_EOS_5DMARK_II,
+                illuminants,
+                optimisation_factory=optimisation_factory_JzAzBz,
+                workers=2)[2],
+            matrix_idt(
+                MSDS_CANON_EOS_5DMARK_II,
+                illuminants['iso7589'],
+                optimisation_factory=optimisation_factory_JzAzBz),
+            rtol=0.0000001,
+            atol=0.0000001)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -15,7 +15,8 @@ from colour.characterisation.correction import (
     polynomial_expansion_Vandermonde, matrix_colour_correction_Cheung2004,
     matrix_colour_correction_Finlayson2015,
     matrix_colour_correction_Vandermonde, colour_correction_Cheung2004,
-    colour_correction_Finlayson2015, colour_correction_Vandermonde)
+    colour_correction_Finlayson2015, colour_correction_Vandermonde,
+    ColourCorrectionModel)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -32,7 +33,8 @@ __all__ = [
     'TestMatrixColourCorrectionCheung2004',
     'TestMatrixColourCorrectionFinlayson2015',
     'TestMatrixColourCorrectionVandermonde', 'TestColourCorrectionCheung2004',
-    'TestColourCorrectionFinlayson2015', 'TestColourCorrectionVandermonde'
+    'TestColourCorrectionFinlayson2015', 'TestColourCorrectionVandermonde',
+    'TestColourCorrectionModel'
 ]
 
 MATRIX_TEST = np.array([
@@ -727,5 +729,110 @@ colour_correction_Vandermonde` definition nan support.
                 pass
 
 
+class TestColourCorrectionModel(unittest.TestCase):
+    """
+    Defines :class:`colour.characterisation.correction.ColourCorrectionModel`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('method', 'matrix')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ColourCorrectionModel))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', 'expand', 'fit', 'apply')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ColourCorrectionModel))
+
+    def test_fit(self):
+        """
+        Tests :meth:`colour.characterisation.correction.\
+ColourCorrectionModel.fit` method.
+        """
+
+        np.testing.assert_almost_equal(
+            ColourCorrectionModel().fit(MATRIX_TEST, MATRIX_REFERENCE).matrix,
+            matrix_colour_correction_Cheung2004(MATRIX_TEST, MATRIX_REFERENCE),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            ColourCorrectionModel('Vandermonde', degree=3).fit(
+                MATRIX_TEST, MATRIX_REFERENCE).matrix,
+            matrix_colour_correction_Vandermonde(MATRIX_TEST, MATRIX_REFERENCE,
+                                                 3),
+            decimal=7)
+
+        weights = np.ones(MATRIX_TEST.shape[0])
+        weights[0] = 0
+        np.testing.assert_almost_equal(
+            ColourCorrectionModel('Finlayson 2015', degree=2).fit(
+                MATRIX_TEST, MATRIX_REFERENCE, weights).matrix,
+            matrix_colour_correction_Finlayson2015(MATRIX_TEST[1:],
+                                                   MATRIX_REFERENCE[1:], 2),
+            decimal=7)
+
+        model = ColourCorrectionModel(terms=10)
+        M = model.fit(MATRIX_TEST, MATRIX_REFERENCE).matrix
+        M_r = model.fit(MATRIX_TEST, MATRIX_REFERENCE, regularisation=1).matrix
+        self.assertLess(np.linalg.norm(M_r), np.linalg.norm(M))
+
+    def test_apply(self):
+        """
+        Tests :meth:`colour.characterisation.correction.\
+ColourCorrectionModel.apply` method.
+        """
+
+        RGB = np.reshape(MATRIX_TEST, (4, 6, 3))
+
+        for method, kwargs, colour_correction_callable in (
+            ('Cheung 2004', {
+                'terms': 7
+            }, colour_correction_Cheung2004),
+            ('Finlayson 2015', {
+                'degree': 3
+            }, colour_correction_Finlayson2015),
+            ('Vandermonde', {
+                'degree': 4
+            }, colour_correction_Vandermonde),
+        ):
+            model = ColourCorrectionModel(method, **kwargs).fit(
+                MATRIX_TEST, MATRIX_REFERENCE)
+            RGB_c = colour_correction_callable(RGB, MATRIX_TEST,
+                                               MATRIX_REFERENCE,
+                                               *kwargs.values())
+
+            np.testing.assert_almost_equal(model.apply(RGB), RGB_c, decimal=7)
+
+            out = np.zeros(RGB.shape, np.float32)
+            self.assertIs(model.apply(RGB, chunk_size=5, out=out), out)
+            np.testing.assert_almost_equal(out, RGB_c, decimal=5)
+
+    def test_raise_exception_apply(self):
+        """
+        Tests :meth:`colour.characterisation.correction.\
+ColourCorrectionModel.apply` method raised exception.
+        """
+
+        self.assertRaises(RuntimeError,
+                          ColourCorrectionModel().apply, MATRIX_TEST)
+
+        model = ColourCorrectionModel().fit(MATRIX_TEST, MATRIX_REFERENCE)
+        self.assertRaises(
+            ValueError, model.apply, MATRIX_TEST, out=np.zeros((3, 24)).T)
+        self.assertRaises(
+            ValueError, model.apply, MATRIX_TEST, out=np.zeros((4, 6, 3)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,7 +10,8 @@ from colour.utilities.documentation import is_documentation_building
 from .spectrum import (SpectralShape, SPECTRAL_SHAPE_DEFAULT,
                        SpectralDistribution, MultiSpectralDistributions,
                        sds_and_msds_to_sds, sds_and_msds_to_msds)
-from .blackbody import sd_blackbody, blackbody_spectral_radiance, planck_law
+from .blackbody import (sd_blackbody, msds_blackbody,
+                        blackbody_spectral_radiance, planck_law)
 from .cmfs import (LMS_ConeFundamentals, RGB_ColourMatchingFunctions,
                    XYZ_ColourMatchingFunctions)
 from .datasets import *  # noqa
@@ -19,8 +20,13 @@ from .generation import sd_constant, sd_zeros, sd_ones
 from .generation import msds_constant, msds_zeros, msds_ones
 from .generation import SD_GAUSSIAN_METHODS
 from .generation import sd_gaussian, sd_gaussian_normal, sd_gaussian_fwhm
+from .generation import MSDS_GAUSSIAN_METHODS
+from .generation import (msds_gaussian, msds_gaussian_normal,
+                         msds_gaussian_fwhm)
 from .generation import SD_SINGLE_LED_METHODS
 from .generation import sd_single_led, sd_single_led_Ohno2005
+from .generation import MSDS_SINGLE_LED_METHODS
+from .generation import msds_single_led, msds_single_led_Ohno2005
 from .generation import SD_MULTI_LEDS_METHODS
 from .generation import sd_multi_leds, sd_multi_leds_Ohno2005
 from .tristimulus import SD_TO_XYZ_METHODS, MSDS_TO_XYZ_METHODS
@@ -34,8 +40,9 @@ from .tristimulus import (
 from .correction import BANDPASS_CORRECTION_METHODS
 from .correction import bandpass_correction
 from .correction import bandpass_correction_Stearns1988
-from .illuminants import (sd_CIE_standard_illuminant_A,
-                          sd_CIE_illuminant_D_series, daylight_locus_function)
+from .illuminants import (
+    sd_CIE_standard_illuminant_A, sd_CIE_illuminant_D_series,
+    msds_CIE_illuminant_D_series, daylight_locus_function)
 from .lefs import (sd_mesopic_luminous_efficiency_function,
                    mesopic_weighting_function)
 from .lightness import LIGHTNESS_METHODS
@@ -71,7 +78,10 @@ __all__ = [
     'SpectralShape', 'SPECTRAL_SHAPE_DEFAULT', 'SpectralDistribution',
     'MultiSpectralDistributions', 'sds_and_msds_to_sds', 'sds_and_msds_to_msds'
 ]
-__all__ += ['sd_blackbody', 'blackbody_spectral_radiance', 'planck_law']
+__all__ += [
+    'sd_blackbody', 'msds_blackbody', 'blackbody_spectral_radiance',
+    'planck_law'
+]
 __all__ += [
     'LMS_ConeFundamentals', 'RGB_ColourMatchingFunctions',
     'XYZ_ColourMatchingFunctions'
@@ -81,8 +91,12 @@ __all__ += ['sd_constant', 'sd_zeros', 'sd_ones']
 __all__ += ['msds_constant', 'msds_zeros', 'msds_ones']
 __all__ += ['SD_GAUSSIAN_METHODS']
 __all__ += ['sd_gaussian', 'sd_gaussian_normal', 'sd_gaussian_fwhm']
+__all__ += ['MSDS_GAUSSIAN_METHODS']
+__all__ += ['msds_gaussian', 'msds_gaussian_normal', 'msds_gaussian_fwhm']
 __all__ += ['SD_SINGLE_LED_METHODS']
 __all__ += ['sd_single_led', 'sd_single_led_Ohno2005']
+__all__ += ['MSDS_SINGLE_LED_METHODS']
+__all__ += ['msds_single_led', 'msds_single_led_Ohno2005']
 __all__ += ['SD_MULTI_LEDS_METHODS']
 __all__ += ['sd_multi_leds', 'sd_multi_leds_Ohno2005']
 __all__ += ['SD_TO_XYZ_METHODS', 'MSDS_TO_XYZ_METHODS']
@@ -99,7 +113,7 @@ __all__ += ['bandpass_correction']
 __all__ += ['bandpass_correction_Stearns1988']
 __all__ += [
     'sd_CIE_standard_illuminant_A', 'sd_CIE_illuminant_D_series',
-    'daylight_locus_function'
+    'msds_CIE_illuminant_D_series', 'daylight_locus_function'
 ]
 __all__ += [
     'sd_mesopic_luminous_efficiency_function', 'mesopic_weighting_function'
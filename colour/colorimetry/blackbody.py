@@ -17,7 +17,9 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT, SpectralDistribution)
+from colour.colorimetry import (
+    SPECTRAL_SHAPE_DEFAULT, MultiSpectralDistributions, SpectralDistribution)
+from colour.colorimetry.spectrum import _unique_labels
 from colour.utilities import as_float_array, usage_warning
 
 __author__ = 'Colour Developers'
@@ -29,7 +31,7 @@ __status__ = 'Production'
 
 __all__ = [
     'CONSTANT_C1', 'CONSTANT_C2', 'CONSTANT_N', 'planck_law',
-    'blackbody_spectral_radiance', 'sd_blackbody'
+    'blackbody_spectral_radiance', 'sd_blackbody', 'msds_blackbody'
 ]
 
 # 2 * math.pi * CONSTANT_PLANCK * CONSTANT_LIGHT_SPEED ** 2
@@ -592,3 +594,88 @@ def sd_blackbody(temperature,
         planck_law(wavelengths * 1e-9, temperature, c1, c2, n) * 1e-9,
         wavelengths,
         name='{0}K Blackbody'.format(temperature))
+
+
+def msds_blackbody(temperature,
+                   shape=SPECTRAL_SHAPE_DEFAULT,
+                   c1=CONSTANT_C1,
+                   c2=CONSTANT_C2,
+                   n=CONSTANT_N,
+                   as_array=False):
+    """
+    Returns the multi-spectral distributions of the planckian radiators for
+    given temperatures :math:`T[K]` with values in
+    *watts per steradian per square metre per nanometer* (:math:`W/sr/m^2/nm`).
+
+    The spectral radiance of all the planckian radiators is computed with a
+    single vectorised evaluation of :func:`colour.colorimetry.planck_law`
+    definition.
+
+    Parameters
+    ----------
+    temperature : array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral distributions of the
+        planckian radiators.
+    c1 : numeric, optional
+        The official value of :math:`c1` is provided by the Committee on Data
+        for Science and Technology (CODATA) and is
+        :math:`c1=3,741771x10.16\\ W/m_2` *(Mohr and Taylor, 2000)*.
+    c2 : numeric, optional
+        Since :math:`T` is measured on the International Temperature Scale,
+        the value of :math:`c2` used in colorimetry should follow that adopted
+        in the current International Temperature Scale (ITS-90)
+        *(Preston-Thomas, 1990; Mielenz et aI., 1991)*, namely
+        :math:`c2=1,4388x10.2\\ m/K`.
+    n : numeric, optional
+        Medium index of refraction. For dry air at 15C and 101 325 Pa,
+        containing 0,03 percent by volume of carbon dioxide, it is
+        approximately 1,00028 throughout the visible region although
+        *CIE 15:2004* recommends using :math:`n=1`.
+    as_array : bool, optional
+        Whether to return the values as an *ndarray* of shape
+        (temperature.shape, wavelengths) instead of a
+        :class:`colour.MultiSpectralDistributions` class instance, avoiding
+        the construction cost of the latter for large temperatures arrays.
+
+    Returns
+    -------
+    MultiSpectralDistributions or ndarray
+        Blackbody multi-spectral distributions with values in
+        *watts per steradian per square metre per nanometer*
+        (:math:`W/sr/m^2/nm`).
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SpectralShape
+    >>> shape = SpectralShape(400, 700, 100)
+    >>> msds_blackbody([4000, 6500], shape, as_array=True)
+    ... # doctest: +ELLIPSIS
+    array([[  1446.3994564...,   2864.7657743...,   3825.2419984...,   \
+4181.5665822...],
+           [ 46134.7021007...,  46093.8549932...,  39259.9721715...,  \
+31325.4538593...]])
+    >>> msds_blackbody([4000, 6500], shape).labels
+    ['4000K Blackbody', '6500K Blackbody']
+    """
+
+    # The labels are formatted from the given temperatures so that they match
+    # the names of the spectral distributions from :func:`sd_blackbody`.
+    labels = [
+        '{0}K Blackbody'.format(T) for T in np.ravel(np.asarray(temperature))
+    ]
+    temperature = as_float_array(temperature)
+
+    wavelengths = shape.range()
+    values = planck_law(wavelengths * 1e-9, temperature[..., np.newaxis], c1,
+                        c2, n) * 1e-9
+
+    if as_array:
+        return values
+
+    return MultiSpectralDistributions(
+        np.reshape(values, (-1, len(wavelengths))).T,
+        wavelengths,
+        name='Blackbody',
+        labels=_unique_labels(labels))
@@ -15,9 +15,16 @@ Defines various objects performing spectral generation:
 -   :func:`colour.colorimetry.sd_gaussian_fwhm`
 -   :attr:`colour.SD_GAUSSIAN_METHODS`
 -   :func:`colour.sd_gaussian`
+-   :func:`colour.colorimetry.msds_gaussian_normal`
+-   :func:`colour.colorimetry.msds_gaussian_fwhm`
+-   :attr:`colour.MSDS_GAUSSIAN_METHODS`
+-   :func:`colour.msds_gaussian`
 -   :func:`colour.colorimetry.sd_single_led_Ohno2005`
 -   :attr:`colour.SD_SINGLE_LED_METHODS`
 -   :func:`colour.sd_single_led`
+-   :func:`colour.colorimetry.msds_single_led_Ohno2005`
+-   :attr:`colour.MSDS_SINGLE_LED_METHODS`
+-   :func:`colour.msds_single_led`
 -   :func:`colour.colorimetry.sd_multi_leds_Ohno2005`
 -   :attr:`colour.SD_MULTI_LEDS_METHODS`
 -   :func:`colour.sd_multi_leds`
@@ -40,6 +47,7 @@ import numpy as np
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.colorimetry import (
     SPECTRAL_SHAPE_DEFAULT, MultiSpectralDistributions, SpectralDistribution)
+from colour.colorimetry.spectrum import _unique_labels
 from colour.utilities import CaseInsensitiveMapping, as_float_array, full, ones
 
 __author__ = 'Colour Developers'
@@ -52,9 +60,11 @@ __status__ = 'Production'
 __all__ = [
     'sd_constant', 'sd_zeros', 'sd_ones', 'msds_constant', 'msds_zeros',
     'msds_ones', 'sd_gaussian_normal', 'sd_gaussian_fwhm',
-    'SD_GAUSSIAN_METHODS', 'sd_gaussian', 'sd_single_led_Ohno2005',
-    'SD_SINGLE_LED_METHODS', 'sd_single_led', 'sd_multi_leds_Ohno2005',
-    'SD_MULTI_LEDS_METHODS', 'sd_multi_leds'
+    'SD_GAUSSIAN_METHODS', 'sd_gaussian', 'msds_gaussian_normal',
+    'msds_gaussian_fwhm', 'MSDS_GAUSSIAN_METHODS', 'msds_gaussian',
+    'sd_single_led_Ohno2005', 'SD_SINGLE_LED_METHODS', 'sd_single_led',
+    'msds_single_led_Ohno2005', 'MSDS_SINGLE_LED_METHODS', 'msds_single_led',
+    'sd_multi_leds_Ohno2005', 'SD_MULTI_LEDS_METHODS', 'sd_multi_leds'
 ]
 
 
@@ -444,6 +454,201 @@ def sd_gaussian(mu_peak_wavelength,
     return SD_GAUSSIAN_METHODS[method](mu_peak_wavelength, sigma_fwhm, shape)
 
 
+def msds_gaussian_normal(mu,
+                         sigma,
+                         shape=SPECTRAL_SHAPE_DEFAULT,
+                         as_array=False):
+    """
+    Returns the gaussian multi-spectral distributions of given spectral shape
+    at given mean wavelengths :math:`\\mu` and standard deviations
+    :math:`sigma`.
+
+    Parameters
+    ----------
+    mu : array_like
+        Mean wavelengths :math:`\\mu` the gaussian spectral distributions will
+        peak at.
+    sigma : array_like
+        Standard deviations :math:`sigma` of the gaussian spectral
+        distributions.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral distributions.
+    as_array : bool, optional
+        Whether to return the values as an *ndarray* of shape
+        (mu.shape, wavelengths) instead of a
+        :class:`colour.MultiSpectralDistributions` class instance.
+
+    Returns
+    -------
+    MultiSpectralDistributions or ndarray
+        Gaussian multi-spectral distributions.
+
+    Notes
+    -----
+    -   By default, the multi-spectral distributions will use the shape given
+        by :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute.
+    -   ``mu`` and ``sigma`` are broadcast against each other.
+
+    Examples
+    --------
+    >>> msds = msds_gaussian_normal([500, 550], 25)
+    >>> msds.shape
+    SpectralShape(360.0, 780.0, 1.0)
+    >>> msds[500]  # doctest: +ELLIPSIS
+    array([ 1.        ,  0.1353352...])
+    """
+
+    labels = [
+        '{0}nm - {1} Sigma - Gaussian'.format(mu_i, sigma_i)
+        for mu_i, sigma_i in zip(
+            *[np.ravel(a) for a in np.broadcast_arrays(mu, sigma)])
+    ]
+    mu, sigma = np.broadcast_arrays(as_float_array(mu), as_float_array(sigma))
+
+    wavelengths = shape.range()
+
+    values = np.exp(-(wavelengths - mu[..., np.newaxis]) ** 2 /
+                    (2 * sigma[..., np.newaxis] ** 2.))
+
+    if as_array:
+        return values
+
+    return MultiSpectralDistributions(
+        np.reshape(values, (-1, len(wavelengths))).T,
+        wavelengths,
+        name='Gaussian',
+        labels=_unique_labels(labels))
+
+
+def msds_gaussian_fwhm(peak_wavelength,
+                       fwhm,
+                       shape=SPECTRAL_SHAPE_DEFAULT,
+                       as_array=False):
+    """
+    Returns the gaussian multi-spectral distributions of given spectral shape
+    at given peak wavelengths and full widths at half maximum.
+
+    Parameters
+    ----------
+    peak_wavelength : array_like
+        Wavelengths the gaussian spectral distributions will peak at.
+    fwhm : array_like
+        Full widths at half maximum, i.e. widths of the gaussian spectral
+        distributions measured between those points on the *y* axis which are
+        half the maximum amplitude.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral distributions.
+    as_array : bool, optional
+        Whether to return the values as an *ndarray* of shape
+        (peak_wavelength.shape, wavelengths) instead of a
+        :class:`colour.MultiSpectralDistributions` class instance.
+
+    Returns
+    -------
+    MultiSpectralDistributions or ndarray
+        Gaussian multi-spectral distributions.
+
+    Notes
+    -----
+    -   By default, the multi-spectral distributions will use the shape given
+        by :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute.
+    -   ``peak_wavelength`` and ``fwhm`` are broadcast against each other.
+
+    Examples
+    --------
+    >>> msds = msds_gaussian_fwhm([500, 550], 25)
+    >>> msds.shape
+    SpectralShape(360.0, 780.0, 1.0)
+    >>> msds[500]  # doctest: +ELLIPSIS
+    array([ 1.        ,  0.0183156...])
+    """
+
+    labels = [
+        '{0}nm - {1} FWHM - Gaussian'.format(peak_wavelength_i, fwhm_i)
+        for peak_wavelength_i, fwhm_i in zip(
+            *[np.ravel(a) for a in np.broadcast_arrays(peak_wavelength, fwhm)])
+    ]
+    peak_wavelength, fwhm = np.broadcast_arrays(
+        as_float_array(peak_wavelength), as_float_array(fwhm))
+
+    wavelengths = shape.range()
+
+    values = np.exp(-((wavelengths - peak_wavelength[..., np.newaxis]) /
+                      fwhm[..., np.newaxis]) ** 2)
+
+    if as_array:
+        return values
+
+    return MultiSpectralDistributions(
+        np.reshape(values, (-1, len(wavelengths))).T,
+        wavelengths,
+        name='Gaussian',
+        labels=_unique_labels(labels))
+
+
+MSDS_GAUSSIAN_METHODS = CaseInsensitiveMapping({
+    'Normal': msds_gaussian_normal,
+    'FWHM': msds_gaussian_fwhm
+})
+MSDS_GAUSSIAN_METHODS.__doc__ = """
+Supported gaussian multi-spectral distributions computation methods.
+
+MSDS_GAUSSIAN_METHODS : CaseInsensitiveMapping
+    **{'Normal', 'FWHM'}**
+"""
+
+
+def msds_gaussian(mu_peak_wavelength,
+                  sigma_fwhm,
+                  shape=SPECTRAL_SHAPE_DEFAULT,
+                  method='Normal',
+                  as_array=False):
+    """
+    Returns the gaussian multi-spectral distributions of given spectral shape
+    using given method.
+
+    Parameters
+    ----------
+    mu_peak_wavelength : array_like
+        Mean wavelengths :math:`\\mu` the gaussian spectral distributions will
+        peak at.
+    sigma_fwhm : array_like
+        Standard deviations :math:`sigma` of the gaussian spectral
+        distributions or Full widths at half maximum, i.e. widths of the
+        gaussian spectral distributions measured between those points on the
+        *y* axis which are half the maximum amplitude.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral distributions.
+    method : unicode, optional
+        **{'Normal', 'FWHM'}**,
+        Computation method.
+    as_array : bool, optional
+        Whether to return the values as an *ndarray* of shape
+        (mu_peak_wavelength.shape, wavelengths) instead of a
+        :class:`colour.MultiSpectralDistributions` class instance.
+
+    Returns
+    -------
+    MultiSpectralDistributions or ndarray
+        Gaussian multi-spectral distributions.
+
+    Notes
+    -----
+    -   By default, the multi-spectral distributions will use the shape given
+        by :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute.
+
+    Examples
+    --------
+    >>> msds_gaussian([500, 550], 25, as_array=True).shape
+    (2, 421)
+    >>> msds_gaussian([500, 550], 25, method='FWHM').labels
+    ['500nm - 25 FWHM - Gaussian', '550nm - 25 FWHM - Gaussian']
+    """
+
+    return MSDS_GAUSSIAN_METHODS[method](
+        mu_peak_wavelength, sigma_fwhm, shape, as_array=as_array)
+
+
 def sd_single_led_Ohno2005(peak_wavelength, fwhm,
                            shape=SPECTRAL_SHAPE_DEFAULT):
     """
@@ -555,6 +760,140 @@ def sd_single_led(peak_wavelength,
     return SD_SINGLE_LED_METHODS[method](peak_wavelength, fwhm, shape)
 
 
+def msds_single_led_Ohno2005(peak_wavelength,
+                             fwhm,
+                             shape=SPECTRAL_SHAPE_DEFAULT,
+                             as_array=False):
+    """
+    Returns the single *LED* multi-spectral distributions of given spectral
+    shape at given peak wavelengths and full widths at half maximum according
+    to *Ohno (2005)* method.
+
+    Parameters
+    ----------
+    peak_wavelength : array_like
+        Wavelengths the single *LED* spectral distributions will peak at.
+    fwhm : array_like
+        Full widths at half maximum, i.e. widths of the underlying gaussian
+        spectral distributions measured between those points on the *y* axis
+        which are half the maximum amplitude.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral distributions.
+    as_array : bool, optional
+        Whether to return the values as an *ndarray* of shape
+        (peak_wavelength.shape, wavelengths) instead of a
+        :class:`colour.MultiSpectralDistributions` class instance.
+
+    Returns
+    -------
+    MultiSpectralDistributions or ndarray
+        Single *LED* multi-spectral distributions.
+
+    Notes
+    -----
+    -   By default, the multi-spectral distributions will use the shape given
+        by :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute.
+    -   ``peak_wavelength`` and ``fwhm`` are broadcast against each other.
+
+    References
+    ----------
+    :cite:`Ohno2005`, :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> msds = msds_single_led_Ohno2005([500, 550], 50)
+    >>> msds.shape
+    SpectralShape(360.0, 780.0, 1.0)
+    >>> msds[500]  # doctest: +ELLIPSIS
+    array([ 1.        ,  0.1271184...])
+    """
+
+    labels = [
+        '{0}nm - {1} FWHM LED - Ohno (2005)'.format(peak_wavelength_i, fwhm_i)
+        for peak_wavelength_i, fwhm_i in zip(
+            *[np.ravel(a) for a in np.broadcast_arrays(peak_wavelength, fwhm)])
+    ]
+    peak_wavelength, fwhm = np.broadcast_arrays(
+        as_float_array(peak_wavelength), as_float_array(fwhm))
+
+    values = msds_gaussian_fwhm(peak_wavelength, fwhm, shape, as_array=True)
+    values = (values + 2 * values ** 5) / 3
+
+    if as_array:
+        return values
+
+    wavelengths = shape.range()
+
+    return MultiSpectralDistributions(
+        np.reshape(values, (-1, len(wavelengths))).T,
+        wavelengths,
+        name='LED - Ohno (2005)',
+        labels=_unique_labels(labels))
+
+
+MSDS_SINGLE_LED_METHODS = CaseInsensitiveMapping({
+    'Ohno 2005': msds_single_led_Ohno2005,
+})
+MSDS_SINGLE_LED_METHODS.__doc__ = """
+Supported single *LED* multi-spectral distributions computation methods.
+
+MSDS_SINGLE_LED_METHODS : CaseInsensitiveMapping
+    **{'Ohno 2005'}**
+"""
+
+
+def msds_single_led(peak_wavelength,
+                    fwhm,
+                    shape=SPECTRAL_SHAPE_DEFAULT,
+                    method='Ohno 2005',
+                    as_array=False):
+    """
+    Returns the single *LED* multi-spectral distributions of given spectral
+    shape at given peak wavelengths and full widths at half maximum according
+    to given method.
+
+    Parameters
+    ----------
+    peak_wavelength : array_like
+        Wavelengths the single *LED* spectral distributions will peak at.
+    fwhm : array_like
+        Full widths at half maximum, i.e. widths of the underlying gaussian
+        spectral distributions measured between those points on the *y* axis
+        which are half the maximum amplitude.
+    shape : SpectralShape, optional
+        Spectral shape used to create the multi-spectral distributions.
+    method : unicode, optional
+        **{'Ohno 2005'}**,
+        Computation method.
+    as_array : bool, optional
+        Whether to return the values as an *ndarray* of shape
+        (peak_wavelength.shape, wavelengths) instead of a
+        :class:`colour.MultiSpectralDistributions` class instance.
+
+    Returns
+    -------
+    MultiSpectralDistributions or ndarray
+        Single *LED* multi-spectral distributions.
+
+    Notes
+    -----
+    -   By default, the multi-spectral distributions will use the shape given
+        by :attr:`colour.SPECTRAL_SHAPE_DEFAULT` attribute.
+
+    References
+    ----------
+    :cite:`Ohno2005`, :cite:`Ohno2008a`
+
+    Examples
+    --------
+    >>> msds_single_led([500, 550], 50, as_array=True).shape
+    (2, 421)
+    """
+
+    return MSDS_SINGLE_LED_METHODS[method](
+        peak_wavelength, fwhm, shape, as_array=as_array)
+
+
 def sd_multi_leds_Ohno2005(peak_wavelengths,
                            fwhm,
                            peak_power_ratios=None,
@@ -7,6 +7,7 @@ Defines *CIE* illuminants computation related objects:
 
 -   :func:`colour.sd_CIE_standard_illuminant_A`
 -   :func:`colour.sd_CIE_illuminant_D_series`
+-   :func:`colour.msds_CIE_illuminant_D_series`
 -   :func:`colour.daylight_locus_function`
 
 References
@@ -30,9 +31,10 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.algebra import LinearInterpolator
-from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
-                                SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES,
-                                SpectralDistribution)
+from colour.colorimetry import (
+    SPECTRAL_SHAPE_DEFAULT, SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES,
+    MultiSpectralDistributions, SpectralDistribution)
+from colour.colorimetry.spectrum import _unique_labels
 from colour.utilities import as_float_array, as_numeric, tsplit
 
 __author__ = 'Colour Developers'
@@ -44,7 +46,7 @@ __status__ = 'Production'
 
 __all__ = [
     'sd_CIE_standard_illuminant_A', 'sd_CIE_illuminant_D_series',
-    'daylight_locus_function'
+    'msds_CIE_illuminant_D_series', 'daylight_locus_function'
 ]
 
 
@@ -300,6 +302,87 @@ def sd_CIE_illuminant_D_series(xy, M1_M2_rounding=True):
         interpolator=LinearInterpolator)
 
 
+def msds_CIE_illuminant_D_series(xy, M1_M2_rounding=True, as_array=False):
+    """
+    Returns the multi-spectral distributions of given *CIE Illuminant D
+    Series* using given *CIE xy* chromaticity coordinates array.
+
+    The :math:`S_0`, :math:`S_1` and :math:`S_2` basis functions are combined
+    for all the chromaticity coordinates at once.
+
+    Parameters
+    ----------
+    xy : array_like
+        *CIE xy* chromaticity coordinates array.
+    M1_M2_rounding : bool, optional
+        Whether to round :math:`M1` and :math:`M2` variables to 3 decimal
+        places in order to yield the internationally agreed values.
+    as_array : bool, optional
+        Whether to return the values as an *ndarray* of shape
+        (xy.shape[:-1], wavelengths) instead of a
+        :class:`colour.MultiSpectralDistributions` class instance.
+
+    Returns
+    -------
+    MultiSpectralDistributions or ndarray
+        *CIE Illuminant D Series* multi-spectral distributions.
+
+    Notes
+    -----
+    -   The nominal *CIE xy* chromaticity coordinates which have been computed
+        with :func:`colour.temperature.CCT_to_xy_CIE_D` must be given according
+        to *CIE 015:2004* recommendation and thus multiplied by
+        1.4388 / 1.4380.
+    -   :math:`M1` and :math:`M2` variables are rounded to 3 decimal places
+         according to *CIE 015:2004* recommendation.
+
+    References
+    ----------
+    :cite:`CIETC1-482004`, :cite:`Wyszecki2000z`
+
+    Examples
+    --------
+    >>> from colour.temperature import CCT_to_xy_CIE_D
+    >>> xy = CCT_to_xy_CIE_D(np.array([5000, 6500]) * 1.4388 / 1.4380)
+    >>> msds = msds_CIE_illuminant_D_series(xy)
+    >>> msds.shape
+    SpectralShape(300.0, 830.0, 5.0)
+    >>> msds[400]  # doctest: +ELLIPSIS
+    array([ 49.3081...,  82.7549...])
+    """
+
+    xy = as_float_array(xy)
+    x, y = tsplit(xy)
+
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
+    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
+
+    if M1_M2_rounding:
+        M1 = np.around(M1, 3)
+        M2 = np.around(M2, 3)
+
+    S0 = SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES['S0']
+    S1 = SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES['S1']
+    S2 = SDS_BASIS_FUNCTIONS_CIE_ILLUMINANT_D_SERIES['S2']
+
+    values = (S0.values + M1[..., np.newaxis] * S1.values +
+              M2[..., np.newaxis] * S2.values)
+
+    if as_array:
+        return values
+
+    return MultiSpectralDistributions(
+        np.reshape(values, (-1, len(S0.wavelengths))).T,
+        S0.wavelengths,
+        name='CIE Illuminant D Series',
+        labels=_unique_labels([
+            'CIE xy ({0}, {1}) - CIE Illuminant D Series'.format(*xy_i)
+            for xy_i in np.reshape(xy, (-1, 2))
+        ]),
+        interpolator=LinearInterpolator)
+
+
 def daylight_locus_function(x_D):
     """
     Returns the daylight locus as *CIE xy* chromaticity coordinates.
@@ -2704,6 +2704,39 @@ MultiSpectralDistributions or array_like or dict_like, optional
         return self.copy()
 
 
+def _unique_labels(labels):
+    """
+    Returns given labels with the repeated ones suffixed with their index so
+    that they do not collapse into a single column of a
+    :class:`colour.MultiSpectralDistributions` class instance.
+
+    Parameters
+    ----------
+    labels : array_like
+        Labels to make unique.
+
+    Returns
+    -------
+    list
+        Unique labels.
+
+    Examples
+    --------
+    >>> _unique_labels(['5000K', '5000K', '6000K'])
+    ['5000K', '5000K (1)', '6000K']
+    """
+
+    unique_labels, seen = [], set()
+    for i, label in enumerate(labels):
+        while label in seen:
+            label = '{0} ({1})'.format(label, i)
+
+        seen.add(label)
+        unique_labels.append(label)
+
+    return unique_labels
+
+
 def sds_and_msds_to_sds(sds):
     """
     Converts given spectral and multi-spectral distributions to a flat list of
@@ -9,7 +9,8 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.colorimetry import SpectralShape, planck_law, sd_blackbody
+from colour.colorimetry import (SpectralShape, planck_law, sd_blackbody,
+                                msds_blackbody)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -20,7 +21,8 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'DATA_PLANCK_LAW', 'DATA_BLACKBODY', 'TestPlanckLaw', 'TestSdBlackbody'
+    'DATA_PLANCK_LAW', 'DATA_BLACKBODY', 'TestPlanckLaw', 'TestSdBlackbody',
+    'TestMsdsBlackbody'
 ]
 
 DATA_PLANCK_LAW = {
@@ -4577,5 +4579,47 @@ class TestSdBlackbody(unittest.TestCase):
             atol=0.0000001)
 
 
+class TestMsdsBlackbody(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.blackbody.msds_blackbody` definition
+    unit tests methods.
+    """
+
+    def test_msds_blackbody(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.msds_blackbody` definition.
+        """
+
+        shape = SpectralShape(360, 830, 1)
+        msds = msds_blackbody([5000, 1667, 10000], shape)
+
+        np.testing.assert_allclose(
+            msds.values[..., 0],
+            DATA_BLACKBODY,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+        for i, temperature in enumerate([5000, 1667, 10000]):
+            sd = sd_blackbody(temperature, shape)
+            np.testing.assert_allclose(
+                msds.values[..., i], sd.values, rtol=0.0000001)
+            self.assertEqual(msds.labels[i], sd.name)
+
+        values = msds_blackbody(
+            np.array([[5000, 1667], [10000, 5000]]), shape, as_array=True)
+        self.assertTupleEqual(values.shape, (2, 2, 471))
+        np.testing.assert_allclose(
+            values[0, 0], DATA_BLACKBODY, rtol=0.0000001, atol=0.0000001)
+        np.testing.assert_allclose(values[1, 1], values[0, 0])
+
+        msds = msds_blackbody(np.array([[5000, 1667], [10000, 5000]]), shape)
+        self.assertTupleEqual(msds.values.shape, (471, 4))
+        self.assertListEqual(msds.labels, [
+            '5000K Blackbody', '1667K Blackbody', '10000K Blackbody',
+            '5000K Blackbody (3)'
+        ])
+        np.testing.assert_allclose(msds.values[..., 3], msds.values[..., 0])
+
+
 if __name__ == '__main__':
     unittest.main()
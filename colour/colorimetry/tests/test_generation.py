@@ -10,7 +10,8 @@ import unittest
 
 from colour.colorimetry.generation import (
     sd_constant, sd_zeros, sd_ones, msds_constant, msds_zeros, msds_ones,
-    sd_gaussian_normal, sd_gaussian_fwhm, sd_single_led_Ohno2005,
+    sd_gaussian_normal, sd_gaussian_fwhm, msds_gaussian_normal,
+    msds_gaussian_fwhm, sd_single_led_Ohno2005, msds_single_led_Ohno2005,
     sd_multi_leds_Ohno2005)
 
 __author__ = 'Colour Developers'
@@ -23,7 +24,9 @@ __status__ = 'Production'
 __all__ = [
     'TestSdConstant', 'TestSdZeros', 'TestSdOnes', 'TestMsdsConstant',
     'TestMsdsZeros', 'TestMsdsOnes', 'TestSdGaussianNormal',
-    'TestSdGaussianFwhm', 'TestSdSingleLedOhno2005', 'TestSdMultiLedsOhno2005'
+    'TestSdGaussianFwhm', 'TestMsdsGaussianNormal', 'TestMsdsGaussianFwhm',
+    'TestSdSingleLedOhno2005', 'TestMsdsSingleLedOhno2005',
+    'TestSdMultiLedsOhno2005'
 ]
 
 
@@ -194,6 +197,55 @@ class TestSdGaussianFwhm(unittest.TestCase):
         self.assertAlmostEqual(sd[580], 0.367879441171443, places=7)
 
 
+class TestMsdsGaussianNormal(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.generation.msds_gaussian_normal`
+    definition unit tests methods.
+    """
+
+    def test_msds_gaussian_normal(self):
+        """
+        Tests :func:`colour.colorimetry.generation.msds_gaussian_normal`
+        definition.
+        """
+
+        msds = msds_gaussian_normal([555, 530], [25, 50])
+
+        np.testing.assert_almost_equal(
+            msds[530], np.array([0.606530659712633, 1]), decimal=7)
+
+        for i, (mu, sigma) in enumerate([(555, 25), (530, 50)]):
+            sd = sd_gaussian_normal(mu, sigma)
+            np.testing.assert_almost_equal(
+                msds.values[..., i], sd.values, decimal=7)
+            self.assertEqual(msds.labels[i], sd.name)
+
+        self.assertTupleEqual(
+            msds_gaussian_normal(np.tile(555, (3, 2)), 25,
+                                 as_array=True).shape, (3, 2, 421))
+
+
+class TestMsdsGaussianFwhm(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.generation.msds_gaussian_fwhm`
+    definition unit tests methods.
+    """
+
+    def test_msds_gaussian_fwhm(self):
+        """
+        Tests :func:`colour.colorimetry.generation.msds_gaussian_fwhm`
+        definition.
+        """
+
+        values = msds_gaussian_fwhm([555, 530], [25, 50], as_array=True)
+
+        for i, (peak_wavelength, fwhm) in enumerate([(555, 25), (530, 50)]):
+            np.testing.assert_almost_equal(
+                values[i],
+                sd_gaussian_fwhm(peak_wavelength, fwhm).values,
+                decimal=7)
+
+
 class TestSdSingleLedOhno2005(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.generation.sd_single_led_Ohno2005`
@@ -215,6 +267,38 @@ class TestSdSingleLedOhno2005(unittest.TestCase):
         self.assertAlmostEqual(sd[580], 0.127118445056538, places=7)
 
 
+class TestMsdsSingleLedOhno2005(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.generation.msds_single_led_Ohno2005`
+    definition unit tests methods.
+    """
+
+    def test_msds_single_led_Ohno2005(self):
+        """
+        Tests :func:`colour.colorimetry.generation.msds_single_led_Ohno2005`
+        definition.
+        """
+
+        msds = msds_single_led_Ohno2005([555, 580], 25)
+
+        np.testing.assert_almost_equal(
+            msds[580], np.array([0.127118445056538, 1]), decimal=7)
+
+        for i, peak_wavelength in enumerate([555, 580]):
+            sd = sd_single_led_Ohno2005(peak_wavelength, 25)
+            np.testing.assert_almost_equal(
+                msds.values[..., i], sd.values, decimal=7)
+            self.assertEqual(msds.labels[i], sd.name)
+
+        msds = msds_single_led_Ohno2005([555, 555, 580], 25)
+        self.assertTupleEqual(msds.values.shape, (421, 3))
+        self.assertListEqual(msds.labels, [
+            '555nm - 25 FWHM LED - Ohno (2005)',
+            '555nm - 25 FWHM LED - Ohno (2005) (1)',
+            '580nm - 25 FWHM LED - Ohno (2005)'
+        ])
+
+
 class TestSdMultiLedsOhno2005(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.generation.sd_multi_leds_Ohno2005`
@@ -10,7 +10,8 @@ import unittest
 
 from colour.colorimetry import (
     SDS_ILLUMINANTS, SpectralShape, sd_CIE_standard_illuminant_A,
-    sd_CIE_illuminant_D_series, daylight_locus_function)
+    sd_CIE_illuminant_D_series, msds_CIE_illuminant_D_series,
+    daylight_locus_function)
 from colour.temperature import CCT_to_xy_CIE_D
 from colour.utilities import ignore_numpy_errors
 
@@ -23,7 +24,7 @@ __status__ = 'Production'
 
 __all__ = [
     'DATA_A', 'TestSdCIEStandardIlluminantA', 'TestSdCIEIlluminantDSeries',
-    'TestDaylightLocusFunction'
+    'TestMsdsCIEIlluminantDSeries', 'TestDaylightLocusFunction'
 ]
 
 DATA_A = np.array([
@@ -173,6 +174,45 @@ sd_CIE_illuminant_D_series` definition.
                 atol=tolerance)
 
 
+class TestMsdsCIEIlluminantDSeries(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.\
+msds_CIE_illuminant_D_series` definition unit tests methods.
+    """
+
+    def test_msds_CIE_illuminant_D_series(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.\
+msds_CIE_illuminant_D_series` definition.
+        """
+
+        xy = CCT_to_xy_CIE_D(
+            np.array([5000, 5500, 6500, 7500]) * 1.4388 / 1.4380)
+        msds = msds_CIE_illuminant_D_series(xy)
+
+        for i, xy_i in enumerate(xy):
+            sd = sd_CIE_illuminant_D_series(xy_i)
+            np.testing.assert_almost_equal(
+                msds.values[..., i], sd.values, decimal=7)
+            self.assertEqual(msds.labels[i], sd.name)
+
+        values = msds_CIE_illuminant_D_series(
+            np.reshape(xy, (2, 2, 2)), as_array=True)
+        self.assertTupleEqual(values.shape, (2, 2, 107))
+        np.testing.assert_almost_equal(
+            np.reshape(values, (4, 107)), msds.values.T, decimal=7)
+
+        np.testing.assert_almost_equal(
+            msds_CIE_illuminant_D_series(
+                xy, M1_M2_rounding=False, as_array=True)[2],
+            sd_CIE_illuminant_D_series(xy[2], M1_M2_rounding=False).values,
+            decimal=7)
+
+        msds = msds_CIE_illuminant_D_series(np.tile(xy[0], (3, 1)))
+        self.assertTupleEqual(msds.values.shape, (107, 3))
+        self.assertEqual(len(set(msds.labels)), 3)
+
+
 class TestDaylightLocusFunction(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.illuminants.daylight_locus_function`
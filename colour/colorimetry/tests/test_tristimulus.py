@@ -12,6 +12,9 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 
 from colour.algebra import LinearInterpolator
@@ -1000,6 +1003,58 @@ class TestMsds_to_XYZ_integration(unittest.TestCase):
             TVS_D65_ARRAY_K1_INTEGRATION,
             decimal=7)
 
+    def test_msds_to_XYZ_integration_chunks(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_integration`
+        definition blocks integration of memory-mapped arrays.
+        """
+
+        cmfs = MSDS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(400, 700, 60)
+
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            msds = np.memmap(
+                os.path.join(temporary_directory, 'msds.dat'),
+                dtype=np.float32,
+                mode='w+',
+                shape=DATA_TWO.shape)
+            msds[...] = DATA_TWO
+
+            for chunk_size, workers in ((1, None), (7, 2), (2 ** 16, 4)):
+                XYZ = np.memmap(
+                    os.path.join(temporary_directory, 'XYZ.dat'),
+                    dtype=np.float32,
+                    mode='w+',
+                    shape=DATA_TWO.shape[:-1] + (3, ))
+
+                self.assertIs(
+                    msds_to_XYZ_integration(
+                        msds,
+                        cmfs,
+                        SDS_ILLUMINANTS['D65'],
+                        shape=shape,
+                        out=XYZ,
+                        chunk_size=chunk_size,
+                        workers=workers), XYZ)
+                np.testing.assert_allclose(
+                    XYZ, TVS_D65_ARRAY_INTEGRATION, rtol=1e-5)
+
+                del XYZ
+
+            self.assertRaises(
+                AssertionError,
+                msds_to_XYZ_integration,
+                msds,
+                cmfs,
+                SDS_ILLUMINANTS['D65'],
+                shape=shape,
+                out=np.zeros((2, 3)))
+
+            del msds
+        finally:
+            shutil.rmtree(temporary_directory)
+
     def test_domain_range_scale_msds_to_XYZ_integration(self):
         """
         Tests :func:`colour.colorimetry.tristimulus.msds_to_XYZ_integration`
@@ -44,8 +44,10 @@ from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
                                 MSDS_CMFS_STANDARD_OBSERVER, sd_ones)
 from colour.constants import DEFAULT_INT_DTYPE
 from colour.utilities import (CaseInsensitiveMapping, as_float_array,
-                              filter_kwargs, from_range_100,
-                              get_domain_range_scale, runtime_warning, tsplit)
+                              chunk_slices, filter_kwargs, from_range_100,
+                              get_domain_range_scale, profiled,
+                              runtime_warning, thread_pool, tsplit)
+from colour.utilities.profiling import _profile_cache_access
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -137,8 +139,12 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
 
     hash_key = tuple([hash(arg) for arg in (interval, interval_type)])
     if hash_key in _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS:
+        _profile_cache_access('_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS',
+                              True)
         return _CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS[hash_key]
 
+    _profile_cache_access('_CACHE_LAGRANGE_INTERPOLATING_COEFFICIENTS', False)
+
     r_n = np.linspace(1 / interval, 1 - (1 / interval), interval - 1)
     d = 3
     if interval_type.lower() == 'inner':
@@ -151,6 +157,7 @@ def lagrange_coefficients_ASTME2022(interval=10, interval_type='inner'):
     return lica
 
 
+@profiled
 def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
     """
     Returns a table of tristimulus weighting factors for given colour matching
@@ -261,8 +268,11 @@ def tristimulus_weighting_factors_ASTME2022(cmfs, illuminant, shape, k=None):
                               get_domain_range_scale())
     ])
     if hash_key in _CACHE_TRISTIMULUS_WEIGHTING_FACTORS:
+        _profile_cache_access('_CACHE_TRISTIMULUS_WEIGHTING_FACTORS', True)
         return _CACHE_TRISTIMULUS_WEIGHTING_FACTORS[hash_key]
 
+    _profile_cache_access('_CACHE_TRISTIMULUS_WEIGHTING_FACTORS', False)
+
     Y = cmfs.values
     S = illuminant.values
 
@@ -394,6 +404,7 @@ def adjust_tristimulus_weighting_factors_ASTME308(W, shape_r, shape_t):
     return W[start_index:-end_index or None, ...]
 
 
+@profiled
 def sd_to_XYZ_integration(
         sd,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -506,6 +517,7 @@ def sd_to_XYZ_integration(
     return from_range_100(XYZ)
 
 
+@profiled
 def sd_to_XYZ_tristimulus_weighting_factors_ASTME308(
         sd,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -620,6 +632,7 @@ def sd_to_XYZ_tristimulus_weighting_factors_ASTME308(
     return from_range_100(XYZ)
 
 
+@profiled
 def sd_to_XYZ_ASTME308(
         sd,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -792,6 +805,7 @@ Aliases:
 SD_TO_XYZ_METHODS['astm2015'] = SD_TO_XYZ_METHODS['ASTM E308']
 
 
+@profiled
 def sd_to_XYZ(
         sd,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -913,8 +927,11 @@ def sd_to_XYZ(
                               tuple(kwargs.items()), get_domain_range_scale())
     ])
     if hash_key in _CACHE_SD_TO_XYZ:
+        _profile_cache_access('_CACHE_SD_TO_XYZ', True)
         return _CACHE_SD_TO_XYZ[hash_key]
 
+    _profile_cache_access('_CACHE_SD_TO_XYZ', False)
+
     function = SD_TO_XYZ_METHODS[method]
 
     XYZ = _CACHE_SD_TO_XYZ[hash_key] = function(
@@ -923,13 +940,17 @@ def sd_to_XYZ(
     return XYZ
 
 
+@profiled
 def msds_to_XYZ_integration(
         msds,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
         .copy().trim(SPECTRAL_SHAPE_DEFAULT),
         illuminant=sd_ones(),
         k=None,
-        shape=SPECTRAL_SHAPE_DEFAULT):
+        shape=SPECTRAL_SHAPE_DEFAULT,
+        out=None,
+        chunk_size=2 ** 16,
+        workers=None):
     """
     Converts given multi-spectral distributions to *CIE XYZ* tristimulus values
     using given colour matching functions and illuminant. The multi-spectral
@@ -965,12 +986,25 @@ def msds_to_XYZ_integration(
     shape : SpectralShape, optional
         Spectral shape of the multi-spectral distributions, ``cmfs`` and
         ``illuminant`` will be aligned to it.
+    out : ndarray, optional
+        Preallocated or memory-mapped array the *CIE XYZ* tristimulus values
+        of an *array_like* multi-spectral distributions are written to, its
+        shape must be ``msds.shape[:-1] + (3, )``.
+    chunk_size : int, optional
+        Approximate number of spectral distributions of an *array_like*
+        multi-spectral distributions integrated at once, the array is
+        processed in blocks of its first axis so that it can be a
+        :class:`numpy.memmap` class instance larger than the memory.
+    workers : int, optional
+        Number of threads integrating the blocks, if *None*, the blocks are
+        integrated sequentially.
 
     Returns
     -------
     array_like
         *CIE XYZ* tristimulus values, for a 512x384 multi-spectral image with
-        77 bins, the output shape will be (384, 512, 3).
+        77 bins, the output shape will be (384, 512, 3). The ``out`` array is
+        returned if given.
 
     Notes
     -----
@@ -988,6 +1022,12 @@ def msds_to_XYZ_integration(
         illuminant to the given spectral shape while the latter favours
         precision by aligning the multi-spectral distributions to the colour
         matching functions.
+    -   The *array_like* multi-spectral distributions are integrated with a
+        single product per block with a table of weighting factors combining
+        the colour matching functions, the illuminant and the normalisation
+        constant :math:`k`, the array only needs to support the ``shape``
+        attribute and the slicing of its first axis, e.g. a
+        :class:`numpy.memmap` class instance or a *HDF5* dataset.
 
     References
     ----------
@@ -1060,6 +1100,13 @@ def msds_to_XYZ_integration(
             [ 41.8166227...,  27.1191979...,  14.2627944...],
             [  9.2414098...,  20.2056200...,  20.1992502...],
             [ 24.7830551...,  26.2221584...,  36.4430633...]]])
+    >>> XYZ = np.zeros((2, 6, 3))
+    >>> msds_to_XYZ_integration(
+    ...     msds, illuminant=D65, shape=shape, out=XYZ, chunk_size=6,
+    ...     workers=2) is XYZ
+    True
+    >>> XYZ[1, 0]  # doctest: +ELLIPSIS
+    array([  8.8287837...,  13.3870357...,  30.5702050...])
     """
 
     if isinstance(msds, MultiSpectralDistributions):
@@ -1068,7 +1115,8 @@ def msds_to_XYZ_integration(
             for sd in msds.to_sds()
         ])
     else:
-        msds = as_float_array(msds)
+        if not hasattr(msds, 'shape') or len(msds.shape) < 2:
+            msds = as_float_array(msds)
 
         msd_shape_m_1, shape_wl_count = msds.shape[-1], len(shape.range())
         assert msd_shape_m_1 == shape_wl_count, (
@@ -1087,20 +1135,52 @@ def msds_to_XYZ_integration(
             illuminant = illuminant.copy().align(shape)
 
         S = illuminant.values
-        x_bar, y_bar, z_bar = tsplit(cmfs.values)
+        y_bar = cmfs.values[..., 1]
         dw = cmfs.shape.interval
 
         k = 100 / (np.sum(y_bar * S) * dw) if k is None else k
 
-        X_p = msds * x_bar * S * dw
-        Y_p = msds * y_bar * S * dw
-        Z_p = msds * z_bar * S * dw
+        # Weighting factors table integrating the blocks with a single product.
+        W = from_range_100(k * cmfs.values * (S * dw)[..., np.newaxis])
+
+        if len(msds.shape) < 2:
+            XYZ = np.dot(msds, W)
+
+            if out is None:
+                return XYZ
+
+            out[...] = XYZ
+
+            return out
+
+        if out is None:
+            out = np.empty(msds.shape[:-1] + (3, ))
 
-        XYZ = k * np.sum(np.array([X_p, Y_p, Z_p]), axis=-1)
+        assert out.shape == msds.shape[:-1] + (3, ), (
+            '"out" array shape must be {0}!'.format(msds.shape[:-1] + (3, )))
 
-        return from_range_100(np.rollaxis(XYZ, 0, msds.ndim))
+        rows = chunk_slices(
+            msds.shape[0],
+            max(chunk_size // max(int(np.prod(msds.shape[1:-1])), 1), 1))
 
+        def _integrate_rows(block):
+            """
+            Integrates given rows block of the multi-spectral distributions.
+            """
 
+            out[block] = np.dot(as_float_array(msds[block]), W)
+
+        if workers is None or len(rows) == 1:
+            for block in rows:
+                _integrate_rows(block)
+        else:
+            with thread_pool(workers) as pool:
+                pool.map(_integrate_rows, rows)
+
+        return out
+
+
+@profiled
 def msds_to_XYZ_ASTME308(
         msds,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -1252,6 +1332,7 @@ Aliases:
 MSDS_TO_XYZ_METHODS['astm2015'] = MSDS_TO_XYZ_METHODS['ASTM E308']
 
 
+@profiled
 def msds_to_XYZ(
         msds,
         cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
@@ -1317,6 +1398,18 @@ def msds_to_XYZ(
         {:func:`colour.colorimetry.msds_to_XYZ_integration`},
         Spectral shape of the multi-spectral distributions array :math:`msds`,
         ``cmfs`` and ``illuminant`` will be aligned to it.
+    out : ndarray, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`},
+        Preallocated or memory-mapped array the *CIE XYZ* tristimulus values
+        of the multi-spectral distributions array :math:`msds` are written to.
+    chunk_size : int, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`},
+        Approximate number of spectral distributions of the multi-spectral
+        distributions array :math:`msds` integrated at once.
+    workers : int, optional
+        {:func:`colour.colorimetry.msds_to_XYZ_integration`},
+        Number of threads integrating the blocks of the multi-spectral
+        distributions array :math:`msds`.
 
     Returns
     -------
@@ -221,6 +221,7 @@ class Signal(AbstractContinuousFunction):
             'left': np.nan,
             'right': np.nan
         }
+        self._function = None
 
         self.domain, self.range = self.signal_unpack_data(data, domain)
 
@@ -231,8 +232,6 @@ class Signal(AbstractContinuousFunction):
         self.extrapolator = kwargs.get('extrapolator')
         self.extrapolator_kwargs = kwargs.get('extrapolator_kwargs')
 
-        self._create_function()
-
     @property
     def dtype(self):
         """
@@ -316,7 +315,7 @@ class Signal(AbstractContinuousFunction):
                         self._range = np.resize(self._range, value.shape)
 
                 self._domain = value
-                self._create_function()
+                self._invalidate_function()
 
     @property
     def range(self):
@@ -359,7 +358,7 @@ class Signal(AbstractContinuousFunction):
                         '"domain" and "range" variables must have same size!')
 
                 self._range = value
-                self._create_function()
+                self._invalidate_function()
 
     @property
     def interpolator(self):
@@ -389,7 +388,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for interpolator capabilities.
             self._interpolator = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def interpolator_kwargs(self):
@@ -424,7 +423,7 @@ class Signal(AbstractContinuousFunction):
             ).format('interpolator_kwargs', value)
 
             self._interpolator_kwargs = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def extrapolator(self):
@@ -454,7 +453,7 @@ class Signal(AbstractContinuousFunction):
         if value is not None:
             # TODO: Check for extrapolator capabilities.
             self._extrapolator = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def extrapolator_kwargs(self):
@@ -489,7 +488,7 @@ class Signal(AbstractContinuousFunction):
                 format('extrapolator_kwargs', value))
 
             self._extrapolator_kwargs = value
-            self._create_function()
+            self._invalidate_function()
 
     @property
     def function(self):
@@ -500,8 +499,17 @@ class Signal(AbstractContinuousFunction):
         -------
         callable
             Continuous signal callable.
+
+        Notes
+        -----
+        -   The underlying interpolating and extrapolating function is
+            created lazily on first access and invalidated whenever the
+            continuous signal definition changes.
         """
 
+        if self._function is None:
+            self._create_function()
+
         return self._function
 
     def __str__(self):
@@ -649,7 +657,7 @@ class Signal(AbstractContinuousFunction):
         if isinstance(x, slice):
             return self._range[x]
         else:
-            return self._function(x)
+            return self.function(x)
 
     def __setitem__(self, x, y):
         """
@@ -739,7 +747,7 @@ class Signal(AbstractContinuousFunction):
                 self._domain = np.insert(self._domain, indexes, x_nm)
                 self._range = np.insert(self._range, indexes, y[~mask])
 
-        self._create_function()
+        self._invalidate_function()
 
     def __contains__(self, x):
         """
@@ -858,6 +866,14 @@ class Signal(AbstractContinuousFunction):
 
         return not (self == other)
 
+    def _invalidate_function(self):
+        """
+        Invalidates the continuous signal underlying function so that it is
+        re-created on next evaluation.
+        """
+
+        self._function = None
+
     def _create_function(self):
         """
         Creates the continuous signal underlying function.
@@ -914,7 +930,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._domain = fill_nan(self._domain, method, default)
-        self._create_function()
+        self._invalidate_function()
 
     def _fill_range_nan(self, method='Interpolation', default=0):
         """
@@ -937,7 +953,7 @@ class Signal(AbstractContinuousFunction):
         """
 
         self._range = fill_nan(self._range, method, default)
-        self._create_function()
+        self._invalidate_function()
 
     def arithmetical_operation(self, a, operation, in_place=False):
         """
@@ -1028,11 +1044,21 @@ class Signal(AbstractContinuousFunction):
 
         if in_place:
             if isinstance(a, Signal):
-                self[self._domain] = operation(self._range, a[self._domain])
-                exclusive_or = np.setxor1d(self._domain, a.domain)
-                self[exclusive_or] = full(exclusive_or.shape, np.nan)
+                if np.array_equal(self._domain, a.domain):
+                    # Matching domains, operating directly on the
+                    # existing `self._range` buffer.
+                    ioperator(self._range, a.range)
+                    self._invalidate_function()
+                else:
+                    self[self._domain] = operation(self._range,
+                                                   a[self._domain])
+                    exclusive_or = np.setxor1d(self._domain, a.domain)
+                    self[exclusive_or] = full(exclusive_or.shape, np.nan)
             else:
-                self.range = ioperator(self.range, a)
+                # Operating directly on the existing `self._range` buffer
+                # to avoid the copies incurred by the `self.range` property.
+                ioperator(self._range, as_array(a, self.dtype))
+                self._invalidate_function()
 
             return self
         else:
@@ -204,6 +204,28 @@ class TestSignal(unittest.TestCase):
 
         assert hasattr(self._signal.function, '__call__')
 
+    def test_function_lazy_creation(self):
+        """
+        Tests :func:`colour.continuous.signal.Signal.function` property lazy
+        creation.
+        """
+
+        signal = Signal(self._range)
+        self.assertIsNone(signal._function)
+
+        signal[0.5]
+        self.assertIsNotNone(signal._function)
+
+        signal.range = self._range * 2
+        self.assertIsNone(signal._function)
+
+        np.testing.assert_almost_equal(signal[1], 40.0, decimal=7)
+
+        signal.arithmetical_operation(10, '+', True)
+        self.assertIsNone(signal._function)
+
+        np.testing.assert_almost_equal(signal[1], 50.0, decimal=7)
+
     def test_raise_exception_function(self):
         """
         Tests :func:`colour.continuous.signal.Signal.function` property raised
@@ -542,6 +564,14 @@ class TestSignal(unittest.TestCase):
             signal.range + signal._range,
             decimal=7)
 
+        signal = self._signal.copy()
+        range_ = signal._range
+        signal.arithmetical_operation(10, '*', True)
+        signal.arithmetical_operation(self._signal, '+', True)
+        self.assertIs(signal._range, range_)
+        np.testing.assert_almost_equal(
+            signal.range, self._range * 10 + self._range, decimal=7)
+
     def test_is_uniform(self):
         """
         Tests :func:`colour.continuous.signal.Signal.is_uniform` method.
@@ -33,13 +33,19 @@ Melgosa_CIEDE2000_Workshop-July4.pdf
 
 from __future__ import absolute_import
 
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+import numpy as np
+from itertools import product
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import (CaseInsensitiveMapping, chunk_slices,
+                              filter_kwargs, thread_pool)
 
 from .cam02_ucs import delta_E_CAM02LCD, delta_E_CAM02SCD, delta_E_CAM02UCS
 from .cam16_ucs import delta_E_CAM16LCD, delta_E_CAM16SCD, delta_E_CAM16UCS
 from .delta_e import (JND_CIE1976, delta_E_CIE1976, delta_E_CIE1994,
                       delta_E_CIE2000, delta_E_CMC)
 from .din99 import delta_E_DIN99
+from .index import COLOUR_INDEX_METRICS, ColourIndex
 
 __all__ = ['delta_E_CAM02LCD', 'delta_E_CAM02SCD', 'delta_E_CAM02UCS']
 __all__ += ['delta_E_CAM16LCD', 'delta_E_CAM16SCD', 'delta_E_CAM16UCS']
@@ -48,6 +54,7 @@ __all__ += [
     'delta_E_CMC'
 ]
 __all__ += ['delta_E_DIN99']
+__all__ += ['COLOUR_INDEX_METRICS', 'ColourIndex']
 
 DELTA_E_METHODS = CaseInsensitiveMapping({
     'CIE 1976': delta_E_CIE1976,
@@ -161,4 +168,276 @@ def delta_E(a, b, method='CIE 2000', **kwargs):
     return function(a, b, **filter_kwargs(function, **kwargs))
 
 
-__all__ += ['DELTA_E_METHODS', 'delta_E']
+DELTA_E_MEMORY_BUDGET = 2 ** 27
+"""
+Default memory budget in bytes of the intermediate arrays allocated by the
+:func:`colour.difference.delta_E_chunked` and
+:func:`colour.difference.delta_E_pairwise` definitions.
+
+DELTA_E_MEMORY_BUDGET : int
+"""
+
+_DELTA_E_BYTES_PER_SAMPLE = 48 * 8
+"""
+Conservative estimate of the bytes allocated per sample by the intermediate
+arrays of the most expensive colour difference method, i.e. *CIE 2000*.
+
+_DELTA_E_BYTES_PER_SAMPLE : int
+"""
+
+
+def _samples(a):
+    """
+    Reshapes given colourspace array to a 2-dimensional array of samples,
+    leaving single colours untouched so that they broadcast.
+
+    Parameters
+    ----------
+    a : array_like
+        Colourspace array.
+
+    Returns
+    -------
+    ndarray
+        2-dimensional array of samples or single colour.
+    """
+
+    a = np.asarray(a)
+
+    return a if a.ndim == 1 else np.reshape(a, (-1, a.shape[-1]))
+
+
+def delta_E_chunked(a,
+                    b,
+                    method='CIE 2000',
+                    memory_budget=DELTA_E_MEMORY_BUDGET,
+                    workers=None,
+                    dtype=None,
+                    out=None,
+                    **kwargs):
+    """
+    Returns the difference :math:`\\Delta E_{ab}` between two given
+    *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace arrays using given
+    method, evaluating the samples in chunks so that the size of the
+    intermediate arrays is bounded by given memory budget.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`.
+    b : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`b`,
+        either with the same shape than :math:`a` or a single colour.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    memory_budget : int, optional
+        Memory budget in bytes of the intermediate arrays.
+    workers : int, optional
+        Number of threads evaluating the chunks, if *None*, the chunks are
+        evaluated sequentially.
+    dtype : object, optional
+        Type of the colour difference array, default to the type defined by
+        the :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+    out : ndarray, optional
+        Array the colour difference is written in-place to.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.difference.delta_E`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ndarray
+        Colour difference :math:`\\Delta E_{ab}`.
+
+    Raises
+    ------
+    ValueError
+        If the arrays do not have the same shape and none of them is a single
+        colour.
+
+    Notes
+    -----
+    -   The intermediate computations happen at the precision defined by the
+        :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute, ``dtype``
+        only controls the storage of the colour difference, e.g. *float32*
+        halving its footprint.
+    -   Given arrays can be any array-like supporting slicing, e.g.
+        :class:`numpy.memmap` class instances.
+
+    Examples
+    --------
+    >>> a = np.tile(np.array([100.00000000, 21.57210357, 272.22819350]),
+    ...             (4, 2, 1))
+    >>> b = np.array([100.00000000, 426.67945353, 72.39590835])
+    >>> delta_E_chunked(a, b, memory_budget=1024)  # doctest: +ELLIPSIS
+    array([[ 94.0356490...,  94.0356490...],
+           [ 94.0356490...,  94.0356490...],
+           [ 94.0356490...,  94.0356490...],
+           [ 94.0356490...,  94.0356490...]])
+    """
+
+    function = DELTA_E_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
+    a, b = np.asarray(a), np.asarray(b)
+
+    if a.ndim > 1 and b.ndim > 1 and a.shape != b.shape:
+        raise ValueError('"a" and "b" arrays must have the same shape or one '
+                         'of them must be a single colour!')
+
+    shape = (a if a.ndim > 1 else b).shape[:-1]
+
+    a, b = _samples(a), _samples(b)
+
+    if out is None:
+        out = np.empty(shape, dtype)
+
+    chunk_size = max(1, memory_budget // _DELTA_E_BYTES_PER_SAMPLE)
+
+    def _chunk_delta_E(chunk):
+        """
+        Computes the colour difference of given chunk into the output array.
+        """
+
+        a_c = a if a.ndim == 1 else a[chunk]
+        b_c = b if b.ndim == 1 else b[chunk]
+
+        out.flat[chunk] = np.ravel(function(a_c, b_c, **kwargs))
+
+    chunks = chunk_slices(int(np.prod(shape)), chunk_size)
+
+    if workers is None:
+        for chunk in chunks:
+            _chunk_delta_E(chunk)
+    else:
+        with thread_pool(workers) as pool:
+            pool.map(_chunk_delta_E, chunks)
+
+    return out
+
+
+def delta_E_pairwise(a,
+                     b,
+                     method='CIE 2000',
+                     memory_budget=DELTA_E_MEMORY_BUDGET,
+                     workers=None,
+                     dtype=None,
+                     **kwargs):
+    """
+    Returns the pairwise difference :math:`\\Delta E_{ab}` matrix between
+    the samples of two given *CIE L\\*a\\*b\\** or :math:`J'a'b'`
+    colourspace arrays using given method, e.g. to compare a set of samples
+    to a palette.
+
+    The :math:`N \\times M` matrix is computed in tiles so that the size of
+    the intermediate arrays is bounded by given memory budget.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`a`
+        of :math:`N` samples.
+    b : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace array :math:`b`
+        of :math:`M` samples.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'DIN99'}**
+        Computation method.
+    memory_budget : int, optional
+        Memory budget in bytes of the intermediate arrays.
+    workers : int, optional
+        Number of threads evaluating the tiles, if *None*, the tiles are
+        evaluated sequentially.
+    dtype : object, optional
+        Type of the colour difference matrix, default to the type defined by
+        the :attr:`colour.constant.DEFAULT_FLOAT_DTYPE` attribute.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.difference.delta_E`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    ndarray
+        Colour difference :math:`\\Delta E_{ab}` matrix of shape
+        ``a.shape[:-1] + b.shape[:-1]``.
+
+    Notes
+    -----
+    -   Non-symmetric methods, e.g. *CMC* or *CIE 1994*, use the samples of
+        :math:`a` as reference.
+
+    Examples
+    --------
+    >>> a = np.array([
+    ...     [100.00000000, 21.57210357, 272.22819350],
+    ...     [50.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> b = np.array([
+    ...     [100.00000000, 426.67945353, 72.39590835],
+    ...     [100.00000000, 21.57210357, 272.22819350],
+    ...     [60.00000000, 0.00000000, 0.00000000],
+    ... ])
+    >>> delta_E_pairwise(a, b, method='CIE 1976')  # doctest: +ELLIPSIS
+    array([[ 451.7133019...,    0.        ,  275.9955524...],
+           [ 435.6564284...,  277.6212257...,   10.        ]])
+    """
+
+    function = DELTA_E_METHODS[method]
+    kwargs = filter_kwargs(function, **kwargs)
+
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
+    a, b = np.asarray(a), np.asarray(b)
+    shape = a.shape[:-1] + b.shape[:-1]
+    a = np.reshape(a, (-1, a.shape[-1]))
+    b = np.reshape(b, (-1, b.shape[-1]))
+
+    N, M = a.shape[0], b.shape[0]
+    out = np.empty((N, M), dtype)
+
+    tile_size = max(1, memory_budget // _DELTA_E_BYTES_PER_SAMPLE)
+    columns = max(1, min(M, tile_size))
+    rows = max(1, tile_size // columns)
+
+    def _tile_delta_E(tile):
+        """
+        Computes the colour difference of given tile into the output matrix.
+        """
+
+        i, j = tile
+        a_t, b_t = a[i], b[j]
+        t_shape = (a_t.shape[0], b_t.shape[0], a.shape[-1])
+
+        out[i, j] = function(
+            np.broadcast_to(a_t[:, np.newaxis, :], t_shape),
+            np.broadcast_to(b_t[np.newaxis, :, :], t_shape), **kwargs)
+
+    tiles = list(product(chunk_slices(N, rows), chunk_slices(M, columns)))
+
+    if workers is None:
+        for tile in tiles:
+            _tile_delta_E(tile)
+    else:
+        with thread_pool(workers) as pool:
+            pool.map(_tile_delta_E, tiles)
+
+    return np.reshape(out, shape)
+
+
+__all__ += [
+    'DELTA_E_METHODS', 'delta_E', 'DELTA_E_MEMORY_BUDGET', 'delta_E_chunked',
+    'delta_E_pairwise'
+]
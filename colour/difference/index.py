@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Index
+============
+
+Defines the nearest colour search index objects:
+
+-   :attr:`colour.difference.COLOUR_INDEX_METRICS`
+-   :class:`colour.difference.ColourIndex`
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+from scipy.spatial import cKDTree
+
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              chunk_slices, filter_kwargs, thread_pool)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['COLOUR_INDEX_METRICS', 'ColourIndex']
+
+COLOUR_INDEX_METRICS = CaseInsensitiveMapping({
+    'CIE Lab': ('CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'DIN99'),
+    'CAM16-LCD': ('CAM16-LCD', ),
+    'CAM16-SCD': ('CAM16-SCD', ),
+    'CAM16-UCS': ('CAM16-UCS', ),
+    'Jzazbz': (),
+})
+COLOUR_INDEX_METRICS.__doc__ = """
+Colour difference metrics supported by the :class:`colour.difference.\
+ColourIndex` class for each colourspace, the *Euclidean* distance being
+always supported. The *CAM16* colour difference metrics are only supported
+in the colourspace whose coordinates they are defined with.
+
+COLOUR_INDEX_METRICS : CaseInsensitiveMapping
+    **{'CIE Lab', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'Jzazbz'}**
+"""
+
+
+class ColourIndex(object):
+    """
+    Defines a nearest colour search index built over reference colours, e.g.
+    colour checker patches or *Munsell Renotation System* colours, expressed
+    in a perceptually uniform colourspace.
+
+    The index stores the reference colours in a *k-d tree* so that the
+    *Euclidean* nearest neighbours are found in logarithmic time. When a non
+    *Euclidean* colour difference metric, e.g. *CIE 2000*, is used, a larger
+    set of *Euclidean* candidates is retrieved and re-ranked with the metric.
+
+    Parameters
+    ----------
+    colours : array_like, optional
+        Reference colours in given colourspace.
+    space : unicode, optional
+        **{'CIE Lab', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS', 'Jzazbz'}**,
+        Colourspace of the reference and query colours.
+    metric : unicode, optional
+        {:attr:`colour.difference.COLOUR_INDEX_METRICS`},
+        Colour difference metric used to rank the neighbours, if *None*, the
+        *Euclidean* distance in given colourspace is used.
+    candidates_factor : int, optional
+        Number of *Euclidean* candidates retrieved per requested neighbour
+        before re-ranking with a non *Euclidean* metric.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.delta_E`},
+        Please refer to the documentation of the previously listed definition.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.difference.ColourIndex.colours`
+    -   :attr:`~colour.difference.ColourIndex.space`
+    -   :attr:`~colour.difference.ColourIndex.metric`
+
+    Methods
+    -------
+    -   :meth:`~colour.difference.ColourIndex.__init__`
+    -   :meth:`~colour.difference.ColourIndex.__len__`
+    -   :meth:`~colour.difference.ColourIndex.insert`
+    -   :meth:`~colour.difference.ColourIndex.query`
+    -   :meth:`~colour.difference.ColourIndex.write`
+    -   :meth:`~colour.difference.ColourIndex.read`
+
+    Notes
+    -----
+    -   The re-ranking step is exact for the *Euclidean* metrics, e.g.
+        *CIE 1976* and *CAM16-UCS*, it is otherwise an approximation whose
+        quality increases with the ``candidates_factor`` argument.
+    -   Inserting colours invalidates the *k-d tree* which is rebuilt on the
+        next query.
+
+    Examples
+    --------
+    >>> colours = np.array([
+    ...     [50.0, 0.0, 0.0],
+    ...     [60.0, 10.0, -10.0],
+    ...     [40.0, -20.0, 20.0],
+    ... ])
+    >>> index = ColourIndex(colours)
+    >>> index.query(np.array([[58.0, 8.0, -9.0], [45.0, -5.0, 5.0]]))
+    ... # doctest: +ELLIPSIS
+    (array([ 3.        ,  8.6602540...]), array([1, 0]))
+    >>> index = ColourIndex(colours, metric='CIE 2000')
+    >>> index.query(np.array([[58.0, 8.0, -9.0], [45.0, -5.0, 5.0]]))
+    ... # doctest: +ELLIPSIS
+    (array([ 2.5604267...,  8.9580557...]), array([1, 0]))
+    """
+
+    def __init__(self,
+                 colours=None,
+                 space='CIE Lab',
+                 metric=None,
+                 candidates_factor=4,
+                 **kwargs):
+        assert space in COLOUR_INDEX_METRICS, (
+            '"{0}" colourspace is not supported, it must be one of {1}!'.
+            format(space, list(COLOUR_INDEX_METRICS.keys())))
+
+        if metric is not None:
+            assert metric.lower() in [
+                m.lower() for m in COLOUR_INDEX_METRICS[space]
+            ], ('"{0}" metric is not supported for "{1}" colourspace, it must '
+                'be one of {2}!'.format(metric, space,
+                                        COLOUR_INDEX_METRICS[space]))
+
+        self._space = space
+        self._metric = metric
+        self._candidates_factor = candidates_factor
+        self._kwargs = kwargs
+
+        self._colours = np.zeros((0, 3))
+        self._tree = None
+
+        if colours is not None:
+            self.insert(colours)
+
+    @property
+    def colours(self):
+        """
+        Getter property for the index reference colours.
+
+        Returns
+        -------
+        ndarray
+            Index reference colours.
+        """
+
+        return np.copy(self._colours)
+
+    @property
+    def space(self):
+        """
+        Getter property for the index colourspace.
+
+        Returns
+        -------
+        unicode
+            Index colourspace.
+        """
+
+        return self._space
+
+    @property
+    def metric(self):
+        """
+        Getter property for the index colour difference metric.
+
+        Returns
+        -------
+        unicode
+            Index colour difference metric.
+        """
+
+        return self._metric
+
+    def __len__(self):
+        """
+        Returns the index reference colours count.
+
+        Returns
+        -------
+        int
+            Index reference colours count.
+        """
+
+        return self._colours.shape[0]
+
+    @property
+    def tree(self):
+        """
+        Getter property for the index *k-d tree*, built on first access.
+
+        Returns
+        -------
+        cKDTree
+            Index *k-d tree*.
+        """
+
+        if self._tree is None:
+            self._tree = cKDTree(self._colours)
+
+        return self._tree
+
+    def insert(self, colours):
+        """
+        Inserts given reference colours into the index.
+
+        Parameters
+        ----------
+        colours : array_like
+            Reference colours in the index colourspace.
+
+        Returns
+        -------
+        ndarray
+            Indexes of the inserted colours.
+
+        Examples
+        --------
+        >>> index = ColourIndex()
+        >>> index.insert(np.array([[50.0, 0.0, 0.0], [60.0, 10.0, -10.0]]))
+        array([0, 1])
+        >>> index.insert(np.array([40.0, -20.0, 20.0]))
+        array([2])
+        """
+
+        colours = np.reshape(as_float_array(colours), (-1, 3))
+
+        indexes = np.arange(len(self), len(self) + colours.shape[0])
+
+        self._colours = np.vstack([self._colours, colours])
+        self._tree = None
+
+        return indexes
+
+    def _query(self, colours, k):
+        """
+        Queries the :math:`k` nearest reference colours of given 2-dimensional
+        colours array.
+        """
+
+        if self._metric is None:
+            distances, indexes = self.tree.query(colours, k)
+
+            return (np.reshape(distances, (-1, k)), np.reshape(
+                indexes, (-1, k)))
+
+        from colour.difference import DELTA_E_METHODS
+
+        k_c = min(len(self), k * self._candidates_factor)
+        _distances, candidates = self.tree.query(colours, k_c)
+        candidates = np.reshape(candidates, (-1, k_c))
+
+        function = DELTA_E_METHODS[self._metric]
+        distances = function(colours[:, np.newaxis, :],
+                             self._colours[candidates],
+                             **filter_kwargs(function, **self._kwargs))
+        distances = np.reshape(distances, candidates.shape)
+
+        ranking = np.argsort(distances, axis=-1)[..., :k]
+
+        return (np.take_along_axis(distances, ranking, axis=-1),
+                np.take_along_axis(candidates, ranking, axis=-1))
+
+    def query(self, colours, k=1, chunk_size=2 ** 16, workers=None):
+        """
+        Queries the :math:`k` nearest reference colours of given colours.
+
+        Parameters
+        ----------
+        colours : array_like
+            Colours in the index colourspace.
+        k : int, optional
+            Number of nearest reference colours to return.
+        chunk_size : int, optional
+            Number of colours queried at once, bounding the size of the
+            intermediate arrays.
+        workers : int, optional
+            Number of threads querying the chunks, if *None*, the chunks are
+            queried sequentially.
+
+        Returns
+        -------
+        tuple
+            Colour differences and indexes of the nearest reference colours
+            with shape ``colours.shape[:-1]`` if :math:`k` is 1,
+            ``colours.shape[:-1] + (k, )`` otherwise.
+
+        Raises
+        ------
+        ValueError
+            If the index is empty or if :math:`k` is greater than the
+            reference colours count.
+
+        Examples
+        --------
+        >>> colours = np.array([
+        ...     [50.0, 0.0, 0.0],
+        ...     [60.0, 10.0, -10.0],
+        ...     [40.0, -20.0, 20.0],
+        ... ])
+        >>> index = ColourIndex(colours)
+        >>> index.query(np.array([58.0, 8.0, -9.0]), k=2)
+        ... # doctest: +ELLIPSIS
+        (array([  3.        ,  14.4568322...]), array([1, 0]))
+        """
+
+        if k > len(self):
+            raise ValueError(
+                '"k" must be lower or equal to the reference colours count: '
+                '{0}!'.format(len(self)))
+
+        colours = as_float_array(colours)
+        shape = colours.shape[:-1]
+        colours = np.reshape(colours, (-1, 3))
+
+        distances = np.empty((colours.shape[0], k))
+        indexes = np.empty((colours.shape[0], k), np.int_)
+
+        # Building the tree before dispatching the chunks to the threads.
+        self.tree
+
+        def _query_chunk(chunk):
+            """
+            Queries given chunk into the output arrays.
+            """
+
+            distances[chunk], indexes[chunk] = self._query(colours[chunk], k)
+
+        chunks = chunk_slices(colours.shape[0], chunk_size)
+
+        if workers is None:
+            for chunk in chunks:
+                _query_chunk(chunk)
+        else:
+            with thread_pool(workers) as pool:
+                pool.map(_query_chunk, chunks)
+
+        shape = shape if k == 1 else shape + (k, )
+
+        return np.reshape(distances, shape), np.reshape(indexes, shape)
+
+    def write(self, path):
+        """
+        Writes the index to given *.npz* file path.
+
+        Parameters
+        ----------
+        path : unicode
+            Index file path.
+
+        Returns
+        -------
+        bool
+            Definition success.
+
+        Notes
+        -----
+        -   The *k-d tree* is not serialised but rebuilt on the first query
+            of the read index.
+        -   The re-ranking keyword arguments are serialised as *JSON* so that
+            their types, e.g. *bool*, are preserved, they must thus be
+            *JSON* serialisable.
+        """
+
+        np.savez(
+            path,
+            colours=self._colours,
+            space=self._space,
+            metric='' if self._metric is None else self._metric,
+            candidates_factor=self._candidates_factor,
+            kwargs=json.dumps(
+                self._kwargs, default=lambda x: np.asarray(x).tolist()))
+
+        return True
+
+    @staticmethod
+    def read(path):
+        """
+        Reads the index from given *.npz* file path.
+
+        Parameters
+        ----------
+        path : unicode
+            Index file path.
+
+        Returns
+        -------
+        ColourIndex
+            Colour index.
+
+        Examples
+        --------
+        >>> import os
+        >>> import tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), 'index.npz')
+        >>> ColourIndex(np.array([[50.0, 0.0, 0.0]]), metric='CMC').write(path)
+        True
+        >>> index = ColourIndex.read(path)
+        >>> len(index), index.metric
+        (1, 'CMC')
+        """
+
+        with np.load(path) as data:
+            metric = str(data['metric'])
+            kwargs = dict(
+                (str(name), value)
+                for name, value in json.loads(str(data['kwargs'])).items())
+
+            return ColourIndex(data['colours'], str(data['space']), metric
+                               if metric else None,
+                               int(data['candidates_factor']), **kwargs)
@@ -8,7 +8,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.difference import delta_E
+from colour.difference import delta_E, delta_E_chunked, delta_E_pairwise
 
 from colour.utilities import domain_range_scale
 
@@ -19,7 +19,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestDelta_E']
+__all__ = ['TestDelta_E', 'TestDelta_E_chunked', 'TestDelta_E_pairwise']
 
 
 class TestDelta_E(unittest.TestCase):
@@ -49,5 +49,98 @@ class TestDelta_E(unittest.TestCase):
                         decimal=7)
 
 
+class TestDelta_E_chunked(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.delta_E_chunked` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        random_state = np.random.RandomState(16)
+        self._Lab_1 = random_state.uniform(-50, 100, (12, 7, 3))
+        self._Lab_2 = random_state.uniform(-50, 100, (12, 7, 3))
+
+    def test_delta_E_chunked(self):
+        """
+        Tests :func:`colour.difference.delta_E_chunked` definition.
+        """
+
+        for method in ('CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'DIN99'):
+            delta_E_r = delta_E(self._Lab_1, self._Lab_2, method)
+
+            np.testing.assert_almost_equal(
+                delta_E_chunked(
+                    self._Lab_1, self._Lab_2, method, memory_budget=4096),
+                delta_E_r,
+                decimal=7)
+
+            np.testing.assert_almost_equal(
+                delta_E_chunked(
+                    self._Lab_1,
+                    self._Lab_2,
+                    method,
+                    memory_budget=4096,
+                    workers=2),
+                delta_E_r,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_chunked(self._Lab_1, self._Lab_2[0, 0], 'CIE 2000', 4096),
+            delta_E(self._Lab_1, self._Lab_2[0, 0], 'CIE 2000'),
+            decimal=7)
+
+        out = np.zeros(self._Lab_1.shape[:-1], np.float32)
+        delta_E_chunked(self._Lab_1, self._Lab_2, memory_budget=4096, out=out)
+        np.testing.assert_allclose(
+            out, delta_E(self._Lab_1, self._Lab_2), rtol=1e-5)
+
+    def test_raise_exception_delta_E_chunked(self):
+        """
+        Tests :func:`colour.difference.delta_E_chunked` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, delta_E_chunked, self._Lab_1,
+                          self._Lab_2[0])
+
+
+class TestDelta_E_pairwise(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.delta_E_pairwise` definition unit tests
+    methods.
+    """
+
+    def test_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.delta_E_pairwise` definition.
+        """
+
+        random_state = np.random.RandomState(16)
+        Lab_1 = random_state.uniform(-50, 100, (5, 3, 3))
+        Lab_2 = random_state.uniform(-50, 100, (11, 3))
+
+        for method in ('CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'DIN99'):
+            delta_E_r = delta_E(Lab_1[:, :, np.newaxis, :],
+                                Lab_2[np.newaxis, np.newaxis, :, :], method)
+
+            delta_E_p = delta_E_pairwise(
+                Lab_1, Lab_2, method, memory_budget=2048)
+            self.assertTupleEqual(delta_E_p.shape, (5, 3, 11))
+            np.testing.assert_almost_equal(delta_E_p, delta_E_r, decimal=7)
+
+            np.testing.assert_almost_equal(
+                delta_E_pairwise(
+                    Lab_1, Lab_2, method, memory_budget=2048, workers=2),
+                delta_E_r,
+                decimal=7)
+
+        self.assertEqual(
+            delta_E_pairwise(Lab_1, Lab_2, dtype=np.float32).dtype, np.float32)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.difference.index` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.difference import (ColourIndex, delta_E_CAM16LCD, delta_E_CIE1976,
+                               delta_E_CIE2000)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestColourIndex']
+
+
+class TestColourIndex(unittest.TestCase):
+    """
+    Defines :class:`colour.difference.index.ColourIndex` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        np.random.seed(16)
+
+        self._colours = np.random.random(
+            (256, 3)) * np.array([100, 160, 160]) - np.array([0, 80, 80])
+        self._samples = np.random.random(
+            (64, 3)) * np.array([100, 160, 160]) - np.array([0, 80, 80])
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('colours', 'space', 'metric')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ColourIndex))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__len__', 'insert', 'query', 'write',
+                            'read')
+
+        for method in required_methods:
+            self.assertIn(method, dir(ColourIndex))
+
+    def test_insert(self):
+        """
+        Tests :meth:`colour.difference.index.ColourIndex.insert` method.
+        """
+
+        index = ColourIndex()
+        self.assertEqual(len(index), 0)
+
+        np.testing.assert_equal(
+            index.insert(self._colours[:128]), np.arange(128))
+        np.testing.assert_equal(
+            index.insert(self._colours[128:]), np.arange(128, 256))
+        np.testing.assert_equal(index.colours, self._colours)
+
+        index.query(self._samples)
+        index.insert(self._samples[0])
+        distances, indexes = index.query(self._samples[0])
+        self.assertEqual(distances, 0)
+        self.assertEqual(indexes, 256)
+
+    def test_query(self):
+        """
+        Tests :meth:`colour.difference.index.ColourIndex.query` method.
+        """
+
+        delta_E = delta_E_CIE1976(self._samples[:, np.newaxis, :],
+                                  self._colours)
+        ranking = np.argsort(delta_E, axis=-1)
+
+        index = ColourIndex(self._colours)
+        distances, indexes = index.query(self._samples)
+        self.assertEqual(indexes.shape, (64, ))
+        np.testing.assert_equal(indexes, ranking[:, 0])
+        np.testing.assert_almost_equal(
+            distances, np.min(delta_E, axis=-1), decimal=7)
+
+        distances, indexes = index.query(
+            np.reshape(self._samples, (4, 16, 3)), k=4, chunk_size=5)
+        self.assertEqual(indexes.shape, (4, 16, 4))
+        np.testing.assert_equal(np.reshape(indexes, (64, 4)), ranking[:, :4])
+
+        np.testing.assert_equal(
+            index.query(self._samples, 4, chunk_size=5, workers=4)[1],
+            ranking[:, :4])
+
+        delta_E = delta_E_CIE2000(self._samples[:, np.newaxis, :],
+                                  self._colours)
+
+        index = ColourIndex(
+            self._colours, metric='CIE 2000', candidates_factor=256)
+        distances, indexes = index.query(self._samples, k=3)
+        np.testing.assert_equal(indexes, np.argsort(delta_E, axis=-1)[:, :3])
+        np.testing.assert_almost_equal(
+            distances, np.sort(delta_E, axis=-1)[:, :3], decimal=7)
+
+        index = ColourIndex(self._colours, metric='CIE 2000')
+        distances, indexes = index.query(self._samples)
+        self.assertGreater(
+            np.mean(indexes == np.argmin(delta_E, axis=-1)), 0.9)
+
+        delta_E = delta_E_CAM16LCD(self._samples[:, np.newaxis, :],
+                                   self._colours)
+
+        index = ColourIndex(
+            self._colours,
+            'CAM16-LCD',
+            metric='CAM16-LCD',
+            candidates_factor=256)
+        distances, indexes = index.query(self._samples, k=3)
+        np.testing.assert_equal(indexes, np.argsort(delta_E, axis=-1)[:, :3])
+
+        self.assertRaises(
+            AssertionError,
+            ColourIndex,
+            self._colours,
+            'CAM16-UCS',
+            metric='CAM16-LCD')
+
+    def test_raise_exception_query(self):
+        """
+        Tests :meth:`colour.difference.index.ColourIndex.query` method raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, ColourIndex().query, self._samples)
+        self.assertRaises(ValueError,
+                          ColourIndex(self._colours[:2]).query, self._samples,
+                          3)
+
+    def test_read_write(self):
+        """
+        Tests :meth:`colour.difference.index.ColourIndex.read` and
+        :meth:`colour.difference.index.ColourIndex.write` methods.
+        """
+
+        path = os.path.join(self._temporary_directory, 'index.npz')
+
+        index = ColourIndex(
+            self._colours, metric='CMC', candidates_factor=8, l=1, c=1)
+        self.assertTrue(index.write(path))
+
+        index_r = ColourIndex.read(path)
+        self.assertEqual(index_r.space, index.space)
+        self.assertEqual(index_r.metric, index.metric)
+        np.testing.assert_equal(index_r.colours, index.colours)
+        np.testing.assert_equal(
+            index_r.query(self._samples, 2), index.query(self._samples, 2))
+
+        ColourIndex(self._colours).write(path)
+        self.assertIsNone(ColourIndex.read(path).metric)
+
+        index = ColourIndex(self._colours, metric='CIE 1994', textiles=False)
+        index.write(path)
+        index_r = ColourIndex.read(path)
+        np.testing.assert_equal(
+            index_r.query(self._samples, 2), index.query(self._samples, 2))
+        np.testing.assert_equal(
+            index_r.query(self._samples, 2),
+            ColourIndex(self._colours, metric='CIE 1994').query(
+                self._samples, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
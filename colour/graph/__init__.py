@@ -2,10 +2,15 @@
 
 from __future__ import absolute_import
 
-from .conversion import (CONVERSION_GRAPH, CONVERSION_GRAPH_NODE_LABELS,
-                         describe_conversion_path, convert)
+from .conversion import (
+    CONVERSION_GRAPH, CONVERSION_GRAPH_NODE_LABELS, Conversion_Routing_Table,
+    build_conversion_routing_table, get_conversion_routing_table,
+    set_conversion_routing_table, describe_conversion_path, convert,
+    convert_many)
 
 __all__ = [
     'CONVERSION_GRAPH', 'CONVERSION_GRAPH_NODE_LABELS',
-    'describe_conversion_path', 'convert'
+    'Conversion_Routing_Table', 'build_conversion_routing_table',
+    'get_conversion_routing_table', 'set_conversion_routing_table',
+    'describe_conversion_path', 'convert', 'convert_many'
 ]
@@ -5,16 +5,22 @@ Automatic Colour Conversion Graph
 
 Defines the automatic colour conversion graph objects:
 
+-   :class:`colour.graph.Conversion_Routing_Table`
+-   :func:`colour.graph.build_conversion_routing_table`
+-   :func:`colour.graph.get_conversion_routing_table`
+-   :func:`colour.graph.set_conversion_routing_table`
 -   :func:`colour.describe_conversion_path`
 -   :func:`colour.convert`
+-   :func:`colour.convert_many`
 """
 
 from __future__ import division, print_function, unicode_literals
 
+import heapq
 import inspect
 import numpy as np
 import textwrap
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from copy import copy
 from functools import partial
 from pprint import pformat
@@ -56,8 +62,10 @@ from colour.appearance import (
     CIECAM02_to_XYZ, XYZ_to_ATD95, XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt,
     XYZ_to_LLAB, XYZ_to_Nayatani95, XYZ_to_RLAB)
 from colour.temperature import CCT_to_uv, CCT_to_xy, uv_to_CCT, xy_to_CCT
-from colour.utilities import (domain_range_scale, filter_kwargs, message_box,
-                              required, tsplit, tstack, usage_warning)
+from colour.utilities import (domain_range_scale, filter_kwargs, is_string,
+                              message_box, profiled, required, tsplit, tstack,
+                              usage_warning)
+from colour.utilities.profiling import _profile_call
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -72,7 +80,9 @@ __all__ = [
     'XYZ_to_luminance', 'RGB_luminance_to_RGB',
     'CONVERSION_SPECIFICATIONS_DATA', 'CONVERSION_GRAPH_NODE_LABELS',
     'CONVERSION_SPECIFICATIONS', 'CONVERSION_GRAPH',
-    'describe_conversion_path', 'convert'
+    'Conversion_Routing_Table', 'build_conversion_routing_table',
+    'get_conversion_routing_table', 'set_conversion_routing_table',
+    'describe_conversion_path', 'convert', 'convert_many'
 ]
 
 
@@ -580,13 +590,303 @@ def _build_graph():
 
 CONVERSION_GRAPH = None
 """
-Automatic colour conversion graph.
+Automatic colour conversion graph, only built for plotting purposes: The
+conversion paths are resolved with a
+:class:`colour.graph.Conversion_Routing_Table` class instance.
 
 CONVERSION_GRAPH : DiGraph
 """
 
 
 @required('NetworkX')
+def _conversion_graph():
+    """
+    Returns the automatic colour conversion graph, building it if required.
+
+    Returns
+    -------
+    DiGraph
+         Automatic colour conversion graph.
+    """
+
+    import colour
+
+    global CONVERSION_GRAPH
+
+    if CONVERSION_GRAPH is None:
+        # Updating the :attr:`CONVERSION_GRAPH` attributes.
+        colour.graph.CONVERSION_GRAPH = CONVERSION_GRAPH = _build_graph()
+
+    return CONVERSION_GRAPH
+
+
+class Conversion_Routing_Table(
+        namedtuple('Conversion_Routing_Table',
+                   ('nodes', 'predecessors', 'costs'))):
+    """
+    All-pairs routing table of the automatic colour conversion graph.
+
+    The routing table only stores the nodes names and *ndarray* instances, it
+    can thus be serialised, e.g. with :mod:`pickle`, and given to worker
+    processes which can then skip building it.
+
+    Parameters
+    ----------
+    nodes : tuple
+        Nodes of the graph, their indexes are those used by the
+        ``predecessors`` and ``costs`` arrays.
+    predecessors : ndarray, (n, n)
+        Predecessors array: The value at index :math:`[i, j]` is the index of
+        the node preceding node :math:`j` on the cheapest conversion path from
+        node :math:`i`, it is negative when there is no such path.
+    costs : ndarray, (n, n)
+        Costs of the cheapest conversion paths from node :math:`i` to node
+        :math:`j`, *inf* when there is no such path.
+    """
+
+
+def build_conversion_routing_table(costs=None):
+    """
+    Builds the all-pairs routing table of the automatic colour conversion graph
+    from :attr:`colour.graph.CONVERSION_SPECIFICATIONS` attribute.
+
+    Parameters
+    ----------
+    costs : dict, optional
+        Edges costs, e.g. measured execution times of the conversion
+        definitions, indexed by the *(source, target)* nodes of the edges.
+        Edges without cost have a unit cost, thus, by default, the conversion
+        paths are those with the fewest edges.
+
+    Notes
+    -----
+    -   Ties between conversion paths of equal cost are broken
+        deterministically: The nodes being visited by increasing cost then
+        index, each node keeps the first predecessor reaching it at its lowest
+        cost.
+
+    Returns
+    -------
+    Conversion_Routing_Table
+        All-pairs routing table.
+
+    Examples
+    --------
+    >>> table = build_conversion_routing_table()
+    >>> table.costs[table.nodes.index('cie lab'), table.nodes.index('cct')]
+    3.0
+    >>> table = build_conversion_routing_table({
+    ...     ('cie xyz', 'cie xy'): 5,
+    ...     ('cie xyz', 'cie xyy'): 5
+    ... })
+    >>> table.costs[table.nodes.index('cie lab'), table.nodes.index('cct')]
+    4.0
+    """
+
+    if costs is None:
+        costs = {}
+
+    nodes = tuple(
+        sorted(
+            set([
+                node for specification in CONVERSION_SPECIFICATIONS
+                for node in specification[:2]
+            ])))
+    indexes = dict((node, i) for i, node in enumerate(nodes))
+
+    # Like for the graph edges, the last specification of an edge prevails.
+    edges = OrderedDict()
+    for specification in CONVERSION_SPECIFICATIONS:
+        edges[(indexes[specification.source],
+               indexes[specification.target])] = costs.get(
+                   (specification.source, specification.target), 1)
+
+    assert min(edges.values()) > 0, 'Edges costs must be strictly positive!'
+
+    successors = [[] for _node in nodes]
+    for (i, j), cost in edges.items():
+        successors[i].append((j, cost))
+
+    count = len(nodes)
+    path_costs = np.full((count, count), np.inf)
+    predecessors = np.full((count, count), -1, dtype=np.int16)
+    for i in range(count):
+        # Dijkstra algorithm, the nodes being visited by increasing cost then
+        # index, a node keeps the first predecessor reaching it at its lowest
+        # cost so that ties are broken deterministically.
+        row_costs, row_predecessors = [np.inf] * count, [-1] * count
+        row_costs[i], row_predecessors[i] = 0, i
+        heap = [(0, i)]
+        while heap:
+            cost, j = heapq.heappop(heap)
+            if cost > row_costs[j]:
+                continue
+
+            for k, edge_cost in successors[j]:
+                if cost + edge_cost < row_costs[k]:
+                    row_costs[k], row_predecessors[k] = cost + edge_cost, j
+                    heapq.heappush(heap, (cost + edge_cost, k))
+
+        path_costs[i] = row_costs
+        predecessors[i] = row_predecessors
+
+    return Conversion_Routing_Table(nodes, predecessors, path_costs)
+
+
+_CONVERSION_ROUTING_TABLE = None
+"""
+Routing table used to resolve the conversion paths.
+
+_CONVERSION_ROUTING_TABLE : Conversion_Routing_Table
+"""
+
+_CONVERSION_FUNCTIONS = None
+"""
+Conversion functions indexed by the *(source, target)* nodes of their edges.
+
+_CONVERSION_FUNCTIONS : dict
+"""
+
+
+def get_conversion_routing_table():
+    """
+    Returns the routing table used to resolve the conversion paths of the
+    automatic colour conversion graph, building it on first use.
+
+    Returns
+    -------
+    Conversion_Routing_Table
+        Routing table.
+
+    Examples
+    --------
+    >>> get_conversion_routing_table().nodes[:3]
+    ('atd95', 'cam02lcd', 'cam02scd')
+    """
+
+    global _CONVERSION_ROUTING_TABLE
+
+    if _CONVERSION_ROUTING_TABLE is None:
+        _CONVERSION_ROUTING_TABLE = build_conversion_routing_table()
+
+    return _CONVERSION_ROUTING_TABLE
+
+
+def set_conversion_routing_table(table=None):
+    """
+    Sets the routing table used to resolve the conversion paths of the
+    automatic colour conversion graph.
+
+    Parameters
+    ----------
+    table : Conversion_Routing_Table, optional
+        Routing table, e.g. built with given edges costs or unserialised in a
+        worker process. If *None*, the default routing table will be built on
+        next use.
+
+    Examples
+    --------
+    >>> set_conversion_routing_table(build_conversion_routing_table())
+    >>> set_conversion_routing_table()
+    """
+
+    global _CONVERSION_ROUTING_TABLE
+    global _CONVERSION_FUNCTIONS
+
+    _CONVERSION_ROUTING_TABLE = table
+    _CONVERSION_FUNCTIONS = None
+
+
+def _conversion_function(source, target):
+    """
+    Returns the conversion function of the edge between given source and
+    target nodes.
+
+    Parameters
+    ----------
+    source : unicode
+        Source node.
+    target : unicode
+        Target node.
+
+    Returns
+    -------
+    callable
+        Conversion function.
+
+    Examples
+    --------
+    >>> _conversion_function('cie xyz', 'cie xy')  # doctest: +ELLIPSIS
+    <function XYZ_to_xy at 0x...>
+    """
+
+    global _CONVERSION_FUNCTIONS
+
+    if _CONVERSION_FUNCTIONS is None:
+        _CONVERSION_FUNCTIONS = dict(
+            ((specification.source, specification.target),
+             specification.conversion_function)
+            for specification in CONVERSION_SPECIFICATIONS)
+
+    return _CONVERSION_FUNCTIONS[(source, target)]
+
+
+def _conversion_nodes_path(source, target):
+    """
+    Returns the nodes of the conversion path from the source node to the
+    target node in the automatic colour conversion graph.
+
+    Parameters
+    ----------
+    source : unicode
+        Source node.
+    target : unicode
+        Target node.
+
+    Returns
+    -------
+    list
+        Nodes of the conversion path from the source node to the target node.
+
+    Raises
+    ------
+    ValueError
+        If a node is not defined or if there is no conversion path from the
+        source node to the target node.
+
+    Examples
+    --------
+    >>> _conversion_nodes_path('cie lab', 'cct')
+    ['cie lab', 'cie xyz', 'cie xy', 'cct']
+    """
+
+    table = get_conversion_routing_table()
+
+    for node in (source, target):
+        if node not in table.nodes:
+            raise ValueError(
+                '"{0}" node is not defined in the automatic colour conversion '
+                'graph!'.format(node))
+
+    i, j = table.nodes.index(source), table.nodes.index(target)
+
+    # Walking the predecessors of the source node row as a list is much faster
+    # than indexing the *ndarray* for each node.
+    predecessors = table.predecessors[i].tolist()
+
+    path = [j]
+    while path[-1] != i:
+        if predecessors[path[-1]] < 0:
+            raise ValueError(
+                'No conversion path exists from "{0}" to "{1}"!'.format(
+                    source, target))
+
+        path.append(predecessors[path[-1]])
+
+    return [table.nodes[node] for node in reversed(path)]
+
+
+@profiled
 def _conversion_path(source, target):
     """
     Returns the conversion path from the source node to the target node in the
@@ -613,21 +913,9 @@ def _conversion_path(source, target):
 <function xy_to_CCT at 0x...>]
     """
 
-    import colour
-    import networkx as nx
+    path = _conversion_nodes_path(source, target)
 
-    global CONVERSION_GRAPH
-
-    if CONVERSION_GRAPH is None:
-        # Updating the :attr:`CONVERSION_GRAPH` attributes.
-        colour.graph.CONVERSION_GRAPH = CONVERSION_GRAPH = _build_graph()
-
-    path = nx.shortest_path(CONVERSION_GRAPH, source, target)
-
-    return [
-        CONVERSION_GRAPH.get_edge_data(a, b)['conversion_function']
-        for a, b in zip(path[:-1], path[1:])
-    ]
+    return [_conversion_function(a, b) for a, b in zip(path[:-1], path[1:])]
 
 
 def _lower_order_function(callable_):
@@ -650,6 +938,69 @@ def _lower_order_function(callable_):
     return callable_.func if isinstance(callable_, partial) else callable_
 
 
+def _usage_warning_conversion_graph(definition):
+    """
+    Issues the usage warning of the automatic colour conversion graph beta
+    feature for given definition name.
+    """
+
+    # TODO: Remove the following warning whenever the automatic colour
+    # conversion graph implementation is considered stable.
+    usage_warning(
+        'The "Automatic Colour Conversion Graph" is a beta feature, be '
+        'mindful of this when using it. Please report any unexpected '
+        'behaviour and do not hesitate to ask any questions should they arise.'
+        '\nThis warning can be disabled with the '
+        '"colour.utilities.suppress_warnings" context manager as follows:\n'
+        'with colour.utilities.suppress_warnings(colour_usage_warnings=True): '
+        '\n    {0}(*args, **kwargs)'.format(definition))
+
+
+def _convert_edge(a, conversion_function, kwargs, verbose_kwargs):
+    """
+    Converts given object :math:`a` with given conversion function, i.e. along
+    an edge of the automatic colour conversion graph, and stores the returned
+    object into given verbose keyword arguments.
+
+    Parameters
+    ----------
+    a : object
+        Object :math:`a` to convert.
+    conversion_function : callable
+        Conversion function of the edge.
+    kwargs : dict
+        Keyword arguments passed to :func:`colour.convert` definition.
+    verbose_kwargs : dict
+        Keyword arguments for :func:`colour.describe_conversion_path`
+        definition, updated in place.
+
+    Returns
+    -------
+    object
+        Converted object :math:`a`.
+    """
+
+    conversion_function_name = _lower_order_function(
+        conversion_function).__name__
+
+    # Filtering compatible keyword arguments passed directly and
+    # irrespective of any conversion function name.
+    filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
+
+    # Filtering keyword arguments passed as dictionary with the
+    # conversion function name.
+    filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+
+    a = _profile_call(conversion_function, a, **filtered_kwargs)
+
+    if conversion_function_name in verbose_kwargs:
+        verbose_kwargs[conversion_function_name]['return'] = a
+    else:
+        verbose_kwargs[conversion_function_name] = {'return': a}
+
+    return a
+
+
 def describe_conversion_path(source,
                              target,
                              mode='Short',
@@ -758,13 +1109,15 @@ def describe_conversion_path(source,
 
 
 @domain_range_scale('1')
+@profiled
 def convert(a, source, target, **kwargs):
     """
     Converts given object :math:`a` from source colour representation to target
     colour representation using the automatic colour conversion graph.
 
-    The conversion is performed by finding the shortest path in a
-    `NetworkX <https://networkx.github.io/>`__ :class:`DiGraph` class instance.
+    The conversion is performed along the cheapest path, i.e. by default the
+    path with the fewest edges, given by the all-pairs routing table returned
+    by :func:`colour.graph.get_conversion_routing_table` definition.
 
     The conversion path adopts the **'1'** domain-range scale and the object
     :math:`a` is expected to be *soft* normalised accordingly. For example,
@@ -951,16 +1304,7 @@ verbose={'mode': 'Long'})
     array([ 0.4567576...,  0.3098826...,  0.2486222...])
     """
 
-    # TODO: Remove the following warning whenever the automatic colour
-    # conversion graph implementation is considered stable.
-    usage_warning(
-        'The "Automatic Colour Conversion Graph" is a beta feature, be '
-        'mindful of this when using it. Please report any unexpected '
-        'behaviour and do not hesitate to ask any questions should they arise.'
-        '\nThis warning can be disabled with the '
-        '"colour.utilities.suppress_warnings" context manager as follows:\n'
-        'with colour.utilities.suppress_warnings(colour_usage_warnings=True): '
-        '\n    convert(*args, **kwargs)')
+    _usage_warning_conversion_graph('convert')
 
     source, target = source.lower(), target.lower()
 
@@ -968,26 +1312,94 @@ verbose={'mode': 'Long'})
 
     verbose_kwargs = copy(kwargs)
     for conversion_function in conversion_path:
-        conversion_function_name = _lower_order_function(
-            conversion_function).__name__
+        a = _convert_edge(a, conversion_function, kwargs, verbose_kwargs)
 
-        # Filtering compatible keyword arguments passed directly and
-        # irrespective of any conversion function name.
-        filtered_kwargs = filter_kwargs(conversion_function, **kwargs)
+    if 'verbose' in verbose_kwargs:
+        verbose_kwargs.update(verbose_kwargs.pop('verbose'))
+        describe_conversion_path(source, target, **verbose_kwargs)
 
-        # Filtering keyword arguments passed as dictionary with the
-        # conversion function name.
-        filtered_kwargs.update(kwargs.get(conversion_function_name, {}))
+    return a
+
+
+@domain_range_scale('1')
+@profiled
+def convert_many(a, source, targets, **kwargs):
+    """
+    Converts given object :math:`a` from source colour representation to many
+    target colour representations using the automatic colour conversion graph.
+
+    The shortest conversion paths to the target colour representations are
+    merged into a tree rooted at the source colour representation: The
+    conversion definitions of the paths prefixes shared by many targets, e.g.
+    :func:`colour.XYZ_to_CAM16` for both the *CAM16* and *CAM16UCS* targets,
+    are evaluated only once, and the domain-range scale is set only once for
+    all the targets.
+
+    Parameters
+    ----------
+    a : array_like or numeric or SpectralDistribution
+        Object :math:`a` to convert.
+    source : unicode
+        Source colour representation, i.e. the source node in the automatic
+        colour conversion graph.
+    targets : unicode or array_like
+        Target colour representation(s), i.e. the target node(s) in the
+        automatic colour conversion graph.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.convert`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    dict
+        Converted object :math:`a` for each target colour representation.
+
+    Warnings
+    --------
+    The domain-range scale is **'1'** and cannot be changed.
+
+    Examples
+    --------
+    >>> a = np.array([0.20654008, 0.12197225, 0.05136952])
+    >>> converted = convert_many(a, 'CIE XYZ', ['CIE Lab', 'CIE LCHab'])
+    >>> converted['CIE Lab']  # doctest: +ELLIPSIS
+    array([ 0.4152787...,  0.5263858...,  0.2692317...])
+    >>> converted['CIE LCHab']  # doctest: +ELLIPSIS
+    array([ 0.4152787...,  0.5912425...,  0.0752458...])
+    """
+
+    _usage_warning_conversion_graph('convert_many')
+
+    if is_string(targets):
+        targets = [targets]
 
-        a = conversion_function(a, **filtered_kwargs)
+    source = source.lower()
 
-        if conversion_function_name in verbose_kwargs:
-            verbose_kwargs[conversion_function_name]['return'] = a
-        else:
-            verbose_kwargs[conversion_function_name] = {'return': a}
+    # Converted objects indexed by the conversion path prefixes, i.e. the
+    # nodes of the tree merging the conversion paths.
+    tree = {(source, ): a}
+
+    converted = {}
+    verbose_kwargs = copy(kwargs)
+    for target in targets:
+        path = tuple(_conversion_nodes_path(source, target.lower()))
+
+        for i in range(1, len(path)):
+            if path[:i + 1] in tree:
+                continue
+
+            tree[path[:i + 1]] = _convert_edge(
+                tree[path[:i]], _conversion_function(path[i - 1], path[i]),
+                kwargs, verbose_kwargs)
+
+        converted[target] = tree[path]
 
     if 'verbose' in verbose_kwargs:
         verbose_kwargs.update(verbose_kwargs.pop('verbose'))
-        describe_conversion_path(source, target, **verbose_kwargs)
+        for target in targets:
+            describe_conversion_path(source, target.lower(), **verbose_kwargs)
 
-    return a
+    return converted
@@ -6,13 +6,21 @@ Defines unit tests for :mod:`colour.graph.conversion` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import pickle
 import six
 import unittest
 
+from colour.appearance import CAM_Specification_CAM16
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import CCS_ILLUMINANTS, SDS_ILLUMINANTS
 from colour.models import RGB_COLOURSPACE_ACES2065_1
-from colour.graph import describe_conversion_path, convert
+from colour.graph import (
+    Conversion_Routing_Table, build_conversion_routing_table,
+    get_conversion_routing_table, set_conversion_routing_table,
+    describe_conversion_path, convert, convert_many)
+from colour.graph.conversion import (CONVERSION_GRAPH_NODE_LABELS,
+                                     _conversion_nodes_path)
+from colour.utilities import profile
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -21,7 +29,111 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestDescribeConversionPath', 'TestConvert']
+__all__ = [
+    'TestBuildConversionRoutingTable', 'TestSetConversionRoutingTable',
+    'TestDescribeConversionPath', 'TestConvert', 'TestConvertMany'
+]
+
+
+class TestBuildConversionRoutingTable(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.build_conversion_routing_table`
+    definition unit tests methods.
+    """
+
+    def test_build_conversion_routing_table(self):
+        """
+        Tests :func:`colour.graph.conversion.build_conversion_routing_table`
+        definition.
+        """
+
+        table = build_conversion_routing_table()
+
+        self.assertIsInstance(table, Conversion_Routing_Table)
+        self.assertListEqual(
+            list(table.nodes), sorted(CONVERSION_GRAPH_NODE_LABELS.keys()))
+        self.assertTupleEqual(table.predecessors.shape,
+                              (len(table.nodes), len(table.nodes)))
+
+        i, j = table.nodes.index('cie lab'), table.nodes.index('cct')
+        self.assertEqual(table.costs[i, j], 3)
+        self.assertEqual(table.nodes[table.predecessors[i, j]], 'cie xy')
+
+        # Only cheapest path: "CIE Lab" --> "CIE XYZ" --> "CIE UCS" -->
+        # "CIE UCS uv" --> "CCT".
+        table = build_conversion_routing_table({
+            ('cie xyz', 'cie xy'): 5,
+            ('cie xyz', 'cie xyy'): 5
+        })
+        self.assertEqual(table.costs[i, j], 4)
+        self.assertEqual(table.nodes[table.predecessors[i, j]], 'cie ucs uv')
+
+        unpickled_table = pickle.loads(pickle.dumps(table))
+        self.assertTupleEqual(unpickled_table.nodes, table.nodes)
+        np.testing.assert_equal(unpickled_table.predecessors,
+                                table.predecessors)
+        np.testing.assert_equal(unpickled_table.costs, table.costs)
+
+    def test_raise_exception_build_conversion_routing_table(self):
+        """
+        Tests :func:`colour.graph.conversion.build_conversion_routing_table`
+        definition raised exception.
+        """
+
+        self.assertRaises(AssertionError, build_conversion_routing_table,
+                          {('cie xyz', 'cie xy'): 0})
+
+
+class TestSetConversionRoutingTable(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.set_conversion_routing_table`
+    definition unit tests methods.
+    """
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        set_conversion_routing_table()
+
+    def test_set_conversion_routing_table(self):
+        """
+        Tests :func:`colour.graph.conversion.set_conversion_routing_table`
+        definition.
+        """
+
+        self.assertListEqual(
+            _conversion_nodes_path('cie lab', 'cct'),
+            ['cie lab', 'cie xyz', 'cie xy', 'cct'])
+
+        # Only cheapest path: "CIE Lab" --> "CIE XYZ" --> "CIE UCS" -->
+        # "CIE UCS uv" --> "CCT".
+        table = build_conversion_routing_table({
+            ('cie xyz', 'cie xy'): 5,
+            ('cie xyz', 'cie xyy'): 5
+        })
+        set_conversion_routing_table(pickle.loads(pickle.dumps(table)))
+        self.assertListEqual(
+            _conversion_nodes_path('cie lab', 'cct'),
+            ['cie lab', 'cie xyz', 'cie ucs', 'cie ucs uv', 'cct'])
+
+        set_conversion_routing_table()
+        self.assertIsNot(get_conversion_routing_table(), table)
+        self.assertListEqual(
+            _conversion_nodes_path('cie lab', 'cct'),
+            ['cie lab', 'cie xyz', 'cie xy', 'cct'])
+
+    def test_raise_exception_conversion_nodes_path(self):
+        """
+        Tests :func:`colour.graph.conversion._conversion_nodes_path` definition
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, _conversion_nodes_path, 'cie xyz',
+                          'undefined')
+        self.assertRaises(ValueError, _conversion_nodes_path, 'atd95',
+                          'cie xyz')
 
 
 class TestDescribeConversionPath(unittest.TestCase):
@@ -130,5 +242,59 @@ class TestConvert(unittest.TestCase):
                 illuminant=tuple(illuminant)))
 
 
+class TestConvertMany(unittest.TestCase):
+    """
+    Defines :func:`colour.graph.conversion.convert_many` definition unit tests
+    methods.
+    """
+
+    def test_convert_many(self):
+        """
+        Tests :func:`colour.graph.conversion.convert_many` definition.
+        """
+
+        a = np.array([0.20654008, 0.12197225, 0.05136952])
+        targets = ('CIE XYZ', 'CIE Lab', 'CIE LCHab', 'CAM16UCS', 'JzAzBz',
+                   'Hunter Lab')
+
+        with profile() as session:
+            converted = convert_many(a, 'CIE XYZ', targets)
+
+        self.assertListEqual(sorted(converted.keys()), sorted(targets))
+        for target in targets:
+            np.testing.assert_almost_equal(
+                converted[target], convert(a, 'CIE XYZ', target), decimal=7)
+
+        self.assertEqual(
+            session.definitions['colour.models.cie_lab.XYZ_to_Lab']['calls'],
+            1)
+
+        converted = convert_many(
+            a, 'CIE XYZ', ['CAM16', 'CAM16UCS'], verbose={'mode': 'Short'})
+        self.assertIsInstance(converted['CAM16'], CAM_Specification_CAM16)
+        np.testing.assert_almost_equal(
+            converted['CAM16UCS'],
+            convert(a, 'CIE XYZ', 'CAM16UCS'),
+            decimal=7)
+
+        illuminant = CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50']
+        converted = convert_many(
+            a,
+            'CIE XYZ', ['CIE xyY', 'CIE Lab'],
+            XYZ_to_Lab={'illuminant': illuminant})
+        np.testing.assert_almost_equal(
+            converted['CIE Lab'],
+            convert(
+                a, 'CIE XYZ', 'CIE Lab',
+                XYZ_to_Lab={'illuminant': illuminant}),
+            decimal=7)
+
+        converted = convert_many(a, 'CIE XYZ', 'CIE Lab')
+        self.assertListEqual(list(converted.keys()), ['CIE Lab'])
+        np.testing.assert_almost_equal(
+            converted['CIE Lab'], convert(a, 'CIE XYZ', 'CIE Lab'), decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
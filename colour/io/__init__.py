@@ -10,9 +10,13 @@ from .image import read_image_Imageio, write_image_Imageio
 from .image import READ_IMAGE_METHODS, WRITE_IMAGE_METHODS
 from .image import read_image, write_image
 from .tabular import (read_spectral_data_from_csv_file, read_sds_from_csv_file,
-                      write_sds_to_csv_file)
+                      write_sds_to_csv_file, read_msds_from_csv_file,
+                      write_msds_to_csv_file)
 from .tm2714 import SpectralDistribution_IESTM2714
 from .xrite import read_sds_from_xrite_file
+from .directory import (read_sds_from_IESTM2714_file,
+                        SPECTRAL_DATA_FILE_READERS, read_msds_from_files,
+                        read_msds_from_directory)
 
 __all__ = []
 __all__ += luts.__all__
@@ -23,7 +27,12 @@ __all__ += ['READ_IMAGE_METHODS', 'WRITE_IMAGE_METHODS']
 __all__ += ['read_image', 'write_image']
 __all__ += [
     'read_spectral_data_from_csv_file', 'read_sds_from_csv_file',
-    'write_sds_to_csv_file'
+    'write_sds_to_csv_file', 'read_msds_from_csv_file',
+    'write_msds_to_csv_file'
 ]
 __all__ += ['SpectralDistribution_IESTM2714']
 __all__ += ['read_sds_from_xrite_file']
+__all__ += [
+    'read_sds_from_IESTM2714_file', 'SPECTRAL_DATA_FILE_READERS',
+    'read_msds_from_files', 'read_msds_from_directory'
+]
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+Spectral Data Directory Input
+=============================
+
+Defines various objects reading many spectral data files at once:
+
+-   :func:`colour.io.read_sds_from_IESTM2714_file`
+-   :attr:`colour.io.SPECTRAL_DATA_FILE_READERS`
+-   :func:`colour.io.read_msds_from_files`
+-   :func:`colour.io.read_msds_from_directory`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+
+from colour.colorimetry import MultiSpectralDistributions
+from colour.colorimetry import SPECTRAL_SHAPE_DEFAULT
+from colour.io.tabular import read_sds_from_csv_file
+from colour.io.tm2714 import SpectralDistribution_IESTM2714
+from colour.io.xrite import read_sds_from_xrite_file
+from colour.utilities import (CaseInsensitiveMapping, multiprocessing_pool,
+                              thread_pool)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'read_sds_from_IESTM2714_file', 'SPECTRAL_DATA_FILE_READERS',
+    'read_msds_from_files', 'read_msds_from_directory'
+]
+
+
+def read_sds_from_IESTM2714_file(path):
+    """
+    Reads the spectral data from given *IES TM-27-14* file and returns it as
+    an *dict* of :class:`colour.SpectralDistribution` classes.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *IES TM-27-14* file path.
+
+    Returns
+    -------
+    dict
+        :class:`colour.SpectralDistribution` class of given *IES TM-27-14*
+        file.
+    """
+
+    sd = SpectralDistribution_IESTM2714(path).read()
+
+    return {sd.name: sd}
+
+
+SPECTRAL_DATA_FILE_READERS = CaseInsensitiveMapping({
+    '.csv': read_sds_from_csv_file,
+    '.spdx': read_sds_from_IESTM2714_file,
+    '.txt': read_sds_from_xrite_file,
+})
+SPECTRAL_DATA_FILE_READERS.__doc__ = """
+Supported spectral data file readers, keyed by file extension.
+
+SPECTRAL_DATA_FILE_READERS : CaseInsensitiveMapping
+    **{'.csv', '.spdx', '.txt'}**
+"""
+
+
+def _wrapper_read_msds_from_file(arguments):
+    """
+    Reads the spectral data from given file, aligns it to given spectral shape
+    and returns its labels and values.
+    """
+
+    path, shape = arguments
+
+    sds = SPECTRAL_DATA_FILE_READERS[os.path.splitext(path)[-1]](path)
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+
+    labels, values = [], []
+    for name, sd in sds.items():
+        labels.append(
+            stem if len(sds) == 1 else '{0} - {1}'.format(stem, name))
+        values.append(sd.copy().align(shape).values)
+
+    return labels, values
+
+
+def read_msds_from_files(paths,
+                         shape=SPECTRAL_SHAPE_DEFAULT,
+                         workers=None,
+                         executor='Thread'):
+    """
+    Reads the spectral data from given files and returns it as a single
+    :class:`colour.MultiSpectralDistributions` class instance aligned to given
+    spectral shape.
+
+    Parameters
+    ----------
+    paths : array_like
+        Absolute spectral data files paths, the reader is chosen according to
+        the file extension, see
+        :attr:`colour.io.SPECTRAL_DATA_FILE_READERS` attribute.
+    shape : SpectralShape, optional
+        Spectral shape the spectral distributions are aligned to.
+    workers : int, optional
+        Number of workers reading the files, if *None*, the files are read
+        sequentially.
+    executor : unicode, optional
+        **{'Thread', 'Process'}**,
+        Pool executing the workers, a process pool is better suited to large
+        numbers of small files whose parsing is bound by the *GIL*.
+
+    Returns
+    -------
+    MultiSpectralDistributions
+        Multi-spectral distributions of given files.
+
+    Raises
+    ------
+    RuntimeError
+        If no spectral data was read from given files.
+
+    Notes
+    -----
+    -   The labels are the files names without extension, suffixed with the
+        spectral distributions names for files storing more than one
+        spectral distribution, e.g. *CSV* files.
+
+    Examples
+    --------
+    >>> from colour.colorimetry import SpectralShape
+    >>> directory = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                          'resources')
+    >>> msds = read_msds_from_files(
+    ...     [os.path.join(directory, 'Fluorescent.spdx'),
+    ...      os.path.join(directory, 'colorchecker_n_ohta.csv')],
+    ...     SpectralShape(400, 700, 10))
+    >>> msds.labels[:3]
+    ['Fluorescent', 'colorchecker_n_ohta - 1', 'colorchecker_n_ohta - 2']
+    >>> msds.values.shape
+    (31, 25)
+    """
+
+    executor = executor.lower()
+    assert executor in ('thread', 'process'), (
+        '"{0}" executor is not supported, it must be one of {1}!'.format(
+            executor, ['Thread', 'Process']))
+
+    paths = list(paths)
+    for path in paths:
+        extension = os.path.splitext(path)[-1]
+        assert extension in SPECTRAL_DATA_FILE_READERS, (
+            '"{0}" file extension is not supported, it must be one of '
+            '{1}!'.format(extension, list(SPECTRAL_DATA_FILE_READERS.keys())))
+
+    arguments = [(path, shape) for path in paths]
+
+    if workers is None:
+        results = [_wrapper_read_msds_from_file(args) for args in arguments]
+    else:
+        pool_factory = (thread_pool
+                        if executor == 'thread' else multiprocessing_pool)
+        with pool_factory(workers) as pool:
+            results = pool.map(_wrapper_read_msds_from_file, arguments)
+
+    labels = [label for result in results for label in result[0]]
+    values = [value for result in results for value in result[1]]
+
+    if not values:
+        raise RuntimeError('No spectral data was read from given files!')
+
+    return MultiSpectralDistributions(
+        np.transpose(values), shape.range(), labels=labels)
+
+
+def read_msds_from_directory(directory,
+                             shape=SPECTRAL_SHAPE_DEFAULT,
+                             recursive=False,
+                             workers=None,
+                             executor='Thread'):
+    """
+    Reads the spectral data from the supported files of given directory and
+    returns it as a single :class:`colour.MultiSpectralDistributions` class
+    instance aligned to given spectral shape.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory to read the spectral data files from, files with an
+        extension not defined in the
+        :attr:`colour.io.SPECTRAL_DATA_FILE_READERS` attribute are ignored.
+    shape : SpectralShape, optional
+        Spectral shape the spectral distributions are aligned to.
+    recursive : bool, optional
+        Whether to read the files of the sub-directories.
+    workers : int, optional
+        Number of workers reading the files, if *None*, the files are read
+        sequentially.
+    executor : unicode, optional
+        **{'Thread', 'Process'}**,
+        Pool executing the workers.
+
+    Returns
+    -------
+    MultiSpectralDistributions
+        Multi-spectral distributions of given directory files, sorted by
+        path.
+
+    Examples
+    --------
+    >>> import shutil
+    >>> import tempfile
+    >>> directory = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                          'resources')
+    >>> temporary_directory = tempfile.mkdtemp()
+    >>> for name in ('Fluorescent.spdx', 'CMS_Test_Pattern.exr'):
+    ...     _ = shutil.copy(os.path.join(directory, name),
+    ...                     temporary_directory)
+    >>> read_msds_from_directory(temporary_directory, workers=2).labels
+    ['Fluorescent']
+    >>> shutil.rmtree(temporary_directory)
+    """
+
+    paths = []
+    for root, directories, files in os.walk(directory):
+        paths.extend(
+            os.path.join(root, name) for name in files
+            if os.path.splitext(name)[-1] in SPECTRAL_DATA_FILE_READERS)
+
+        if not recursive:
+            break
+
+    return read_msds_from_files(sorted(paths), shape, workers, executor)
@@ -8,15 +8,21 @@ Defines various input / output objects for *CSV* tabular data files:
 -   :func:`colour.read_spectral_data_from_csv_file`
 -   :func:`colour.read_sds_from_csv_file`
 -   :func:`colour.write_sds_to_csv_file`
+-   :func:`colour.io.read_msds_from_csv_file`
+-   :func:`colour.io.write_msds_to_csv_file`
 """
 
 from __future__ import division, unicode_literals
 
-from collections import OrderedDict
 import csv
+import numpy as np
+from collections import OrderedDict
+from itertools import islice
 
-from colour.colorimetry import SpectralDistribution
+from colour.colorimetry import (MultiSpectralDistributions,
+                                SpectralDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -27,10 +33,70 @@ __status__ = 'Production'
 
 __all__ = [
     'read_spectral_data_from_csv_file', 'read_sds_from_csv_file',
-    'write_sds_to_csv_file'
+    'write_sds_to_csv_file', 'read_msds_from_csv_file',
+    'write_msds_to_csv_file'
 ]
 
 
+def _read_csv_fields(csv_file, delimiter, fields):
+    """
+    Returns the spectral data fields names of given *CSV* file object, reading
+    its first line if no fields names are given.
+    """
+
+    if fields is None:
+        fields = next(
+            csv.reader([csv_file.readline()], delimiter=str(delimiter)))
+
+    fields = [field.strip() for field in fields]
+
+    if len(fields) < 2:
+        raise RuntimeError(('A "CSV" spectral data file should define '
+                            'the following fields: '
+                            '("wavelength", "field 1", ..., "field n")!'))
+
+    return fields
+
+
+def _parse_csv_block(lines, delimiter, columns, default):
+    """
+    Parses given *CSV* lines into a 2-dimensional array, invalid or missing
+    values being replaced with given per-column default values.
+
+    The lines are parsed at once with :func:`numpy.loadtxt` and only fall back
+    to a per-value parsing when the block contains non numeric values.
+    """
+
+    lines = [line for line in lines if line.strip()]
+
+    if not lines:
+        return np.zeros((0, columns))
+
+    try:
+        block = np.loadtxt(
+            lines,
+            delimiter=str(delimiter),
+            dtype=DEFAULT_FLOAT_DTYPE,
+            ndmin=2)
+        if block.shape[1] == columns:
+            return block
+    except ValueError:
+        pass
+
+    block = np.empty((len(lines), columns), dtype=DEFAULT_FLOAT_DTYPE)
+    for i, line in enumerate(csv.reader(lines, delimiter=str(delimiter))):
+        line = (line + [''] * columns)[:columns]
+        # The wavelength is mandatory and raises if it cannot be parsed.
+        block[i, 0] = DEFAULT_FLOAT_DTYPE(line[0])
+        for j in range(1, columns):
+            try:
+                block[i, j] = DEFAULT_FLOAT_DTYPE(line[j])
+            except ValueError:
+                block[i, j] = default[j - 1]
+
+    return block
+
+
 def read_spectral_data_from_csv_file(path,
                                      delimiter=',',
                                      fields=None,
@@ -115,27 +181,13 @@ def read_spectral_data_from_csv_file(path,
      '24']
     """
 
-    with open(path, 'rU') as csv_file:
-        reader = csv.DictReader(
-            csv_file, delimiter=str(delimiter), fieldnames=fields)
-        if len(reader.fieldnames) == 1:
-            raise RuntimeError(('A "CSV" spectral data file should define '
-                                'the following fields: '
-                                '("wavelength", "field 1", ..., "field n")!'))
-
-        wavelength = reader.fieldnames[0]
-        fields = reader.fieldnames[1:]
+    msds = read_msds_from_csv_file(path, delimiter, fields, default)
 
-        data = OrderedDict(zip(fields, ({} for _ in range(len(fields)))))
-        for line in reader:
-            for field in fields:
-                try:
-                    value = DEFAULT_FLOAT_DTYPE(line[field])
-                except ValueError:
-                    value = default
+    wavelengths = msds.wavelengths.tolist()
 
-                data[field][DEFAULT_FLOAT_DTYPE(line[wavelength])] = value
-        return data
+    return OrderedDict(
+        (field, dict(zip(wavelengths, values)))
+        for field, values in zip(msds.labels, msds.values.T.tolist()))
 
 
 def read_sds_from_csv_file(path, delimiter=',', fields=None, default=0):
@@ -259,10 +311,12 @@ def read_sds_from_csv_file(path, delimiter=',', fields=None, default=0):
                          extrapolator_kwargs={...})
     """
 
-    data = read_spectral_data_from_csv_file(path, delimiter, fields, default)
+    msds = read_msds_from_csv_file(path, delimiter, fields, default)
 
-    sds = OrderedDict(((key, SpectralDistribution(value, name=key))
-                       for key, value in data.items()))
+    sds = OrderedDict(((label,
+                        SpectralDistribution(
+                            values, msds.wavelengths, name=label))
+                       for label, values in zip(msds.labels, msds.values.T)))
     return sds
 
 
@@ -300,21 +354,193 @@ def write_sds_to_csv_file(sds, path, delimiter=',', fields=None):
             raise RuntimeError(('Cannot write spectral distributions '
                                 'with different shapes to "CSV" file!'))
 
+    fields = list(fields) if fields is not None else sorted(sds.keys())
     wavelengths = tuple(sds.values())[0].wavelengths
-    with open(path, 'w') as csv_file:
-        fields = list(fields) if fields is not None else sorted(sds.keys())
-        writer = csv.DictWriter(
-            csv_file,
-            delimiter=str(delimiter),
-            fieldnames=['wavelength'] + fields,
-            lineterminator='\n')
 
-        writer.writeheader()
+    return _write_csv_block(
+        path, wavelengths, np.transpose(
+            [sds[field].values for field in fields]), fields, delimiter)
+
+
+def read_msds_from_csv_file(path,
+                            delimiter=',',
+                            fields=None,
+                            default=0,
+                            chunk_size=None):
+    """
+    Reads the spectral data from given *CSV* file and returns its content as
+    a :class:`colour.MultiSpectralDistributions` class instance.
+
+    The numeric block of the file is parsed at once, making the definition
+    suitable for very wide files, e.g. reflectance exports with thousands of
+    columns.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    default : numeric or array_like, optional
+        Default value for fields row with missing or invalid value, either a
+        single value or one value per spectral data field.
+    chunk_size : int, optional
+        Number of rows, i.e. wavelengths, read at once. If given, a generator
+        of :class:`colour.MultiSpectralDistributions` class instances, one per
+        rows chunk, is returned so that files larger than the available
+        memory can be processed, the rows must then be sorted by ascending
+        wavelength across the chunks.
+
+    Returns
+    -------
+    MultiSpectralDistributions or generator
+        :class:`colour.MultiSpectralDistributions` class instance of given
+        *CSV* file or generator of the rows chunks.
+
+    Raises
+    ------
+    RuntimeError
+        If the *CSV* spectral data file doesn't define the appropriate fields.
+
+    Notes
+    -----
+    -   Empty lines are ignored.
+    -   The rows are sorted by wavelength, the last row of duplicate
+        wavelengths being retained.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> msds = read_msds_from_csv_file(csv_file)
+    >>> msds.shape
+    SpectralShape(380.0, 780.0, 5.0)
+    >>> msds.labels[:4]
+    ['1', '2', '3', '4']
+    >>> msds[380][:4]
+    array([ 0.048,  0.103,  0.113,  0.048])
+    >>> [chunk.shape for chunk in read_msds_from_csv_file(csv_file, \
+chunk_size=48)]
+    [SpectralShape(380.0, 615.0, 5.0), SpectralShape(620.0, 780.0, 5.0)]
+    """
 
-        for wavelength in wavelengths:
-            row = {'wavelength': wavelength}
-            row.update(
-                dict((field, sds[field][wavelength]) for field in fields))
-            writer.writerow(row)
+    if chunk_size is not None:
+        return _read_msds_chunks_from_csv_file(path, delimiter, fields,
+                                               default, chunk_size)
+
+    return next(
+        _read_msds_chunks_from_csv_file(path, delimiter, fields, default,
+                                        None))
+
+
+def _read_msds_chunks_from_csv_file(path, delimiter, fields, default,
+                                    chunk_size):
+    """
+    Yields the rows chunks of given *CSV* file as
+    :class:`colour.MultiSpectralDistributions` class instances.
+    """
+
+    with open(path, 'r') as csv_file:
+        fields = _read_csv_fields(csv_file, delimiter, fields)
+        labels = fields[1:]
+
+        default = np.resize(as_float_array(default), len(labels))
+
+        wavelength = None
+        while True:
+            block = _sort_csv_block(
+                _parse_csv_block(
+                    islice(csv_file, chunk_size), delimiter, len(fields),
+                    default))
+
+            if block.shape[0] == 0 and chunk_size is not None:
+                return
+
+            assert wavelength is None or block[0, 0] > wavelength, (
+                'Rows must be sorted by ascending wavelength across chunks!')
+
+            wavelength = block[-1, 0]
+
+            yield MultiSpectralDistributions(
+                block[..., 1:], block[..., 0], labels=labels)
+
+            if chunk_size is None:
+                return
+
+
+def _sort_csv_block(block):
+    """
+    Sorts given 2-dimensional *CSV* block by wavelength, i.e. its first
+    column, retaining the last row of duplicate wavelengths.
+    """
+
+    block = block[np.argsort(block[..., 0], kind='mergesort')]
+
+    retain = np.ones(block.shape[0], dtype=bool)
+    retain[:-1] = block[1:, 0] != block[:-1, 0]
+
+    return block[retain]
+
+
+def _write_csv_block(path, wavelengths, values, fields, delimiter):
+    """
+    Writes given wavelengths and 2-dimensional values array to given *CSV*
+    file.
+    """
+
+    with open(path, 'w') as csv_file:
+        writer = csv.writer(
+            csv_file, delimiter=str(delimiter), lineterminator='\n')
+
+        writer.writerow(['wavelength'] + list(fields))
+        writer.writerows(np.column_stack([wavelengths, values]).tolist())
 
     return True
+
+
+def write_msds_to_csv_file(msds, path, delimiter=',', fields=None):
+    """
+    Writes given multi-spectral distributions to given *CSV* file.
+
+    Parameters
+    ----------
+    msds : MultiSpectralDistributions
+        Multi-spectral distributions to write.
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        multi-spectral distributions labels are written in their current
+        order.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> msds = read_msds_from_csv_file(csv_file)
+    >>> path = os.path.join(tempfile.mkdtemp(), 'colorchecker_n_ohta.csv')
+    >>> write_msds_to_csv_file(msds, path, fields=['1', '2'])
+    True
+    >>> read_msds_from_csv_file(path).labels
+    ['1', '2']
+    """
+
+    labels = list(msds.labels)
+    fields = labels if fields is None else list(fields)
+    indexes = [labels.index(field) for field in fields]
+
+    return _write_csv_block(path, msds.wavelengths, msds.values[..., indexes],
+                            fields, delimiter)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.directory` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.colorimetry import MultiSpectralDistributions, SpectralShape
+from colour.io import (SpectralDistribution_IESTM2714,
+                       read_msds_from_directory, read_msds_from_files,
+                       read_sds_from_csv_file, read_sds_from_IESTM2714_file)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = [
+    'RESOURCES_DIRECTORY', 'TestReadSdsFromIESTM2714File',
+    'TestReadMsdsFromFiles', 'TestReadMsdsFromDirectory'
+]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadSdsFromIESTM2714File(unittest.TestCase):
+    """
+    Defines :func:`colour.io.directory.read_sds_from_IESTM2714_file`
+    definition unit tests methods.
+    """
+
+    def test_read_sds_from_IESTM2714_file(self):
+        """
+        Tests :func:`colour.io.directory.read_sds_from_IESTM2714_file`
+        definition.
+        """
+
+        path = os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx')
+        sds = read_sds_from_IESTM2714_file(path)
+
+        self.assertEqual(len(sds), 1)
+        self.assertEqual(
+            list(sds.values())[0],
+            SpectralDistribution_IESTM2714(path).read())
+
+
+class TestReadMsdsFromFiles(unittest.TestCase):
+    """
+    Defines :func:`colour.io.directory.read_msds_from_files` definition unit
+    tests methods.
+    """
+
+    def test_read_msds_from_files(self):
+        """
+        Tests :func:`colour.io.directory.read_msds_from_files` definition.
+        """
+
+        shape = SpectralShape(400, 700, 10)
+        paths = [
+            os.path.join(RESOURCES_DIRECTORY, 'colorchecker_n_ohta.csv'),
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'),
+            os.path.join(RESOURCES_DIRECTORY,
+                         'X-Rite_Digital_Colour_Checker.txt'),
+        ]
+
+        msds = read_msds_from_files(paths, shape)
+        self.assertIsInstance(msds, MultiSpectralDistributions)
+        self.assertEqual(msds.shape, shape)
+        self.assertEqual(msds.values.shape, (31, 24 + 1 + 10))
+        self.assertEqual(msds.labels[0], 'colorchecker_n_ohta - 1')
+        self.assertEqual(msds.labels[24], 'Fluorescent')
+        self.assertTrue(
+            msds.labels[25].startswith('X-Rite_Digital_Colour_Checker - '))
+
+        sd = read_sds_from_csv_file(paths[0])['1'].align(shape)
+        np.testing.assert_almost_equal(
+            msds.values[..., 0], sd.values, decimal=7)
+
+        for executor in ('Thread', 'Process'):
+            np.testing.assert_almost_equal(
+                read_msds_from_files(
+                    paths, shape, workers=2, executor=executor).values,
+                msds.values,
+                decimal=7)
+
+    def test_raise_exception_read_msds_from_files(self):
+        """
+        Tests :func:`colour.io.directory.read_msds_from_files` definition
+        raised exception.
+        """
+
+        self.assertRaises(
+            AssertionError, read_msds_from_files,
+            [os.path.join(RESOURCES_DIRECTORY, 'Colour_Logo.png')])
+
+        self.assertRaises(
+            AssertionError, read_msds_from_files, [], executor='Undefined')
+
+
+class TestReadMsdsFromDirectory(unittest.TestCase):
+    """
+    Defines :func:`colour.io.directory.read_msds_from_directory` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_msds_from_directory(self):
+        """
+        Tests :func:`colour.io.directory.read_msds_from_directory` definition.
+        """
+
+        sub_directory = os.path.join(self._temporary_directory, 'Directory')
+        os.makedirs(sub_directory)
+        shutil.copy(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'),
+            os.path.join(self._temporary_directory, 'B.spdx'))
+        shutil.copy(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'),
+            os.path.join(self._temporary_directory, 'A.spdx'))
+        shutil.copy(
+            os.path.join(RESOURCES_DIRECTORY, 'Colour_Logo.png'),
+            self._temporary_directory)
+        shutil.copy(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'),
+            os.path.join(sub_directory, 'C.spdx'))
+
+        msds = read_msds_from_directory(self._temporary_directory)
+        self.assertListEqual(msds.labels, ['A', 'B'])
+        np.testing.assert_equal(msds.values[..., 0], msds.values[..., 1])
+
+        msds = read_msds_from_directory(
+            self._temporary_directory, recursive=True, workers=2)
+        self.assertListEqual(msds.labels, ['A', 'B', 'C'])
+
+
+if __name__ == '__main__':
+    unittest.main()
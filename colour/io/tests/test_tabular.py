@@ -12,9 +12,11 @@ import unittest
 import tempfile
 from six import PY2, text_type
 
-from colour.colorimetry import SpectralDistribution, SpectralShape
+from colour.colorimetry import (MultiSpectralDistributions,
+                                SpectralDistribution, SpectralShape)
 from colour.io import (read_spectral_data_from_csv_file,
-                       read_sds_from_csv_file, write_sds_to_csv_file)
+                       read_sds_from_csv_file, write_sds_to_csv_file,
+                       read_msds_from_csv_file, write_msds_to_csv_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -26,7 +28,8 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'COLOURCHECKER_N_OHTA_1',
     'TestReadSpectralDataFromCsvFile', 'TestReadSdsFromCsvFile',
-    'TestWriteSdsToCsvFile'
+    'TestWriteSdsToCsvFile', 'TestReadMsdsFromCsvFile',
+    'TestWriteMsdsToCsvFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -241,5 +244,153 @@ class TestWriteSdsToCsvFile(unittest.TestCase):
         self.assertRaises(RuntimeError, write_sds_to_csv_file, sds, '')
 
 
+class TestReadMsdsFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_msds_from_csv_file` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_msds_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_msds_from_csv_file` definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        msds = read_msds_from_csv_file(colour_checker_n_ohta)
+        self.assertIsInstance(msds, MultiSpectralDistributions)
+        self.assertListEqual(msds.labels, [text_type(x) for x in range(1, 25)])
+        self.assertEqual(msds.shape, SpectralShape(380, 780, 5))
+        np.testing.assert_equal(msds.values[..., 0], [
+            COLOURCHECKER_N_OHTA_1[key]
+            for key in sorted(COLOURCHECKER_N_OHTA_1)
+        ])
+
+        chunks = list(
+            read_msds_from_csv_file(colour_checker_n_ohta, chunk_size=30))
+        self.assertListEqual([chunk.values.shape for chunk in chunks],
+                             [(30, 24), (30, 24), (21, 24)])
+        np.testing.assert_equal(
+            np.vstack([chunk.values for chunk in chunks]), msds.values)
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY, 'linss2_10e_5.csv')
+        msds = read_msds_from_csv_file(
+            linss2_10e_5,
+            fields=['wavelength', 'l_bar', 'm_bar', 's_bar'],
+            default=[-1, -2, -3])
+        self.assertListEqual(msds.labels, ['l_bar', 'm_bar', 's_bar'])
+        np.testing.assert_equal(msds.values[msds.wavelengths == 760][0],
+                                [7.79912E-05, 5.69093E-06, -3])
+
+        path = os.path.join(self._temporary_directory, 'missing.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a,b\n400,1,\n410,,2\n\n420,3,4\n')
+
+        msds = read_msds_from_csv_file(path, default=[-1, -2])
+        np.testing.assert_equal(msds.values, [[1, -2], [-1, 2], [3, 4]])
+
+        path = os.path.join(self._temporary_directory, 'unsorted.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a\n410,3\n400,1\n420,4\n410,2\n')
+
+        msds = read_msds_from_csv_file(path)
+        np.testing.assert_equal(msds.wavelengths, [400, 410, 420])
+        np.testing.assert_equal(msds.values, [[1], [2], [4]])
+        self.assertDictEqual(
+            read_spectral_data_from_csv_file(path)['a'], {
+                400: 1,
+                410: 2,
+                420: 4
+            })
+
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a\n410,3\n400,1\n420,4\n410,2\n'
+                           '440,6\n430,5\n450,7\n460,8\n')
+
+        sorted_path = os.path.join(self._temporary_directory, 'sorted.csv')
+        with open(sorted_path, 'w') as csv_file:
+            csv_file.write('wavelength,a\n400,1\n410,2\n420,4\n430,5\n'
+                           '440,6\n450,7\n460,8\n')
+
+        sd = read_sds_from_csv_file(path)['a']
+        sd_sorted = read_sds_from_csv_file(sorted_path)['a']
+        np.testing.assert_equal(sd.wavelengths, sd_sorted.wavelengths)
+        self.assertEqual(sd[405], sd_sorted[405])
+
+    def test_raise_exception_read_msds_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_msds_from_csv_file` definition
+        raised exception.
+        """
+
+        self.assertRaises(RuntimeError, read_msds_from_csv_file,
+                          os.path.join(RESOURCES_DIRECTORY, 'Invalid.csv'))
+
+        path = os.path.join(self._temporary_directory, 'unsorted.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a\n410,3\n420,4\n400,1\n')
+
+        self.assertRaises(AssertionError, list,
+                          read_msds_from_csv_file(path, chunk_size=2))
+
+
+class TestWriteMsdsToCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.write_msds_to_csv_file` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_msds_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_msds_to_csv_file` definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        msds = read_msds_from_csv_file(colour_checker_n_ohta)
+        colour_checker_n_ohta_test = os.path.join(self._temporary_directory,
+                                                  'colorchecker_n_ohta.csv')
+        self.assertTrue(
+            write_msds_to_csv_file(msds, colour_checker_n_ohta_test))
+        msds_test = read_msds_from_csv_file(colour_checker_n_ohta_test)
+        self.assertListEqual(msds_test.labels, msds.labels)
+        np.testing.assert_equal(msds_test.wavelengths, msds.wavelengths)
+        np.testing.assert_equal(msds_test.values, msds.values)
+
+        write_msds_to_csv_file(
+            msds, colour_checker_n_ohta_test, fields=['3', '1'])
+        msds_test = read_msds_from_csv_file(colour_checker_n_ohta_test)
+        self.assertListEqual(msds_test.labels, ['3', '1'])
+        np.testing.assert_equal(msds_test.values, msds.values[..., [2, 0]])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,15 +16,14 @@ References
 
 from __future__ import division, unicode_literals
 
-import os
-import re
 from collections import namedtuple
 from xml.etree import ElementTree  # nosec
 from xml.dom import minidom  # nosec
 
 from colour.colorimetry import SpectralDistribution
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import Structure, is_numeric, is_string, tstack
+from colour.utilities import (Structure, as_float_array, is_numeric, is_string,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -979,44 +978,49 @@ dict_like, optional
         0.0339999...
         """
 
-        formatter = './{{{0}}}{1}/{{{0}}}{2}'
-
-        tree = ElementTree.parse(self._path)  # nosec
-        root = tree.getroot()
-
-        namespace = re.match('{(.*)}', root.tag).group(1)
-
-        self.name = os.path.splitext(os.path.basename(self._path))[0]
-
-        iterator = root.iter
-
+        specifications = {}
         for header_element in (self.header, self):
             mapping = header_element.mapping
             for specification in mapping.elements:
-                element = root.find(
-                    formatter.format(namespace, mapping.element,
-                                     specification.element))
-                if element is not None:
-                    setattr(header_element, specification.attribute,
-                            specification.read_conversion(element.text))
-
-        # Reading spectral data.
+                specifications[(mapping.element,
+                                specification.element)] = (header_element,
+                                                           specification)
+
+        data_element = self.mapping.data.element
+        data_attribute = self.mapping.data.attribute
+
+        # The file is parsed as a stream: elements are processed and cleared
+        # as soon as they are closed so that the *DOM* is never built.
         wavelengths = []
         values = []
-        for spectral_data in iterator('{{{0}}}{1}'.format(
-                namespace, self.mapping.data.element)):
-            wavelengths.append(
-                DEFAULT_FLOAT_DTYPE(
-                    spectral_data.attrib[self.mapping.data.attribute]))
-            values.append(DEFAULT_FLOAT_DTYPE(spectral_data.text))
+        tags = []
+        for event, element in ElementTree.iterparse(  # nosec
+                self._path, events=('start', 'end')):
+            tag = element.tag.rsplit('}', 1)[-1]
+
+            if event == 'start':
+                tags.append(tag)
+                continue
+
+            tags.pop()
+
+            if tag == data_element:
+                wavelengths.append(element.attrib[data_attribute])
+                values.append(element.text)
+            elif tags and (tags[-1], tag) in specifications:
+                header_element, specification = specifications[(tags[-1], tag)]
+                setattr(header_element, specification.attribute,
+                        specification.read_conversion(element.text))
+
+            element.clear()
 
         self.name = ' - '.join([
             self.header.manufacturer,
             self.header.catalog_number,
             self.header.description,
         ])
-        self.wavelengths = wavelengths
-        self.values = values
+        self.wavelengths = as_float_array(wavelengths)
+        self.values = as_float_array(values)
 
         return self
 
@@ -17,7 +17,10 @@ from .cylindrical import RGB_to_HSV, HSV_to_RGB, RGB_to_HSL, HSL_to_RGB
 from .cmyk import RGB_to_CMY, CMY_to_RGB, CMY_to_CMYK, CMYK_to_CMY
 from .prismatic import RGB_to_Prismatic, Prismatic_to_RGB
 from .ycbcr import (WEIGHTS_YCBCR, RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YcCbcCrc,
-                    YcCbcCrc_to_RGB)
+                    YcCbcCrc_to_RGB, CHROMA_SUBSAMPLING_SCHEMES,
+                    chroma_subsample, chroma_upsample, RGB_to_YCbCr_planar,
+                    YCbCr_planar_to_RGB, RGB_to_YcCbcCrc_planar,
+                    YcCbcCrc_planar_to_RGB)
 from .ycocg import RGB_to_YCoCg, YCoCg_to_RGB
 from .ictcp import RGB_to_ICTCP, ICTCP_to_RGB
 
@@ -36,7 +39,9 @@ __all__ += ['RGB_to_CMY', 'CMY_to_RGB', 'CMY_to_CMYK', 'CMYK_to_CMY']
 __all__ += ['RGB_to_Prismatic', 'Prismatic_to_RGB']
 __all__ += [
     'WEIGHTS_YCBCR', 'RGB_to_YCbCr', 'YCbCr_to_RGB', 'RGB_to_YcCbcCrc',
-    'YcCbcCrc_to_RGB'
+    'YcCbcCrc_to_RGB', 'CHROMA_SUBSAMPLING_SCHEMES', 'chroma_subsample',
+    'chroma_upsample', 'RGB_to_YCbCr_planar', 'YCbCr_planar_to_RGB',
+    'RGB_to_YcCbcCrc_planar', 'YcCbcCrc_planar_to_RGB'
 ]
 __all__ += ['RGB_to_YCoCg', 'YCoCg_to_RGB']
 __all__ += ['RGB_to_ICTCP', 'ICTCP_to_RGB']
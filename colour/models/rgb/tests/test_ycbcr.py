@@ -9,9 +9,10 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.models.rgb.ycbcr import (RGB_to_YCbCr, YCbCr_to_RGB,
-                                     RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
-                                     WEIGHTS_YCBCR)
+from colour.models.rgb.ycbcr import (
+    RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
+    WEIGHTS_YCBCR, chroma_subsample, chroma_upsample, RGB_to_YCbCr_planar,
+    YCbCr_planar_to_RGB, RGB_to_YcCbcCrc_planar, YcCbcCrc_planar_to_RGB)
 from colour.utilities import domain_range_scale, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -23,7 +24,9 @@ __status__ = 'Development'
 
 __all__ = [
     'TestRGB_to_YCbCr', 'TestYCbCr_to_RGB', 'TestRGB_to_YcCbcCrc',
-    'TestYcCbcCrc_to_RGB'
+    'TestYcCbcCrc_to_RGB', 'TestChromaSubsample', 'TestChromaUpsample',
+    'TestRGB_to_YCbCr_planar', 'TestYCbCr_planar_to_RGB',
+    'TestRGB_to_YcCbcCrc_planar', 'TestYcCbcCrc_planar_to_RGB'
 ]
 
 
@@ -393,5 +396,259 @@ class TestYcCbcCrc_to_RGB(unittest.TestCase):
             YcCbcCrc_to_RGB(YcCbcCrc)
 
 
+class TestChromaSubsample(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.chroma_subsample` definition unit
+    tests methods.
+    """
+
+    def test_chroma_subsample(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.chroma_subsample` definition.
+        """
+
+        plane = np.array([
+            [512, 520, 528, 536, 600],
+            [512, 516, 520, 524, 600],
+            [100, 200, 300, 400, 500],
+        ])
+
+        np.testing.assert_equal(chroma_subsample(plane, '4:4:4'), plane)
+
+        np.testing.assert_equal(
+            chroma_subsample(plane),
+            np.array([[516, 532, 600], [514, 522, 600], [150, 350, 500]]))
+
+        np.testing.assert_equal(
+            chroma_subsample(plane, '4:2:0'),
+            np.array([[515, 527, 600], [150, 350, 500]]))
+
+        np.testing.assert_equal(
+            chroma_subsample(plane, '4:2:2', 'Co-Sited'),
+            np.array([[516, 528, 584], [514, 520, 581], [150, 300, 475]]))
+
+        self.assertEqual(
+            chroma_subsample(plane.astype(np.uint16)).dtype, np.uint16)
+
+        np.testing.assert_almost_equal(
+            chroma_subsample(plane / 1023),
+            np.array([[516, 532, 600], [514, 522, 600], [150, 350, 500]]) /
+            1023,
+            decimal=7)
+
+    def test_raise_exception_chroma_subsample(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.chroma_subsample` definition
+        raised exception.
+        """
+
+        self.assertRaises(AssertionError, chroma_subsample, np.ones([2, 2]),
+                          '4:1:1')
+        self.assertRaises(AssertionError, chroma_subsample, np.ones([2, 2]),
+                          '4:2:2', 'Undefined')
+
+
+class TestChromaUpsample(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.chroma_upsample` definition unit
+    tests methods.
+    """
+
+    def test_chroma_upsample(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.chroma_upsample` definition.
+        """
+
+        plane = np.array([[100, 200, 300], [500, 500, 500]], dtype=np.uint16)
+
+        np.testing.assert_equal(
+            chroma_upsample(plane),
+            np.array([
+                [100, 125, 175, 225, 275, 300],
+                [500, 500, 500, 500, 500, 500],
+            ]))
+
+        np.testing.assert_equal(
+            chroma_upsample(plane, (2, 5), siting='Co-Sited'),
+            np.array([
+                [100, 150, 200, 250, 300],
+                [500, 500, 500, 500, 500],
+            ]))
+
+        np.testing.assert_equal(
+            chroma_upsample(plane, (4, 6), '4:2:0', filter_='Nearest'),
+            np.repeat(np.repeat(plane, 2, axis=0), 2, axis=1))
+
+        np.testing.assert_equal(
+            chroma_upsample(plane, (4, 6), '4:2:0')[:, 0],
+            np.array([100, 200, 400, 500]))
+
+        self.assertEqual(chroma_upsample(plane).dtype, np.uint16)
+
+        np.testing.assert_equal(chroma_upsample(plane, scheme='4:4:4'), plane)
+
+    def test_round_trip_chroma_upsample(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.chroma_upsample` definition
+        round trip with :func:`colour.models.rgb.ycbcr.chroma_subsample`
+        definition on a constant plane.
+        """
+
+        plane = np.full([6, 8], 448, dtype=np.uint16)
+        for scheme in ('4:2:2', '4:2:0'):
+            for siting in ('Centre', 'Co-Sited'):
+                for filter_ in ('Linear', 'Nearest'):
+                    np.testing.assert_equal(
+                        chroma_upsample(
+                            chroma_subsample(plane, scheme, siting),
+                            plane.shape, scheme, siting, filter_), plane)
+
+
+class TestRGB_to_YCbCr_planar(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr_planar` definition
+    unit tests methods.
+    """
+
+    def test_RGB_to_YCbCr_planar(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr_planar` definition.
+        """
+
+        np.random.seed(4)
+
+        for bits in (8, 10, 12, 16):
+            RGB = np.random.randint(0, 2 ** bits, (16, 16, 3))
+            for K in WEIGHTS_YCBCR.values():
+                YCbCr = RGB_to_YCbCr(
+                    RGB,
+                    K,
+                    in_bits=bits,
+                    in_int=True,
+                    out_bits=bits,
+                    out_int=True)
+                Y, Cb, Cr = RGB_to_YCbCr_planar(
+                    RGB.astype(np.uint16),
+                    K,
+                    in_bits=bits,
+                    out_bits=bits,
+                    scheme='4:4:4')
+
+                self.assertEqual(Y.dtype, np.uint16)
+                np.testing.assert_allclose(
+                    np.stack([Y, Cb, Cr], axis=-1), YCbCr, atol=1)
+
+        RGB = np.random.randint(0, 1024, (2, 5, 7, 3))
+        Y, Cb, Cr = RGB_to_YCbCr_planar(RGB, scheme='4:2:0')
+        self.assertEqual(Y.shape, (2, 5, 7))
+        self.assertEqual(Cb.shape, (2, 3, 4))
+
+        YCbCr = RGB_to_YCbCr(RGB, in_int=True, out_bits=10, out_int=True)
+        np.testing.assert_allclose(
+            Cr,
+            chroma_subsample(YCbCr[..., 2], '4:2:0').astype(np.int_),
+            atol=1)
+
+        Y, Cb, Cr = RGB_to_YCbCr_planar(
+            np.full([2, 2, 3], 1023), out_legal=False)
+        np.testing.assert_equal(Y, np.full([2, 2], 1023))
+        np.testing.assert_equal(Cb, np.full([2, 1], 512))
+
+
+class TestYCbCr_planar_to_RGB(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.YCbCr_planar_to_RGB` definition
+    unit tests methods.
+    """
+
+    def test_YCbCr_planar_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_planar_to_RGB` definition.
+        """
+
+        np.random.seed(4)
+
+        for bits in (8, 10, 12, 16):
+            RGB = np.random.randint(0, 2 ** bits, (16, 16, 3))
+            YCbCr = RGB_to_YCbCr_planar(
+                RGB, in_bits=bits, out_bits=bits, scheme='4:4:4')
+
+            RGB_r = YCbCr_to_RGB(
+                np.stack(YCbCr, axis=-1),
+                in_bits=bits,
+                in_int=True,
+                out_bits=bits,
+                out_int=True)
+            np.testing.assert_allclose(
+                YCbCr_planar_to_RGB(
+                    YCbCr, in_bits=bits, out_bits=bits, scheme='4:4:4'),
+                np.clip(RGB_r, 0, 2 ** bits - 1),
+                atol=1)
+
+        x = np.linspace(0, 1, 32)
+        RGB = np.round(
+            np.stack(np.meshgrid(x, x) + [np.outer(x, x)], axis=-1) * 1023)
+        for scheme in ('4:2:2', '4:2:0'):
+            for siting in ('Centre', 'Co-Sited'):
+                YCbCr = RGB_to_YCbCr_planar(RGB, scheme=scheme, siting=siting)
+                RGB_r = YCbCr_planar_to_RGB(
+                    YCbCr, scheme=scheme, siting=siting)
+
+                self.assertEqual(RGB_r.dtype, np.uint16)
+                self.assertEqual(RGB_r.shape, RGB.shape)
+                np.testing.assert_allclose(RGB_r, RGB, atol=48)
+
+
+class TestRGB_to_YcCbcCrc_planar(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.RGB_to_YcCbcCrc_planar` definition
+    unit tests methods.
+    """
+
+    def test_RGB_to_YcCbcCrc_planar(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YcCbcCrc_planar`
+        definition.
+        """
+
+        np.random.seed(4)
+
+        RGB = np.random.random([4, 6, 3])
+        YcCbcCrc = RGB_to_YcCbcCrc(RGB, out_int=True)
+
+        Yc, Cbc, Crc = RGB_to_YcCbcCrc_planar(RGB)
+        np.testing.assert_equal(Yc, YcCbcCrc[..., 0])
+        np.testing.assert_equal(
+            Cbc, chroma_subsample(YcCbcCrc[..., 1].astype(np.uint16)))
+        self.assertEqual(Crc.shape, (4, 3))
+
+
+class TestYcCbcCrc_planar_to_RGB(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.YcCbcCrc_planar_to_RGB` definition
+    unit tests methods.
+    """
+
+    def test_YcCbcCrc_planar_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YcCbcCrc_planar_to_RGB`
+        definition.
+        """
+
+        np.random.seed(4)
+
+        RGB = np.random.random([4, 6, 3])
+        YcCbcCrc = RGB_to_YcCbcCrc_planar(RGB, scheme='4:4:4')
+
+        np.testing.assert_almost_equal(
+            YcCbcCrc_planar_to_RGB(YcCbcCrc, scheme='4:4:4'),
+            YcCbcCrc_to_RGB(np.stack(YcCbcCrc, axis=-1), in_int=True),
+            decimal=7)
+
+        self.assertEqual(
+            YcCbcCrc_planar_to_RGB(RGB_to_YcCbcCrc_planar(RGB)).shape,
+            (4, 6, 3))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,6 +9,7 @@ from colour.utilities import (CaseInsensitiveMapping, filter_kwargs,
 from colour.utilities.deprecation import handle_arguments_deprecation
 
 from .common import CV_range, legal_to_full, full_to_legal
+from .approximation import CCTFApproximator, cctf_approximator
 from .gamma import gamma_function
 from .aces import (log_encoding_ACESproxy, log_decoding_ACESproxy,
                    log_encoding_ACEScc, log_decoding_ACEScc,
@@ -64,6 +65,7 @@ from .srgb import eotf_inverse_sRGB, eotf_sRGB
 from .viper_log import log_encoding_ViperLog, log_decoding_ViperLog
 
 __all__ = ['CV_range', 'legal_to_full', 'full_to_legal']
+__all__ += ['CCTFApproximator', 'cctf_approximator']
 __all__ += ['gamma_function']
 __all__ += [
     'log_encoding_ACESproxy', 'log_decoding_ACESproxy', 'log_encoding_ACEScc',
@@ -756,7 +758,7 @@ CCTF_ENCODINGS : CaseInsensitiveMapping
 """
 
 
-def cctf_encoding(value, function='sRGB', **kwargs):
+def cctf_encoding(value, function='sRGB', fast=False, **kwargs):
     """
     Encodes linear :math:`RGB` values to non linear :math:`R'G'B'` values using
     given encoding colour component transfer function (Encoding CCTF).
@@ -768,9 +770,19 @@ def cctf_encoding(value, function='sRGB', **kwargs):
     function : unicode, optional
         {:attr:`colour.CCTF_ENCODINGS`},
         Computation function.
+    fast : bool, optional
+        Whether to evaluate a cached table approximating the encoding CCTF, see
+        :class:`colour.models.CCTFApproximator` class.
 
     Other Parameters
     ----------------
+    domain : array_like, optional
+        {:func:`colour.models.cctf_approximator`},
+        Domain of the table in the current domain-range scale, the values
+        outside of it are computed with the encoding CCTF.
+    tolerance : numeric, optional
+        {:func:`colour.models.cctf_approximator`},
+        Maximum error of the approximation on the table domain.
     \\**kwargs : dict, optional
         Keywords arguments for the relevant encoding CCTF of the
         :attr:`colour.CCTF_ENCODINGS` attribute collection.
@@ -798,6 +810,9 @@ def cctf_encoding(value, function='sRGB', **kwargs):
     >>> cctf_encoding(  # doctest: +ELLIPSIS
     ...     0.11699185725296059, function='ITU-R BT.1886')
     0.4090077...
+    >>> cctf_encoding(0.18, function='ST 2084', fast=True, domain=(0, 10000))
+    ... # doctest: +ELLIPSIS
+    0.079420...
     """
 
     if 'itu-r bt.2100' in function.lower():
@@ -809,6 +824,14 @@ def cctf_encoding(value, function='sRGB', **kwargs):
 
     function = CCTF_ENCODINGS[function]
 
+    if fast:
+        settings = dict((key, kwargs.pop(key))
+                        for key in ('domain', 'tolerance') if key in kwargs)
+
+        return cctf_approximator(
+            function, **dict(settings, **filter_kwargs(function,
+                                                       **kwargs)))(value)
+
     return function(value, **filter_kwargs(function, **kwargs))
 
 
@@ -850,7 +873,7 @@ CCTF_DECODINGS : CaseInsensitiveMapping
 """
 
 
-def cctf_decoding(value, function='sRGB', **kwargs):
+def cctf_decoding(value, function='sRGB', fast=False, **kwargs):
     """
     Decodes non-linear :math:`R'G'B'` values to linear :math:`RGB` values using
     given decoding colour component transfer function (Decoding CCTF).
@@ -862,9 +885,19 @@ def cctf_decoding(value, function='sRGB', **kwargs):
     function : unicode, optional
         {:attr:`colour.CCTF_DECODINGS`},
         Computation function.
+    fast : bool, optional
+        Whether to evaluate a cached table approximating the decoding CCTF, see
+        :class:`colour.models.CCTFApproximator` class.
 
     Other Parameters
     ----------------
+    domain : array_like, optional
+        {:func:`colour.models.cctf_approximator`},
+        Domain of the table in the current domain-range scale, the values
+        outside of it are computed with the decoding CCTF.
+    tolerance : numeric, optional
+        {:func:`colour.models.cctf_approximator`},
+        Maximum error of the approximation on the table domain.
     \\**kwargs : dict, optional
         Keywords arguments for the relevant decoding CCTF of the
         :attr:`colour.CCTF_DECODINGS` attribute collection.
@@ -892,6 +925,8 @@ def cctf_decoding(value, function='sRGB', **kwargs):
     >>> cctf_decoding(  # doctest: +ELLIPSIS
     ...     0.461356129500442, function='ITU-R BT.1886')
     0.1...
+    >>> cctf_decoding(0.461356129500442, fast=True)  # doctest: +ELLIPSIS
+    0.18000...
     """
 
     if 'itu-r bt.2100' in function.lower():
@@ -904,6 +939,14 @@ def cctf_decoding(value, function='sRGB', **kwargs):
 
     function = CCTF_DECODINGS[function]
 
+    if fast:
+        settings = dict((key, kwargs.pop(key))
+                        for key in ('domain', 'tolerance') if key in kwargs)
+
+        return cctf_approximator(
+            function, **dict(settings, **filter_kwargs(function,
+                                                       **kwargs)))(value)
+
     return function(value, **filter_kwargs(function, **kwargs))
 
 
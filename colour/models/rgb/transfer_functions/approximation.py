@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""
+Transfer Functions Approximation
+================================
+
+Defines the objects approximating expensive transfer functions with
+precomputed tables:
+
+-   :class:`colour.models.CCTFApproximator`
+-   :func:`colour.models.cctf_approximator`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.algebra import is_spow_enabled
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import as_float, as_float_array, get_domain_range_scale
+from colour.utilities.common import _hashable
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['CCTFApproximator', 'cctf_approximator']
+
+_MANTISSA_BITS = 52
+"""
+Mantissa bits count of the *float64* values.
+
+_MANTISSA_BITS : int
+"""
+
+_MINIMUM_BITS = 2
+"""
+Minimum mantissa bits count indexing the table intervals of each octave.
+
+_MINIMUM_BITS : int
+"""
+
+_MAXIMUM_BITS = 16
+"""
+Maximum mantissa bits count indexing the table intervals of each octave.
+
+_MAXIMUM_BITS : int
+"""
+
+_OCTAVES = 64
+"""
+Octaves count spanned by the table below the domain upper bound, the lower
+values are linearly interpolated between zero and the first octave.
+
+_OCTAVES : int
+"""
+
+_CACHE_CCTF_APPROXIMATORS = {}
+
+
+class CCTFApproximator(object):
+    """
+    Defines an element-wise transfer function approximation using a
+    precomputed table whose samples are adaptively spaced so that the linear
+    interpolation error stays lower than given tolerance.
+
+    The table intervals are the octaves of the domain, each one divided into
+    :math:`2^n` uniform intervals, :math:`n` being the smallest mantissa bits
+    count meeting the tolerance. The samples concentrate thus near zero where
+    the curvature of power and logarithmic functions is high, and the
+    interval of a value is indexed by shifting its *IEEE 754* representation
+    instead of searching the table. Half-float input values are looked up into
+    an exhaustive table storing the transfer function value of each of the
+    65536 *float16* values, yielding exact results.
+
+    Parameters
+    ----------
+    function : callable
+        Element-wise transfer function to approximate, e.g.
+        :func:`colour.models.eotf_inverse_ST2084` definition.
+    domain : array_like, optional
+        Domain of the table in the current domain-range scale, the values
+        outside of it are computed with the transfer function.
+    tolerance : numeric, optional
+        Maximum error of the approximation on the table domain, the error is
+        absolute for transfer function values with magnitude lower than 1 and
+        relative otherwise.
+    maximum_size : int, optional
+        Maximum intervals count of the table, the finest table not exceeding
+        it is used if the tolerance cannot be met.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.models.CCTFApproximator.function`
+    -   :attr:`~colour.models.CCTFApproximator.domain`
+    -   :attr:`~colour.models.CCTFApproximator.tolerance`
+    -   :attr:`~colour.models.CCTFApproximator.kwargs`
+    -   :attr:`~colour.models.CCTFApproximator.size`
+    -   :attr:`~colour.models.CCTFApproximator.error`
+
+    Methods
+    -------
+    -   :meth:`~colour.models.CCTFApproximator.__init__`
+    -   :meth:`~colour.models.CCTFApproximator.__call__`
+
+    Notes
+    -----
+    -   The tables are built on first call and for each domain-range scale
+        and :func:`colour.algebra.spow` state used.
+    -   The negative values are evaluated with the transfer function, the
+        values in the lowest octave, i.e. lower than the domain upper bound
+        divided by :math:`2^{64}`, are linearly interpolated from zero.
+    -   The error is estimated at the mid and quarter points of each table
+        interval and exposed by the
+        :attr:`colour.models.CCTFApproximator.error` attribute, a transfer
+        function with a discontinuity narrower than the finest interval may
+        exceed it.
+    -   Only transfer functions operating on each value independently can be
+        approximated, the *ITU-R BT.2100 HLG* OOTFs computing the luminance of
+        :math:`RGB` triplets cannot.
+
+    Examples
+    --------
+    >>> from colour.models import eotf_inverse_ST2084
+    >>> approximator = CCTFApproximator(
+    ...     eotf_inverse_ST2084, domain=(0, 10000), tolerance=1e-6)
+    >>> approximator(np.array([0.18, 100, 1000]))  # doctest: +ELLIPSIS
+    array([ 0.0794209...,  0.5080784...,  0.751827...])
+    >>> approximator.error < 1e-6
+    True
+    >>> approximator(np.float16(100))  # doctest: +ELLIPSIS
+    0.5080784...
+    """
+
+    def __init__(self,
+                 function,
+                 domain=(0, 1),
+                 tolerance=1e-6,
+                 maximum_size=2 ** 20,
+                 **kwargs):
+        self._function = function
+        self._domain = tuple(as_float_array(domain).tolist())
+        self._tolerance = tolerance
+        self._maximum_size = maximum_size
+        self._kwargs = kwargs
+
+        self._tables = {}
+        self._tables_float16 = {}
+
+    @property
+    def function(self):
+        """
+        Getter property for the approximated transfer function.
+
+        Returns
+        -------
+        callable
+            Approximated transfer function.
+        """
+
+        return self._function
+
+    @property
+    def domain(self):
+        """
+        Getter property for the table domain.
+
+        Returns
+        -------
+        tuple
+            Table domain.
+        """
+
+        return self._domain
+
+    @property
+    def tolerance(self):
+        """
+        Getter property for the approximation tolerance.
+
+        Returns
+        -------
+        numeric
+            Approximation tolerance.
+        """
+
+        return self._tolerance
+
+    @property
+    def kwargs(self):
+        """
+        Getter property for the transfer function keywords arguments.
+
+        Returns
+        -------
+        dict
+            Transfer function keywords arguments.
+        """
+
+        return self._kwargs
+
+    @property
+    def size(self):
+        """
+        Getter property for the table intervals count in the current
+        domain-range scale.
+
+        Returns
+        -------
+        int
+            Table intervals count.
+        """
+
+        return self._table()[2].size
+
+    @property
+    def error(self):
+        """
+        Getter property for the estimated maximum error of the approximation
+        on the table domain in the current domain-range scale.
+
+        Returns
+        -------
+        numeric
+            Estimated maximum error.
+        """
+
+        return self._table()[6]
+
+    def _evaluate(self, x):
+        """
+        Evaluates the transfer function at given values.
+        """
+
+        with np.errstate(all='ignore'):
+            return as_float_array(self._function(x, **self._kwargs))
+
+    @staticmethod
+    def _errors(y, y_i):
+        """
+        Returns the approximation errors of given interpolated values.
+        """
+
+        with np.errstate(all='ignore'):
+            return np.abs(y_i - y) / np.maximum(np.abs(y), 1)
+
+    def _table(self):
+        """
+        Returns the table, building it if required, for the current
+        domain-range scale and :func:`colour.algebra.spow` state.
+        """
+
+        key = (get_domain_range_scale(), is_spow_enabled())
+        if key in self._tables:
+            return self._tables[key]
+
+        start, end = max(self._domain[0], 0), self._domain[1]
+
+        assert end > 0, 'The domain upper bound must be greater than 0!'
+
+        exponent = max(
+            int(np.frexp(end)[1]) - _OCTAVES,
+            int(np.frexp(start)[1]) if start > 0 else -1021)
+
+        for bits in range(_MINIMUM_BITS, _MAXIMUM_BITS + 1):
+            shift = _MANTISSA_BITS - bits
+            offset = (exponent + 1022) << bits
+
+            count = int(np.array(end).view(np.int64) >> shift) - offset + 2
+            if count > self._maximum_size and bits > _MINIMUM_BITS:
+                break
+
+            x = np.zeros(count + 1)
+            x[1:] = (np.arange(offset, offset + count, dtype=np.int64) <<
+                     shift).view(DEFAULT_FLOAT_DTYPE)
+            y = self._evaluate(x)
+
+            with np.errstate(all='ignore'):
+                slope = np.diff(y) / np.diff(x)
+                intercept = y[:-1] - slope * x[:-1]
+
+            # The values lower than the last interval that cannot be
+            # interpolated, e.g. a logarithm of zero, are evaluated with the
+            # transfer function.
+            invalid = np.where(~np.isfinite(intercept))[0]
+            lower = start if invalid.size == 0 else max(
+                start, x[invalid[-1] + 1])
+
+            valid = np.logical_and(x[1:] > lower, x[:-1] < end)
+            t = np.array([0.25, 0.5, 0.75])[:, np.newaxis]
+            x_t = x[:-1][valid] + np.diff(x)[valid] * t
+            y_t = slope[valid] * x_t + intercept[valid]
+            error = (float(np.nanmax(self._errors(self._evaluate(x_t), y_t)))
+                     if x_t.size else 0)
+
+            table = (shift, offset - 1, slope, intercept, lower, end, error)
+
+            if error <= self._tolerance:
+                break
+
+        self._tables[key] = table
+
+        return table
+
+    def _table_float16(self):
+        """
+        Returns the exhaustive *float16* table, building it if required, for
+        the current domain-range scale and :func:`colour.algebra.spow` state.
+        """
+
+        key = (get_domain_range_scale(), is_spow_enabled())
+        if key not in self._tables_float16:
+            self._tables_float16[key] = self._evaluate(
+                np.arange(2 ** 16, dtype=np.uint16).view(
+                    np.float16).astype(DEFAULT_FLOAT_DTYPE))
+
+        return self._tables_float16[key]
+
+    def __call__(self, value):
+        """
+        Evaluates the approximated transfer function at given values.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Values to evaluate the approximated transfer function at.
+
+        Returns
+        -------
+        numeric or ndarray
+            Approximated transfer function values.
+        """
+
+        if np.asarray(value).dtype == np.float16:
+            return as_float(
+                np.take(self._table_float16(),
+                        np.asarray(value).view(np.uint16)))
+
+        value = as_float_array(value)
+
+        shift, offset, slope, intercept, start, end, _error = self._table()
+
+        indexes = np.atleast_1d(value).view(np.int64) >> shift
+        indexes -= offset
+        np.clip(indexes, 0, slope.size - 1, out=indexes)
+
+        result = np.take(slope, indexes)
+        result *= np.atleast_1d(value)
+        result += np.take(intercept, indexes)
+
+        exact = ~np.logical_and(value >= start, value <= end)
+        if np.any(exact):
+            result[np.atleast_1d(exact)] = self._evaluate(
+                np.atleast_1d(value)[np.atleast_1d(exact)])
+
+        return as_float(np.reshape(result, value.shape))
+
+
+def cctf_approximator(function,
+                      domain=(0, 1),
+                      tolerance=1e-6,
+                      maximum_size=2 ** 20,
+                      **kwargs):
+    """
+    Returns the :class:`colour.models.CCTFApproximator` class instance of
+    given transfer function, keywords arguments and approximation settings,
+    the instances and their tables are cached for the process lifetime.
+
+    Parameters
+    ----------
+    function : callable
+        Element-wise transfer function to approximate.
+    domain : array_like, optional
+        Domain of the table in the current domain-range scale.
+    tolerance : numeric, optional
+        Maximum error of the approximation on the table domain.
+    maximum_size : int, optional
+        Maximum intervals count of the table.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the transfer function.
+
+    Returns
+    -------
+    CCTFApproximator
+        Transfer function approximator.
+
+    Examples
+    --------
+    >>> from colour.models import eotf_inverse_sRGB
+    >>> cctf_approximator(eotf_inverse_sRGB) is cctf_approximator(
+    ...     eotf_inverse_sRGB)
+    True
+    """
+
+    key = (function, tuple(as_float_array(domain).tolist()), tolerance,
+           maximum_size,
+           tuple(
+               sorted((name, _hashable(value))
+                      for name, value in kwargs.items())))
+
+    approximator = _CACHE_CCTF_APPROXIMATORS.get(key)
+    if approximator is None:
+        approximator = CCTFApproximator(function, domain, tolerance,
+                                        maximum_size, **kwargs)
+        _CACHE_CCTF_APPROXIMATORS[key] = approximator
+
+    return approximator
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for
+:mod:`colour.models.rgb.transfer_functions.approximation` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.algebra import spow, spow_enable
+from colour.models.rgb.transfer_functions import (
+    CCTFApproximator, cctf_approximator, eotf_inverse_ST2084, eotf_sRGB,
+    log_encoding_Cineon, log_decoding_ALEXALogC)
+from colour.utilities import domain_range_scale
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestCCTFApproximator', 'TestCctfApproximator']
+
+
+class TestCCTFApproximator(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.transfer_functions.approximation.\
+CCTFApproximator` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('function', 'domain', 'tolerance', 'kwargs',
+                               'size', 'error')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CCTFApproximator))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__call__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CCTFApproximator))
+
+    def test__call__(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.approximation.\
+CCTFApproximator.__call__` method.
+        """
+
+        np.random.seed(4)
+
+        for function, domain, tolerance in (
+            (eotf_inverse_ST2084, (0, 10000), 1e-6),
+            (eotf_sRGB, (0, 1), 1e-7),
+            (log_decoding_ALEXALogC, (0, 1), 1e-5),
+        ):
+            approximator = CCTFApproximator(function, domain, tolerance)
+            self.assertLessEqual(approximator.error, tolerance)
+
+            value = np.random.random((32, 32, 3)) * domain[1]
+            value[0, 0] = [0, domain[1], domain[1] / 2 ** 70]
+            reference = function(value)
+
+            result = approximator(value)
+            self.assertEqual(result.shape, value.shape)
+            self.assertLessEqual(
+                np.max(
+                    np.abs(result - reference) / np.maximum(
+                        np.abs(reference), 1)), tolerance)
+
+        approximator = CCTFApproximator(eotf_sRGB, tolerance=1e-3)
+        self.assertLess(approximator.size,
+                        CCTFApproximator(eotf_sRGB, tolerance=1e-7).size)
+
+        approximator = CCTFApproximator(eotf_sRGB, maximum_size=1024)
+        self.assertLessEqual(approximator.size, 1024)
+        self.assertGreater(approximator.error, approximator.tolerance)
+
+    def test_domain(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.approximation.\
+CCTFApproximator.__call__` method outside the table domain.
+        """
+
+        approximator = CCTFApproximator(log_encoding_Cineon)
+        value = np.array([-0.5, 0, 1e-30, 0.18, 1, 4])
+        np.testing.assert_allclose(
+            approximator(value), log_encoding_Cineon(value), atol=1e-6)
+
+        self.assertAlmostEqual(
+            approximator(2), log_encoding_Cineon(2), places=7)
+
+        approximator = CCTFApproximator(eotf_sRGB, domain=(0.5, 1))
+        value = np.array([0.25, 0.75])
+        np.testing.assert_allclose(
+            approximator(value), eotf_sRGB(value), atol=1e-6)
+
+        approximator = CCTFApproximator(eotf_sRGB)
+        with domain_range_scale('100'):
+            np.testing.assert_allclose(
+                approximator(np.array([18, 50])),
+                eotf_sRGB(np.array([18, 50])),
+                atol=1e-4)
+
+    def test_float16(self):
+        """
+        Tests :meth:`colour.models.rgb.transfer_functions.approximation.\
+CCTFApproximator.__call__` method with *float16* values.
+        """
+
+        value = np.linspace(-1, 10000, 1024).astype(np.float16)
+
+        approximator = CCTFApproximator(eotf_inverse_ST2084)
+        np.testing.assert_equal(
+            approximator(value), eotf_inverse_ST2084(value.astype(np.float_)))
+
+        self.assertEqual(
+            approximator(np.float16(100)), eotf_inverse_ST2084(100))
+
+        value = np.array([-0.5, 0.5], dtype=np.float16)
+        approximator = CCTFApproximator(spow, p=1 / 2.2)
+        np.testing.assert_equal(
+            approximator(value), spow(value.astype(np.float_), 1 / 2.2))
+        with spow_enable(False):
+            np.testing.assert_equal(
+                approximator(value), spow(value.astype(np.float_), 1 / 2.2))
+
+
+class TestCctfApproximator(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.approximation.\
+cctf_approximator` definition unit tests methods.
+    """
+
+    def test_cctf_approximator(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.approximation.\
+cctf_approximator` definition.
+        """
+
+        approximator = cctf_approximator(eotf_inverse_ST2084, L_p=1000)
+        self.assertIs(approximator,
+                      cctf_approximator(eotf_inverse_ST2084, L_p=1000))
+        self.assertIsNot(approximator,
+                         cctf_approximator(eotf_inverse_ST2084, L_p=4000))
+        self.assertIsNot(
+            approximator,
+            cctf_approximator(eotf_inverse_ST2084, tolerance=1e-4, L_p=1000))
+        self.assertDictEqual(approximator.kwargs, {'L_p': 1000})
+
+        black_offset = np.array([10 ** ((95 - 685) / 300)])
+        self.assertIs(
+            cctf_approximator(log_encoding_Cineon, black_offset=black_offset),
+            cctf_approximator(
+                log_encoding_Cineon, black_offset=np.copy(black_offset)))
+
+
+if __name__ == '__main__':
+    unittest.main()
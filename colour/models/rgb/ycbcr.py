@@ -9,6 +9,13 @@ Defines the *Y'CbCr* colour encoding related transformations:
 -   :func:`colour.YCbCr_to_RGB`
 -   :func:`colour.RGB_to_YcCbcCrc`
 -   :func:`colour.YcCbcCrc_to_RGB`
+-   :attr:`colour.models.CHROMA_SUBSAMPLING_SCHEMES`
+-   :func:`colour.models.chroma_subsample`
+-   :func:`colour.models.chroma_upsample`
+-   :func:`colour.models.RGB_to_YCbCr_planar`
+-   :func:`colour.models.YCbCr_planar_to_RGB`
+-   :func:`colour.models.RGB_to_YcCbcCrc_planar`
+-   :func:`colour.models.YcCbcCrc_planar_to_RGB`
 
 Notes
 -----
@@ -63,7 +70,9 @@ __status__ = 'Development'
 
 __all__ = [
     'WEIGHTS_YCBCR', 'YCbCr_ranges', 'RGB_to_YCbCr', 'YCbCr_to_RGB',
-    'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB'
+    'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB', 'CHROMA_SUBSAMPLING_SCHEMES',
+    'chroma_subsample', 'chroma_upsample', 'RGB_to_YCbCr_planar',
+    'YCbCr_planar_to_RGB', 'RGB_to_YcCbcCrc_planar', 'YcCbcCrc_planar_to_RGB'
 ]
 
 WEIGHTS_YCBCR = CaseInsensitiveMapping({
@@ -659,3 +668,654 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     RGB = tstack([R, G, B])
 
     return from_range_1(RGB)
+
+
+CHROMA_SUBSAMPLING_SCHEMES = CaseInsensitiveMapping({
+    '4:4:4': (1, 1),
+    '4:2:2': (1, 2),
+    '4:2:0': (2, 2),
+})
+CHROMA_SUBSAMPLING_SCHEMES.__doc__ = """
+Chroma subsampling schemes vertical and horizontal factors.
+
+References
+----------
+:cite:`Wikipedia2004d`
+
+CHROMA_SUBSAMPLING_SCHEMES : CaseInsensitiveMapping
+    **{'4:4:4', '4:2:2', '4:2:0'}**
+"""
+
+
+def _validate_chroma_subsampling(scheme, siting, filter_=None):
+    """
+    Validates given chroma subsampling scheme, chroma siting and upsampling
+    filter and returns the scheme factors.
+    """
+
+    assert scheme in CHROMA_SUBSAMPLING_SCHEMES, (
+        '"{0}" chroma subsampling scheme is not supported, it must be one of '
+        '{1}!'.format(scheme, list(CHROMA_SUBSAMPLING_SCHEMES.keys())))
+
+    assert siting.lower() in ('centre', 'co-sited'), (
+        '"{0}" chroma siting is not supported, it must be one of '
+        '{1}!'.format(siting, ['Centre', 'Co-Sited']))
+
+    if filter_ is not None:
+        assert filter_.lower() in ('linear', 'nearest'), (
+            '"{0}" chroma upsampling filter is not supported, it must be one '
+            'of {1}!'.format(filter_, ['Linear', 'Nearest']))
+
+    return CHROMA_SUBSAMPLING_SCHEMES[scheme]
+
+
+def _subsample_axis(a, axis, siting):
+    """
+    Subsamples given array by a factor 2 along given axis and returns the
+    unnormalised filtered array and the base 2 logarithm of the filter weights
+    sum.
+    """
+
+    a = np.moveaxis(a, axis, -1)
+
+    if a.shape[-1] % 2:
+        a = np.concatenate([a, a[..., -1:]], axis=-1)
+
+    even, odd = a[..., 0::2], a[..., 1::2]
+
+    if siting.lower() == 'centre':
+        a, bits = even + odd, 1
+    else:
+        # [1, 2, 1] filter centred on the even samples, the first sample being
+        # mirrored.
+        a = np.concatenate([odd[..., :1], odd[..., :-1]], axis=-1)
+        a += even
+        a += even
+        a += odd
+        bits = 2
+
+    return np.moveaxis(a, -1, axis), bits
+
+
+def _upsample_axis(a, axis, size, siting, filter_):
+    """
+    Upsamples given array by a factor 2 along given axis, cropping it to
+    given size, and returns the unnormalised interpolated array and the base
+    2 logarithm of the filter weights sum.
+    """
+
+    a = np.moveaxis(a, axis, -1)
+
+    if filter_.lower() == 'nearest':
+        return np.moveaxis(np.repeat(a, 2, axis=-1)[..., :size], -1, axis), 0
+
+    following = np.concatenate([a[..., 1:], a[..., -1:]], axis=-1)
+
+    upsampled = np.empty(a.shape[:-1] + (a.shape[-1] * 2, ), dtype=a.dtype)
+    if siting.lower() == 'centre':
+        preceding = np.concatenate([a[..., :1], a[..., :-1]], axis=-1)
+        upsampled[..., 0::2] = a * 3 + preceding
+        upsampled[..., 1::2] = a * 3 + following
+        bits = 2
+    else:
+        upsampled[..., 0::2] = a * 2
+        upsampled[..., 1::2] = a + following
+        bits = 1
+
+    return np.moveaxis(upsampled[..., :size], -1, axis), bits
+
+
+def _subsample(a, factors, siting):
+    """
+    Subsamples given planes array with given vertical and horizontal factors,
+    the vertical chroma siting being always centred.
+    """
+
+    bits = 0
+    if factors[1] == 2:
+        a, bits_h = _subsample_axis(a, -1, siting)
+        bits += bits_h
+
+    if factors[0] == 2:
+        a, bits_v = _subsample_axis(a, -2, 'Centre')
+        bits += bits_v
+
+    return a, bits
+
+
+def _upsample(a, shape, factors, siting, filter_):
+    """
+    Upsamples given planes array to given shape with given vertical and
+    horizontal factors, the vertical chroma siting being always centred.
+    """
+
+    bits = 0
+    if factors[0] == 2:
+        a, bits_v = _upsample_axis(a, -2, shape[0], 'Centre', filter_)
+        bits += bits_v
+
+    if factors[1] == 2:
+        a, bits_h = _upsample_axis(a, -1, shape[1], siting, filter_)
+        bits += bits_h
+
+    return a, bits
+
+
+def _round_shift(a, bits):
+    """
+    Divides given integer array by :math:`2^{bits}` in place with rounding to
+    the nearest integer.
+    """
+
+    if bits > 0:
+        a += 1 << (bits - 1)
+        a >>= bits
+
+    return a
+
+
+def _working_dtype(maximum):
+    """
+    Returns the smallest signed integer dtype able to represent given maximum
+    absolute intermediate value.
+    """
+
+    return np.int32 if maximum < 2 ** 31 else np.int64
+
+
+def chroma_subsample(plane, scheme='4:2:2', siting='Centre'):
+    """
+    Subsamples given chroma plane according to given chroma subsampling
+    scheme.
+
+    Integer planes are filtered with integer arithmetic and returned with
+    their original dtype.
+
+    Parameters
+    ----------
+    plane : array_like
+        Chroma plane with shape (..., height, width).
+    scheme : unicode, optional
+        **{'4:2:2', '4:2:0', '4:4:4'}**,
+        Chroma subsampling scheme, see
+        :attr:`colour.models.CHROMA_SUBSAMPLING_SCHEMES` attribute.
+    siting : unicode, optional
+        **{'Centre', 'Co-Sited'}**,
+        Horizontal chroma siting: *Centre* averages the sample pairs, e.g.
+        *JPEG*, *Co-Sited* applies a [1, 2, 1] filter centred on the even
+        samples, e.g. *ITU-R BT.709* and *ITU-R BT.2020*. The vertical chroma
+        siting of the *4:2:0* scheme is always centred.
+
+    Returns
+    -------
+    ndarray
+        Subsampled chroma plane.
+
+    Examples
+    --------
+    >>> plane = np.array([[512, 520, 528, 536], [512, 516, 520, 524]],
+    ...                  dtype=np.uint16)
+    >>> chroma_subsample(plane)
+    array([[516, 532],
+           [514, 522]], dtype=uint16)
+    >>> chroma_subsample(plane, '4:2:0', 'Co-Sited')
+    array([[515, 524]], dtype=uint16)
+    """
+
+    factors = _validate_chroma_subsampling(scheme, siting)
+
+    plane = np.asarray(plane)
+    dtype = plane.dtype
+
+    if dtype.kind in 'ui':
+        a, bits = _subsample(
+            plane.astype(_working_dtype(np.iinfo(dtype).max * 8)), factors,
+            siting)
+
+        return _round_shift(a, bits).astype(dtype)
+    else:
+        a, bits = _subsample(as_float_array(plane), factors, siting)
+
+        return a / 2 ** bits
+
+
+def chroma_upsample(plane,
+                    shape=None,
+                    scheme='4:2:2',
+                    siting='Centre',
+                    filter_='Linear'):
+    """
+    Upsamples given chroma plane according to given chroma subsampling
+    scheme.
+
+    Integer planes are interpolated with integer arithmetic and returned with
+    their original dtype.
+
+    Parameters
+    ----------
+    plane : array_like
+        Subsampled chroma plane with shape (..., height, width).
+    shape : array_like, optional
+        Full resolution (height, width) shape, default to twice the
+        subsampled dimensions.
+    scheme : unicode, optional
+        **{'4:2:2', '4:2:0', '4:4:4'}**,
+        Chroma subsampling scheme, see
+        :attr:`colour.models.CHROMA_SUBSAMPLING_SCHEMES` attribute.
+    siting : unicode, optional
+        **{'Centre', 'Co-Sited'}**,
+        Horizontal chroma siting, see :func:`colour.models.chroma_subsample`
+        definition.
+    filter_ : unicode, optional
+        **{'Linear', 'Nearest'}**,
+        Upsampling filter.
+
+    Returns
+    -------
+    ndarray
+        Upsampled chroma plane.
+
+    Examples
+    --------
+    >>> plane = np.array([[516, 532]], dtype=np.uint16)
+    >>> chroma_upsample(plane)
+    array([[516, 520, 528, 532]], dtype=uint16)
+    >>> chroma_upsample(plane, siting='Co-Sited')
+    array([[516, 524, 532, 532]], dtype=uint16)
+    >>> chroma_upsample(plane, (2, 3), '4:2:0', filter_='Nearest')
+    array([[516, 516, 532],
+           [516, 516, 532]], dtype=uint16)
+    """
+
+    factors = _validate_chroma_subsampling(scheme, siting, filter_)
+
+    plane = np.asarray(plane)
+    dtype = plane.dtype
+
+    if shape is None:
+        shape = (plane.shape[-2] * factors[0], plane.shape[-1] * factors[1])
+
+    if dtype.kind in 'ui':
+        a, bits = _upsample(
+            plane.astype(_working_dtype(np.iinfo(dtype).max * 16)), shape,
+            factors, siting, filter_)
+
+        return _round_shift(a, bits).astype(dtype)
+    else:
+        a, bits = _upsample(
+            as_float_array(plane), shape, factors, siting, filter_)
+
+        return a / 2 ** bits
+
+
+def _matrix_RGB_to_YCbCr_int(K, RGB_bits, RGB_legal, YCbCr_bits, YCbCr_legal):
+    """
+    Returns the matrix and offset converting integer *R'G'B'* code values to
+    integer *Y'CbCr* code values.
+    """
+
+    Kr, Kb = K
+    Kg = 1 - Kr - Kb
+    RGB_min, RGB_max = CV_range(RGB_bits, RGB_legal, True)
+    Y_min, Y_max, C_min, C_max = YCbCr_ranges(YCbCr_bits, YCbCr_legal, True)
+
+    matrix = np.array([
+        [Kr, Kg, Kb],
+        [-Kr / (2 - 2 * Kb), -Kg / (2 - 2 * Kb), 0.5],
+        [0.5, -Kg / (2 - 2 * Kr), -Kb / (2 - 2 * Kr)],
+    ])
+    matrix *= np.array([Y_max - Y_min, C_max - C_min, C_max - C_min
+                        ])[:, np.newaxis] / (RGB_max - RGB_min)
+
+    offset = np.array([Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2])
+    offset -= np.sum(matrix, axis=-1) * RGB_min
+
+    return matrix, offset
+
+
+def RGB_to_YCbCr_planar(RGB,
+                        K=WEIGHTS_YCBCR['ITU-R BT.709'],
+                        in_bits=10,
+                        in_legal=False,
+                        out_bits=10,
+                        out_legal=True,
+                        scheme='4:2:2',
+                        siting='Centre',
+                        precision=16):
+    """
+    Converts an array of integer *R'G'B'* code values to the corresponding
+    integer and planar *Y'CbCr* colour encoding code values, subsampling the
+    chroma planes according to given scheme.
+
+    The conversion is performed with fixed-point integer arithmetic, i.e.
+    without floating point intermediate arrays.
+
+    Parameters
+    ----------
+    RGB : array_like
+        Input *R'G'B'* array of integer code values with shape
+        (..., height, width, 3).
+    K : array_like, optional
+        Luma weighting coefficients of red and blue. See
+        :attr:`colour.WEIGHTS_YCBCR` for presets. Default is
+        *(0.2126, 0.0722)*, the weightings for *ITU-R BT.709*.
+    in_bits : int, optional
+        Bit depth of the input integer code values.
+    in_legal : bool, optional
+        Whether to treat the input values as legal range.
+    out_bits : int, optional
+        Bit depth of the output integer code values, at most 16.
+    out_legal : bool, optional
+        Whether to return legal range values.
+    scheme : unicode, optional
+        **{'4:2:2', '4:2:0', '4:4:4'}**,
+        Chroma subsampling scheme, see
+        :attr:`colour.models.CHROMA_SUBSAMPLING_SCHEMES` attribute.
+    siting : unicode, optional
+        **{'Centre', 'Co-Sited'}**,
+        Horizontal chroma siting, see :func:`colour.models.chroma_subsample`
+        definition.
+    precision : int, optional
+        Number of fractional bits of the fixed-point coefficients.
+
+    Returns
+    -------
+    tuple
+        *Y'*, *Cb* and *Cr* planes of *uint16* integer code values, the
+        chroma planes being subsampled.
+
+    Notes
+    -----
+    -   The output code values are clipped to [0, 2 ** out_bits - 1].
+    -   Odd dimensions are padded by replicating the last row or column
+        before subsampling.
+
+    Examples
+    --------
+    >>> RGB = np.array([[[1023, 1023, 1023], [1023, 0, 0]],
+    ...                 [[0, 1023, 0], [0, 0, 1023]]], dtype=np.uint16)
+    >>> Y, Cb, Cr = RGB_to_YCbCr_planar(RGB)
+    >>> Y
+    array([[940, 250],
+           [691, 127]], dtype=uint16)
+    >>> Cb
+    array([[461],
+           [563]], dtype=uint16)
+    >>> Cr
+    array([[736],
+           [288]], dtype=uint16)
+    """
+
+    factors = _validate_chroma_subsampling(scheme, siting)
+
+    matrix, offset = _matrix_RGB_to_YCbCr_int(K, in_bits, in_legal, out_bits,
+                                              out_legal)
+
+    matrix = np.round(matrix * 2 ** precision).astype(np.int64)
+    offset = np.round(offset * 2 ** precision).astype(np.int64)
+
+    bits = _subsample(np.zeros((1, 2, 2)), factors, siting)[1]
+    dtype = _working_dtype(
+        (np.max(np.sum(np.abs(matrix), axis=-1)) *
+         (2 ** in_bits) + np.max(np.abs(offset))) * 2 ** (bits + 1))
+
+    RGB = np.asarray(RGB)
+    R, G, B = (RGB[..., i].astype(dtype) for i in range(3))
+
+    planes = []
+    for i in range(3):
+        a = R * matrix[i, 0]
+        a += G * matrix[i, 1]
+        a += B * matrix[i, 2]
+        a += offset[i]
+
+        if i == 0:
+            a = _round_shift(a, precision)
+        else:
+            a, bits = _subsample(a, factors, siting)
+            a = _round_shift(a, precision + bits)
+
+        planes.append(np.clip(a, 0, 2 ** out_bits - 1).astype(np.uint16))
+
+    return tuple(planes)
+
+
+def YCbCr_planar_to_RGB(YCbCr,
+                        K=WEIGHTS_YCBCR['ITU-R BT.709'],
+                        in_bits=10,
+                        in_legal=True,
+                        out_bits=10,
+                        out_legal=False,
+                        scheme='4:2:2',
+                        siting='Centre',
+                        filter_='Linear',
+                        precision=16):
+    """
+    Converts integer and planar *Y'CbCr* colour encoding code values, whose
+    chroma planes are subsampled according to given scheme, to the
+    corresponding array of integer *R'G'B'* code values.
+
+    The conversion is performed with fixed-point integer arithmetic, i.e.
+    without floating point intermediate arrays.
+
+    Parameters
+    ----------
+    YCbCr : array_like
+        *Y'*, *Cb* and *Cr* planes of integer code values.
+    K : array_like, optional
+        Luma weighting coefficients of red and blue. See
+        :attr:`colour.WEIGHTS_YCBCR` for presets. Default is
+        *(0.2126, 0.0722)*, the weightings for *ITU-R BT.709*.
+    in_bits : int, optional
+        Bit depth of the input integer code values.
+    in_legal : bool, optional
+        Whether to treat the input values as legal range.
+    out_bits : int, optional
+        Bit depth of the output integer code values, at most 16.
+    out_legal : bool, optional
+        Whether to return legal range values.
+    scheme : unicode, optional
+        **{'4:2:2', '4:2:0', '4:4:4'}**,
+        Chroma subsampling scheme, see
+        :attr:`colour.models.CHROMA_SUBSAMPLING_SCHEMES` attribute.
+    siting : unicode, optional
+        **{'Centre', 'Co-Sited'}**,
+        Horizontal chroma siting, see :func:`colour.models.chroma_subsample`
+        definition.
+    filter_ : unicode, optional
+        **{'Linear', 'Nearest'}**,
+        Chroma upsampling filter.
+    precision : int, optional
+        Number of fractional bits of the fixed-point coefficients.
+
+    Returns
+    -------
+    ndarray
+        *R'G'B'* array of *uint16* integer code values with shape
+        (..., height, width, 3).
+
+    Notes
+    -----
+    -   The output code values are clipped to [0, 2 ** out_bits - 1].
+
+    Examples
+    --------
+    >>> Y = np.array([[940, 250], [691, 127]], dtype=np.uint16)
+    >>> Cb = np.array([[461], [563]], dtype=np.uint16)
+    >>> Cr = np.array([[736], [288]], dtype=np.uint16)
+    >>> YCbCr_planar_to_RGB((Y, Cb, Cr), filter_='Nearest')
+    array([[[1023,  914,  915],
+            [ 620,  108,  109]],
+    <BLANKLINE>
+           [[ 329,  841,  840],
+            [   0,  182,  182]]], dtype=uint16)
+    """
+
+    factors = _validate_chroma_subsampling(scheme, siting, filter_)
+
+    matrix, offset = _matrix_RGB_to_YCbCr_int(K, out_bits, out_legal, in_bits,
+                                              in_legal)
+    matrix = np.linalg.inv(matrix)
+    offset = -np.dot(matrix, offset)
+
+    Y, Cb, Cr = (np.asarray(plane) for plane in YCbCr)
+
+    bits = _upsample(np.zeros((1, 1, 1)), (2, 2), factors, siting, filter_)[1]
+
+    # The luma plane is scaled to the unnormalised upsampled chroma planes
+    # so that a single rounding is performed.
+    matrix = np.round(matrix * 2 ** precision).astype(np.int64)
+    matrix[:, 0] <<= bits
+    offset = np.round(offset * 2 ** (precision + bits)).astype(np.int64)
+
+    dtype = _working_dtype(
+        np.max(np.sum(np.abs(matrix), axis=-1)) * (2 ** in_bits) *
+        (2 ** bits) + np.max(np.abs(offset)))
+
+    Y = Y.astype(dtype)
+    Cb, _bits = _upsample(
+        Cb.astype(dtype), Y.shape[-2:], factors, siting, filter_)
+    Cr, _bits = _upsample(
+        Cr.astype(dtype), Y.shape[-2:], factors, siting, filter_)
+
+    RGB = np.empty(Y.shape + (3, ), dtype=np.uint16)
+    for i in range(3):
+        a = Y * matrix[i, 0]
+        a += Cb * matrix[i, 1]
+        a += Cr * matrix[i, 2]
+        a += offset[i]
+
+        RGB[..., i] = np.clip(
+            _round_shift(a, precision + bits), 0, 2 ** out_bits - 1)
+
+    return RGB
+
+
+def RGB_to_YcCbcCrc_planar(RGB,
+                           out_bits=10,
+                           out_legal=True,
+                           is_12_bits_system=False,
+                           scheme='4:2:2',
+                           siting='Centre'):
+    """
+    Converts an array of *RGB* linear values to the corresponding integer and
+    planar *Yc'Cbc'Crc'* colour encoding code values, subsampling the chroma
+    planes according to given scheme.
+
+    Parameters
+    ----------
+    RGB : array_like
+        Input *RGB* array of linear float values with shape
+        (..., height, width, 3).
+    out_bits : int, optional
+        Bit depth of the output integer code values, at most 16.
+    out_legal : bool, optional
+        Whether to return legal range values.
+    is_12_bits_system : bool, optional
+        *Recommendation ITU-R BT.2020* OETF (OECF) adopts different parameters
+        for 10 and 12 bit systems.
+    scheme : unicode, optional
+        **{'4:2:2', '4:2:0', '4:4:4'}**,
+        Chroma subsampling scheme, see
+        :attr:`colour.models.CHROMA_SUBSAMPLING_SCHEMES` attribute.
+    siting : unicode, optional
+        **{'Centre', 'Co-Sited'}**,
+        Horizontal chroma siting, see :func:`colour.models.chroma_subsample`
+        definition.
+
+    Returns
+    -------
+    tuple
+        *Yc'*, *Cbc'* and *Crc'* planes of *uint16* integer code values, the
+        chroma planes being subsampled.
+
+    Notes
+    -----
+    -   The constant luminance encoding is non-linear, the code values are
+        thus computed with :func:`colour.RGB_to_YcCbcCrc` definition before
+        the chroma planes are subsampled with integer arithmetic.
+
+    Examples
+    --------
+    >>> RGB = np.full([2, 2, 3], 0.18)
+    >>> Yc, Cbc, Crc = RGB_to_YcCbcCrc_planar(RGB, scheme='4:2:0')
+    >>> Yc
+    array([[422, 422],
+           [422, 422]], dtype=uint16)
+    >>> Cbc, Crc
+    (array([[512]], dtype=uint16), array([[512]], dtype=uint16))
+    """
+
+    YcCbcCrc = RGB_to_YcCbcCrc(
+        RGB,
+        out_bits=out_bits,
+        out_legal=out_legal,
+        out_int=True,
+        is_12_bits_system=is_12_bits_system)
+    YcCbcCrc = np.clip(YcCbcCrc, 0, 2 ** out_bits - 1).astype(np.uint16)
+
+    return (YcCbcCrc[..., 0], chroma_subsample(YcCbcCrc[..., 1], scheme,
+                                               siting),
+            chroma_subsample(YcCbcCrc[..., 2], scheme, siting))
+
+
+def YcCbcCrc_planar_to_RGB(YcCbcCrc,
+                           in_bits=10,
+                           in_legal=True,
+                           is_12_bits_system=False,
+                           scheme='4:2:2',
+                           siting='Centre',
+                           filter_='Linear'):
+    """
+    Converts integer and planar *Yc'Cbc'Crc'* colour encoding code values,
+    whose chroma planes are subsampled according to given scheme, to the
+    corresponding *RGB* array of linear values.
+
+    Parameters
+    ----------
+    YcCbcCrc : array_like
+        *Yc'*, *Cbc'* and *Crc'* planes of integer code values.
+    in_bits : int, optional
+        Bit depth of the input integer code values.
+    in_legal : bool, optional
+        Whether to treat the input values as legal range.
+    is_12_bits_system : bool, optional
+        *Recommendation ITU-R BT.2020* EOTF (EOCF) adopts different parameters
+        for 10 and 12 bit systems.
+    scheme : unicode, optional
+        **{'4:2:2', '4:2:0', '4:4:4'}**,
+        Chroma subsampling scheme, see
+        :attr:`colour.models.CHROMA_SUBSAMPLING_SCHEMES` attribute.
+    siting : unicode, optional
+        **{'Centre', 'Co-Sited'}**,
+        Horizontal chroma siting, see :func:`colour.models.chroma_subsample`
+        definition.
+    filter_ : unicode, optional
+        **{'Linear', 'Nearest'}**,
+        Chroma upsampling filter.
+
+    Returns
+    -------
+    ndarray
+        *RGB* array of linear float values with shape (..., height, width, 3).
+
+    Examples
+    --------
+    >>> Yc = np.full([2, 2], 422, dtype=np.uint16)
+    >>> Cbc = Crc = np.array([[512]], dtype=np.uint16)
+    >>> YcCbcCrc_planar_to_RGB((Yc, Cbc, Crc), scheme='4:2:0')[0, 0]
+    ... # doctest: +ELLIPSIS
+    array([ 0.1797387...,  0.1797387...,  0.1797387...])
+    """
+
+    Yc, Cbc, Crc = (np.asarray(plane) for plane in YcCbcCrc)
+
+    Cbc = chroma_upsample(Cbc, Yc.shape[-2:], scheme, siting, filter_)
+    Crc = chroma_upsample(Crc, Yc.shape[-2:], scheme, siting, filter_)
+
+    return YcCbcCrc_to_RGB(
+        tstack([Yc, Cbc, Crc]),
+        in_bits=in_bits,
+        in_legal=in_legal,
+        in_int=True,
+        is_12_bits_system=is_12_bits_system)
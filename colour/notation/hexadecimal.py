@@ -26,6 +26,45 @@ __status__ = 'Production'
 
 __all__ = ['RGB_to_HEX', 'HEX_to_RGB']
 
+_HEX_DIGITS_PAIRS = np.ravel(
+    np.array(
+        [[ord(digit) for digit in '{0:02x}'.format(i)] for i in range(256)],
+        dtype=np.uint32).view(np.uint64))
+"""
+Unicode codes of the hexadecimal digits pair of each byte value packed in
+64-bit integers.
+
+_HEX_DIGITS_PAIRS : ndarray
+"""
+
+_HEX_CODES = np.frombuffer(b'0123456789abcdefABCDEF', dtype=np.uint8)
+"""
+Character codes of the lowercase and uppercase hexadecimal digits.
+
+_HEX_CODES : ndarray
+"""
+
+_HEX_VALUES = np.full(256, -1, dtype=np.int16)
+_HEX_VALUES[_HEX_CODES] = np.hstack([np.arange(16), np.arange(10, 16)])
+"""
+Values of the hexadecimal digits indexed by their character codes, the other
+codes being mapped to -1.
+
+_HEX_VALUES : ndarray
+"""
+
+_HEX_PAIRS_VALUES = np.full(65536, -1, dtype=np.int16)
+_HEX_PAIRS_VALUES[np.stack(
+    np.meshgrid(_HEX_CODES, _HEX_CODES, indexing='ij'),
+    axis=-1).view(np.uint16)[..., 0]] = (
+        _HEX_VALUES[_HEX_CODES][:, np.newaxis] * 16 + _HEX_VALUES[_HEX_CODES])
+"""
+Values of the hexadecimal digits pairs indexed by their character codes
+viewed as 16-bit integers, the other pairs being mapped to -1.
+
+_HEX_PAIRS_VALUES : ndarray
+"""
+
 
 def RGB_to_HEX(RGB):
     """
@@ -34,11 +73,12 @@ def RGB_to_HEX(RGB):
     Parameters
     ----------
     RGB : array_like
-        *RGB* colourspace array.
+        *RGB* colourspace array, an optional fourth alpha component is
+        converted to the *#RRGGBBAA* representation.
 
     Returns
     -------
-    unicode
+    unicode or ndarray
         Hexadecimal representation.
 
     Notes
@@ -50,16 +90,26 @@ def RGB_to_HEX(RGB):
     | ``RGB``    | [0, 1]                | [0, 1]        |
     +------------+-----------------------+---------------+
 
+    -   The conversion is performed on the bytes of a fixed-width string
+        array, i.e. without *Python* level iteration.
+
     Examples
     --------
     >>> RGB = np.array([0.66666667, 0.86666667, 1.00000000])
     >>> # Doctests skip for Python 2.x compatibility.
     >>> RGB_to_HEX(RGB)  # doctest: +SKIP
     '#aaddff'
+    >>> RGB_to_HEX(np.array([0.66666667, 0.86666667, 1.00000000, 0.5]))
+    ... # doctest: +SKIP
+    '#aaddff7f'
     """
 
     RGB = to_domain_1(RGB)
 
+    alpha = None
+    if RGB.shape[-1] == 4:
+        RGB, alpha = RGB[..., 0:3], np.clip(RGB[..., 3:4], 0, 1)
+
     if np.any(RGB < 0):
         usage_warning(
             '"RGB" array contains negative values, those will be clipped, '
@@ -74,12 +124,23 @@ def RGB_to_HEX(RGB):
 
         RGB = eotf_inverse_sRGB(normalise_maximum(eotf_sRGB(RGB)))
 
-    to_HEX = np.vectorize('{0:02x}'.format)
+    if alpha is not None:
+        RGB = np.concatenate([RGB, alpha], axis=-1)
 
-    HEX = to_HEX((RGB * 255).astype(np.uint8)).astype(object)
-    HEX = np.asarray('#') + HEX[..., 0] + HEX[..., 1] + HEX[..., 2]
+    values = (RGB * 255).astype(np.uint8)
 
-    return HEX
+    # The unicode character codes are written directly, each byte value
+    # mapping to a pair of hexadecimal digits packed in a 64-bit integer.
+    width = 1 + values.shape[-1] * 2
+    codes = np.empty(values.shape[:-1] + (width, ), dtype=np.uint32)
+    codes[..., 0] = ord('#')
+    codes[..., 1:] = np.reshape(
+        np.take(_HEX_DIGITS_PAIRS, values).view(np.uint32),
+        codes[..., 1:].shape)
+
+    HEX = codes.view('U{0}'.format(width))[..., 0]
+
+    return HEX if HEX.ndim else str(HEX)
 
 
 def HEX_to_RGB(HEX):
@@ -89,12 +150,20 @@ def HEX_to_RGB(HEX):
     Parameters
     ----------
     HEX : unicode or array_like
-        Hexadecimal representation.
+        Hexadecimal representation, i.e. *#RGB*, *#RGBA*, *#RRGGBB* or
+        *#RRGGBBAA*, the leading *#* being optional.
 
     Returns
     -------
     ndarray
-        *RGB* colourspace array.
+        *RGB* colourspace array, with a fourth alpha component if the
+        hexadecimal representation defines it.
+
+    Raises
+    ------
+    ValueError
+        If the hexadecimal representation is invalid or if representations
+        with and without alpha are mixed.
 
     Notes
     -----
@@ -105,25 +174,95 @@ def HEX_to_RGB(HEX):
     | ``RGB``   | [0, 1]                | [0, 1]        |
     +-----------+-----------------------+---------------+
 
+    -   The conversion is performed on the bytes of a fixed-width string
+        array, i.e. without *Python* level iteration.
+
     Examples
     --------
     >>> HEX = '#aaddff'
     >>> HEX_to_RGB(HEX)  # doctest: +ELLIPSIS
     array([ 0.6666666...,  0.8666666...,  1.        ])
+    >>> HEX_to_RGB(['#adf', '#aaddff80'])  # doctest: +ELLIPSIS
+    Traceback (most recent call last):
+      ...
+    ValueError: Hexadecimal representations with and without alpha cannot \
+be mixed!
+    >>> HEX_to_RGB(['#adf8', '#aaddff80'])  # doctest: +ELLIPSIS
+    array([[ 0.6666666...,  0.8666666...,  1.        ,  0.5333333...],
+           [ 0.6666666...,  0.8666666...,  1.        ,  0.5019607...]])
     """
 
-    HEX = np.core.defchararray.lstrip(HEX, '#')
-
-    def to_RGB(x):
-        """
-        Converts given hexadecimal representation to *RGB*.
-        """
-
-        l_x = len(x)
-        return [int(x[i:i + l_x // 3], 16) for i in range(0, l_x, l_x // 3)]
-
-    to_RGB_v = np.vectorize(to_RGB, otypes=[np.ndarray])
-
-    RGB = as_float_array(to_RGB_v(HEX).tolist()) / 255
+    HEX = np.asarray(HEX)
+    shape = HEX.shape
+
+    if HEX.dtype.kind not in 'SU':
+        HEX = HEX.astype(np.unicode_)
+
+    if HEX.size == 0:
+        return from_range_1(np.zeros(shape + (3, )))
+
+    # The fixed-width strings are viewed as 2-dimensional arrays of character
+    # codes, the unicode characters being 4 bytes wide and the shorter strings
+    # being padded with null characters.
+    HEX = np.ascontiguousarray(np.reshape(HEX, -1))
+    if HEX.dtype.kind == 'U':
+        codes = np.reshape(HEX.view(np.uint32), (HEX.size, -1))
+        # Characters outside the *Latin-1* range are never valid digits, they
+        # are mapped to an invalid non-null code so that they are not taken
+        # for padding.
+        if np.max(codes) > 255:
+            codes = np.where(codes > 255, 255, codes)
+        codes = codes.astype(np.uint8)
+    else:
+        codes = np.reshape(HEX.view(np.uint8), (HEX.size, -1))
+
+    hashes = codes[:, 0] == ord('#')
+    if np.all(hashes == hashes[0]) and np.all(codes[:, -1] != 0):
+        codes = codes[:, int(hashes[0]):]
+        length = np.full(HEX.size, codes.shape[-1])
+    else:
+        offset = hashes.astype(np.int_)
+        length = np.sum(codes != 0, axis=-1) - offset
+        codes = np.take_along_axis(
+            np.hstack([codes, np.zeros((HEX.size, 8), dtype=np.uint8)]),
+            offset[:, np.newaxis] + np.arange(8),
+            axis=-1)
+
+    valid = np.isin(length, (3, 4, 6, 8))
+    if not np.all(valid):
+        raise ValueError('"{0}" hexadecimal representation is invalid!'.format(
+            HEX[np.argmin(valid)]))
+
+    alpha = np.logical_or(length == 4, length == 8)
+    if np.any(alpha) != np.all(alpha):
+        raise ValueError('Hexadecimal representations with and without alpha '
+                         'cannot be mixed!')
+
+    channels = 4 if alpha[0] else 3
+
+    # Shorthand representations repeat each digit, i.e. "#abc" is "#aabbcc",
+    # the digits pairs of the other representations are decoded at once by
+    # viewing them as 16-bit integers.
+    short = length <= 4
+    if np.any(short):
+        values_s = np.take(_HEX_VALUES, codes[:, :channels]) * 17
+    if not np.all(short):
+        values_l = np.take(
+            _HEX_PAIRS_VALUES,
+            np.ascontiguousarray(codes[:, :channels * 2]).view(np.uint16))
+
+    if np.all(short):
+        values = values_s
+    elif not np.any(short):
+        values = values_l
+    else:
+        values = np.where(short[:, np.newaxis], values_s, values_l)
+
+    valid = np.all(values >= 0, axis=-1)
+    if not np.all(valid):
+        raise ValueError('"{0}" hexadecimal representation is invalid!'.format(
+            HEX[np.argmin(valid)]))
+
+    RGB = np.reshape(as_float_array(values) / 255, shape + (channels, ))
 
     return from_range_1(RGB)
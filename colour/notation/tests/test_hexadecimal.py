@@ -53,6 +53,14 @@ class TestRGB_to_HEX(unittest.TestCase):
                     [0.00000000, 1.00000000, 0.00000000],
                 ])), ['#fe0e0e', '#0e0e0e', '#000e00'])
 
+        self.assertEqual(
+            RGB_to_HEX(np.array([0.45620519, 0.03081071, 0.04091952, 0.5])),
+            '#74070a7f')
+
+        self.assertEqual(
+            RGB_to_HEX(np.array([0.45620519, 0.03081071, 0.04091952, 2.0])),
+            '#74070aff')
+
     def test_n_dimensional_RGB_to_HEX(self):
         """
         Tests :func:`colour.notation.hexadecimal.RGB_to_HEX` definition
@@ -124,6 +132,54 @@ class TestHEX_to_RGB(unittest.TestCase):
             np.array([1.00000000, 1.00000000, 1.00000000]),
             decimal=2)
 
+        np.testing.assert_almost_equal(
+            HEX_to_RGB('74070A'),
+            np.array([0.45620519, 0.03081071, 0.04091952]),
+            decimal=2)
+
+        np.testing.assert_almost_equal(
+            HEX_to_RGB(['#adf', '#ad0']),
+            np.array([
+                [0.66666667, 0.86666667, 1.00000000],
+                [0.66666667, 0.86666667, 0.00000000],
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            HEX_to_RGB(np.array([b'#adf8', b'74070a80'])),
+            np.array([
+                [0.66666667, 0.86666667, 1.00000000, 0.53333333],
+                [0.45490196, 0.02745098, 0.03921569, 0.50196078],
+            ]),
+            decimal=7)
+
+    def test_raise_exception_HEX_to_RGB(self):
+        """
+        Tests :func:`colour.notation.hexadecimal.HEX_to_RGB` definition
+        raised exception.
+        """
+
+        for HEX in ('#74070', '#74070g', 'x', '#74070\u0100',
+                    '#abc\u20ac\u20ac\u20ac', ['#abc', '#abc\u20ac']):
+            self.assertRaises(ValueError, HEX_to_RGB, HEX)
+
+        self.assertRaises(ValueError, HEX_to_RGB, ['#adf', '#adf8'])
+
+    def test_round_trip_HEX_to_RGB(self):
+        """
+        Tests :func:`colour.notation.hexadecimal.HEX_to_RGB` definition round
+        trip with :func:`colour.notation.hexadecimal.RGB_to_HEX` definition.
+        """
+
+        RGB = np.reshape(np.arange(256 * 4) % 256, (16, 16, 4)) / 255
+
+        HEX = RGB_to_HEX(RGB)
+        self.assertEqual(HEX.shape, (16, 16))
+        np.testing.assert_equal(HEX_to_RGB(HEX), RGB)
+        np.testing.assert_equal(HEX_to_RGB(HEX.astype(object)), RGB)
+        np.testing.assert_equal(
+            HEX_to_RGB(np.char.upper(HEX).astype(np.bytes_)), RGB)
+
     def test_n_dimensional_HEX_to_RGB(self):
         """
         Tests :func:`colour.notation.hexadecimal.HEX_to_RGB` definition
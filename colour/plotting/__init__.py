@@ -15,9 +15,9 @@ from .datasets import *  # noqa
 from . import datasets  # noqa
 from .common import (  # noqa
     CONSTANTS_COLOUR_STYLE, CONSTANTS_ARROW_STYLE, colour_style,
-    override_style, XYZ_to_plotting_colourspace, ColourSwatch, colour_cycle,
-    artist, camera, render, label_rectangles, uniform_axes3d,
-    filter_passthrough, filter_RGB_colourspaces, filter_cmfs,
+    override_style, XYZ_to_plotting_colourspace, RenderCache, CACHE_RENDER,
+    ColourSwatch, colour_cycle, artist, camera, render, label_rectangles,
+    uniform_axes3d, filter_passthrough, filter_RGB_colourspaces, filter_cmfs,
     filter_illuminants, filter_colour_checkers, update_settings_collection,
     plot_single_colour_swatch, plot_multi_colour_swatches,
     plot_single_function, plot_multi_functions, plot_image)
@@ -70,13 +70,13 @@ __all__ = []
 __all__ += datasets.__all__
 __all__ += [
     'CONSTANTS_COLOUR_STYLE', 'CONSTANTS_ARROW_STYLE', 'colour_style',
-    'override_style', 'XYZ_to_plotting_colourspace', 'ColourSwatch',
-    'colour_cycle', 'artist', 'camera', 'render', 'label_rectangles',
-    'uniform_axes3d', 'filter_passthrough', 'filter_RGB_colourspaces',
-    'filter_cmfs', 'filter_illuminants', 'filter_colour_checkers',
-    'update_settings_collection', 'plot_single_colour_swatch',
-    'plot_multi_colour_swatches', 'plot_single_function',
-    'plot_multi_functions', 'plot_image'
+    'override_style', 'XYZ_to_plotting_colourspace', 'RenderCache',
+    'CACHE_RENDER', 'ColourSwatch', 'colour_cycle', 'artist', 'camera',
+    'render', 'label_rectangles', 'uniform_axes3d', 'filter_passthrough',
+    'filter_RGB_colourspaces', 'filter_cmfs', 'filter_illuminants',
+    'filter_colour_checkers', 'update_settings_collection',
+    'plot_single_colour_swatch', 'plot_multi_colour_swatches',
+    'plot_single_function', 'plot_multi_functions', 'plot_image'
 ]
 __all__ += ['plot_cvd_simulation_Machado2009']
 __all__ += [
@@ -7,6 +7,8 @@ Defines the common plotting objects:
 
 -   :func:`colour.plotting.colour_style`
 -   :func:`colour.plotting.override_style`
+-   :class:`colour.plotting.RenderCache`
+-   :attr:`colour.plotting.CACHE_RENDER`
 -   :func:`colour.plotting.colour_cycle`
 -   :func:`colour.plotting.artist`
 -   :func:`colour.plotting.camera`
@@ -26,12 +28,14 @@ Defines the common plotting objects:
 from __future__ import division
 
 import functools
+import hashlib
 import itertools
 import matplotlib
 import matplotlib.cm
 import matplotlib.pyplot as plt
 import matplotlib.ticker
 import numpy as np
+import os
 import re
 import six
 from collections import OrderedDict, namedtuple
@@ -55,13 +59,13 @@ __status__ = 'Production'
 
 __all__ = [
     'CONSTANTS_COLOUR_STYLE', 'CONSTANTS_ARROW_STYLE', 'colour_style',
-    'override_style', 'XYZ_to_plotting_colourspace', 'ColourSwatch',
-    'colour_cycle', 'artist', 'camera', 'render', 'label_rectangles',
-    'uniform_axes3d', 'filter_passthrough', 'filter_RGB_colourspaces',
-    'filter_cmfs', 'filter_illuminants', 'filter_colour_checkers',
-    'update_settings_collection', 'plot_single_colour_swatch',
-    'plot_multi_colour_swatches', 'plot_single_function',
-    'plot_multi_functions', 'plot_image'
+    'override_style', 'XYZ_to_plotting_colourspace', 'RenderCache',
+    'CACHE_RENDER', 'ColourSwatch', 'colour_cycle', 'artist', 'camera',
+    'render', 'label_rectangles', 'uniform_axes3d', 'filter_passthrough',
+    'filter_RGB_colourspaces', 'filter_cmfs', 'filter_illuminants',
+    'filter_colour_checkers', 'update_settings_collection',
+    'plot_single_colour_swatch', 'plot_multi_colour_swatches',
+    'plot_single_function', 'plot_multi_functions', 'plot_image'
 ]
 
 CONSTANTS_COLOUR_STYLE = Structure(
@@ -346,6 +350,264 @@ def XYZ_to_plotting_colourspace(XYZ,
         if apply_cctf_encoding else None)
 
 
+class RenderCache(object):
+    """
+    Defines a bounded *Least Recently Used* (LRU) cache for the data that
+    is expensive to compute but independent of the figure being rendered,
+    e.g. the *Chromaticity Diagram* background colours or the
+    *Spectral Locus* geometry.
+
+    The cache entries are tuples of *ndarray* keyed by tuples of hashable
+    objects or *ndarray*, the latter being hashed with their content. The
+    least recently used entries are evicted when the entries size exceeds the
+    cache maximum size.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum size in bytes of the cache entries held in memory.
+    path : unicode, optional
+        Directory where the cache entries are persisted as *.npz* files, if
+        *None*, the entries are only held in memory.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.plotting.RenderCache.maximum_size`
+    -   :attr:`~colour.plotting.RenderCache.path`
+    -   :attr:`~colour.plotting.RenderCache.size`
+
+    Methods
+    -------
+    -   :meth:`~colour.plotting.RenderCache.__init__`
+    -   :meth:`~colour.plotting.RenderCache.__len__`
+    -   :meth:`~colour.plotting.RenderCache.__contains__`
+    -   :meth:`~colour.plotting.RenderCache.get`
+    -   :meth:`~colour.plotting.RenderCache.clear`
+
+    Notes
+    -----
+    -   The cached *ndarray* are read-only so that they are not altered
+        inadvertently by the callers.
+
+    Examples
+    --------
+    >>> cache = RenderCache(maximum_size=2 ** 10)
+    >>> cache.get(('Ramp', 3), lambda: (np.linspace(0, 1, 3), ))
+    (array([ 0. ,  0.5,  1. ]),)
+    >>> ('Ramp', 3) in cache
+    True
+    >>> cache.size
+    24
+    """
+
+    def __init__(self, maximum_size=2 ** 26, path=None):
+        self._maximum_size = None
+        self.maximum_size = maximum_size
+        self._path = None
+        self.path = path
+
+        self._entries = OrderedDict()
+        self._size = 0
+
+    @property
+    def maximum_size(self):
+        """
+        Getter and setter property for the maximum size in bytes of the cache
+        entries held in memory.
+
+        Parameters
+        ----------
+        value : int
+            Value to set the maximum size with.
+
+        Returns
+        -------
+        int
+            Maximum size.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for the **self.maximum_size** property.
+        """
+
+        self._maximum_size = value
+
+        if hasattr(self, '_entries'):
+            self._evict()
+
+    @property
+    def path(self):
+        """
+        Getter and setter property for the directory where the cache entries
+        are persisted.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the directory with.
+
+        Returns
+        -------
+        unicode
+            Directory where the cache entries are persisted.
+        """
+
+        return self._path
+
+    @path.setter
+    def path(self, value):
+        """
+        Setter for the **self.path** property.
+        """
+
+        if value is not None and not os.path.exists(value):
+            os.makedirs(value)
+
+        self._path = value
+
+    @property
+    def size(self):
+        """
+        Getter property for the size in bytes of the cache entries held in
+        memory.
+
+        Returns
+        -------
+        int
+            Size of the cache entries.
+        """
+
+        return self._size
+
+    def __len__(self):
+        """
+        Returns the count of cache entries held in memory.
+
+        Returns
+        -------
+        int
+            Cache entries count.
+        """
+
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """
+        Returns whether the cache holds an entry in memory for given key.
+
+        Parameters
+        ----------
+        key : tuple
+            Entry key.
+
+        Returns
+        -------
+        bool
+            Whether the cache holds an entry for given key.
+        """
+
+        return self._digest(key) in self._entries
+
+    @staticmethod
+    def _digest(key):
+        """
+        Returns the digest of given key, hashing the *ndarray* content.
+        """
+
+        digest = hashlib.sha1()
+        for item in key:
+            if isinstance(item, np.ndarray):
+                digest.update(np.ascontiguousarray(item).tobytes())
+                digest.update(str(item.shape).encode('utf-8'))
+            else:
+                digest.update(repr(item).encode('utf-8'))
+            digest.update(b'|')
+
+        return digest.hexdigest()
+
+    def _evict(self):
+        """
+        Evicts the least recently used entries until the cache size is lower
+        or equal to its maximum size.
+        """
+
+        while self._entries and self._size > self._maximum_size:
+            _digest, value = self._entries.popitem(last=False)
+            self._size -= sum(array.nbytes for array in value)
+
+    def get(self, key, factory):
+        """
+        Returns the entry for given key, calling given factory to compute it if
+        the cache does not hold it.
+
+        Parameters
+        ----------
+        key : tuple
+            Entry key.
+        factory : callable
+            Callable returning the entry, i.e. a tuple of *ndarray*, when
+            called without arguments.
+
+        Returns
+        -------
+        tuple
+            Cache entry.
+        """
+
+        digest = self._digest(key)
+
+        value = self._entries.pop(digest, None)
+        if value is not None:
+            self._entries[digest] = value
+
+            return value
+
+        path = (None if self._path is None else os.path.join(
+            self._path, '{0}.npz'.format(digest)))
+
+        if path is not None and os.path.exists(path):
+            with np.load(path) as data:
+                value = tuple(
+                    data['arr_{0}'.format(i)] for i in range(len(data.files)))
+        else:
+            value = tuple(np.asarray(array) for array in factory())
+
+            if path is not None:
+                np.savez(path, *value)
+
+        for array in value:
+            array.flags.writeable = False
+
+        self._entries[digest] = value
+        self._size += sum(array.nbytes for array in value)
+        self._evict()
+
+        return value
+
+    def clear(self):
+        """
+        Clears the cache entries held in memory, the persisted entries are
+        left untouched.
+        """
+
+        self._entries.clear()
+        self._size = 0
+
+
+CACHE_RENDER = RenderCache()
+"""
+Render cache used by the plotting definitions, e.g. for the
+*Chromaticity Diagram* background colours and the *Spectral Locus* and
+*Planckian Locus* geometry.
+
+CACHE_RENDER : RenderCache
+"""
+
+
 class ColourSwatch(namedtuple('ColourSwatch', ('name', 'RGB'))):
     """
     Defines a data structure for a colour swatch.
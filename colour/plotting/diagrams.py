@@ -17,6 +17,7 @@ from __future__ import division
 
 import bisect
 import numpy as np
+from functools import partial
 from matplotlib.collections import LineCollection
 from matplotlib.patches import Polygon
 
@@ -24,13 +25,15 @@ from colour.algebra import normalise_vector
 from colour.colorimetry import SDS_ILLUMINANTS, sd_to_XYZ, sds_and_msds_to_sds
 from colour.models import (Luv_to_uv, Luv_uv_to_xy, UCS_to_uv, UCS_uv_to_xy,
                            XYZ_to_Luv, XYZ_to_UCS, XYZ_to_xy, xy_to_XYZ)
-from colour.plotting import (CONSTANTS_COLOUR_STYLE, CONSTANTS_ARROW_STYLE,
-                             XYZ_to_plotting_colourspace, artist, filter_cmfs,
-                             filter_illuminants, override_style, render,
-                             update_settings_collection)
-from colour.utilities import (domain_range_scale, first_item, is_string,
-                              normalise_maximum, tstack, suppress_warnings)
+from colour.plotting import (
+    CACHE_RENDER, CONSTANTS_COLOUR_STYLE, CONSTANTS_ARROW_STYLE,
+    XYZ_to_plotting_colourspace, artist, filter_cmfs, filter_illuminants,
+    override_style, render, update_settings_collection)
+from colour.utilities import (as_float_array, domain_range_scale, first_item,
+                              is_string, normalise_maximum, tstack,
+                              suppress_warnings)
 from colour.utilities.deprecation import handle_arguments_deprecation
+from colour.utilities.profiling import _definition_name
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -50,6 +53,22 @@ __all__ = [
 ]
 
 
+def _callable_key(callable_):
+    """
+    Returns a render cache key item for given callable, i.e. its qualified
+    name and, for the *partial* objects, their arguments.
+    """
+
+    if callable_ is None:
+        return None
+
+    if isinstance(callable_, partial):
+        return (_callable_key(callable_.func), callable_.args,
+                tuple(sorted(callable_.keywords.items())))
+
+    return _definition_name(callable_)
+
+
 @override_style()
 def plot_spectral_locus(cmfs='CIE 1931 2 Degree Standard Observer',
                         spectral_locus_colours=None,
@@ -116,17 +135,10 @@ def plot_spectral_locus(cmfs='CIE 1931 2 Degree Standard Observer',
     equal_energy = np.array([1 / 3] * 2)
 
     if method == 'CIE 1931':
-        ij = XYZ_to_xy(cmfs.values, illuminant)
         labels = ((390, 460, 470, 480, 490, 500, 510, 520, 540, 560, 580, 600,
                    620, 700)
                   if spectral_locus_labels is None else spectral_locus_labels)
-    elif method == 'CIE 1960 UCS':
-        ij = UCS_to_uv(XYZ_to_UCS(cmfs.values))
-        labels = ((420, 440, 450, 460, 470, 480, 490, 500, 510, 520, 530, 540,
-                   550, 560, 570, 580, 590, 600, 610, 620, 630, 645, 680)
-                  if spectral_locus_labels is None else spectral_locus_labels)
-    elif method == 'CIE 1976 UCS':
-        ij = Luv_to_uv(XYZ_to_Luv(cmfs.values, illuminant), illuminant)
+    elif method in ('CIE 1960 UCS', 'CIE 1976 UCS'):
         labels = ((420, 440, 450, 460, 470, 480, 490, 500, 510, 520, 530, 540,
                    550, 560, 570, 580, 590, 600, 610, 620, 630, 645, 680)
                   if spectral_locus_labels is None else spectral_locus_labels)
@@ -136,15 +148,23 @@ def plot_spectral_locus(cmfs='CIE 1931 2 Degree Standard Observer',
             '[\'CIE 1931\', \'CIE 1960 UCS\', \'CIE 1976 UCS\']'.format(
                 method))
 
-    pl_ij = tstack([
-        np.linspace(ij[0][0], ij[-1][0], 20),
-        np.linspace(ij[0][1], ij[-1][1], 20)
-    ]).reshape(-1, 1, 2)
-    sl_ij = np.copy(ij).reshape(-1, 1, 2)
+    def _spectral_locus():
+        """
+        Computes the *Spectral Locus* and purple line chromaticity coordinates
+        and colours.
+        """
 
-    if spectral_locus_colours.upper() == 'RGB':
-        spectral_locus_colours = normalise_maximum(
-            XYZ_to_plotting_colourspace(cmfs.values), axis=-1)
+        if method == 'CIE 1931':
+            ij = XYZ_to_xy(cmfs.values, illuminant)
+        elif method == 'CIE 1960 UCS':
+            ij = UCS_to_uv(XYZ_to_UCS(cmfs.values))
+        elif method == 'CIE 1976 UCS':
+            ij = Luv_to_uv(XYZ_to_Luv(cmfs.values, illuminant), illuminant)
+
+        pl_ij = tstack([
+            np.linspace(ij[0][0], ij[-1][0], 20),
+            np.linspace(ij[0][1], ij[-1][1], 20)
+        ]).reshape(-1, 1, 2)
 
         if method == 'CIE 1931':
             XYZ = xy_to_XYZ(pl_ij)
@@ -152,8 +172,25 @@ def plot_spectral_locus(cmfs='CIE 1931 2 Degree Standard Observer',
             XYZ = xy_to_XYZ(UCS_uv_to_xy(pl_ij))
         elif method == 'CIE 1976 UCS':
             XYZ = xy_to_XYZ(Luv_uv_to_xy(pl_ij))
-        purple_line_colours = normalise_maximum(
-            XYZ_to_plotting_colourspace(XYZ.reshape(-1, 3)), axis=-1)
+
+        return (ij, pl_ij,
+                normalise_maximum(
+                    XYZ_to_plotting_colourspace(cmfs.values), axis=-1),
+                normalise_maximum(
+                    XYZ_to_plotting_colourspace(XYZ.reshape(-1, 3)), axis=-1))
+
+    colourspace = CONSTANTS_COLOUR_STYLE.colour.colourspace
+    ij, pl_ij, sl_colours, pl_colours = CACHE_RENDER.get(
+        ('Spectral Locus', method, cmfs.wavelengths, cmfs.values,
+         colourspace.name, colourspace.matrix_XYZ_to_RGB,
+         _callable_key(colourspace.cctf_encoding), as_float_array(illuminant)),
+        _spectral_locus)
+
+    sl_ij = ij.reshape(-1, 1, 2)
+
+    if spectral_locus_colours.upper() == 'RGB':
+        spectral_locus_colours = sl_colours
+        purple_line_colours = pl_colours
     else:
         purple_line_colours = spectral_locus_colours
 
@@ -272,32 +309,48 @@ def plot_chromaticity_diagram_colours(
 
     illuminant = CONSTANTS_COLOUR_STYLE.colour.colourspace.whitepoint
 
-    ii, jj = np.meshgrid(
-        np.linspace(0, 1, samples), np.linspace(1, 0, samples))
-    ij = tstack([ii, jj])
+    if method not in ('CIE 1931', 'CIE 1960 UCS', 'CIE 1976 UCS'):
+        raise ValueError(
+            'Invalid method: "{0}", must be one of '
+            '[\'CIE 1931\', \'CIE 1960 UCS\', \'CIE 1976 UCS\']'.format(
+                method))
 
-    # NOTE: Various values in the grid have potential to generate
-    # zero-divisions, they could be avoided by perturbing the grid, e.g. adding
-    # a small epsilon. It was decided instead to disable warnings.
-    with suppress_warnings(python_warnings=True):
-        if method == 'CIE 1931':
-            XYZ = xy_to_XYZ(ij)
-            spectral_locus = XYZ_to_xy(cmfs.values, illuminant)
-        elif method == 'CIE 1960 UCS':
-            XYZ = xy_to_XYZ(UCS_uv_to_xy(ij))
-            spectral_locus = UCS_to_uv(XYZ_to_UCS(cmfs.values))
-        elif method == 'CIE 1976 UCS':
-            XYZ = xy_to_XYZ(Luv_uv_to_xy(ij))
-            spectral_locus = Luv_to_uv(
-                XYZ_to_Luv(cmfs.values, illuminant), illuminant)
-        else:
-            raise ValueError(
-                'Invalid method: "{0}", must be one of '
-                '[\'CIE 1931\', \'CIE 1960 UCS\', \'CIE 1976 UCS\']'.format(
-                    method))
-
-    RGB = normalise_maximum(
-        XYZ_to_plotting_colourspace(XYZ, illuminant), axis=-1)
+    def _chromaticity_diagram_colours():
+        """
+        Computes the *Chromaticity Diagram* colours and the *Spectral Locus*
+        chromaticity coordinates.
+        """
+
+        ii, jj = np.meshgrid(
+            np.linspace(0, 1, samples), np.linspace(1, 0, samples))
+        ij = tstack([ii, jj])
+
+        # NOTE: Various values in the grid have potential to generate
+        # zero-divisions, they could be avoided by perturbing the grid, e.g.
+        # adding a small epsilon. It was decided instead to disable warnings.
+        with suppress_warnings(python_warnings=True):
+            if method == 'CIE 1931':
+                XYZ = xy_to_XYZ(ij)
+                spectral_locus = XYZ_to_xy(cmfs.values, illuminant)
+            elif method == 'CIE 1960 UCS':
+                XYZ = xy_to_XYZ(UCS_uv_to_xy(ij))
+                spectral_locus = UCS_to_uv(XYZ_to_UCS(cmfs.values))
+            elif method == 'CIE 1976 UCS':
+                XYZ = xy_to_XYZ(Luv_uv_to_xy(ij))
+                spectral_locus = Luv_to_uv(
+                    XYZ_to_Luv(cmfs.values, illuminant), illuminant)
+
+            RGB = normalise_maximum(
+                XYZ_to_plotting_colourspace(XYZ, illuminant), axis=-1)
+
+        return RGB, spectral_locus
+
+    colourspace = CONSTANTS_COLOUR_STYLE.colour.colourspace
+    RGB, spectral_locus = CACHE_RENDER.get(
+        ('Chromaticity Diagram Colours', method, samples, cmfs.wavelengths,
+         cmfs.values, colourspace.name, colourspace.matrix_XYZ_to_RGB,
+         _callable_key(colourspace.cctf_encoding), as_float_array(illuminant)),
+        _chromaticity_diagram_colours)
 
     polygon = Polygon(
         spectral_locus
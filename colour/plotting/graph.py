@@ -10,9 +10,8 @@ Defines the automatic colour conversion graph plotting objects:
 
 from __future__ import division
 
-import colour
-from colour.graph import (CONVERSION_GRAPH_NODE_LABELS,
-                          describe_conversion_path)
+from colour.graph import CONVERSION_GRAPH_NODE_LABELS
+from colour.graph.conversion import _conversion_graph
 from colour.utilities import required
 
 __author__ = 'Colour Developers'
@@ -70,10 +69,7 @@ def plot_automatic_colour_conversion_graph(filename, prog='fdp', args=''):
 
     import networkx as nx
 
-    # TODO: Investigate API to trigger the conversion graph build.
-    describe_conversion_path('RGB', 'RGB', print_callable=lambda x: x)
-
-    agraph = nx.nx_agraph.to_agraph(colour.graph.CONVERSION_GRAPH)
+    agraph = nx.nx_agraph.to_agraph(_conversion_graph())
 
     for node in agraph.nodes():
         node.attr.update(label=CONVERSION_GRAPH_NODE_LABELS[node.name])
@@ -71,8 +71,9 @@ from colour.plotting import (
     filter_cmfs, plot_multi_functions, override_style, render,
     update_settings_collection)
 from colour.plotting.diagrams import plot_chromaticity_diagram
-from colour.utilities import (as_float_array, as_int_array, domain_range_scale,
-                              first_item, tsplit, tstack)
+from colour.utilities import (as_float_array, as_int_array, chunk_slices,
+                              domain_range_scale, first_item, is_iterable,
+                              tsplit, tstack)
 from colour.utilities.deprecation import handle_arguments_deprecation
 
 __author__ = 'Colour Developers'
@@ -88,6 +89,7 @@ __all__ = [
     'plot_RGB_colourspaces_in_chromaticity_diagram_CIE1931',
     'plot_RGB_colourspaces_in_chromaticity_diagram_CIE1960UCS',
     'plot_RGB_colourspaces_in_chromaticity_diagram_CIE1976UCS',
+    'RGB_chromaticities_histogram',
     'plot_RGB_chromaticities_in_chromaticity_diagram',
     'plot_RGB_chromaticities_in_chromaticity_diagram_CIE1931',
     'plot_RGB_chromaticities_in_chromaticity_diagram_CIE1960UCS',
@@ -745,6 +747,119 @@ Plot_RGB_Colourspaces_In_Chromaticity_Diagram_CIE1976UCS.png
         **settings)
 
 
+def _RGB_to_chromaticities(RGB, colourspace, method):
+    """
+    Converts given *RGB* colourspace array to chromaticity coordinates
+    according to given *Chromaticity Diagram* method.
+    """
+
+    XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, colourspace.whitepoint,
+                     colourspace.matrix_RGB_to_XYZ)
+
+    method = method.upper()
+
+    if method == 'CIE 1931':
+        return XYZ_to_xy(XYZ, colourspace.whitepoint)
+    elif method == 'CIE 1960 UCS':
+        return UCS_to_uv(XYZ_to_UCS(XYZ))
+    elif method == 'CIE 1976 UCS':
+        return Luv_to_uv(
+            XYZ_to_Luv(XYZ, colourspace.whitepoint), colourspace.whitepoint)
+
+
+def RGB_chromaticities_histogram(RGB,
+                                 colourspace='sRGB',
+                                 method='CIE 1931',
+                                 bins=256,
+                                 bounding_box=(0, 1, 0, 1),
+                                 histogram=None,
+                                 chunk_size=2 ** 20):
+    """
+    Computes the 2-dimensional histogram of the chromaticity coordinates of
+    given *RGB* colourspace array according to given *Chromaticity Diagram*
+    method.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array.
+    colourspace : unicode or RGB_Colourspace, optional
+        *RGB* colourspace of the *RGB* array. ``colourspace`` can be of any
+        type or form supported by the
+        :func:`colour.plotting.filter_RGB_colourspaces` definition.
+    method : unicode, optional
+        **{'CIE 1931', 'CIE 1960 UCS', 'CIE 1976 UCS'}**,
+        *Chromaticity Diagram* method.
+    bins : int, optional
+        Bins count along each chromaticity coordinates axis.
+    bounding_box : array_like, optional
+        Histogram bounding box:
+        `bounding_box = (x min, x max, y min, y max)`.
+    histogram : ndarray, optional
+        Histogram with shape (bins, bins) the chromaticity coordinates counts
+        are accumulated into, allowing to stream a sequence of frames.
+    chunk_size : int, optional
+        Number of *RGB* colourspace array values converted at once.
+
+    Returns
+    -------
+    ndarray
+        Histogram with shape (bins, bins), indexed by the :math:`x` and
+        :math:`y` chromaticity coordinates bins respectively.
+
+    Notes
+    -----
+    -   The chromaticity coordinates outside the bounding box are discarded.
+
+    Examples
+    --------
+    >>> RGB = np.array([
+    ...     [0.45620520, 0.03081070, 0.04091953],
+    ...     [0.18216103, 0.26617215, 0.10437584],
+    ...     [0.45620520, 0.03081070, 0.04091953],
+    ... ])
+    >>> histogram = RGB_chromaticities_histogram(RGB, 'sRGB', bins=4)
+    >>> histogram
+    array([[0, 0, 0, 0],
+           [0, 1, 0, 0],
+           [0, 2, 0, 0],
+           [0, 0, 0, 0]])
+    >>> RGB_chromaticities_histogram(RGB, 'sRGB', bins=4, histogram=histogram)
+    array([[0, 0, 0, 0],
+           [0, 2, 0, 0],
+           [0, 4, 0, 0],
+           [0, 0, 0, 0]])
+    """
+
+    RGB = np.reshape(RGB, [-1, 3])
+
+    colourspace = first_item(filter_RGB_colourspaces(colourspace).values())
+
+    x_min, x_max, y_min, y_max = bounding_box
+
+    if histogram is None:
+        histogram = np.zeros([bins, bins], np.int_)
+
+    for chunk in chunk_slices(RGB.shape[0], chunk_size):
+        i, j = tsplit(
+            _RGB_to_chromaticities(
+                as_float_array(RGB[chunk]), colourspace, method))
+
+        with np.errstate(invalid='ignore'):
+            i = np.floor((i - x_min) / (x_max - x_min) * bins)
+            j = np.floor((j - y_min) / (y_max - y_min) * bins)
+            within = np.logical_and.reduce(
+                [i >= 0, i < bins, j >= 0, j < bins])
+
+        histogram += np.reshape(
+            np.bincount(
+                i[within].astype(np.int_) * bins + j[within].astype(np.int_),
+                minlength=bins * bins), [bins, bins]).astype(
+                    histogram.dtype, copy=False)
+
+    return histogram
+
+
 @override_style()
 def plot_RGB_chromaticities_in_chromaticity_diagram(
         RGB,
@@ -753,6 +868,8 @@ def plot_RGB_chromaticities_in_chromaticity_diagram(
             plot_RGB_colourspaces_in_chromaticity_diagram),
         method='CIE 1931',
         scatter_kwargs=None,
+        mode='Scatter',
+        density_kwargs=None,
         **kwargs):
     """
     Plots given *RGB* colourspace array in the *Chromaticity Diagram* according
@@ -760,8 +877,10 @@ def plot_RGB_chromaticities_in_chromaticity_diagram(
 
     Parameters
     ----------
-    RGB : array_like
-        *RGB* colourspace array.
+    RGB : array_like or iterable
+        *RGB* colourspace array or, with the *Density* mode, an iterable, e.g.
+        a generator, of *RGB* colourspace arrays, e.g. the frames of a
+        sequence, accumulated one at a time.
     colourspace : unicode or RGB_Colourspace, optional
         *RGB* colourspace of the *RGB* array. ``colourspace`` can be of any
         type or form supported by the
@@ -777,7 +896,19 @@ def plot_RGB_chromaticities_in_chromaticity_diagram(
 
         -   *c* : unicode or array_like, if ``c`` is set to *RGB*, the scatter
             will use the colours as given by the ``RGB`` argument.
+    mode : unicode, optional
+        **{'Scatter', 'Density'}**,
+        Plotting mode, the *Density* mode bins the chromaticity coordinates
+        into a 2-dimensional histogram drawn as a single image which is
+        suited to large *RGB* colourspace arrays, e.g. multi-megapixel images.
+    density_kwargs : dict, optional
+        Keyword arguments for the :func:`plt.imshow` definition. The following
+        special keyword arguments can also be used:
 
+        -   *bins* : int, bins count along each chromaticity coordinates axis.
+        -   *bounding_box* : array_like, histogram bounding box.
+        -   *percentile* : numeric, if set, the histogram counts are clipped
+            at given percentile of the non-empty bins counts.
 
     Other Parameters
     ----------------
@@ -795,6 +926,12 @@ plot_RGB_colourspaces_in_chromaticity_diagram`,
     tuple
         Current figure and axes.
 
+    Raises
+    ------
+    ValueError
+        If the *RGB* colourspace arrays iterable of the *Density* mode is
+        empty.
+
     Examples
     --------
     >>> RGB = np.random.random((128, 128, 3))
@@ -807,20 +944,99 @@ plot_RGB_colourspaces_in_chromaticity_diagram`,
 Plot_RGB_Chromaticities_In_Chromaticity_Diagram.png
         :align: center
         :alt: plot_RGB_chromaticities_in_chromaticity_diagram
+
+    >>> RGB = (np.random.random((64, 64, 3)) for _ in range(4))
+    >>> plot_RGB_chromaticities_in_chromaticity_diagram(
+    ...     RGB, 'ITU-R BT.709', mode='Density',
+    ...     density_kwargs={'percentile': 99})
+    ... # doctest: +ELLIPSIS
+    (<Figure size ... with 1 Axes>, <...AxesSubplot...>)
     """
 
     scatter_kwargs = handle_arguments_deprecation({
         'ArgumentRenamed': [['scatter_parameters', 'scatter_kwargs']],
     }, **kwargs).get('scatter_kwargs', scatter_kwargs)
 
-    RGB = as_float_array(RGB).reshape(-1, 3)
+    assert mode.lower() in ('scatter', 'density'), (
+        '"{0}" mode is not supported, it must be one of {1}!'.format(
+            mode, ['Scatter', 'Density']))
 
     settings = {'uniform': True}
     settings.update(kwargs)
 
     _figure, axes = artist(**settings)
 
-    method = method.upper()
+    settings = dict(kwargs)
+    settings.update({'axes': axes, 'standalone': False})
+
+    colourspace = first_item(filter_RGB_colourspaces(colourspace).values())
+    settings['colourspaces'] = (
+        ['^{0}$'.format(colourspace.name)] + settings.get('colourspaces', []))
+
+    chromaticity_diagram_callable(**settings)
+
+    if mode.lower() == 'density':
+        density_settings = {
+            'bins': 256,
+            'bounding_box': (0, 1, 0, 1),
+            'percentile': None,
+            'cmap': CONSTANTS_COLOUR_STYLE.colour.map,
+            'interpolation': 'nearest',
+            'alpha': 0.85,
+        }
+        if density_kwargs is not None:
+            density_settings.update(density_kwargs)
+
+        bins = density_settings.pop('bins')
+        bounding_box = density_settings.pop('bounding_box')
+        percentile = density_settings.pop('percentile')
+
+        if isinstance(RGB, np.ndarray) or not is_iterable(RGB) or isinstance(
+                RGB, (list, tuple)):
+            RGB = [RGB]
+
+        histogram = None
+        for RGB_f in RGB:
+            histogram = RGB_chromaticities_histogram(
+                RGB_f, colourspace, method, bins, bounding_box, histogram)
+
+        if histogram is None:
+            raise ValueError('No "RGB" colourspace array was accumulated into '
+                             'the histogram, the iterable is empty!')
+
+        if percentile is not None and np.any(histogram):
+            density_settings['vmax'] = np.percentile(histogram[histogram > 0],
+                                                     percentile)
+
+        # Drawing the histogram image must not alter the diagram limits and
+        # aspect ratio.
+        x_limits, y_limits = axes.get_xlim(), axes.get_ylim()
+        axes.imshow(
+            np.ma.masked_equal(np.transpose(histogram), 0),
+            origin='lower',
+            extent=bounding_box,
+            aspect=axes.get_aspect(),
+            **density_settings)
+        axes.set_xlim(x_limits)
+        axes.set_ylim(y_limits)
+    else:
+        _plot_RGB_chromaticities_scatter(axes, RGB, colourspace, method,
+                                         scatter_kwargs)
+
+    settings.update({'standalone': True})
+    settings.update(kwargs)
+
+    return render(**settings)
+
+
+def _plot_RGB_chromaticities_scatter(axes, RGB, colourspace, method,
+                                     scatter_kwargs):
+    """
+    Scatters given *RGB* colourspace array chromaticity coordinates on given
+    axes.
+    """
+
+    RGB = as_float_array(RGB).reshape(-1, 3)
 
     scatter_settings = {
         's': 40,
@@ -831,15 +1047,6 @@ Plot_RGB_Chromaticities_In_Chromaticity_Diagram.png
     if scatter_kwargs is not None:
         scatter_settings.update(scatter_kwargs)
 
-    settings = dict(kwargs)
-    settings.update({'axes': axes, 'standalone': False})
-
-    colourspace = first_item(filter_RGB_colourspaces(colourspace).values())
-    settings['colourspaces'] = (
-        ['^{0}$'.format(colourspace.name)] + settings.get('colourspaces', []))
-
-    chromaticity_diagram_callable(**settings)
-
     use_RGB_colours = scatter_settings['c'].upper() == 'RGB'
     if use_RGB_colours:
         RGB = RGB[RGB[:, 1].argsort()]
@@ -850,25 +1057,10 @@ Plot_RGB_Chromaticities_In_Chromaticity_Diagram.png
                 CONSTANTS_COLOUR_STYLE.colour.colourspace,
                 apply_cctf_encoding=True).reshape(-1, 3), 0, 1)
 
-    XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, colourspace.whitepoint,
-                     colourspace.matrix_RGB_to_XYZ)
-
-    if method == 'CIE 1931':
-        ij = XYZ_to_xy(XYZ, colourspace.whitepoint)
-    elif method == 'CIE 1960 UCS':
-        ij = UCS_to_uv(XYZ_to_UCS(XYZ))
-
-    elif method == 'CIE 1976 UCS':
-        ij = Luv_to_uv(
-            XYZ_to_Luv(XYZ, colourspace.whitepoint), colourspace.whitepoint)
+    ij = _RGB_to_chromaticities(RGB, colourspace, method)
 
     axes.scatter(ij[..., 0], ij[..., 1], **scatter_settings)
 
-    settings.update({'standalone': True})
-    settings.update(kwargs)
-
-    return render(**settings)
-
 
 @override_style()
 def plot_RGB_chromaticities_in_chromaticity_diagram_CIE1931(
@@ -20,7 +20,7 @@ from colour.colorimetry import MSDS_CMFS, CCS_ILLUMINANTS
 from colour.models import (UCS_uv_to_xy, XYZ_to_UCS, UCS_to_uv, xy_to_XYZ)
 from colour.temperature import CCT_to_uv
 from colour.plotting import (
-    CONSTANTS_COLOUR_STYLE, CONSTANTS_ARROW_STYLE, artist,
+    CACHE_RENDER, CONSTANTS_COLOUR_STYLE, CONSTANTS_ARROW_STYLE, artist,
     plot_chromaticity_diagram_CIE1931, plot_chromaticity_diagram_CIE1960UCS,
     filter_passthrough, override_style, render, update_settings_collection)
 from colour.plotting.diagrams import plot_chromaticity_diagram
@@ -113,16 +113,32 @@ def plot_planckian_locus(planckian_locus_colours=None,
         raise ValueError('Invalid method: "{0}", must be one of '
                          '[\'CIE 1931\', \'CIE 1960 UCS\']'.format(method))
 
-    start, end = 1667, 100000
-    CCT = np.arange(start, end + 250, 250)
-    CCT_D_uv = tstack([CCT, zeros(CCT.shape)])
-    ij = uv_to_ij(CCT_to_uv(CCT_D_uv, 'Robertson 1968'))
+    CCT_l = np.array([1667, 2000, 2500, 3000, 4000, 6000, 10000])
+
+    def _planckian_locus():
+        """
+        Computes the *Planckian Locus* and iso-temperature lines chromaticity
+        coordinates.
+        """
+
+        start, end = 1667, 100000
+        CCT = np.arange(start, end + 250, 250)
+        CCT_D_uv = tstack([CCT, zeros(CCT.shape)])
+        ij = uv_to_ij(CCT_to_uv(CCT_D_uv, 'Robertson 1968'))
+
+        ij_l = np.array([[
+            uv_to_ij(CCT_to_uv(np.array([i, -D_uv]), 'Robertson 1968')),
+            uv_to_ij(CCT_to_uv(np.array([i, D_uv]), 'Robertson 1968'))
+        ] for i in CCT_l])
+
+        return ij, ij_l
+
+    ij, ij_l = CACHE_RENDER.get(('Planckian Locus', method, D_uv),
+                                _planckian_locus)
 
     axes.plot(ij[..., 0], ij[..., 1], color=planckian_locus_colours)
 
-    for i in (1667, 2000, 2500, 3000, 4000, 6000, 10000):
-        i0, j0 = uv_to_ij(CCT_to_uv(np.array([i, -D_uv]), 'Robertson 1968'))
-        i1, j1 = uv_to_ij(CCT_to_uv(np.array([i, D_uv]), 'Robertson 1968'))
+    for i, ((i0, j0), (i1, j1)) in zip(CCT_l, ij_l):
         axes.plot((i0, i1), (j0, j1), color=planckian_locus_colours)
         axes.annotate(
             '{0}K'.format(i),
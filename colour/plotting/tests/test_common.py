@@ -20,8 +20,8 @@ from colour.io import read_image
 from colour.models import RGB_COLOURSPACES, XYZ_to_sRGB, gamma_function
 from colour.plotting import ColourSwatch
 from colour.plotting import (
-    colour_style, override_style, XYZ_to_plotting_colourspace, colour_cycle,
-    artist, camera, render, label_rectangles, uniform_axes3d,
+    colour_style, override_style, XYZ_to_plotting_colourspace, RenderCache,
+    colour_cycle, artist, camera, render, label_rectangles, uniform_axes3d,
     filter_passthrough, filter_RGB_colourspaces, filter_cmfs,
     filter_illuminants, filter_colour_checkers, update_settings_collection,
     plot_single_colour_swatch, plot_multi_colour_swatches,
@@ -36,12 +36,13 @@ __status__ = 'Production'
 
 __all__ = [
     'TestColourStyle', 'TestOverrideStyle', 'TestXyzToPlottingColourspace',
-    'TestColourCycle', 'TestArtist', 'TestCamera', 'TestRender',
-    'TestLabelRectangles', 'TestUniformAxes3d', 'TestFilterPassthrough',
-    'TestFilterRgbColourspaces', 'TestFilterCmfs', 'TestFilterIlluminants',
-    'TestFilterColourCheckers', 'TestUpdateSettingsCollection',
-    'TestPlotSingleColourSwatch', 'TestPlotMultiColourSwatches',
-    'TestPlotSingleFunction', 'TestPlotMultiFunctions', 'TestPlotImage'
+    'TestRenderCache', 'TestColourCycle', 'TestArtist', 'TestCamera',
+    'TestRender', 'TestLabelRectangles', 'TestUniformAxes3d',
+    'TestFilterPassthrough', 'TestFilterRgbColourspaces', 'TestFilterCmfs',
+    'TestFilterIlluminants', 'TestFilterColourCheckers',
+    'TestUpdateSettingsCollection', 'TestPlotSingleColourSwatch',
+    'TestPlotMultiColourSwatches', 'TestPlotSingleFunction',
+    'TestPlotMultiFunctions', 'TestPlotImage'
 ]
 
 
@@ -103,6 +104,109 @@ class TestXyzToPlottingColourspace(unittest.TestCase):
             XYZ_to_sRGB(XYZ), XYZ_to_plotting_colourspace(XYZ), decimal=7)
 
 
+class TestRenderCache(unittest.TestCase):
+    """
+    Defines :class:`colour.plotting.common.RenderCache` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('maximum_size', 'path', 'size')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RenderCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__len__', '__contains__', 'get',
+                            'clear')
+
+        for method in required_methods:
+            self.assertIn(method, dir(RenderCache))
+
+    def test_get(self):
+        """
+        Tests :meth:`colour.plotting.common.RenderCache.get` method.
+        """
+
+        calls = []
+
+        def factory(value):
+            """
+            Returns an entry filled with given value.
+            """
+
+            calls.append(value)
+
+            return (np.full(16, value), )
+
+        cache = RenderCache(maximum_size=256)
+        self.assertEqual(
+            cache.get(('a', np.ones(3)), partial(factory, 1))[0][0], 1)
+        self.assertEqual(
+            cache.get(('a', np.ones(3)), partial(factory, 2))[0][0], 1)
+        self.assertEqual(calls, [1])
+        self.assertIn(('a', np.ones(3)), cache)
+        self.assertNotIn(('a', np.zeros(3)), cache)
+        self.assertEqual(cache.size, 128)
+
+        self.assertRaises(ValueError,
+                          cache.get(('a', np.ones(3)), None)[0].__setitem__, 0,
+                          2)
+
+        cache.get(('b', ), partial(factory, 3))
+        cache.get(('a', np.ones(3)), None)
+        cache.get(('c', ), partial(factory, 4))
+        self.assertEqual(len(cache), 2)
+        self.assertIn(('a', np.ones(3)), cache)
+        self.assertNotIn(('b', ), cache)
+
+        cache.maximum_size = 128
+        self.assertEqual(len(cache), 1)
+        self.assertIn(('c', ), cache)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+    def test_path(self):
+        """
+        Tests :attr:`colour.plotting.common.RenderCache.path` attribute.
+        """
+
+        path = os.path.join(self._temporary_directory, 'cache')
+
+        cache = RenderCache(path=path)
+        cache.get(('a', ), lambda: (np.arange(4), np.ones([2, 2])))
+        self.assertEqual(len(os.listdir(path)), 1)
+
+        cache = RenderCache(path=path)
+        a, b = cache.get(('a', ), None)
+        np.testing.assert_equal(a, np.arange(4))
+        np.testing.assert_equal(b, np.ones([2, 2]))
+
+
 class TestColourCycle(unittest.TestCase):
     """
     Defines :func:`colour.plotting.common.colour_cycle` definition unit tests
@@ -6,16 +6,18 @@ Defines unit tests for :mod:`colour.plotting.diagrams` module.
 from __future__ import division, unicode_literals
 
 import unittest
+from functools import partial
 from matplotlib.pyplot import Axes, Figure
 
 from colour.colorimetry import (SDS_ILLUMINANTS, SpectralShape,
                                 MSDS_CMFS_STANDARD_OBSERVER)
-from colour.plotting import (plot_chromaticity_diagram_CIE1931,
-                             plot_chromaticity_diagram_CIE1960UCS,
-                             plot_chromaticity_diagram_CIE1976UCS,
-                             plot_sds_in_chromaticity_diagram_CIE1931,
-                             plot_sds_in_chromaticity_diagram_CIE1960UCS,
-                             plot_sds_in_chromaticity_diagram_CIE1976UCS)
+from colour.models import gamma_function
+from colour.plotting import (
+    CACHE_RENDER, CONSTANTS_COLOUR_STYLE, plot_chromaticity_diagram_CIE1931,
+    plot_chromaticity_diagram_CIE1960UCS, plot_chromaticity_diagram_CIE1976UCS,
+    plot_sds_in_chromaticity_diagram_CIE1931,
+    plot_sds_in_chromaticity_diagram_CIE1960UCS,
+    plot_sds_in_chromaticity_diagram_CIE1976UCS)
 from colour.plotting.diagrams import (
     plot_spectral_locus, plot_chromaticity_diagram_colours,
     plot_chromaticity_diagram, plot_sds_in_chromaticity_diagram)
@@ -104,6 +106,22 @@ plot_chromaticity_diagram_colours` definition.
             ValueError,
             lambda: plot_chromaticity_diagram_colours(method='Undefined'))
 
+        colourspace = CONSTANTS_COLOUR_STYLE.colour.colourspace
+        try:
+            CACHE_RENDER.clear()
+            plot_chromaticity_diagram_colours(samples=64)
+            self.assertEqual(len(CACHE_RENDER), 1)
+
+            for exponent in (1 / 2.2, 1 / 2.4):
+                CONSTANTS_COLOUR_STYLE.colour.colourspace = colourspace.copy()
+                CONSTANTS_COLOUR_STYLE.colour.colourspace.cctf_encoding = (
+                    partial(gamma_function, exponent=exponent))
+                plot_chromaticity_diagram_colours(samples=64)
+
+            self.assertEqual(len(CACHE_RENDER), 3)
+        finally:
+            CONSTANTS_COLOUR_STYLE.colour.colourspace = colourspace
+
 
 class TestPlotChromaticityDiagram(unittest.TestCase):
     """
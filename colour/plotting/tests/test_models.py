@@ -9,6 +9,7 @@ import numpy as np
 import unittest
 from matplotlib.pyplot import Axes, Figure
 
+from colour.models import XYZ_to_xy, sRGB_to_XYZ
 from colour.plotting import (
     common_colourspace_model_axis_reorder, plot_pointer_gamut,
     plot_RGB_colourspaces_in_chromaticity_diagram_CIE1931,
@@ -23,6 +24,7 @@ from colour.plotting import (
     plot_single_cctf, plot_multi_cctfs, plot_constant_hue_loci)
 from colour.plotting.models import (
     plot_RGB_colourspaces_in_chromaticity_diagram,
+    RGB_chromaticities_histogram,
     plot_RGB_chromaticities_in_chromaticity_diagram, ellipses_MacAdam1942,
     plot_ellipses_MacAdam1942_in_chromaticity_diagram)
 
@@ -39,6 +41,7 @@ __all__ = [
     'TestPlotRGBColourspacesInChromaticityDiagramCIE1931',
     'TestPlotRGBColourspacesInChromaticityDiagramCIE1960UCS',
     'TestPlotRGBColourspacesInChromaticityDiagramCIE1976UCS',
+    'TestRGBChromaticitiesHistogram',
     'TestPlotRGBChromaticitiesInChromaticityDiagram',
     'TestPlotRGBChromaticitiesInChromaticityDiagramCIE1931',
     'TestPlotRGBChromaticitiesInChromaticityDiagramCIE1960UCS',
@@ -264,6 +267,40 @@ plot_RGB_colourspaces_in_chromaticity_diagram_CIE1976UCS` definition.
         self.assertIsInstance(axes, Axes)
 
 
+class TestRGBChromaticitiesHistogram(unittest.TestCase):
+    """
+    Defines :func:`colour.plotting.models.RGB_chromaticities_histogram`
+    definition unit tests methods.
+    """
+
+    def test_RGB_chromaticities_histogram(self):
+        """
+        Tests :func:`colour.plotting.models.RGB_chromaticities_histogram`
+        definition.
+        """
+
+        RGB = np.random.random((64, 64, 3))
+        xy = XYZ_to_xy(sRGB_to_XYZ(RGB, apply_cctf_decoding=False))
+        histogram = np.histogram2d(
+            np.ravel(xy[..., 0]),
+            np.ravel(xy[..., 1]),
+            bins=16,
+            range=[[0, 1], [0, 1]])[0]
+
+        np.testing.assert_equal(
+            RGB_chromaticities_histogram(RGB, bins=16, chunk_size=100),
+            histogram)
+
+        accumulated = RGB_chromaticities_histogram(RGB[:32], bins=16)
+        RGB_chromaticities_histogram(RGB[32:], bins=16, histogram=accumulated)
+        np.testing.assert_equal(accumulated, histogram)
+
+        self.assertEqual(
+            np.sum(
+                RGB_chromaticities_histogram(
+                    RGB, bins=16, bounding_box=(0, 0.1, 0, 0.1))), 0)
+
+
 class TestPlotRGBChromaticitiesInChromaticityDiagram(unittest.TestCase):
     """
     Defines :func:`colour.plotting.models.\
@@ -282,6 +319,26 @@ plot_RGB_chromaticities_in_chromaticity_diagram` definition.
         self.assertIsInstance(figure, Figure)
         self.assertIsInstance(axes, Axes)
 
+        figure, axes = plot_RGB_chromaticities_in_chromaticity_diagram(
+            (np.random.random((32, 32, 3)) for _ in range(4)),
+            mode='Density',
+            density_kwargs={'percentile': 95})
+
+        self.assertIsInstance(figure, Figure)
+        self.assertIsInstance(axes, Axes)
+
+        self.assertRaises(
+            AssertionError,
+            plot_RGB_chromaticities_in_chromaticity_diagram,
+            np.random.random((32, 32, 3)),
+            mode='Undefined')
+
+        self.assertRaises(
+            ValueError,
+            plot_RGB_chromaticities_in_chromaticity_diagram,
+            iter([]),
+            mode='Density')
+
 
 class TestPlotRGBChromaticitiesInChromaticityDiagramCIE1931(unittest.TestCase):
     """
@@ -220,6 +220,18 @@ class TestPlotRGBScatter(unittest.TestCase):
         self.assertIsInstance(figure, Figure)
         self.assertIsInstance(axes, Axes)
 
+        figure, axes = plot_RGB_scatter(
+            (np.random.random((32, 32, 3)) for _ in range(4)),
+            'ITU-R BT.709',
+            mode='Density',
+            density_kwargs={
+                'bins': 8,
+                'percentile': 95
+            })
+
+        self.assertIsInstance(figure, Figure)
+        self.assertIsInstance(axes, Axes)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -25,7 +25,8 @@ from colour.plotting import (
     CONSTANTS_COLOUR_STYLE, common_colourspace_model_axis_reorder,
     filter_RGB_colourspaces, filter_cmfs, override_style, render)
 from colour.utilities import (Structure, as_float_array, as_int_array,
-                              first_item, full, ones, zeros)
+                              chunk_slices, first_item, full, is_iterable,
+                              ones, zeros)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -576,14 +577,18 @@ def plot_RGB_scatter(RGB,
                      points_size=12,
                      cmfs='CIE 1931 2 Degree Standard Observer',
                      chromatically_adapt=False,
+                     mode='Scatter',
+                     density_kwargs=None,
                      **kwargs):
     """
     Plots given *RGB* colourspace array in a scatter plot.
 
     Parameters
     ----------
-    RGB : array_like
-        *RGB* colourspace array.
+    RGB : array_like or iterable
+        *RGB* colourspace array or, with the *Density* mode, an iterable, e.g.
+        a generator, of *RGB* colourspace arrays, e.g. the frames of a
+        sequence, accumulated one at a time.
     colourspace : unicode or RGB_Colourspace
         *RGB* colourspace of the *RGB* array. ``colourspace`` can be of any
         type or form supported by the
@@ -617,6 +622,21 @@ def plot_RGB_scatter(RGB,
     chromatically_adapt : bool, optional
         Whether to chromatically adapt the *RGB* colourspaces given in
         ``colourspaces`` to the whitepoint of the default plotting colourspace.
+    mode : unicode, optional
+        **{'Scatter', 'Density'}**,
+        Plotting mode, the *Density* mode bins the *RGB* colourspace array
+        into a 3-dimensional histogram and scatters a single point per
+        non-empty bin, coloured with the bin mean *RGB* value and sized
+        according to the bin count, which is suited to large *RGB* colourspace
+        arrays, e.g. multi-megapixel images.
+    density_kwargs : dict, optional
+        Settings for the *Density* mode:
+
+        -   *bins* : int, bins count along each *RGB* colourspace axis.
+        -   *bounds* : array_like, *RGB* colourspace array values bounds,
+            values outside the bounds are discarded.
+        -   *percentile* : numeric, if set, the bins counts are clipped at
+            given percentile of the non-empty bins counts.
 
     Other Parameters
     ----------------
@@ -635,12 +655,19 @@ def plot_RGB_scatter(RGB,
     >>> RGB = np.random.random((128, 128, 3))
     >>> plot_RGB_scatter(RGB, 'ITU-R BT.709')  # doctest: +ELLIPSIS
     (<Figure size ... with 1 Axes>, <...Axes3DSubplot...>)
+    >>> plot_RGB_scatter(RGB, 'ITU-R BT.709', mode='Density')
+    ... # doctest: +ELLIPSIS
+    (<Figure size ... with 1 Axes>, <...Axes3DSubplot...>)
 
     .. image:: ../_static/Plotting_Plot_RGB_Scatter.png
         :align: center
         :alt: plot_RGB_scatter
     """
 
+    assert mode.lower() in ('scatter', 'density'), (
+        '"{0}" mode is not supported, it must be one of {1}!'.format(
+            mode, ['Scatter', 'Density']))
+
     colourspace = first_item(filter_RGB_colourspaces(colourspace).values())
 
     if colourspaces is None:
@@ -669,6 +696,27 @@ def plot_RGB_scatter(RGB,
         chromatically_adapt=chromatically_adapt,
         **settings)
 
+    if mode.lower() == 'density':
+        density_settings = {'bins': 32, 'bounds': (0, 1), 'percentile': None}
+        if density_kwargs is not None:
+            density_settings.update(density_kwargs)
+
+        if isinstance(RGB, np.ndarray) or not is_iterable(RGB) or isinstance(
+                RGB, (list, tuple)):
+            RGB = [RGB]
+
+        counts, RGB = _RGB_histogram(RGB, density_settings['bins'],
+                                     density_settings['bounds'])
+
+        counts_m = np.max(counts, initial=1)
+        if density_settings['percentile'] is not None and counts.size:
+            counts_m = np.percentile(counts, density_settings['percentile'])
+
+        points_size = points_size * (1 + 3 * np.clip(counts / counts_m, 0, 1))
+        colours = np.clip(RGB, 0, 1)
+    else:
+        colours = np.reshape(RGB, (-1, 3))
+
     XYZ = RGB_to_XYZ(RGB, colourspace.whitepoint, colourspace.whitepoint,
                      colourspace.matrix_RGB_to_XYZ)
 
@@ -681,10 +729,47 @@ def plot_RGB_scatter(RGB,
         points[..., 0],
         points[..., 1],
         points[..., 2],
-        color=np.reshape(RGB, (-1, 3)),
+        color=colours,
         s=points_size)
 
     settings.update({'axes': axes, 'standalone': True})
     settings.update(kwargs)
 
     return render(**settings)
+
+
+def _RGB_histogram(RGB, bins, bounds, chunk_size=2 ** 20):
+    """
+    Accumulates given iterable of *RGB* colourspace arrays into a
+    3-dimensional histogram and returns the counts and mean *RGB* values of
+    the non-empty bins.
+    """
+
+    minimum, maximum = bounds
+
+    counts = np.zeros(bins ** 3, np.int_)
+    sums = np.zeros([bins ** 3, 3])
+    for RGB_f in RGB:
+        RGB_f = np.reshape(RGB_f, [-1, 3])
+
+        for chunk in chunk_slices(RGB_f.shape[0], chunk_size):
+            RGB_c = as_float_array(RGB_f[chunk])
+
+            with np.errstate(invalid='ignore'):
+                indexes = np.floor(
+                    (RGB_c - minimum) / (maximum - minimum) * bins)
+                within = np.all(
+                    np.logical_and(indexes >= 0, indexes < bins), axis=-1)
+
+            RGB_c = RGB_c[within]
+            indexes = np.dot(indexes[within].astype(np.int_),
+                             [bins ** 2, bins, 1])
+
+            counts += np.bincount(indexes, minlength=bins ** 3)
+            for i in range(3):
+                sums[..., i] += np.bincount(
+                    indexes, RGB_c[..., i], minlength=bins ** 3)
+
+    within = counts > 0
+
+    return counts[within], sums[within] / counts[within][..., np.newaxis]
@@ -17,7 +17,7 @@ from .cqs import (COLOUR_QUALITY_SCALE_METHODS,
 from .ssi import spectral_similarity_index
 from .tm3018 import (ColourQuality_Specification_ANSIIESTM3018,
                      colour_fidelity_index_ANSIIESTM3018)
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import CaseInsensitiveMapping, profiled
 
 __all__ = []
 __all__ += datasets.__all__
@@ -51,6 +51,7 @@ COLOUR_FIDELITY_INDEX_METHODS : tuple
 """
 
 
+@profiled
 def colour_fidelity_index(sd_test, additional_data=False, method='CIE 2017'):
     """
     Returns the *Colour Fidelity Index* (CFI) :math:`R_f` of given
@@ -27,7 +27,8 @@ from colour.colorimetry import (
     sd_blackbody, MSDS_CMFS, sd_ones, sd_CIE_illuminant_D_series)
 from colour.models import XYZ_to_UCS, UCS_to_uv, JMh_CIECAM02_to_CAM02UCS
 from colour.temperature import uv_to_CCT_Ohno2013, CCT_to_xy_CIE_D
-from colour.utilities import as_int, lerp, usage_warning
+from colour.utilities import as_int, lerp, profiled, usage_warning
+from colour.utilities.profiling import _profile_cache_access
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -100,6 +101,7 @@ class ColourRendering_Specification_CIE2017(
     """
 
 
+@profiled
 def colour_fidelity_index_CIE2017(sd_test, additional_data=False):
     """
     Returns the *CIE 2017 Colour Fidelity Index* (CFI) :math:`R_f` of given
@@ -184,6 +186,7 @@ def colour_fidelity_index_CIE2017(sd_test, additional_data=False):
         return R_f
 
 
+@profiled
 def load_TCS_CIE2017(shape):
     """
     Loads the *CIE 2017 Test Colour Samples* dataset appropriate for the given
@@ -219,8 +222,11 @@ def load_TCS_CIE2017(shape):
     filename = 'tcs_cfi2017_{0}_nm.csv.gz'.format(as_int(interval))
 
     if filename in _CACHE_TCS_CIE2017:
+        _profile_cache_access('_CACHE_TCS_CIE2017', True)
         return _CACHE_TCS_CIE2017[filename]
 
+    _profile_cache_access('_CACHE_TCS_CIE2017', False)
+
     data = np.genfromtxt(
         str(os.path.join(RESOURCES_DIRECTORY_CIE2017, filename)),
         delimiter=',')
@@ -229,6 +235,7 @@ def load_TCS_CIE2017(shape):
     return MultiSpectralDistributions(data[:, 1:], data[:, 0], labels)
 
 
+@profiled
 def CCT_reference_illuminant(sd):
     """
     Computes the reference illuminant correlated colour temperature
@@ -260,6 +267,7 @@ def CCT_reference_illuminant(sd):
     return CCT, D_uv
 
 
+@profiled
 def sd_reference_illuminant(CCT, shape):
     """
     Computes the reference illuminant for a given correlated colour temperature
@@ -339,6 +347,7 @@ def sd_reference_illuminant(CCT, shape):
     return sd_reference
 
 
+@profiled
 def tcs_colorimetry_data(sd_irradiance, sds_tcs, cmfs):
     """
     Returns the *test colour samples* colorimetry data under given test light
@@ -32,23 +32,29 @@ from colour.utilities import (CaseInsensitiveMapping, as_float_array,
 from .datasets import *  # noqa
 from . import datasets
 from .jakob2019 import (sd_Jakob2019, find_coefficients_Jakob2019,
-                        XYZ_to_sd_Jakob2019, LUT3D_Jakob2019)
+                        XYZ_to_sd_Jakob2019, LUT3D_Jakob2019,
+                        RGB_to_XYZ_Jakob2019)
 from .mallett2019 import (spectral_primary_decomposition_Mallett2019,
-                          RGB_to_sd_Mallett2019)
-from .meng2015 import XYZ_to_sd_Meng2015
-from .otsu2018 import Dataset_Otsu2018, NodeTree_Otsu2018, XYZ_to_sd_Otsu2018
+                          RGB_to_sd_Mallett2019, RGB_to_XYZ_Mallett2019)
+from .meng2015 import XYZ_to_sd_Meng2015, XYZ_to_msds_Meng2015
+from .otsu2018 import (Dataset_Otsu2018, NodeTree_Otsu2018, XYZ_to_sd_Otsu2018,
+                       XYZ_to_msds_Otsu2018)
 from .smits1999 import RGB_to_sd_Smits1999
 __all__ = []
 __all__ += datasets.__all__
 __all__ += [
     'sd_Jakob2019', 'find_coefficients_Jakob2019', 'XYZ_to_sd_Jakob2019',
-    'LUT3D_Jakob2019'
+    'LUT3D_Jakob2019', 'RGB_to_XYZ_Jakob2019'
 ]
 __all__ += [
-    'spectral_primary_decomposition_Mallett2019', 'RGB_to_sd_Mallett2019'
+    'spectral_primary_decomposition_Mallett2019', 'RGB_to_sd_Mallett2019',
+    'RGB_to_XYZ_Mallett2019'
+]
+__all__ += ['XYZ_to_sd_Meng2015', 'XYZ_to_msds_Meng2015']
+__all__ += [
+    'Dataset_Otsu2018', 'NodeTree_Otsu2018', 'XYZ_to_sd_Otsu2018',
+    'XYZ_to_msds_Otsu2018'
 ]
-__all__ += ['XYZ_to_sd_Meng2015']
-__all__ += ['Dataset_Otsu2018', 'NodeTree_Otsu2018', 'XYZ_to_sd_Otsu2018']
 __all__ += ['RGB_to_sd_Smits1999']
 
 XYZ_TO_SD_METHODS = CaseInsensitiveMapping({
@@ -485,6 +491,105 @@ def XYZ_to_sd(XYZ, method='Meng 2015', **kwargs):
 
 __all__ += ['XYZ_TO_SD_METHODS', 'XYZ_to_sd']
 
+RGB_TO_XYZ_SPECTRAL_METHODS = CaseInsensitiveMapping({
+    'Jakob 2019': RGB_to_XYZ_Jakob2019,
+    'Mallett 2019': RGB_to_XYZ_Mallett2019,
+})
+RGB_TO_XYZ_SPECTRAL_METHODS.__doc__ = """
+Supported spectral rendering methods of *RGB* colourspace arrays to *CIE XYZ*
+tristimulus values.
+
+References
+----------
+:cite:`Jakob2019`, :cite:`Mallett2019`
+
+RGB_TO_XYZ_SPECTRAL_METHODS : CaseInsensitiveMapping
+    **{'Jakob 2019', 'Mallett 2019'}**
+"""
+
+
+def RGB_to_XYZ_spectral(RGB, method='Mallett 2019', **kwargs):
+    """
+    Converts given *RGB* colourspace array to *CIE XYZ* tristimulus values by
+    recovering the spectral distributions with given method and integrating
+    them under given colour matching functions and illuminant, without storing
+    the spectral array of the whole input.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array.
+    method : unicode, optional
+        **{'Mallett 2019', 'Jakob 2019'}**
+        Computation method.
+
+    Other Parameters
+    ----------------
+    basis_functions : MultiSpectralDistributions
+        {:func:`colour.recovery.RGB_to_XYZ_Mallett2019`},
+        Basis functions for the method. The default is to use the built-in
+        *sRGB* basis functions, i.e.
+        :attr:`colour.recovery.MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019`.
+    chunk_size : int, optional
+        {:func:`colour.recovery.RGB_to_XYZ_Jakob2019`},
+        Number of spectral distributions evaluated at once.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        {:func:`colour.recovery.RGB_to_XYZ_Jakob2019`,
+        :func:`colour.recovery.RGB_to_XYZ_Mallett2019`},
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        {:func:`colour.recovery.RGB_to_XYZ_Jakob2019`,
+        :func:`colour.recovery.RGB_to_XYZ_Mallett2019`},
+        Illuminant spectral distribution.
+    LUT : LUT3D_Jakob2019
+        {:func:`colour.recovery.RGB_to_XYZ_Jakob2019`},
+        Lookup table of the *RGB* colourspace.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``RGB``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    References
+    ----------
+    :cite:`Jakob2019`, :cite:`Mallett2019`
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from colour.colorimetry import SDS_ILLUMINANTS
+    >>> RGB = np.array([[0.45620520, 0.03081070, 0.04091953],
+    ...                 [0.18216103, 0.26617215, 0.10437584]])
+    >>> illuminant = SDS_ILLUMINANTS['A'].copy().align(
+    ...     SPECTRAL_SHAPE_sRGB_MALLETT2019)
+    >>> RGB_to_XYZ_spectral(RGB, illuminant=illuminant)
+    ... # doctest: +ELLIPSIS
+    array([[ 31.1518416...,  16.9713906...,   1.6331407...],
+           [ 22.6360237...,  23.2319612...,   4.6674313...]])
+    """
+
+    function = RGB_TO_XYZ_SPECTRAL_METHODS[method]
+
+    return function(RGB, **filter_kwargs(function, **kwargs))
+
+
+__all__ += ['RGB_TO_XYZ_SPECTRAL_METHODS', 'RGB_to_XYZ_spectral']
+
 
 # ----------------------------------------------------------------------------#
 # ---                API Changes and Deprecation Management                ---#
@@ -10,6 +10,7 @@ Defines objects for reflectance recovery, i.e. spectral upsampling, using
 -   :func:`colour.recovery.find_coefficients_Jakob2019`
 -   :func:`colour.recovery.XYZ_to_sd_Jakob2019`
 -   :class:`colour.recovery.LUT3D_Jakob2019`
+-   :func:`colour.recovery.RGB_to_XYZ_Jakob2019`
 
 References
 ----------
@@ -32,9 +33,10 @@ from colour.colorimetry import (
     intermediate_lightness_function_CIE1976, sd_to_XYZ)
 from colour.difference import JND_CIE1976
 from colour.models import XYZ_to_xy, XYZ_to_Lab, RGB_to_XYZ
-from colour.utilities import (as_float_array, domain_range_scale, full,
-                              index_along_last_axis, is_tqdm_installed,
-                              message_box, to_domain_1, runtime_warning, zeros)
+from colour.utilities import (as_float_array, chunk_slices, domain_range_scale,
+                              from_range_100, full, index_along_last_axis,
+                              is_tqdm_installed, message_box, to_domain_1,
+                              runtime_warning, tsplit, zeros)
 try:
     from unittest import mock
 except ImportError:  # pragma: no cover
@@ -54,7 +56,8 @@ __status__ = 'Production'
 __all__ = [
     'SPECTRAL_SHAPE_JAKOB2019', 'StopMinimizationEarly', 'sd_Jakob2019',
     'error_function', 'dimensionalise_coefficients', 'lightness_scale',
-    'find_coefficients_Jakob2019', 'XYZ_to_sd_Jakob2019', 'LUT3D_Jakob2019'
+    'find_coefficients_Jakob2019', 'XYZ_to_sd_Jakob2019', 'LUT3D_Jakob2019',
+    'RGB_to_XYZ_Jakob2019'
 ]
 
 SPECTRAL_SHAPE_JAKOB2019 = SpectralShape(360, 780, 5)
@@ -1107,3 +1110,106 @@ class LUT3D_Jakob2019(object):
             coeff_file.write(struct.pack('i', self._coefficients.shape[1]))
             np.float32(self._lightness_scale).tofile(coeff_file)
             np.float32(self._coefficients).tofile(coeff_file)
+
+
+def RGB_to_XYZ_Jakob2019(
+        RGB,
+        LUT,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_JAKOB2019),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_JAKOB2019),
+        chunk_size=2 ** 16):
+    """
+    Converts given *RGB* colourspace array to *CIE XYZ* tristimulus values by
+    recovering the spectral distributions with *Jakob and Hanika (2019)*
+    method and integrating them under given colour matching functions and
+    illuminant.
+
+    The spectral distributions are evaluated and integrated chunk by chunk so
+    that the spectral array of the whole input is never stored.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array.
+    LUT : LUT3D_Jakob2019
+        Lookup table of the *RGB* colourspace, e.g. generated with
+        :meth:`colour.recovery.LUT3D_Jakob2019.generate` method.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions, the spectral distributions
+        are evaluated at their wavelengths.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    chunk_size : int, optional
+        Number of spectral distributions evaluated at once.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``RGB``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The integration follows
+        :func:`colour.colorimetry.sd_to_XYZ_integration` definition.
+
+    References
+    ----------
+    :cite:`Jakob2019`
+
+    Examples
+    --------
+    >>> from colour.models import RGB_COLOURSPACE_sRGB
+    >>> cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+    ...         'CIE 1931 2 Degree Standard Observer'].copy().align(
+    ...             SpectralShape(360, 780, 10))
+    >>> illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+    >>> LUT = LUT3D_Jakob2019()
+    >>> LUT.generate(
+    ...     RGB_COLOURSPACE_sRGB, cmfs, illuminant, 3, lambda x: x)
+    >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+    >>> RGB_to_XYZ_Jakob2019(RGB, LUT, cmfs, illuminant)
+    ... # doctest: +ELLIPSIS
+    array([ 37.1333935...,  23.4187512...,   8.5094705...])
+    """
+
+    RGB = to_domain_1(RGB)
+
+    if illuminant.shape != cmfs.shape:
+        runtime_warning(
+            'Aligning "{0}" illuminant shape to "{1}" colour matching '
+            'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    wl = cmfs.wavelengths
+    S = illuminant.values
+    W = cmfs.values * S[..., np.newaxis] / np.sum(cmfs.values[..., 1] * S)
+
+    shape = RGB.shape
+    RGB = np.reshape(RGB, (-1, 3))
+
+    XYZ = np.empty(RGB.shape)
+    for chunk in chunk_slices(RGB.shape[0], chunk_size):
+        c_0, c_1, c_2 = tsplit(
+            np.reshape(LUT.RGB_to_coefficients(RGB[chunk]), (-1, 1, 3)))
+
+        U = c_0 * wl ** 2 + c_1 * wl + c_2
+        R = 1 / 2 + U / (2 * np.sqrt(1 + U ** 2))
+
+        XYZ[chunk] = np.dot(R, W)
+
+    return from_range_100(np.reshape(XYZ, shape) * 100)
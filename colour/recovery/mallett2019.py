@@ -8,6 +8,7 @@ Defines objects for reflectance recovery, i.e. spectral upsampling, using
 
 -   :func:`colour.recovery.spectral_primary_decomposition_Mallett2019`
 -   :func:`colour.recovery.RGB_to_sd_Mallett2019`
+-   :func:`colour.recovery.RGB_to_XYZ_Mallett2019`
 
 References
 ----------
@@ -22,11 +23,13 @@ import numpy as np
 from scipy.linalg import block_diag
 from scipy.optimize import Bounds, LinearConstraint, minimize
 
-from colour.colorimetry import (SpectralDistribution,
-                                MultiSpectralDistributions,
-                                MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS)
-from colour.recovery import MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019
-from colour.utilities import to_domain_1, runtime_warning
+from colour.colorimetry import (
+    SpectralDistribution, MultiSpectralDistributions,
+    MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS, msds_to_XYZ_integration)
+from colour.recovery import (MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019,
+                             SPECTRAL_SHAPE_sRGB_MALLETT2019)
+from colour.utilities import (domain_range_scale, from_range_100, to_domain_1,
+                              runtime_warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -38,6 +41,7 @@ __status__ = 'Production'
 __all__ = [
     'spectral_primary_decomposition_Mallett2019',
     'RGB_to_sd_Mallett2019',
+    'RGB_to_XYZ_Mallett2019',
 ]
 
 
@@ -356,3 +360,83 @@ def RGB_to_sd_Mallett2019(
     sd.name = '{0} (RGB) - Mallett (2019)'.format(RGB)
 
     return sd
+
+
+def RGB_to_XYZ_Mallett2019(
+        RGB,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_sRGB_MALLETT2019),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_sRGB_MALLETT2019),
+        basis_functions=MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019):
+    """
+    Converts given *RGB* colourspace array to *CIE XYZ* tristimulus values by
+    recovering the spectral distributions with *Mallett and Yuksel (2019)*
+    method and integrating them under given colour matching functions and
+    illuminant.
+
+    The recovered spectral distributions being linear combinations of the
+    basis functions, the latter are integrated once into a matrix applied to
+    the *RGB* colourspace array so that no spectral array is ever stored.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    basis_functions : MultiSpectralDistributions
+        Basis functions for the method. The default is to use the built-in
+        *sRGB* basis functions, i.e.
+        :attr:`colour.recovery.MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019`.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``RGB``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    +-----------+-----------------------+---------------+
+    | **Range** | **Scale - Reference** | **Scale - 1** |
+    +===========+=======================+===============+
+    | ``XYZ``   | [0, 100]              | [0, 1]        |
+    +-----------+-----------------------+---------------+
+
+    -   The integration follows
+        :func:`colour.colorimetry.msds_to_XYZ_integration` definition.
+
+    References
+    ----------
+    :cite:`Mallett2019`
+
+    Examples
+    --------
+    >>> from colour.models import XYZ_to_sRGB
+    >>> XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+    >>> RGB = XYZ_to_sRGB(XYZ, apply_cctf_encoding=False)
+    >>> RGB_to_XYZ_Mallett2019(RGB)  # doctest: +ELLIPSIS
+    array([ 20.6543...,  12.1999...,   5.1376...])
+    """
+
+    RGB = to_domain_1(RGB)
+
+    if basis_functions.shape != cmfs.shape:
+        runtime_warning('Aligning "{0}" basis functions shape to "{1}" colour '
+                        'matching functions shape.'.format(
+                            basis_functions.name, cmfs.name))
+        basis_functions = basis_functions.copy().align(cmfs.shape)
+
+    with domain_range_scale('ignore'):
+        M = msds_to_XYZ_integration(basis_functions, cmfs, illuminant)
+
+    return from_range_100(np.dot(RGB, M))
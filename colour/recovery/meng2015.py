@@ -7,6 +7,7 @@ Defines objects for reflectance recovery using *Meng, Simon and Hanika (2015)*
 method:
 
 -   :func:`colour.recovery.XYZ_to_sd_Meng2015`
+-   :func:`colour.recovery.XYZ_to_msds_Meng2015`
 
 References
 ----------
@@ -23,7 +24,8 @@ from scipy.optimize import minimize
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
                                 SpectralDistribution, SpectralShape, sd_ones,
                                 sd_to_XYZ_integration)
-from colour.utilities import to_domain_1, from_range_100, runtime_warning
+from colour.utilities import (chunk_slices, from_range_100, ones,
+                              runtime_warning, to_domain_1, zeros)
 from colour.utilities.deprecation import handle_arguments_deprecation
 
 __author__ = 'Colour Developers'
@@ -33,7 +35,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['SPECTRAL_SHAPE_MENG2015', 'XYZ_to_sd_Meng2015']
+__all__ = [
+    'SPECTRAL_SHAPE_MENG2015', 'XYZ_to_sd_Meng2015', 'XYZ_to_msds_Meng2015'
+]
 
 SPECTRAL_SHAPE_MENG2015 = SpectralShape(360, 780, 5)
 """
@@ -222,3 +226,201 @@ def XYZ_to_sd_Meng2015(
         from_range_100(result.x * 100),
         wavelengths,
         name='{0} (XYZ) - Meng (2015)'.format(XYZ))
+
+
+def _KKT_matrix_Meng2015(cmfs, illuminant):
+    """
+    Returns the *Karush-Kuhn-Tucker* matrix of the *Meng et al. (2015)*
+    quadratic programme, i.e. the objective function hessian bordered by the
+    tristimulus weighting matrix computed for reflectance values in domain
+    [0, 1].
+    """
+
+    S = illuminant.values
+    W = np.transpose(cmfs.values * S[..., np.newaxis]) / np.sum(
+        cmfs.values[..., 1] * S)
+
+    D = np.diff(np.identity(W.shape[-1]), axis=0)
+
+    return np.block([[2 * np.dot(np.transpose(D), D),
+                      np.transpose(W)], [W, np.zeros([3, 3])]])
+
+
+def XYZ_to_msds_Meng2015(
+        XYZ,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_MENG2015),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_MENG2015),
+        rho=0.1,
+        tolerance=1e-10,
+        iterations=10000,
+        chunk_size=1024):
+    """
+    Recovers the spectral distributions of given *CIE XYZ* tristimulus values
+    array using a batched solver of the *Meng et al. (2015)* quadratic
+    programme.
+
+    The smoothest non-negative spectral distributions, i.e. minimising the sum
+    of the squared differences of consecutive values, integrating to given
+    *CIE XYZ* tristimulus values are found with the *Alternating Direction
+    Method of Multipliers* (ADMM) whose linear system is factorised once for
+    all the samples. The active set of the ADMM iterates is periodically used
+    to solve the *Karush-Kuhn-Tucker* (KKT) conditions exactly, the samples
+    whose solution is optimal being retired from the iterations.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral distributions
+        from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    rho : numeric, optional
+        ADMM penalty parameter.
+    tolerance : numeric, optional
+        Tolerance on the KKT conditions of the solutions.
+    iterations : int, optional
+        Maximum ADMM iterations count.
+    chunk_size : int, optional
+        Number of samples solved at once, bounding the size of the batched KKT
+        systems.
+
+    Returns
+    -------
+    ndarray, (..., n)
+        Recovered spectral distributions values at the wavelengths of the
+        colour matching functions.
+
+    Raises
+    ------
+    RuntimeError
+        If the solution of some samples, e.g. outside the spectral locus, was
+        not found within given iterations count.
+
+    Notes
+    -----
+
+    +------------+-----------------------+---------------+
+    | **Domain** | **Scale - Reference** | **Scale - 1** |
+    +============+=======================+===============+
+    | ``XYZ``    | [0, 1]                | [0, 1]        |
+    +------------+-----------------------+---------------+
+
+    -   The upper bound of :func:`colour.recovery.XYZ_to_sd_Meng2015`
+        definition optimisation is never reached in practice and is not
+        enforced.
+    -   The quadratic programme is solved exactly and the returned spectral
+        distributions are usually smoother than those of
+        :func:`colour.recovery.XYZ_to_sd_Meng2015` definition.
+
+    References
+    ----------
+    :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import MultiSpectralDistributions, msds_to_XYZ
+    >>> XYZ = np.array([
+    ...     [0.20654008, 0.12197225, 0.05136952],
+    ...     [0.14222010, 0.23042768, 0.10495772],
+    ... ])
+    >>> cmfs = (
+    ...     MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer'].
+    ...     copy().align(SpectralShape(360, 780, 10))
+    ... )
+    >>> illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+    >>> values = XYZ_to_msds_Meng2015(XYZ, cmfs, illuminant)
+    >>> values.shape
+    (2, 43)
+    >>> msds = MultiSpectralDistributions(
+    ...     np.transpose(values), cmfs.wavelengths)
+    >>> msds_to_XYZ(msds, cmfs, illuminant, method='Integration') / 100
+    ... # doctest: +ELLIPSIS
+    array([[ 0.2065400...,  0.1219722...,  0.0513695...],
+           [ 0.1422201...,  0.2304276...,  0.1049577...]])
+    """
+
+    XYZ = to_domain_1(XYZ)
+
+    if illuminant.shape != cmfs.shape:
+        runtime_warning(
+            'Aligning "{0}" illuminant shape to "{1}" colour matching '
+            'functions shape.'.format(illuminant.name, cmfs.name))
+        illuminant = illuminant.copy().align(cmfs.shape)
+
+    shape = XYZ.shape[:-1]
+    XYZ = np.reshape(XYZ, (-1, 3))
+
+    K = _KKT_matrix_Meng2015(cmfs, illuminant)
+    bins = K.shape[0] - 3
+    Q, W = K[:bins, :bins], K[bins:, :bins]
+
+    # ADMM iterates linear maps, computed once for all the samples.
+    K_i = np.linalg.inv(K + np.diag(np.hstack([ones(bins) * rho, zeros(3)])))
+    M_z = np.transpose(K_i[:bins, :bins] * rho)
+    M_b = np.transpose(K_i[:bins, bins:])
+
+    R = np.empty([XYZ.shape[0], bins])
+    for chunk in chunk_slices(XYZ.shape[0], chunk_size):
+        b = XYZ[chunk]
+        z = np.dot(b[..., 1:2], ones([1, bins]))
+        u = zeros(z.shape)
+        pending = np.arange(b.shape[0])
+
+        for i in range(iterations):
+            a = np.dot(z - u, M_z) + np.dot(b, M_b)
+            z = np.maximum(a + u, 0)
+            u += a - z
+
+            if i % 25 != 24 and i != iterations - 1:
+                continue
+
+            # Solving the KKT system of the ADMM active set.
+            K_a = np.tile(K, (b.shape[0], 1, 1))
+            y = zeros([b.shape[0], bins + 3])
+            y[..., bins:] = b
+            samples, active = np.nonzero(z <= 0)
+            K_a[samples, active, :] = 0
+            K_a[samples, active, active] = 1
+
+            try:
+                x = np.linalg.solve(K_a, y)
+            except np.linalg.LinAlgError:
+                # Singular systems, e.g. for black or samples outside the
+                # spectral locus, are solved individually in the least
+                # squares sense.
+                x = np.array([
+                    np.linalg.lstsq(K_a[j], y[j], rcond=None)[0]
+                    for j in range(y.shape[0])
+                ])
+
+            a, l_m = x[..., :bins], x[..., bins:]
+            g = np.dot(a, Q) + np.dot(l_m, W)
+
+            # The solution must be feasible and the bound multipliers of the
+            # active set must be non-negative.
+            optimal = np.logical_and.reduce([
+                np.all(a >= -tolerance, axis=-1),
+                np.all(
+                    np.abs(np.dot(a, np.transpose(W)) - b) <= tolerance,
+                    axis=-1),
+                np.all(np.where(z <= 0, g, 0) >= -tolerance, axis=-1),
+            ])
+
+            R[chunk][pending[optimal]] = np.maximum(a[optimal], 0)
+
+            pending = pending[~optimal]
+            b, z, u = b[~optimal], z[~optimal], u[~optimal]
+
+            if pending.size == 0:
+                break
+
+        if pending.size != 0:
+            raise RuntimeError(
+                'Optimization failed for {0} after {1} iterations!'.format(
+                    XYZ[chunk][pending], iterations))
+
+    return np.reshape(R, shape + (bins, ))
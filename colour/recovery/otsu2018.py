@@ -8,6 +8,7 @@ Defines objects for reflectance recovery, i.e. spectral upsampling, using
 
 -   :class:`colour.recovery.Dataset_Otsu2018`
 -   :func:`colour.recovery.XYZ_to_sd_Otsu2018`
+-   :func:`colour.recovery.XYZ_to_msds_Otsu2018`
 -   :func:`colour.recovery.NodeTree_Otsu2018`
 
 References
@@ -23,9 +24,9 @@ import numpy as np
 import six
 from collections import namedtuple
 
-from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
-                                SpectralDistribution, SpectralShape,
-                                msds_to_XYZ, sd_to_XYZ)
+from colour.colorimetry import (
+    MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS, MultiSpectralDistributions,
+    SpectralDistribution, SpectralShape, msds_to_XYZ)
 from colour.models import XYZ_to_xy
 from colour.recovery import (SPECTRAL_SHAPE_OTSU2018, BASIS_FUNCTIONS_OTSU2018,
                              CLUSTER_MEANS_OTSU2018, SELECTOR_ARRAY_OTSU2018)
@@ -51,7 +52,8 @@ __status__ = 'Production'
 
 __all__ = [
     'Dataset_Otsu2018', 'DATASET_REFERENCE_OTSU2018', 'XYZ_to_sd_Otsu2018',
-    'PartitionAxis', 'ColourData', 'Node', 'NodeTree_Otsu2018'
+    'XYZ_to_msds_Otsu2018', 'PartitionAxis', 'ColourData', 'Node',
+    'NodeTree_Otsu2018'
 ]
 
 
@@ -90,6 +92,7 @@ class Dataset_Otsu2018(object):
     -   :meth:`~colour.recovery.Dataset_Otsu2018.__init__`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.select`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.cluster`
+    -   :meth:`~colour.recovery.Dataset_Otsu2018.tristimulus_matrices`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.read`
     -   :meth:`~colour.recovery.Dataset_Otsu2018.write`
 
@@ -126,6 +129,8 @@ class Dataset_Otsu2018(object):
         self._means = as_float_array(means)
         self._selector_array = selector_array
 
+        self._tristimulus_matrices_cache = {}
+
     @property
     def shape(self):
         """
@@ -200,29 +205,34 @@ class Dataset_Otsu2018(object):
 
         Parameters
         ----------
-        xy : array_like, (2,)
+        xy : array_like, (..., 2)
             *CIE xy* chromaticity coordinates.
 
         Returns
         -------
-        int
-            Cluster index.
+        int or ndarray
+            Cluster index or indexes.
         """
 
-        i = 0
-        while True:
-            row = self._selector_array[i, :]
-            direction, origin, lesser_index, greater_index = row
+        xy = as_float_array(xy)
+        shape = xy.shape[:-1]
+        xy = np.reshape(xy, (-1, 2))
 
-            if xy[int(direction)] <= origin:
-                index = int(lesser_index)
-            else:
-                index = int(greater_index)
+        indexes = np.empty(xy.shape[0], np.int_)
+        pending = np.arange(xy.shape[0])
+        rows = np.zeros(xy.shape[0], np.int_)
+        while pending.size != 0:
+            direction, origin, lesser_index, greater_index = np.transpose(
+                self._selector_array[rows, :])
 
-            if index < 0:
-                i = -index
-            else:
-                return index
+            index = np.where(xy[pending, direction.astype(np.int_)] <= origin,
+                             lesser_index, greater_index).astype(np.int_)
+
+            leaf = index >= 0
+            indexes[pending[leaf]] = index[leaf]
+            pending, rows = pending[~leaf], -index[~leaf]
+
+        return int(indexes[0]) if shape == () else np.reshape(indexes, shape)
 
     def cluster(self, xy):
         """
@@ -231,14 +241,14 @@ class Dataset_Otsu2018(object):
 
         Parameters
         ----------
-        xy : array_like, (2,)
+        xy : array_like, (..., 2)
             *CIE xy* chromaticity coordinates.
 
         Returns
         -------
-        basis_functions : ndarray, (3, n)
+        basis_functions : ndarray, (..., 3, n)
             Three basis functions.
-        mean : ndarray, (n,)
+        mean : ndarray, (..., n)
             Dataset mean.
         """
 
@@ -246,6 +256,58 @@ class Dataset_Otsu2018(object):
 
         return self._basis_functions[index, :, :], self._means[index, :]
 
+    def tristimulus_matrices(self, cmfs, illuminant):
+        """
+        Returns the inverse of the matrices converting the basis functions
+        weights to *CIE XYZ* tristimulus values and the *CIE XYZ* tristimulus
+        values of the means of every cluster for given colour matching
+        functions and illuminant.
+
+        Parameters
+        ----------
+        cmfs : XYZ_ColourMatchingFunctions
+            Standard observer colour matching functions.
+        illuminant : SpectralDistribution
+            Illuminant spectral distribution.
+
+        Returns
+        -------
+        M_inverse : ndarray, (n, 3, 3)
+            *CIE XYZ* tristimulus values to basis functions weights matrices.
+        XYZ_mu : ndarray, (n, 3)
+            *CIE XYZ* tristimulus values of the clusters means.
+
+        Notes
+        -----
+        -   The matrices are cached per colour matching functions and
+            illuminant values.
+        """
+
+        key = (cmfs.wavelengths.tobytes(), cmfs.values.tobytes(),
+               illuminant.wavelengths.tobytes(), illuminant.values.tobytes())
+
+        if key in self._tristimulus_matrices_cache:
+            return self._tristimulus_matrices_cache[key]
+
+        clusters, _three, bins = self._basis_functions.shape
+
+        msds = MultiSpectralDistributions(
+            np.transpose(
+                np.vstack([
+                    np.reshape(self._basis_functions, (-1, bins)), self._means
+                ])), self._shape.range())
+
+        with domain_range_scale('ignore'):
+            XYZ = msds_to_XYZ(msds, cmfs, illuminant) / 100
+
+        M = np.transpose(
+            np.reshape(XYZ[:clusters * 3], (clusters, 3, 3)), (0, 2, 1))
+
+        self._tristimulus_matrices_cache[key] = (np.linalg.inv(M),
+                                                 XYZ[clusters * 3:])
+
+        return self._tristimulus_matrices_cache[key]
+
     def read(self, path):
         """
         Reads and loads a dataset from an *.npz* file.
@@ -291,6 +353,8 @@ class Dataset_Otsu2018(object):
         self._means = npz['means']
         self._selector_array = npz['selector_array']
 
+        self._tristimulus_matrices_cache = {}
+
         n, three, m = self._basis_functions.shape
         if (three != 3 or self._means.shape != (n, m) or
                 self._selector_array.shape[1] != 4):
@@ -443,31 +507,85 @@ def XYZ_to_sd_Otsu2018(
     array([ 0.2065494...,  0.1219712...,  0.0514002...])
     """
 
-    XYZ = to_domain_1(XYZ)
-    xy = XYZ_to_xy(XYZ)
+    return SpectralDistribution(
+        XYZ_to_msds_Otsu2018(XYZ, cmfs, illuminant, dataset, clip),
+        dataset.shape.range())
 
-    basis_functions, mean = dataset.cluster(xy)
 
-    M = np.empty((3, 3))
-    for i in range(3):
-        sd = SpectralDistribution(basis_functions[i, :], dataset.shape.range())
+def XYZ_to_msds_Otsu2018(
+        XYZ,
+        cmfs=MSDS_CMFS_STANDARD_OBSERVER['CIE 1931 2 Degree Standard Observer']
+        .copy().align(SPECTRAL_SHAPE_OTSU2018),
+        illuminant=SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_OTSU2018),
+        dataset=DATASET_REFERENCE_OTSU2018,
+        clip=True):
+    """
+    Recovers the spectral distributions of given *CIE XYZ* tristimulus values
+    array using *Otsu et al. (2018)* method.
 
-        with domain_range_scale('ignore'):
-            M[:, i] = sd_to_XYZ(sd, cmfs, illuminant) / 100
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral distributions
+        from.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralDistribution, optional
+        Illuminant spectral distribution.
+    dataset : Dataset_Otsu2018, optional
+        Dataset to use for reconstruction. The default is to use the published
+        data.
+    clip : bool, optional
+        If *True*, the default, values below zero and above unity in the
+        recovered spectral distributions will be clipped.
+
+    Returns
+    -------
+    ndarray, (..., n)
+        Recovered spectral distributions values at the wavelengths of the
+        dataset shape.
+
+    Notes
+    -----
+    -   The clusters are selected for all the *CIE xy* chromaticity coordinates
+        at once and the spectral distributions are reconstructed with a
+        matrix product per cluster, using the matrices returned by the
+        :meth:`colour.recovery.Dataset_Otsu2018.tristimulus_matrices` method.
 
-    M_inverse = np.linalg.inv(M)
+    References
+    ----------
+    :cite:`Otsu2018`
+
+    Examples
+    --------
+    >>> XYZ = np.array([
+    ...     [0.20654008, 0.12197225, 0.05136952],
+    ...     [0.14222010, 0.23042768, 0.10495772],
+    ... ])
+    >>> XYZ_to_msds_Otsu2018(XYZ).shape
+    (2, 36)
+    """
+
+    XYZ = to_domain_1(XYZ)
+    shape = XYZ.shape[:-1]
+    XYZ = np.reshape(XYZ, (-1, 3))
 
-    sd = SpectralDistribution(mean, dataset.shape.range())
+    indexes = np.reshape(dataset.select(XYZ_to_xy(XYZ)), -1)
+    M_inverse, XYZ_mu = dataset.tristimulus_matrices(cmfs, illuminant)
 
-    with domain_range_scale('ignore'):
-        XYZ_mu = sd_to_XYZ(sd, cmfs, illuminant) / 100
+    values = np.empty((XYZ.shape[0], dataset.means.shape[-1]))
+    for index in np.unique(indexes):
+        mask = indexes == index
 
-    weights = np.dot(M_inverse, XYZ - XYZ_mu)
-    recovered_sd = np.dot(weights, basis_functions) + mean
+        weights = np.dot(XYZ[mask] - XYZ_mu[index],
+                         np.transpose(M_inverse[index]))
+        values[mask] = (np.dot(weights, dataset.basis_functions[index]) +
+                        dataset.means[index])
 
-    recovered_sd = np.clip(recovered_sd, 0, 1) if clip else recovered_sd
+    values = np.clip(values, 0, 1) if clip else values
 
-    return SpectralDistribution(recovered_sd, dataset.shape.range())
+    return np.reshape(values, shape + (values.shape[-1], ))
 
 
 class PartitionAxis(namedtuple('PartitionAxis', ('origin', 'direction'))):
@@ -12,7 +12,8 @@ from six.moves import zip
 
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SDS_ILLUMINANTS,
                                 SpectralShape, sd_to_XYZ_integration)
-from colour.recovery import XYZ_to_sd
+from colour.recovery import (RGB_to_XYZ_spectral, RGB_to_sd_Mallett2019,
+                             XYZ_to_sd)
 from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
@@ -22,7 +23,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_sd']
+__all__ = ['TestXYZ_to_sd', 'TestRGB_to_XYZ_spectral']
 
 
 class TestXYZ_to_sd(unittest.TestCase):
@@ -74,5 +75,29 @@ class TestXYZ_to_sd(unittest.TestCase):
                         decimal=7)
 
 
+class TestRGB_to_XYZ_spectral(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.RGB_to_XYZ_spectral` definition unit tests
+    methods.
+    """
+
+    def test_RGB_to_XYZ_spectral(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_XYZ_spectral` definition.
+        """
+
+        cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                SpectralShape(360, 780, 5))
+        illuminant = SDS_ILLUMINANTS['D65'].copy().align(cmfs.shape)
+
+        RGB = np.array([0.45620520, 0.03081070, 0.04091953])
+        np.testing.assert_almost_equal(
+            RGB_to_XYZ_spectral(RGB, cmfs=cmfs, illuminant=illuminant),
+            sd_to_XYZ_integration(
+                RGB_to_sd_Mallett2019(RGB), cmfs, illuminant),
+            decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,12 +13,14 @@ import unittest
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ,
+                                sd_to_XYZ_integration)
 from colour.difference import JND_CIE1976, delta_E_CIE1976
 from colour.models import RGB_COLOURSPACE_sRGB, RGB_to_XYZ, XYZ_to_Lab
 from colour.recovery.jakob2019 import (
     XYZ_to_sd_Jakob2019, sd_Jakob2019, error_function,
-    dimensionalise_coefficients, SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019)
+    dimensionalise_coefficients, SPECTRAL_SHAPE_JAKOB2019, LUT3D_Jakob2019,
+    RGB_to_XYZ_Jakob2019)
 from colour.utilities import domain_range_scale, full, ones, zeros
 
 __author__ = 'Colour Developers'
@@ -29,7 +31,8 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestErrorFunction', 'TestXYZ_to_sd_Jakob2019', 'TestLUT3D_Jakob2019'
+    'TestErrorFunction', 'TestXYZ_to_sd_Jakob2019', 'TestLUT3D_Jakob2019',
+    'TestRGB_to_XYZ_Jakob2019'
 ]
 
 
@@ -279,5 +282,75 @@ class TestLUT3D_Jakob2019(unittest.TestCase):
                           .format(RGB, self._RGB_colourspace.name, error))
 
 
+class TestRGB_to_XYZ_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.RGB_to_XYZ_Jakob2019` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                SPECTRAL_SHAPE_JAKOB2019)
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(
+            SPECTRAL_SHAPE_JAKOB2019)
+
+        self._LUT = LUT3D_Jakob2019()
+        self._LUT.generate(RGB_COLOURSPACE_sRGB, self._cmfs, self._sd_D65, 3)
+
+        np.random.seed(16)
+        self._RGB = np.random.random((12, 3))
+
+    def test_RGB_to_XYZ_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.RGB_to_XYZ_Jakob2019`
+        definition.
+        """
+
+        XYZ = np.array([
+            sd_to_XYZ_integration(
+                self._LUT.RGB_to_sd(RGB), self._cmfs, self._sd_D65)
+            for RGB in self._RGB
+        ])
+
+        np.testing.assert_almost_equal(
+            RGB_to_XYZ_Jakob2019(self._RGB, self._LUT, self._cmfs,
+                                 self._sd_D65),
+            XYZ,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_XYZ_Jakob2019(
+                np.reshape(self._RGB, (2, 2, 3, 3)),
+                self._LUT,
+                self._cmfs,
+                self._sd_D65,
+                chunk_size=5),
+            np.reshape(XYZ, (2, 2, 3, 3)),
+            decimal=7)
+
+    def test_domain_range_scale_RGB_to_XYZ_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.RGB_to_XYZ_Jakob2019`
+        definition domain and range scale support.
+        """
+
+        RGB = self._RGB[0]
+        XYZ = RGB_to_XYZ_Jakob2019(RGB, self._LUT, self._cmfs, self._sd_D65)
+
+        d_r = (('reference', 1, 1), (1, 1, 0.01), (100, 100, 1))
+        for scale, factor_a, factor_b in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    RGB_to_XYZ_Jakob2019(RGB * factor_a, self._LUT, self._cmfs,
+                                         self._sd_D65),
+                    XYZ * factor_b,
+                    decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -10,13 +10,15 @@ import numpy as np
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (SpectralShape, MSDS_CMFS_STANDARD_OBSERVER,
-                                SDS_ILLUMINANTS, CCS_ILLUMINANTS, sd_to_XYZ)
+                                SDS_ILLUMINANTS, CCS_ILLUMINANTS, sd_to_XYZ,
+                                sd_to_XYZ_integration)
 from colour.difference import JND_CIE1976, delta_E_CIE1976
 from colour.models import (RGB_COLOURSPACE_PAL_SECAM, RGB_COLOURSPACE_sRGB,
                            XYZ_to_RGB, XYZ_to_Lab)
 from colour.recovery import (MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019,
                              spectral_primary_decomposition_Mallett2019,
-                             RGB_to_sd_Mallett2019)
+                             RGB_to_sd_Mallett2019, RGB_to_XYZ_Mallett2019)
+from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -27,7 +29,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestMixinMallett2019', 'TestSpectralPrimaryDecompositionMallett2019',
-    'TestRGB_to_sd_Mallett2019'
+    'TestRGB_to_sd_Mallett2019', 'TestRGB_to_XYZ_Mallett2019'
 ]
 
 
@@ -140,5 +142,65 @@ class TestRGB_to_sd_Mallett2019(unittest.TestCase, TestMixinMallett2019):
         self.check_basis_functions()
 
 
+class TestRGB_to_XYZ_Mallett2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.RGB_to_XYZ_Mallett2019` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                MSDS_BASIS_FUNCTIONS_sRGB_MALLETT2019.shape)
+        self._sd_A = SDS_ILLUMINANTS['A'].copy().align(self._cmfs.shape)
+
+        np.random.seed(16)
+        self._RGB = np.random.random((12, 3))
+
+    def test_RGB_to_XYZ_Mallett2019(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_XYZ_Mallett2019` definition.
+        """
+
+        XYZ = np.array([
+            sd_to_XYZ_integration(
+                RGB_to_sd_Mallett2019(RGB), self._cmfs, self._sd_A)
+            for RGB in self._RGB
+        ])
+
+        np.testing.assert_almost_equal(
+            RGB_to_XYZ_Mallett2019(self._RGB, self._cmfs, self._sd_A),
+            XYZ,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_XYZ_Mallett2019(
+                np.reshape(self._RGB, (2, 2, 3, 3)), self._cmfs, self._sd_A),
+            np.reshape(XYZ, (2, 2, 3, 3)),
+            decimal=7)
+
+    def test_domain_range_scale_RGB_to_XYZ_Mallett2019(self):
+        """
+        Tests :func:`colour.recovery.RGB_to_XYZ_Mallett2019` definition
+        domain and range scale support.
+        """
+
+        RGB = self._RGB[0]
+        XYZ = RGB_to_XYZ_Mallett2019(RGB, self._cmfs, self._sd_A)
+
+        d_r = (('reference', 1, 1), (1, 1, 0.01), (100, 100, 1))
+        for scale, factor_a, factor_b in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    RGB_to_XYZ_Mallett2019(RGB * factor_a, self._cmfs,
+                                           self._sd_A),
+                    XYZ * factor_b,
+                    decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
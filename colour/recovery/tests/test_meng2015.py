@@ -9,8 +9,9 @@ import numpy as np
 import unittest
 
 from colour.colorimetry import (MSDS_CMFS_STANDARD_OBSERVER, SpectralShape,
-                                SDS_ILLUMINANTS, sd_to_XYZ_integration)
-from colour.recovery import XYZ_to_sd_Meng2015
+                                SDS_ILLUMINANTS, MultiSpectralDistributions,
+                                msds_to_XYZ, sd_to_XYZ_integration)
+from colour.recovery import XYZ_to_sd_Meng2015, XYZ_to_msds_Meng2015
 from colour.utilities import domain_range_scale
 
 __author__ = 'Colour Developers'
@@ -20,7 +21,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_sd_Meng2015']
+__all__ = ['TestXYZ_to_sd_Meng2015', 'TestXYZ_to_msds_Meng2015']
 
 
 class TestXYZ_to_sd_Meng2015(unittest.TestCase):
@@ -120,5 +121,112 @@ class TestXYZ_to_sd_Meng2015(unittest.TestCase):
                     decimal=7)
 
 
+class TestXYZ_to_msds_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.XYZ_to_msds_Meng2015` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                SpectralShape(360, 780, 10))
+        self._sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(self._cmfs.shape)
+
+        self._XYZ = np.array([
+            [0.20654008, 0.12197225, 0.05136952],
+            [0.14222010, 0.23042768, 0.10495772],
+            [0.07818780, 0.06157201, 0.28099326],
+            [0.35157930, 0.37765632, 0.24013455],
+            [0.00000000, 0.00000000, 0.00000000],
+            [0.95047000, 1.00000000, 1.08883000],
+        ])
+
+    def _msds_to_XYZ(self, values, cmfs=None):
+        """
+        Converts given spectral distributions values to *CIE XYZ* tristimulus
+        values.
+        """
+
+        cmfs = self._cmfs if cmfs is None else cmfs
+        msds = MultiSpectralDistributions(
+            np.transpose(np.reshape(values, (-1, cmfs.shape.range().size))),
+            cmfs.wavelengths)
+
+        return msds_to_XYZ(
+            msds, cmfs, self._sd_D65, method='Integration') / 100
+
+    def test_XYZ_to_msds_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msds_Meng2015`
+        definition.
+        """
+
+        values = XYZ_to_msds_Meng2015(self._XYZ, self._cmfs, self._sd_D65)
+        self.assertEqual(values.shape, (6, 43))
+        self.assertTrue(np.all(values >= 0))
+        np.testing.assert_almost_equal(
+            self._msds_to_XYZ(values), self._XYZ, decimal=7)
+
+        # The quadratic programme solution is at least as smooth as the one
+        # found by the "SLSQP" optimisation.
+        sd = XYZ_to_sd_Meng2015(self._XYZ[0], self._cmfs, self._sd_D65)
+        self.assertLessEqual(
+            np.sum(np.diff(values[0]) ** 2), np.sum(np.diff(sd.values) ** 2))
+        np.testing.assert_almost_equal(values[0], sd.values, decimal=2)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_msds_Meng2015(
+                np.reshape(self._XYZ, (2, 3, 3)),
+                self._cmfs,
+                self._sd_D65,
+                chunk_size=4),
+            np.reshape(values, (2, 3, 43)),
+            decimal=7)
+
+        shape = SpectralShape(400, 700, 5)
+        cmfs = self._cmfs.copy().align(shape)
+        np.testing.assert_almost_equal(
+            self._msds_to_XYZ(
+                XYZ_to_msds_Meng2015(self._XYZ[0], cmfs,
+                                     self._sd_D65.copy().align(shape)), cmfs),
+            self._XYZ[0:1],
+            decimal=7)
+
+    def test_raise_exception_XYZ_to_msds_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msds_Meng2015`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            RuntimeError,
+            XYZ_to_msds_Meng2015,
+            np.array([[0.20654008, 0.12197225, 0.05136952],
+                      [0.00000000, 0.00000000, 1.00000000]]),
+            iterations=1000)
+
+    def test_domain_range_scale_XYZ_to_msds_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_msds_Meng2015`
+        definition domain and range scale support.
+        """
+
+        values = XYZ_to_msds_Meng2015(self._XYZ[0], self._cmfs, self._sd_D65)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    XYZ_to_msds_Meng2015(self._XYZ[0] * factor, self._cmfs,
+                                         self._sd_D65),
+                    values,
+                    decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
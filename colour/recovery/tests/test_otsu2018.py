@@ -13,12 +13,15 @@ import unittest
 
 from colour.characterisation import SDS_COLOURCHECKERS
 from colour.colorimetry import (CCS_ILLUMINANTS, SDS_ILLUMINANTS,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_to_XYZ)
+                                MSDS_CMFS_STANDARD_OBSERVER,
+                                SpectralDistribution, sd_to_XYZ)
 from colour.difference import delta_E_CIE1976
 from colour.models import XYZ_to_Lab
-from colour.recovery import (XYZ_to_sd_Otsu2018, SPECTRAL_SHAPE_OTSU2018,
-                             Dataset_Otsu2018, NodeTree_Otsu2018)
-from colour.recovery.otsu2018 import ColourData, Node
+from colour.recovery import (XYZ_to_sd_Otsu2018, XYZ_to_msds_Otsu2018,
+                             SPECTRAL_SHAPE_OTSU2018, Dataset_Otsu2018,
+                             NodeTree_Otsu2018)
+from colour.recovery.otsu2018 import (DATASET_REFERENCE_OTSU2018, ColourData,
+                                      Node)
 from colour.utilities import domain_range_scale, metric_mse
 
 __author__ = 'Colour Developers'
@@ -29,8 +32,9 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestDataset_Otsu2018', 'TestXYZ_to_sd_Otsu2018', 'TestColourData',
-    'TestNode', 'TestNodeTree_Otsu2018'
+    'TestDataset_Otsu2018', 'TestXYZ_to_sd_Otsu2018',
+    'TestXYZ_to_msds_Otsu2018', 'TestColourData', 'TestNode',
+    'TestNodeTree_Otsu2018'
 ]
 
 
@@ -56,11 +60,67 @@ class TestDataset_Otsu2018(unittest.TestCase):
         Tests presence of required methods.
         """
 
-        required_methods = ('__init__', 'select', 'cluster', 'read', 'write')
+        required_methods = ('__init__', 'select', 'cluster',
+                            'tristimulus_matrices', 'read', 'write')
 
         for method in required_methods:
             self.assertIn(method, dir(Dataset_Otsu2018))
 
+    def test_select(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Dataset_Otsu2018.select` method.
+        """
+
+        xy = np.random.RandomState(4).random_sample((64, 2)) * 0.4 + 0.1
+
+        indexes = DATASET_REFERENCE_OTSU2018.select(xy)
+        self.assertEqual(indexes.shape, (64, ))
+        for i, xy_i in enumerate(xy):
+            index = DATASET_REFERENCE_OTSU2018.select(xy_i)
+            self.assertIsInstance(index, int)
+            self.assertEqual(index, indexes[i])
+
+        np.testing.assert_equal(
+            DATASET_REFERENCE_OTSU2018.select(np.reshape(xy, (4, 16, 2))),
+            np.reshape(indexes, (4, 16)))
+
+    def test_tristimulus_matrices(self):
+        """
+        Tests :meth:`colour.recovery.otsu2018.Dataset_Otsu2018.\
+tristimulus_matrices` method.
+        """
+
+        cmfs = MSDS_CMFS_STANDARD_OBSERVER[
+            'CIE 1931 2 Degree Standard Observer'].copy().align(
+                SPECTRAL_SHAPE_OTSU2018)
+        sd_D65 = SDS_ILLUMINANTS['D65'].copy().align(SPECTRAL_SHAPE_OTSU2018)
+
+        M_inverse, XYZ_mu = DATASET_REFERENCE_OTSU2018.tristimulus_matrices(
+            cmfs, sd_D65)
+
+        for i in range(M_inverse.shape[0]):
+            M = np.transpose([
+                sd_to_XYZ(
+                    SpectralDistribution(basis_function,
+                                         SPECTRAL_SHAPE_OTSU2018.range()),
+                    cmfs, sd_D65) / 100 for basis_function in
+                DATASET_REFERENCE_OTSU2018.basis_functions[i]
+            ])
+            np.testing.assert_almost_equal(
+                M_inverse[i], np.linalg.inv(M), decimal=7)
+
+            np.testing.assert_almost_equal(
+                XYZ_mu[i],
+                sd_to_XYZ(
+                    SpectralDistribution(DATASET_REFERENCE_OTSU2018.means[i],
+                                         SPECTRAL_SHAPE_OTSU2018.range()),
+                    cmfs, sd_D65) / 100,
+                decimal=7)
+
+        self.assertIs(
+            DATASET_REFERENCE_OTSU2018.tristimulus_matrices(
+                cmfs.copy(), sd_D65.copy())[0], M_inverse)
+
 
 class TestXYZ_to_sd_Otsu2018(unittest.TestCase):
     """
@@ -127,6 +187,51 @@ class TestXYZ_to_sd_Otsu2018(unittest.TestCase):
                     decimal=7)
 
 
+class TestXYZ_to_msds_Otsu2018(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.otsu2018.XYZ_to_msds_Otsu2018` definition
+    unit tests methods.
+    """
+
+    def test_XYZ_to_msds_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.XYZ_to_msds_Otsu2018`
+        definition.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((24, 3)) * 0.5
+
+        for clip in (True, False):
+            values = XYZ_to_msds_Otsu2018(XYZ, clip=clip)
+            self.assertEqual(values.shape, (24, 36))
+
+            for i, XYZ_i in enumerate(XYZ):
+                np.testing.assert_almost_equal(
+                    values[i],
+                    XYZ_to_sd_Otsu2018(XYZ_i, clip=clip).values,
+                    decimal=7)
+
+            np.testing.assert_almost_equal(
+                XYZ_to_msds_Otsu2018(np.reshape(XYZ, (4, 6, 3)), clip=clip),
+                np.reshape(values, (4, 6, 36)),
+                decimal=7)
+
+    def test_domain_range_scale_XYZ_to_msds_Otsu2018(self):
+        """
+        Tests :func:`colour.recovery.otsu2018.XYZ_to_msds_Otsu2018` definition
+        domain and range scale support.
+        """
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+        values = XYZ_to_msds_Otsu2018(XYZ)
+
+        d_r = (('reference', 1), (1, 1), (100, 100))
+        for scale, factor in d_r:
+            with domain_range_scale(scale):
+                np.testing.assert_almost_equal(
+                    XYZ_to_msds_Otsu2018(XYZ * factor), values, decimal=7)
+
+
 class TestColourData(unittest.TestCase):
     """
     Defines :class:`colour.recovery.otsu2018.ColourData` definition unit tests
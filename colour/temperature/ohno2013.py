@@ -25,9 +25,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.colorimetry import (SPECTRAL_SHAPE_DEFAULT,
-                                MSDS_CMFS_STANDARD_OBSERVER, sd_blackbody,
-                                sd_to_XYZ)
+from colour.colorimetry import (
+    SPECTRAL_SHAPE_DEFAULT, MSDS_CMFS_STANDARD_OBSERVER, msds_blackbody,
+    msds_to_XYZ_integration, sd_blackbody, sd_ones, sd_to_XYZ)
 from colour.models import UCS_to_uv, XYZ_to_UCS
 from colour.utilities import as_float_array, runtime_warning, tsplit
 
@@ -118,17 +118,26 @@ ui=0.4456351..., vi=0.3548306..., di=0.2514749...)]
 
     shape = cmfs.shape
 
-    table = []
-    for Ti in np.linspace(start, end, count):
-        sd = sd_blackbody(Ti, shape)
-        XYZ = sd_to_XYZ(sd, cmfs)
-        XYZ /= np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        ui, vi = UCS_to_uv(UVW)
-        di = np.hypot(ux - ui, vx - vi)
-        table.append(PLANCKIAN_TABLE_TUVD(Ti, ui, vi, di))
+    Ti = np.linspace(start, end, count)
+
+    # For 1nm and 5nm measurement intervals, *ASTM E308-15* practise reduces
+    # to integration, all the planckian radiators are thus integrated at once.
+    if shape.interval in (1, 5):
+        XYZ = msds_to_XYZ_integration(
+            msds_blackbody(Ti, shape, as_array=True),
+            cmfs,
+            sd_ones(shape),
+            shape=shape)
+    else:
+        XYZ = as_float_array(
+            [sd_to_XYZ(sd_blackbody(T, shape), cmfs) for T in Ti])
+
+    XYZ /= np.max(XYZ, axis=-1)[..., np.newaxis]
+    UVW = XYZ_to_UCS(XYZ)
+    ui, vi = tsplit(UCS_to_uv(UVW))
+    di = np.hypot(ux - ui, vx - vi)
 
-    return table
+    return [PLANCKIAN_TABLE_TUVD(*row) for row in zip(Ti, ui, vi, di)]
 
 
 def planckian_table_minimal_distance_index(planckian_table_):
@@ -9,14 +9,15 @@ from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
 from .common import (
     handle_numpy_errors, ignore_numpy_errors, raise_numpy_errors,
     print_numpy_errors, warn_numpy_errors, ignore_python_warnings, batch,
-    disable_multiprocessing, multiprocessing_pool, is_matplotlib_installed,
-    is_networkx_installed, is_openimageio_installed, is_pandas_installed,
-    is_tqdm_installed, required, is_iterable, is_string, is_numeric,
-    is_integer, is_sibling, filter_kwargs, filter_mapping, first_item,
-    get_domain_range_scale, set_domain_range_scale, domain_range_scale,
-    to_domain_1, to_domain_10, to_domain_100, to_domain_degrees, to_domain_int,
-    from_range_1, from_range_10, from_range_100, from_range_degrees,
-    from_range_int, copy_definition)
+    disable_multiprocessing, multiprocessing_pool, thread_pool,
+    is_matplotlib_installed, is_networkx_installed, is_openimageio_installed,
+    is_pandas_installed, is_tqdm_installed, required, is_iterable, is_string,
+    is_numeric, is_integer, is_sibling, filter_kwargs, filter_mapping,
+    first_item, get_domain_range_scale, set_domain_range_scale,
+    domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
+    to_domain_degrees, to_domain_int, from_range_1, from_range_10,
+    from_range_100, from_range_degrees, from_range_int, copy_definition,
+    half_domain_evaluation)
 from .verbose import (
     ColourWarning, ColourUsageWarning, ColourRuntimeWarning, message_box,
     show_warning, warning, runtime_warning, usage_warning, filter_warnings,
@@ -29,8 +30,9 @@ from .array import (as_array, as_int_array, as_float_array, as_numeric, as_int,
                     interval, is_uniform, in_array, tstack, tsplit,
                     row_as_diagonal, vector_dot, matrix_dot, orient, centroid,
                     linear_conversion, lerp, fill_nan, ndarray_write, zeros,
-                    ones, full, index_along_last_axis)
+                    ones, full, index_along_last_axis, chunk_slices)
 from .metrics import metric_mse, metric_psnr
+from .profiling import Profile, profile, profiled, is_profiling
 
 from colour.utilities.deprecation import ModuleAPI, build_API_changes
 from colour.utilities.documentation import is_documentation_building
@@ -42,7 +44,7 @@ __all__ = [
 __all__ += [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
-    'batch', 'disable_multiprocessing', 'multiprocessing_pool',
+    'batch', 'disable_multiprocessing', 'multiprocessing_pool', 'thread_pool',
     'is_matplotlib_installed', 'is_networkx_installed',
     'is_openimageio_installed', 'is_pandas_installed', 'is_tqdm_installed',
     'required', 'is_iterable', 'is_string', 'is_numeric', 'is_integer',
@@ -50,7 +52,8 @@ __all__ += [
     'get_domain_range_scale', 'set_domain_range_scale', 'domain_range_scale',
     'to_domain_1', 'to_domain_10', 'to_domain_100', 'to_domain_degrees',
     'to_domain_int', 'from_range_1', 'from_range_10', 'from_range_100',
-    'from_range_degrees', 'from_range_int', 'copy_definition'
+    'from_range_degrees', 'from_range_int', 'copy_definition',
+    'half_domain_evaluation'
 ]
 __all__ += [
     'ColourWarning', 'ColourUsageWarning', 'ColourRuntimeWarning',
@@ -67,9 +70,10 @@ __all__ += [
     'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
     'vector_dot', 'matrix_dot', 'orient', 'centroid', 'linear_conversion',
     'fill_nan', 'lerp', 'ndarray_write', 'zeros', 'ones', 'full',
-    'index_along_last_axis'
+    'index_along_last_axis', 'chunk_slices'
 ]
 __all__ += ['metric_mse', 'metric_psnr']
+__all__ += ['Profile', 'profile', 'profiled', 'is_profiling']
 
 
 # ----------------------------------------------------------------------------#
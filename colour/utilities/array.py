@@ -46,7 +46,7 @@ __all__ = [
     'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
     'vector_dot', 'matrix_dot', 'orient', 'centroid', 'linear_conversion',
     'lerp', 'fill_nan', 'ndarray_write', 'zeros', 'ones', 'full',
-    'index_along_last_axis'
+    'index_along_last_axis', 'chunk_slices'
 ]
 
 
@@ -1375,3 +1375,45 @@ def index_along_last_axis(a, indexes):
 
     return np.take_along_axis(
         a, np.expand_dims(indexes, axis=-1), axis=-1).squeeze(axis=-1)
+
+
+def chunk_slices(size, chunk_size=None):
+    """
+    Returns the slices partitioning a sequence of given size into contiguous
+    chunks of given size.
+
+    Parameters
+    ----------
+    size : int
+        Size of the sequence to partition.
+    chunk_size : int, optional
+        Size of the chunks, if *None*, a single chunk spanning the whole
+        sequence is returned.
+
+    Returns
+    -------
+    list
+        Slices partitioning the sequence, the last chunk might be smaller than
+        ``chunk_size``.
+
+    Examples
+    --------
+    >>> chunk_slices(5, 2)
+    [slice(0, 2, None), slice(2, 4, None), slice(4, 5, None)]
+    >>> chunk_slices(5)
+    [slice(0, 5, None)]
+    """
+
+    size = int(size)
+
+    if chunk_size is None:
+        chunk_size = max(size, 1)
+
+    chunk_size = int(chunk_size)
+
+    assert chunk_size > 0, '"chunk_size" must be strictly positive!'
+
+    return [
+        slice(i, min(i + chunk_size, size))
+        for i in range(0, max(size, 1), chunk_size)
+    ]
@@ -21,15 +21,22 @@ import multiprocessing
 import multiprocessing.pool
 import functools
 import numpy as np
+import pickle
 import re
 import six
+import threading
 import types
 import warnings
+import weakref
 from contextlib import contextmanager
 from collections import OrderedDict
-from copy import copy
 from six import integer_types, string_types
 
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    ContextVar = None
+
 from colour.constants import INTEGER_THRESHOLD, DEFAULT_FLOAT_DTYPE
 from colour.utilities import CaseInsensitiveMapping, Lookup
 
@@ -43,7 +50,7 @@ __status__ = 'Production'
 __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
-    'batch', 'disable_multiprocessing', 'multiprocessing_pool',
+    'batch', 'disable_multiprocessing', 'multiprocessing_pool', 'thread_pool',
     'is_matplotlib_installed', 'is_networkx_installed',
     'is_openimageio_installed', 'is_pandas_installed', 'is_tqdm_installed',
     'required', 'is_iterable', 'is_string', 'is_numeric', 'is_integer',
@@ -51,7 +58,8 @@ __all__ = [
     'get_domain_range_scale', 'set_domain_range_scale', 'domain_range_scale',
     'to_domain_1', 'to_domain_10', 'to_domain_100', 'to_domain_degrees',
     'to_domain_int', 'from_range_1', 'from_range_10', 'from_range_100',
-    'from_range_degrees', 'from_range_int', 'copy_definition'
+    'from_range_degrees', 'from_range_int', 'copy_definition',
+    'half_domain_evaluation'
 ]
 
 
@@ -216,11 +224,146 @@ class disable_multiprocessing(object):
         return wrapper
 
 
+class _ThreadLocalVariable(object):  # pragma: no cover
+    """
+    A thread-local variable implementing the subset of the
+    :class:`contextvars.ContextVar` class interface used by *Colour*, it is
+    used when the :mod:`contextvars` module is not available, i.e. with
+    *Python* 2.7 and 3.6.
+
+    Parameters
+    ----------
+    name : unicode
+        Variable name.
+    default : object
+        Variable default value.
+    """
+
+    def __init__(self, name, default):
+        self.name = name
+        self._default = default
+        self._local = threading.local()
+
+    def get(self):
+        """
+        Returns the variable value for the current thread.
+        """
+
+        return getattr(self._local, 'value', self._default)
+
+    def set(self, value):
+        """
+        Sets the variable value for the current thread and returns the
+        previous value so that it can be restored.
+        """
+
+        token = self.get()
+        self._local.value = value
+
+        return token
+
+    def reset(self, token):
+        """
+        Restores the variable value returned by a previous call to
+        :meth:`set` method.
+        """
+
+        self._local.value = token
+
+
+_CONTEXT_VARIABLES = OrderedDict()
+"""
+*Colour* context variables, i.e. the global state that each thread and
+*asyncio* task sees independently, e.g. the domain-range scale.
+
+_CONTEXT_VARIABLES : OrderedDict
+"""
+
+
+def _context_variable(name, default):
+    """
+    Creates and registers a *Colour* context variable with given name and
+    default value.
+
+    Parameters
+    ----------
+    name : unicode
+        Variable name.
+    default : object
+        Variable default value.
+
+    Returns
+    -------
+    ContextVar or _ThreadLocalVariable
+        Context variable.
+    """
+
+    if ContextVar is not None:
+        variable = ContextVar(name, default=default)
+    else:  # pragma: no cover
+        variable = _ThreadLocalVariable(name, default)
+
+    _CONTEXT_VARIABLES[name] = variable
+
+    return variable
+
+
+def _context_values():
+    """
+    Returns the values of the *Colour* context variables for the current
+    thread or *asyncio* task.
+
+    Returns
+    -------
+    dict
+        Context variables values.
+    """
+
+    return dict((name, variable.get())
+                for name, variable in _CONTEXT_VARIABLES.items())
+
+
+def _run_with_context_values(values, function, *args, **kwargs):
+    """
+    Calls given definition with the *Colour* context variables set to given
+    values, the previous values are restored afterwards.
+
+    Parameters
+    ----------
+    values : dict
+        Context variables values as returned by the :func:`_context_values`
+        definition.
+    function : callable
+        Definition to call.
+
+    Other Parameters
+    ----------------
+    \\*args : list, optional
+        Arguments.
+    \\**kwargs : dict, optional
+        Keywords arguments.
+
+    Returns
+    -------
+    object
+        Definition output.
+    """
+
+    tokens = [(_CONTEXT_VARIABLES[name], _CONTEXT_VARIABLES[name].set(value))
+              for name, value in values.items() if name in _CONTEXT_VARIABLES]
+
+    try:
+        return function(*args, **kwargs)
+    finally:
+        for variable, token in reversed(tokens):
+            variable.reset(token)
+
+
 def _initializer(kwargs):
     """
     Initializer for the multiprocessing pool. It is mainly use to ensure that
     processes on *Windows* correctly inherit from the current domain-range
-    scale.
+    scale and the other *Colour* context variables.
 
     Parameters
     ----------
@@ -228,11 +371,106 @@ def _initializer(kwargs):
         Initialisation arguments.
     """
 
-    global _DOMAIN_RANGE_SCALE
-
     # NOTE: No coverage information is available as this code is executed in
     # sub-processes.
-    _DOMAIN_RANGE_SCALE = kwargs.get('scale', 'reference')  # pragma: no cover
+    for name, value in kwargs.get('context', {}).items():  # pragma: no cover
+        if name in _CONTEXT_VARIABLES:
+            _CONTEXT_VARIABLES[name].set(value)
+
+
+class _ContextThreadPool(multiprocessing.pool.ThreadPool):
+    """
+    A thread pool running the tasks with the *Colour* context variables values
+    of the thread submitting them, the pool threads would otherwise see the
+    default values, e.g. the *'Reference'* domain-range scale.
+
+    Other Parameters
+    ----------------
+    \\*args : list, optional
+        Arguments.
+    \\**kwargs : dict, optional
+        Keywords arguments.
+    """
+
+    @staticmethod
+    def _contextualise(func):
+        """
+        Binds given function to the current *Colour* context variables values.
+        """
+
+        return functools.partial(_run_with_context_values, _context_values(),
+                                 func)
+
+    def apply_async(self, func, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`apply` method.
+        """
+
+        return super(_ContextThreadPool, self).apply_async(
+            self._contextualise(func), *args, **kwargs)
+
+    def map_async(self, func, *args, **kwargs):
+        """
+        Asynchronous version of :meth:`map` method.
+        """
+
+        return super(_ContextThreadPool, self).map_async(
+            self._contextualise(func), *args, **kwargs)
+
+    def _map_async(self, func, *args, **kwargs):
+        """
+        Helper of the :meth:`map`, :meth:`map_async`, :meth:`starmap` and
+        :meth:`starmap_async` methods.
+        """
+
+        return super(_ContextThreadPool, self)._map_async(
+            self._contextualise(func), *args, **kwargs)
+
+    def imap(self, func, *args, **kwargs):
+        """
+        Equivalent of :func:`map` definition.
+        """
+
+        return super(_ContextThreadPool, self).imap(
+            self._contextualise(func), *args, **kwargs)
+
+    def imap_unordered(self, func, *args, **kwargs):
+        """
+        Like :meth:`imap` method but the ordering of the results is arbitrary.
+        """
+
+        return super(_ContextThreadPool, self).imap_unordered(
+            self._contextualise(func), *args, **kwargs)
+
+
+class _DummyPool(object):
+    """
+    A dummy multiprocessing pool that does not perform multiprocessing.
+
+    Other Parameters
+    ----------------
+    \\*args : list, optional
+        Arguments.
+    \\**kwargs : dict, optional
+        Keywords arguments.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def map(self, func, iterable, chunksize=None):
+        """
+        Applies given function to each element of given iterable.
+        """
+
+        return [func(a) for a in iterable]
+
+    def terminate(self):
+        """
+        Terminate the process.
+        """
+
+        pass
 
 
 @contextmanager
@@ -258,40 +496,58 @@ def multiprocessing_pool(*args, **kwargs):
     [2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
     """
 
-    class _DummyPool(object):
-        """
-        A dummy multiprocessing pool that does not perform multiprocessing.
-
-        Other Parameters
-        ----------------
-        \\*args : list, optional
-            Arguments.
-        \\**kwargs : dict, optional
-            Keywords arguments.
-        """
+    kwargs['initializer'] = _initializer
+    kwargs['initargs'] = ({'context': _context_values()}, )
 
-        def __init__(self, *args, **kwargs):
-            pass
+    if _MULTIPROCESSING_ENABLED:
+        pool_factory = multiprocessing.Pool
+    else:
+        pool_factory = _DummyPool
 
-        def map(self, func, iterable, chunksize=None):
-            """
-            Applies given function to each element of given iterable.
-            """
+    pool = pool_factory(*args, **kwargs)
 
-            return [func(a) for a in iterable]
+    try:
+        yield pool
+    finally:
+        pool.terminate()
 
-        def terminate(self):
-            """
-            Terminate the process.
-            """
 
-            pass
+@contextmanager
+def thread_pool(*args, **kwargs):
+    """
+    A context manager providing a thread pool.
 
-    kwargs['initializer'] = _initializer
-    kwargs['initargs'] = ({'scale': get_domain_range_scale()}, )
+    Threads share the memory of the current process which makes the pool
+    suited to definitions whose work is dominated by *Numpy* operations
+    releasing the *GIL*, e.g. block-wise processing of large arrays.
+
+    Other Parameters
+    ----------------
+    \\*args : list, optional
+        Arguments.
+    \\**kwargs : dict, optional
+        Keywords arguments.
+
+    Notes
+    -----
+    -   The tasks are run with the *Colour* domain-range scale and the other
+        *Colour* context variables values of the thread submitting them.
+    -   The thread pool is replaced with a dummy sequential pool when
+        *Colour* multiprocessing is disabled with the
+        :class:`colour.utilities.disable_multiprocessing` context manager.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> def _add(a, b):
+    ...     return a + b
+    >>> with thread_pool() as pool:
+    ...     pool.map(partial(_add, b=2), range(10))
+    [2, 3, 4, 5, 6, 7, 8, 9, 10, 11]
+    """
 
     if _MULTIPROCESSING_ENABLED:
-        pool_factory = multiprocessing.Pool
+        pool_factory = _ContextThreadPool
     else:
         pool_factory = _DummyPool
 
@@ -368,8 +624,9 @@ def is_networkx_installed(raise_exception=False):
         if raise_exception:
             raise ImportError(
                 ('"NetworkX" related API features, e.g. the automatic colour '
-                 'conversion graph, are not available: "{0}".\nPlease refer '
-                 'to the installation guide for more information: '
+                 'conversion graph plotting, are not available: "{0}".\n'
+                 'Please refer to the installation guide for more '
+                 'information: '
                  'https://www.colour-science.org/installation-guide/'
                  ).format(error))
         return False
@@ -664,6 +921,62 @@ def is_sibling(element, mapping):
         element, tuple(set(type(element) for element in mapping.values())))
 
 
+_CACHE_ARGUMENTS_NAMES = weakref.WeakKeyDictionary()
+"""
+Cache of the callables arguments names used by the
+:func:`colour.utilities.filter_kwargs` definition, the entries are discarded
+along with their callables.
+
+_CACHE_ARGUMENTS_NAMES : WeakKeyDictionary
+"""
+
+
+def _arguments_names(function):
+    """
+    Returns the arguments names of given callable, they are cached for the
+    callables supporting weak references.
+
+    Parameters
+    ----------
+    function : callable
+        Callable to return the arguments names of.
+
+    Returns
+    -------
+    frozenset
+        Arguments names, empty if the signature cannot be inspected.
+    """
+
+    try:
+        return _CACHE_ARGUMENTS_NAMES[function]
+    except (KeyError, TypeError):
+        pass
+
+    # TODO: Remove when dropping Python 2.7.
+    if six.PY2:  # pragma: no cover
+        while hasattr(function, '__wrapped__'):
+            function = function.__wrapped__
+
+        try:
+            args, _varargs, _keywords, _defaults = inspect.getargspec(function)
+        except (TypeError, ValueError):
+            args = []
+    else:  # pragma: no cover
+        try:
+            args = list(inspect.signature(function).parameters.keys())
+        except ValueError:
+            args = []
+
+    arguments = frozenset(args)
+
+    try:
+        _CACHE_ARGUMENTS_NAMES[function] = arguments
+    except TypeError:
+        pass
+
+    return arguments
+
+
 def filter_kwargs(function, **kwargs):
     """
     Filters keyword arguments incompatible with the given function signature.
@@ -683,6 +996,11 @@ def filter_kwargs(function, **kwargs):
     dict
         Filtered keyword arguments.
 
+    Notes
+    -----
+    -   The arguments names of the callable are cached, the signature of a
+        callable must thus not be modified after it has been filtered.
+
     Warnings
     --------
     Python 2.7 does not support inspecting the signature of *partial*
@@ -705,25 +1023,13 @@ def filter_kwargs(function, **kwargs):
     (1, 2, 3)
     """
 
-    kwargs = copy(kwargs)
+    if not kwargs:
+        return {}
 
-    # TODO: Remove when dropping Python 2.7.
-    if six.PY2:  # pragma: no cover
-        try:
-            args, _varargs, _keywords, _defaults = inspect.getargspec(function)
-        except (TypeError, ValueError):
-            return {}
-    else:  # pragma: no cover
-        try:
-            args = list(inspect.signature(function).parameters.keys())
-        except ValueError:
-            return {}
-
-    args = set(kwargs.keys()) - set(args)
-    for key in args:
-        kwargs.pop(key)
+    arguments = _arguments_names(function)
 
-    return kwargs
+    return dict(
+        (key, value) for key, value in kwargs.items() if key in arguments)
 
 
 def filter_mapping(mapping, filterers, anchors=True, flags=re.IGNORECASE):
@@ -846,11 +1152,12 @@ def first_item(a):
     return next(iter(a))
 
 
-_DOMAIN_RANGE_SCALE = 'reference'
+_DOMAIN_RANGE_SCALE = _context_variable('domain_range_scale', 'reference')
 """
-Global variable storing the current *Colour* domain-range scale.
+Context variable storing the current *Colour* domain-range scale, each thread
+and *asyncio* task sees its own value.
 
-_DOMAIN_RANGE_SCALE : unicode
+_DOMAIN_RANGE_SCALE : ContextVar
 """
 
 
@@ -873,7 +1180,19 @@ def get_domain_range_scale():
         *Colour* domain-range scale.
     """
 
-    return _DOMAIN_RANGE_SCALE
+    return _DOMAIN_RANGE_SCALE.get()
+
+
+def _validate_domain_range_scale(scale):
+    """
+    Validates given *Colour* domain-range scale and returns it lower-cased.
+    """
+
+    scale = str(scale).lower()
+    valid = ('1', '100', 'reference', 'ignore')
+    assert scale in valid, 'Scale must be one of "{0}".'.format(valid)
+
+    return scale
 
 
 def set_domain_range_scale(scale='Reference'):
@@ -894,15 +1213,15 @@ def set_domain_range_scale(scale='Reference'):
     scale : unicode or int
         **{'Reference', '1'}**,
         *Colour* domain-range scale to set.
-    """
-
-    global _DOMAIN_RANGE_SCALE
 
-    scale = str(scale).lower()
-    valid = ('1', '100', 'reference', 'ignore')
-    assert scale in valid, 'Scale must be one of "{0}".'.format(valid)
+    Notes
+    -----
+    -   The domain-range scale is set for the current thread or *asyncio*
+        task only, the threads of the :func:`colour.utilities.thread_pool`
+        definition inherit it from the thread submitting the tasks.
+    """
 
-    _DOMAIN_RANGE_SCALE = scale
+    _DOMAIN_RANGE_SCALE.set(_validate_domain_range_scale(scale))
 
 
 class domain_range_scale(object):
@@ -955,15 +1274,15 @@ class domain_range_scale(object):
     """
 
     def __init__(self, scale):
-        self._scale = scale
-        self._previous_scale = get_domain_range_scale()
+        self._scale = _validate_domain_range_scale(scale)
+        self._tokens = []
 
     def __enter__(self):
         """
         Called upon entering the context manager and decorator.
         """
 
-        set_domain_range_scale(self._scale)
+        self._tokens.append(_DOMAIN_RANGE_SCALE.set(self._scale))
 
         return self
 
@@ -972,7 +1291,7 @@ class domain_range_scale(object):
         Called upon exiting the context manager and decorator.
         """
 
-        set_domain_range_scale(self._previous_scale)
+        _DOMAIN_RANGE_SCALE.reset(self._tokens.pop())
 
     def __call__(self, function):
         """
@@ -981,8 +1300,13 @@ class domain_range_scale(object):
 
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
-            with self:
+            # The token is kept local as the decorator instance is shared by
+            # the threads calling the wrapped definition.
+            token = _DOMAIN_RANGE_SCALE.set(self._scale)
+            try:
                 return function(*args, **kwargs)
+            finally:
+                _DOMAIN_RANGE_SCALE.reset(token)
 
         return wrapper
 
@@ -1040,7 +1364,7 @@ def to_domain_1(a, scale_factor=100, dtype=None):
 
     a = np.asarray(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a /= scale_factor
 
     return a
@@ -1101,10 +1425,10 @@ def to_domain_10(a, scale_factor=10, dtype=None):
 
     a = np.asarray(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a *= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a /= scale_factor
 
     return a
@@ -1163,7 +1487,7 @@ def to_domain_100(a, scale_factor=100, dtype=None):
 
     a = np.asarray(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a *= scale_factor
 
     return a
@@ -1224,10 +1548,10 @@ def to_domain_degrees(a, scale_factor=360, dtype=None):
 
     a = np.asarray(a, dtype).copy()
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a *= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a *= scale_factor / 100
 
     return a
@@ -1293,10 +1617,10 @@ def to_domain_int(a, bit_depth=8, dtype=None):
     a = np.asarray(a, dtype).copy()
 
     maximum_code_value = 2 ** bit_depth - 1
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a *= maximum_code_value
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a *= maximum_code_value / 100
 
     return a
@@ -1352,7 +1676,7 @@ def from_range_1(a, scale_factor=100):
     100
     """
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a *= scale_factor
 
     return a
@@ -1410,10 +1734,10 @@ def from_range_10(a, scale_factor=10):
     10
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a /= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a *= scale_factor
 
     return a
@@ -1469,7 +1793,7 @@ def from_range_100(a, scale_factor=100):
     1
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a /= scale_factor
 
     return a
@@ -1527,10 +1851,10 @@ def from_range_degrees(a, scale_factor=360):
     0.2777777...
     """
 
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a /= scale_factor
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a /= scale_factor / 100
 
     return a
@@ -1598,11 +1922,11 @@ def from_range_int(a, bit_depth=8, dtype=None):
         dtype = DEFAULT_FLOAT_DTYPE
 
     maximum_code_value = 2 ** bit_depth - 1
-    if _DOMAIN_RANGE_SCALE == '1':
+    if _DOMAIN_RANGE_SCALE.get() == '1':
         a = np.asarray(a, dtype)
         a /= maximum_code_value
 
-    if _DOMAIN_RANGE_SCALE == '100':
+    if _DOMAIN_RANGE_SCALE.get() == '100':
         a = np.asarray(a, dtype)
         a /= maximum_code_value / 100
 
@@ -1633,3 +1957,113 @@ def copy_definition(definition, name=None):
     copy.__dict__.update(definition.__dict__)
 
     return copy
+
+
+def _hashable(value):
+    """
+    Returns a hashable representation of given value.
+    """
+
+    try:
+        hash(value)
+
+        return value
+    except TypeError:
+        return pickle.dumps(value)
+
+
+def half_domain_evaluation(function=None, cache_size=16):
+    """
+    Decorator evaluating given per-channel definition exhaustively on the
+    65536 *float16* values on its first call with *float16* values, the
+    subsequent calls being a lookup into the resulting table.
+
+    Parameters
+    ----------
+    function : callable, optional
+        Per-channel definition to wrap, i.e. whose output values depend only
+        on the input value at the same index, e.g.
+        :func:`colour.cctf_encoding`, :func:`colour.lightness` or
+        :func:`colour.munsell_value` definitions. If *None*, a decorator
+        with given settings is returned.
+    cache_size : int, optional
+        Maximum count of tables cached by the wrapped definition, each table
+        storing 65536 values. The tables are keyed by the definition
+        arguments besides the first one, the domain-range scale, the float
+        precision and the :func:`colour.algebra.spow` state, the least
+        recently used table is discarded first.
+
+    Returns
+    -------
+    callable
+        Wrapped definition, the values that are not *float16* are passed to
+        the definition unchanged. The ``cache_clear`` attribute of the
+        wrapped definition discards its cached tables.
+
+    Raises
+    ------
+    ValueError
+        If the definition does not return a value per input value.
+
+    Examples
+    --------
+    >>> from colour import lightness
+    >>> lightness_h = half_domain_evaluation(lightness)
+    >>> Y = np.array([12.19722535, 50.0, 100.0], dtype=np.float16)
+    >>> lightness_h(Y, method='CIE 1976')  # doctest: +ELLIPSIS
+    array([  41.5248...,   76.0692...,  100.        ])
+    >>> lightness_h.cache_clear()
+    """
+
+    if function is None:
+        return functools.partial(half_domain_evaluation, cache_size=cache_size)
+
+    tables = OrderedDict()
+    lock = threading.Lock()
+
+    @functools.wraps(function)
+    def wrapper(a, *args, **kwargs):
+        """
+        Calls the wrapped definition.
+        """
+
+        a = np.asarray(a)
+
+        if a.dtype != np.float16:
+            return function(a, *args, **kwargs)
+
+        from colour.algebra import is_spow_enabled
+
+        key = (get_domain_range_scale(), is_spow_enabled(),
+               np.dtype(DEFAULT_FLOAT_DTYPE).str,
+               tuple(_hashable(arg) for arg in args),
+               tuple(
+                   sorted((name, _hashable(value))
+                          for name, value in kwargs.items())))
+
+        with lock:
+            table = tables.pop(key, None)
+
+        if table is None:
+            samples = np.arange(
+                2 ** 16,
+                dtype=np.uint16).view(np.float16).astype(DEFAULT_FLOAT_DTYPE)
+
+            with np.errstate(all='ignore'):
+                table = np.asarray(function(samples, *args, **kwargs))
+
+            if table.shape != samples.shape:
+                raise ValueError(
+                    '"{0}" definition does not return a value per input '
+                    'value!'.format(function.__name__))
+
+        with lock:
+            tables[key] = table
+            while len(tables) > cache_size:
+                tables.popitem(last=False)
+
+        return np.take(table, a.view(np.uint16))
+
+    wrapper.cache_clear = tables.clear
+
+    return wrapper
@@ -13,7 +13,7 @@ from importlib import import_module
 from collections import namedtuple
 from operator import attrgetter
 
-from colour.utilities import usage_warning
+from colour.utilities import is_string, usage_warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -468,6 +468,58 @@ name='module.object_6_access')}
     return changes
 
 
+_API_CHANGES_TYPES = frozenset(
+    change_type.__name__
+    for change_type in (ObjectRenamed, ObjectRemoved, ObjectFutureRename,
+                        ObjectFutureRemove, ObjectFutureAccessChange,
+                        ObjectFutureAccessRemove, ArgumentRenamed,
+                        ArgumentRemoved, ArgumentFutureRename,
+                        ArgumentFutureRemove))
+"""
+Names of the API changes types used as keys of the API changes mappings.
+
+_API_CHANGES_TYPES : frozenset
+"""
+
+
+def _has_changes(changes, names):
+    """
+    Returns whether given API changes mapping concerns any of given objects or
+    arguments names, without building the API changes.
+
+    Parameters
+    ----------
+    changes : dict
+        Dictionary of desired API changes.
+    names : iterable
+        Objects or arguments names.
+
+    Returns
+    -------
+    bool
+        Whether the API changes mapping concerns any of given names.
+    """
+
+    if not names:
+        return False
+
+    for key, values in changes.items():
+        # The mapping may have already been built by the
+        # "build_API_changes" definition, it is then keyed by names.
+        if key in names:
+            return True
+
+        if key not in _API_CHANGES_TYPES:
+            continue
+
+        for change in values:
+            name = change if is_string(change) else change[0]
+            if name.split('.')[-1] in names:
+                return True
+
+    return False
+
+
 def handle_arguments_deprecation(changes, **kwargs):
     """
     Handles arguments deprecation according to desired API changes mapping.
@@ -508,6 +560,9 @@ def handle_arguments_deprecation(changes, **kwargs):
 'argument_2_new_name': True}
     """
 
+    if not _has_changes(changes, kwargs):
+        return kwargs
+
     changes = build_API_changes(changes)
 
     for kwarg in kwargs.copy():
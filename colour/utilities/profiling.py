@@ -0,0 +1,570 @@
+# -*- coding: utf-8 -*-
+"""
+Profiling
+=========
+
+Defines the objects profiling the *Colour* definitions:
+
+-   :class:`colour.utilities.Profile`
+-   :func:`colour.utilities.profile`
+-   :func:`colour.utilities.profiled`
+-   :func:`colour.utilities.is_profiling`
+"""
+
+from __future__ import division, unicode_literals
+
+import functools
+import json
+import numpy as np
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from colour.utilities.common import _context_variable
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['Profile', 'profile', 'profiled', 'is_profiling']
+
+_PROFILE = _context_variable('profile', None)
+"""
+Active profile of the current thread or *asyncio* task, *None* when profiling
+is disabled.
+
+_PROFILE : ContextVar
+"""
+
+# TODO: Remove when dropping Python 2.7.
+_timer = getattr(time, 'perf_counter', time.time)
+
+
+def _definition_name(function):
+    """
+    Returns the qualified name of given definition, the *partial* objects are
+    unwrapped.
+    """
+
+    while isinstance(function, functools.partial):
+        function = function.func
+
+    return '{0}.{1}'.format(
+        getattr(function, '__module__', None) or '<unknown>',
+        getattr(function, '__name__',
+                type(function).__name__))
+
+
+def _input_size(value):
+    """
+    Returns the elements count of given definition input, 0 if it is not
+    an array-like or a spectral distribution.
+    """
+
+    if isinstance(value, np.ndarray):
+        return value.size
+
+    values = getattr(value, 'values', None)
+    if isinstance(values, np.ndarray):
+        return values.size
+
+    if isinstance(value, (int, float, np.number)):
+        return 1
+
+    if isinstance(value, (list, tuple)):
+        try:
+            return np.asarray(value, dtype=np.float_).size
+        except (TypeError, ValueError):
+            return 0
+
+    return 0
+
+
+class Profile(object):
+    """
+    Defines the report of a profiling session: the call counts, cumulative
+    and self times and input sizes of the profiled definitions, and the hit
+    and miss counts of the *Colour* caches.
+
+    Parameters
+    ----------
+    trace : bool, optional
+        Whether to record each call as an event so that the profile can be
+        exported as a *Chrome* trace.
+
+    Attributes
+    ----------
+    -   :attr:`~colour.utilities.Profile.definitions`
+    -   :attr:`~colour.utilities.Profile.caches`
+    -   :attr:`~colour.utilities.Profile.events`
+
+    Methods
+    -------
+    -   :meth:`~colour.utilities.Profile.__init__`
+    -   :meth:`~colour.utilities.Profile.__str__`
+    -   :meth:`~colour.utilities.Profile.call`
+    -   :meth:`~colour.utilities.Profile.record_cache_access`
+    -   :meth:`~colour.utilities.Profile.report`
+    -   :meth:`~colour.utilities.Profile.to_json`
+    -   :meth:`~colour.utilities.Profile.to_chrome_trace`
+
+    Notes
+    -----
+    -   The time of a definition is its wall-clock time, the self time
+        excludes the time spent into the nested profiled definitions called
+        from the same thread.
+    -   The definitions called by the workers of the
+        :func:`colour.utilities.thread_pool` definition are recorded, those
+        called by the workers of the
+        :func:`colour.utilities.multiprocessing_pool` definition are not.
+
+    Examples
+    --------
+    >>> from colour import sd_to_XYZ
+    >>> from colour.colorimetry import sd_ones
+    >>> with profile() as session:
+    ...     XYZ = sd_to_XYZ(sd_ones())
+    >>> session.definitions['colour.colorimetry.tristimulus.sd_to_XYZ'][
+    ...     'calls']
+    1
+    """
+
+    def __init__(self, trace=False):
+        self._trace = trace
+        self._origin = _timer()
+
+        self._definitions = OrderedDict()
+        self._caches = OrderedDict()
+        self._events = []
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __getstate__(self):
+        """
+        Returns the state of the profile without its lock and thread-local
+        data so that it can be sent to the process pools workers.
+        """
+
+        state = self.__dict__.copy()
+        del state['_lock'], state['_local']
+
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores the state of the profile.
+        """
+
+        self.__dict__.update(state)
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def definitions(self):
+        """
+        Getter property for the profiled definitions statistics, keyed by
+        qualified name.
+
+        Returns
+        -------
+        OrderedDict
+            Profiled definitions statistics: *calls*, *cumulative_time* and
+            *self_time* in seconds, *input_size*, the total elements count of
+            the first argument, and *maximum_input_size*.
+        """
+
+        return self._definitions
+
+    @property
+    def caches(self):
+        """
+        Getter property for the caches statistics, keyed by cache name.
+
+        Returns
+        -------
+        OrderedDict
+            Caches statistics: *hits* and *misses*.
+        """
+
+        return self._caches
+
+    @property
+    def events(self):
+        """
+        Getter property for the recorded calls events.
+
+        Returns
+        -------
+        list
+            Calls events as *(name, start, duration, thread, input_size)*
+            tuples, the times being in seconds since the profile creation,
+            empty unless tracing.
+        """
+
+        return self._events
+
+    def __str__(self):
+        """
+        Returns a formatted string representation of the profile.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+        """
+
+        lines = [
+            '{0:<56} {1:>8} {2:>12} {3:>12} {4:>12}'.format(
+                'Definition', 'Calls', 'Cumulative', 'Self', 'Input Size')
+        ]
+        for name, statistics in self.report()['definitions'].items():
+            lines.append('{0:<56} {1:>8} {2:>12.6f} {3:>12.6f} {4:>12}'.format(
+                name, statistics['calls'], statistics['cumulative_time'],
+                statistics['self_time'], statistics['input_size']))
+
+        if self._caches:
+            lines.append('')
+            lines.append('{0:<56} {1:>8} {2:>12}'.format(
+                'Cache', 'Hits', 'Misses'))
+            for name, statistics in self._caches.items():
+                lines.append('{0:<56} {1:>8} {2:>12}'.format(
+                    name, statistics['hits'], statistics['misses']))
+
+        return '\n'.join(lines)
+
+    def call(self, name, function, *args, **kwargs):
+        """
+        Calls given definition and records its statistics under given name.
+
+        Parameters
+        ----------
+        name : unicode
+            Definition name.
+        function : callable
+            Definition to call.
+
+        Other Parameters
+        ----------------
+        \\*args : list, optional
+            Arguments.
+        \\**kwargs : dict, optional
+            Keywords arguments.
+
+        Returns
+        -------
+        object
+            Definition return value.
+        """
+
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        stack.append(0)
+        start = _timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            duration = _timer() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += duration
+
+            size = _input_size(args[0]) if args else 0
+
+            with self._lock:
+                statistics = self._definitions.get(name)
+                if statistics is None:
+                    statistics = self._definitions[name] = OrderedDict([
+                        ('calls', 0),
+                        ('cumulative_time', 0),
+                        ('self_time', 0),
+                        ('input_size', 0),
+                        ('maximum_input_size', 0),
+                    ])
+
+                statistics['calls'] += 1
+                statistics['cumulative_time'] += duration
+                statistics['self_time'] += duration - children
+                statistics['input_size'] += size
+                statistics['maximum_input_size'] = max(
+                    statistics['maximum_input_size'], size)
+
+                if self._trace:
+                    self._events.append((name, start - self._origin, duration,
+                                         threading.current_thread().ident,
+                                         size))
+
+    def record_cache_access(self, name, hit):
+        """
+        Records an access to given cache.
+
+        Parameters
+        ----------
+        name : unicode
+            Cache name.
+        hit : bool
+            Whether the cache contained the requested entry.
+        """
+
+        with self._lock:
+            statistics = self._caches.get(name)
+            if statistics is None:
+                statistics = self._caches[name] = OrderedDict([('hits', 0),
+                                                               ('misses', 0)])
+
+            statistics['hits' if hit else 'misses'] += 1
+
+    def report(self):
+        """
+        Returns the profile report.
+
+        Returns
+        -------
+        OrderedDict
+            Profile report with the *definitions* statistics sorted by
+            decreasing cumulative time and the *caches* statistics.
+
+        Examples
+        --------
+        >>> session = Profile()
+        >>> session.call('add', lambda a, b: a + b, 1, 2)
+        3
+        >>> session.report()['definitions']['add']['calls']
+        1
+        """
+
+        with self._lock:
+            definitions = sorted(
+                ((name, OrderedDict(statistics))
+                 for name, statistics in self._definitions.items()),
+                key=lambda x: x[1]['cumulative_time'],
+                reverse=True)
+
+            return OrderedDict([
+                ('definitions', OrderedDict(definitions)),
+                ('caches',
+                 OrderedDict((name, OrderedDict(statistics))
+                             for name, statistics in self._caches.items())),
+            ])
+
+    def to_json(self, path=None):
+        """
+        Exports the profile report as *JSON*.
+
+        Parameters
+        ----------
+        path : unicode, optional
+            *JSON* file path the report is written to.
+
+        Returns
+        -------
+        unicode
+            *JSON* profile report.
+        """
+
+        report = json.dumps(self.report(), indent=4)
+
+        if path is not None:
+            with open(path, 'w') as json_file:
+                json_file.write(report)
+
+        return report
+
+    def to_chrome_trace(self, path=None):
+        """
+        Exports the recorded calls events in the *Chrome* *Trace Event Format*
+        that can be opened by *chrome://tracing* or *Perfetto*.
+
+        Parameters
+        ----------
+        path : unicode, optional
+            *JSON* file path the trace is written to.
+
+        Returns
+        -------
+        unicode
+            *JSON* *Chrome* trace.
+
+        Raises
+        ------
+        RuntimeError
+            If the profile was not tracing.
+        """
+
+        if not self._trace:
+            raise RuntimeError(
+                'The profile was not tracing, the "Chrome" trace cannot be '
+                'exported!')
+
+        pid = os.getpid()
+        with self._lock:
+            events = [{
+                'name': name,
+                'cat': 'colour',
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': thread,
+                'args': {
+                    'input_size': size
+                },
+            } for name, start, duration, thread, size in self._events]
+
+        trace = json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
+
+        if path is not None:
+            with open(path, 'w') as json_file:
+                json_file.write(trace)
+
+        return trace
+
+
+@contextmanager
+def profile(trace=False):
+    """
+    A context manager profiling the definitions decorated with the
+    :func:`colour.utilities.profiled` decorator and the *Colour* caches
+    accesses.
+
+    Parameters
+    ----------
+    trace : bool, optional
+        Whether to record each call as an event so that the profile can be
+        exported as a *Chrome* trace.
+
+    Yields
+    ------
+    Profile
+        Profile recording the statistics.
+
+    Examples
+    --------
+    >>> from colour import SDS_ILLUMINANTS, convert
+    >>> from colour.utilities import suppress_warnings
+    >>> with profile(trace=True) as session:
+    ...     with suppress_warnings(colour_usage_warnings=True):
+    ...         RGB = convert(SDS_ILLUMINANTS['D65'], 'Spectral Distribution',
+    ...                       'sRGB')
+    >>> 'colour.graph.conversion.convert' in session.definitions
+    True
+    >>> report = session.to_json()
+    >>> trace = session.to_chrome_trace()
+    """
+
+    session = Profile(trace)
+
+    token = _PROFILE.set(session)
+    try:
+        yield session
+    finally:
+        _PROFILE.reset(token)
+
+
+def profiled(function):
+    """
+    A decorator recording the statistics of given definition into the active
+    profile, see :func:`colour.utilities.profile` definition. The definition
+    is called directly when profiling is disabled.
+
+    Parameters
+    ----------
+    function : callable
+        Definition to profile.
+
+    Returns
+    -------
+    callable
+        Profiled definition.
+
+    Examples
+    --------
+    >>> @profiled
+    ... def add(a, b):
+    ...     return a + b
+    >>> with profile() as session:
+    ...     add(1, 2)
+    3
+    >>> list(session.definitions.keys())
+    ['colour.utilities.profiling.add']
+    """
+
+    name = _definition_name(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        """
+        Wrapper for given definition.
+        """
+
+        session = _PROFILE.get()
+        if session is None:
+            return function(*args, **kwargs)
+
+        return session.call(name, function, *args, **kwargs)
+
+    # TODO: Remove when dropping Python 2.7.
+    wrapper.__wrapped__ = function
+    wrapper.__profiled__ = True
+
+    return wrapper
+
+
+def is_profiling():
+    """
+    Returns whether a profile is active in the current thread or *asyncio*
+    task.
+
+    Returns
+    -------
+    bool
+        Whether a profile is active.
+
+    Examples
+    --------
+    >>> is_profiling()
+    False
+    >>> with profile():
+    ...     is_profiling()
+    True
+    """
+
+    return _PROFILE.get() is not None
+
+
+def _profile_call(function, *args, **kwargs):
+    """
+    Calls given definition, recording its statistics into the active profile
+    unless it is already a profiled definition.
+    """
+
+    session = _PROFILE.get()
+    if session is None:
+        return function(*args, **kwargs)
+
+    definition = function
+    while isinstance(definition, functools.partial):
+        definition = definition.func
+
+    if getattr(definition, '__profiled__', False):
+        return function(*args, **kwargs)
+
+    return session.call(_definition_name(function), function, *args, **kwargs)
+
+
+def _profile_cache_access(name, hit):
+    """
+    Records an access to given cache into the active profile.
+    """
+
+    session = _PROFILE.get()
+    if session is not None:
+        session.record_cache_access(name, hit)
@@ -17,7 +17,7 @@ from colour.utilities import (
     closest, normalise_maximum, interval, is_uniform, in_array, tstack, tsplit,
     row_as_diagonal, vector_dot, matrix_dot, orient, centroid,
     linear_conversion, lerp, fill_nan, ndarray_write, zeros, ones, full,
-    index_along_last_axis)
+    index_along_last_axis, chunk_slices)
 from colour.utilities import is_networkx_installed
 
 __author__ = 'Colour Developers'
@@ -35,7 +35,7 @@ __all__ = [
     'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
     'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
     'TestLerp', 'TestFillNan', 'TestNdarrayWrite', 'TestZeros', 'TestOnes',
-    'TestFull', 'TestIndexAlongLastAxis'
+    'TestFull', 'TestIndexAlongLastAxis', 'TestChunkSlices'
 ]
 
 
@@ -1073,5 +1073,31 @@ class TestIndexAlongLastAxis(unittest.TestCase):
             index_along_last_axis(a, indexes)
 
 
+class TestChunkSlices(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.chunk_slices` definition unit tests
+    methods.
+    """
+
+    def test_chunk_slices(self):
+        """
+        Tests :func:`colour.utilities.array.chunk_slices` definition.
+        """
+
+        self.assertListEqual(
+            chunk_slices(5, 2),
+            [slice(0, 2), slice(2, 4), slice(4, 5)])
+
+        self.assertListEqual(chunk_slices(5), [slice(0, 5)])
+
+        self.assertListEqual(chunk_slices(4, 4), [slice(0, 4)])
+
+        self.assertListEqual(chunk_slices(0, 4), [slice(0, 0)])
+
+        a = np.arange(10)
+        np.testing.assert_equal(
+            np.hstack([a[chunk] for chunk in chunk_slices(a.size, 3)]), a)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,19 +5,21 @@ Defines unit tests for :mod:`colour.utilities.common` module.
 
 from __future__ import division, unicode_literals
 
+import multiprocessing.pool
 import numpy as np
 import unittest
 import six
 from collections import OrderedDict
 from functools import partial
 
+from colour.algebra import spow, spow_enable
 from colour.utilities import (
-    batch, multiprocessing_pool, is_iterable, is_string, is_numeric,
-    is_integer, is_sibling, filter_kwargs, filter_mapping, first_item,
-    get_domain_range_scale, set_domain_range_scale, domain_range_scale,
-    to_domain_1, to_domain_10, to_domain_100, to_domain_int, to_domain_degrees,
-    from_range_1, from_range_10, from_range_100, from_range_int,
-    from_range_degrees)
+    batch, disable_multiprocessing, multiprocessing_pool, thread_pool,
+    is_iterable, is_string, is_numeric, is_integer, is_sibling, filter_kwargs,
+    filter_mapping, first_item, get_domain_range_scale, set_domain_range_scale,
+    domain_range_scale, to_domain_1, to_domain_10, to_domain_100,
+    to_domain_int, to_domain_degrees, from_range_1, from_range_10,
+    from_range_100, from_range_int, from_range_degrees, half_domain_evaluation)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
@@ -27,13 +29,14 @@ __email__ = 'colour-developers@colour-science.org'
 __status__ = 'Production'
 
 __all__ = [
-    'TestBatch', 'TestMultiprocessingPool', 'TestIsIterable', 'TestIsString',
-    'TestIsNumeric', 'TestIsInteger', 'TestIsSibling', 'TestFilterKwargs',
-    'TestFilterMapping', 'TestFirstItem', 'TestGetDomainRangeScale',
-    'TestSetDomainRangeScale', 'TestDomainRangeScale', 'TestToDomain1',
-    'TestToDomain10', 'TestToDomain100', 'TestToDomainDegrees',
-    'TestToDomainInt', 'TestFromRange1', 'TestFromRange10', 'TestFromRange100',
-    'TestFromRangeDegrees', 'TestFromRangeInt'
+    'TestBatch', 'TestMultiprocessingPool', 'TestThreadPool', 'TestIsIterable',
+    'TestIsString', 'TestIsNumeric', 'TestIsInteger', 'TestIsSibling',
+    'TestFilterKwargs', 'TestFilterMapping', 'TestFirstItem',
+    'TestGetDomainRangeScale', 'TestSetDomainRangeScale',
+    'TestDomainRangeScale', 'TestToDomain1', 'TestToDomain10',
+    'TestToDomain100', 'TestToDomainDegrees', 'TestToDomainInt',
+    'TestFromRange1', 'TestFromRange10', 'TestFromRange100',
+    'TestFromRangeDegrees', 'TestFromRangeInt', 'TestHalfDomainEvaluation'
 ]
 
 
@@ -101,6 +104,56 @@ class TestMultiprocessingPool(unittest.TestCase):
                 [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
 
 
+class TestThreadPool(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.thread_pool` definition units tests
+    methods.
+    """
+
+    def test_thread_pool(self):
+        """
+        Tests :func:`colour.utilities.common.thread_pool` definition.
+        """
+
+        with thread_pool() as pool:
+            self.assertListEqual(
+                pool.map(partial(_add, b=2), range(10)),
+                [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+
+        with disable_multiprocessing():
+            with thread_pool() as pool:
+                self.assertListEqual(
+                    pool.map(partial(_add, b=2), range(10)),
+                    [2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+
+    def test_thread_pool_context(self):
+        """
+        Tests :func:`colour.utilities.common.thread_pool` definition context
+        variables propagation.
+        """
+
+        def _scale(_a):
+            """
+            Returns the domain-range scale of the pool thread.
+            """
+
+            return get_domain_range_scale()
+
+        with domain_range_scale('100'):
+            with thread_pool(2) as pool:
+                self.assertListEqual(pool.map(_scale, range(4)), ['100'] * 4)
+                self.assertListEqual(
+                    list(pool.imap_unordered(_scale, range(4))), ['100'] * 4)
+                self.assertEqual(pool.apply(_scale, (0, )), '100')
+
+                with domain_range_scale('1'):
+                    self.assertEqual(
+                        pool.apply_async(_scale, (0, )).get(), '1')
+
+        with thread_pool(2) as pool:
+            self.assertListEqual(pool.map(_scale, range(4)), ['reference'] * 4)
+
+
 class TestIsIterable(unittest.TestCase):
     """
     Defines :func:`colour.utilities.common.is_iterable` definition unit tests
@@ -281,6 +334,15 @@ class TestFilterKwargs(unittest.TestCase):
             self.assertDictEqual(
                 filter_kwargs(partial(fn_c, b=1), b=1), {'b': 1})
 
+        self.assertDictEqual(filter_kwargs(fn_c), {})
+        self.assertDictEqual(filter_kwargs(fn_c, b=2, d=4), {'b': 2})
+        self.assertDictEqual(filter_kwargs(fn_c, c=3, d=4), {'c': 3})
+        self.assertDictEqual(filter_kwargs(np.sum, axis=0, b=2), {'axis': 0})
+
+        fn_d = partial(fn_c, b=1)
+        kwargs = {'c': 3}
+        self.assertIsNot(filter_kwargs(fn_d, **kwargs), kwargs)
+
 
 class TestFilterMapping(unittest.TestCase):
     """
@@ -487,6 +549,49 @@ class TestDomainRangeScale(unittest.TestCase):
 
         self.assertEqual(fn_b(10), 2.0)
 
+    def test_domain_range_scale_threads(self):
+        """
+        Tests :func:`colour.utilities.common.domain_range_scale` definition
+        with concurrent mixed-scale conversions.
+        """
+
+        from colour import XYZ_to_Lab, convert
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+        Lab = XYZ_to_Lab(XYZ)
+        factors = {'reference': (1, 1), '1': (1, 0.01), '100': (100, 1)}
+
+        def _convert(i):
+            """
+            Converts the colour with a domain-range scale depending on given
+            task index.
+            """
+
+            scale = ('reference', '1', '100')[i % 3]
+            factor_d, factor_r = factors[scale]
+
+            with domain_range_scale(scale):
+                for _ in range(25):
+                    np.testing.assert_almost_equal(
+                        XYZ_to_Lab(XYZ * factor_d), Lab * factor_r, decimal=7)
+                    np.testing.assert_almost_equal(
+                        convert(XYZ, 'CIE XYZ', 'CIE Lab'),
+                        Lab / 100,
+                        decimal=7)
+                    self.assertEqual(get_domain_range_scale(), scale)
+
+            return scale
+
+        pool = multiprocessing.pool.ThreadPool(8)
+        try:
+            self.assertListEqual(
+                pool.map(_convert, range(48)),
+                [('reference', '1', '100')[i % 3] for i in range(48)])
+        finally:
+            pool.terminate()
+
+        self.assertEqual(get_domain_range_scale(), 'reference')
+
 
 class TestToDomain1(unittest.TestCase):
     """
@@ -752,5 +857,70 @@ class TestFromRangeInt(unittest.TestCase):
                 from_range_int(1, dtype=np.float16).dtype, np.float16)
 
 
+class TestHalfDomainEvaluation(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.half_domain_evaluation` definition
+    units tests methods.
+    """
+
+    def test_half_domain_evaluation(self):
+        """
+        Tests :func:`colour.utilities.common.half_domain_evaluation`
+        definition.
+        """
+
+        calls = []
+
+        def function(a, exponent=2, offset=0):
+            """
+            Per-channel definition counting its calls.
+            """
+
+            calls.append(np.size(a))
+
+            return to_domain_1(a) ** exponent + offset
+
+        function_h = half_domain_evaluation(cache_size=3)(function)
+        self.assertEqual(function_h.__name__, 'function')
+
+        a = np.array([[-2, 0.5], [np.inf, 65504]], dtype=np.float16)
+        np.testing.assert_equal(function_h(a), function(a.astype(np.float_)))
+        np.testing.assert_equal(
+            function_h(a, 3), function(a.astype(np.float_), 3))
+        self.assertEqual(function_h(np.float16(0.5), offset=1), 1.25)
+        self.assertEqual(calls.count(65536), 3)
+
+        function_h(a)
+        function_h(a, 3)
+        self.assertEqual(calls.count(65536), 3)
+
+        function_h(a, offset=np.array([1]))
+        function_h(a)
+        self.assertEqual(calls.count(65536), 4)
+        function_h(a, offset=1)
+        self.assertEqual(calls.count(65536), 5)
+
+        with domain_range_scale('100'):
+            self.assertEqual(function_h(np.float16(50)), 0.25)
+
+        np.testing.assert_equal(
+            function_h(np.array([0.25, 0.5])), [0.0625, 0.25])
+        self.assertEqual(calls[-1], 2)
+
+        function_h.cache_clear()
+        function_h(a)
+        self.assertEqual(calls.count(65536), 7)
+
+        spow_h = half_domain_evaluation(spow)
+        a = np.array([-0.5, 0.5], dtype=np.float16)
+        np.testing.assert_equal(spow_h(a, 2), [-0.25, 0.25])
+        with spow_enable(False):
+            np.testing.assert_equal(spow_h(a, 2), [0.25, 0.25])
+        np.testing.assert_equal(spow_h(a, 2), [-0.25, 0.25])
+
+        self.assertRaises(ValueError, half_domain_evaluation(np.sum),
+                          np.ones(3, dtype=np.float16))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -457,6 +457,14 @@ class TestHandleArgumentsDeprecation(unittest.TestCase):
                     'argument_4_name': True
                 })
 
+        self.assertDictEqual(
+            handle_arguments_deprecation(changes, argument_5_name=True),
+            {'argument_5_name': True})
+        self.assertDictEqual(handle_arguments_deprecation(changes), {})
+        self.assertDictEqual(
+            handle_arguments_deprecation(changes, argument_1_name=True),
+            {'argument_1_new_name': True})
+
 
 if __name__ == '__main__':
     unittest.main()
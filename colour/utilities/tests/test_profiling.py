@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.profiling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from colour.colorimetry import sd_ones, sd_to_XYZ
+from colour.utilities import (Profile, filter_kwargs, is_profiling, profile,
+                              profiled, thread_pool)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2020 - Colour Developers'
+__license__ = 'New BSD License - https://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-developers@colour-science.org'
+__status__ = 'Production'
+
+__all__ = ['TestProfile', 'TestProfiled']
+
+
+@profiled
+def _inner(a):
+    """
+    Sleeps and returns given array.
+    """
+
+    time.sleep(0.01)
+
+    return a
+
+
+@profiled
+def _outer(a, b=1):
+    """
+    Calls :func:`_inner` definition twice and returns given array.
+    """
+
+    time.sleep(0.01)
+
+    return _inner(_inner(a)) * b
+
+
+class TestProfile(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.profiling.Profile` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('definitions', 'caches', 'events')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(Profile))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__str__', 'call',
+                            'record_cache_access', 'report', 'to_json',
+                            'to_chrome_trace')
+
+        for method in required_methods:
+            self.assertIn(method, dir(Profile))
+
+    def test_call(self):
+        """
+        Tests :meth:`colour.utilities.profiling.Profile.call` method.
+        """
+
+        with profile() as session:
+            np.testing.assert_equal(_outer(np.zeros(4), b=2), np.zeros(4))
+
+        statistics = session.definitions[
+            'colour.utilities.tests.test_profiling._inner']
+        self.assertEqual(statistics['calls'], 2)
+        self.assertEqual(statistics['input_size'], 8)
+        self.assertEqual(statistics['maximum_input_size'], 4)
+        self.assertAlmostEqual(statistics['self_time'],
+                               statistics['cumulative_time'])
+
+        statistics = session.definitions[
+            'colour.utilities.tests.test_profiling._outer']
+        self.assertEqual(statistics['calls'], 1)
+        self.assertGreaterEqual(statistics['cumulative_time'], 0.03)
+        self.assertLess(statistics['self_time'], 0.02)
+
+    def test_record_cache_access(self):
+        """
+        Tests :meth:`colour.utilities.profiling.Profile.record_cache_access`
+        method.
+        """
+
+        sd = sd_ones() * 0.4217
+        with profile() as session:
+            sd_to_XYZ(sd)
+            sd_to_XYZ(sd)
+
+        self.assertDictEqual(
+            dict(session.caches['_CACHE_SD_TO_XYZ']), {
+                'hits': 1,
+                'misses': 1
+            })
+
+    def test_report(self):
+        """
+        Tests :meth:`colour.utilities.profiling.Profile.report` method.
+        """
+
+        with profile() as session:
+            _outer(np.zeros(4))
+
+        report = session.report()
+        self.assertListEqual(
+            list(report['definitions'].keys()), [
+                'colour.utilities.tests.test_profiling._outer',
+                'colour.utilities.tests.test_profiling._inner'
+            ])
+        self.assertIn('_outer', str(session))
+
+    def test_to_json(self):
+        """
+        Tests :meth:`colour.utilities.profiling.Profile.to_json` method.
+        """
+
+        with profile() as session:
+            _outer(np.zeros(4))
+
+        path = os.path.join(self._temporary_directory, 'profile.json')
+        report = session.to_json(path)
+
+        with open(path) as json_file:
+            self.assertEqual(json_file.read(), report)
+
+        self.assertEqual(
+            json.loads(report)['definitions'][
+                'colour.utilities.tests.test_profiling._inner']['calls'], 2)
+
+    def test_to_chrome_trace(self):
+        """
+        Tests :meth:`colour.utilities.profiling.Profile.to_chrome_trace`
+        method.
+        """
+
+        with profile(trace=True) as session:
+            _outer(np.zeros(4))
+
+        events = json.loads(session.to_chrome_trace())['traceEvents']
+        self.assertEqual(len(events), 3)
+        self.assertEqual(events[-1]['name'],
+                         'colour.utilities.tests.test_profiling._outer')
+        self.assertEqual(events[-1]['ph'], 'X')
+        self.assertLessEqual(events[-1]['ts'], events[0]['ts'])
+
+    def test_raise_exception_to_chrome_trace(self):
+        """
+        Tests :meth:`colour.utilities.profiling.Profile.to_chrome_trace`
+        method raised exception.
+        """
+
+        self.assertRaises(RuntimeError, Profile().to_chrome_trace)
+
+
+class TestProfiled(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.profiling.profiled` definition unit tests
+    methods.
+    """
+
+    def test_profiled(self):
+        """
+        Tests :func:`colour.utilities.profiling.profiled` definition.
+        """
+
+        self.assertFalse(is_profiling())
+        self.assertEqual(_outer.__name__, '_outer')
+        self.assertIn('b', filter_kwargs(_outer, b=2, c=3))
+
+        with profile() as session:
+            self.assertTrue(is_profiling())
+
+            with profile() as nested_session:
+                _inner(1)
+
+            _outer(1)
+
+        self.assertFalse(is_profiling())
+        self.assertEqual(
+            nested_session.definitions[
+                'colour.utilities.tests.test_profiling._inner']['calls'], 1)
+        self.assertEqual(
+            session.definitions['colour.utilities.tests.test_profiling._inner']
+            ['calls'], 2)
+
+        _outer(1)
+        self.assertEqual(
+            session.definitions['colour.utilities.tests.test_profiling._outer']
+            ['calls'], 1)
+
+    def test_profiled_threads(self):
+        """
+        Tests :func:`colour.utilities.profiling.profiled` definition with
+        threads.
+        """
+
+        with profile() as session:
+            with thread_pool(4) as pool:
+                pool.map(_inner, range(8))
+
+        self.assertEqual(
+            session.definitions['colour.utilities.tests.test_profiling._inner']
+            ['calls'], 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -127,7 +127,8 @@ install_requires = \
 ['imageio', 'scipy>=1.1.0,<2.0.0', 'six']
 
 extras_require = \
-{'development': ['biblib-simple',
+{'development': ['asv',
+                 'biblib-simple',
                  'coverage',
                  'coveralls',
                  'flake8',
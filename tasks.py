@@ -31,8 +31,8 @@ __status__ = 'Production'
 __all__ = [
     'APPLICATION_NAME', 'APPLICATION_VERSION', 'PYTHON_PACKAGE_NAME',
     'PYPI_PACKAGE_NAME', 'BIBLIOGRAPHY_NAME', 'clean', 'formatting', 'tests',
-    'quality', 'examples', 'preflight', 'docs', 'todo', 'requirements',
-    'build', 'virtualise', 'tag', 'release', 'sha256'
+    'quality', 'examples', 'benchmarks', 'preflight', 'docs', 'todo',
+    'requirements', 'build', 'virtualise', 'tag', 'release', 'sha256'
 ]
 
 APPLICATION_NAME = colour.__application_name__
@@ -228,6 +228,49 @@ def examples(ctx, plots=False):
             ctx.run('python {0}'.format(os.path.join(root, filename)))
 
 
+@task
+def benchmarks(ctx, quick=False, bench=None, publish=False):
+    """
+    Runs the *Airspeed Velocity* benchmarks in the current environment.
+
+    Parameters
+    ----------
+    ctx : invoke.context.Context
+        Context.
+    quick : bool, optional
+        Whether to run each benchmark only once, the timings are not
+        significant but the benchmarks are checked quickly.
+    bench : unicode, optional
+        Regular expression selecting the benchmarks to run, e.g.
+        *RGBToRGB*.
+    publish : bool, optional
+        Whether to record the results against the current commit and publish
+        them as *HTML* into the *.asv/html* directory.
+
+    Returns
+    -------
+    bool
+        Task success.
+    """
+
+    message_box('Running "Airspeed Velocity" benchmarks...')
+
+    ctx.run('asv machine --yes')
+
+    command = 'asv run --python=same --show-stderr'
+    if quick:
+        command += ' --quick'
+    if bench is not None:
+        command += ' --bench "{0}"'.format(bench)
+    if publish:
+        command += ' --set-commit-hash $(git rev-parse HEAD)'
+
+    ctx.run(command, env={'MPLBACKEND': 'AGG'})
+
+    if publish:
+        ctx.run('asv publish')
+
+
 @task(formatting, tests, quality, examples)
 def preflight(ctx):
     """